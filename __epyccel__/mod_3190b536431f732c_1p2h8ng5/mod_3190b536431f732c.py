@@ -0,0 +1,4 @@
+@types('real')
+def isinf_call(x):
+    from math import isinf
+    return isinf(x)
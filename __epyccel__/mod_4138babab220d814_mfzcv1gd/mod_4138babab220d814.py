@@ -0,0 +1,4 @@
+@types('real')
+def log2_call(x):
+    from math import log2
+    return log2(x)
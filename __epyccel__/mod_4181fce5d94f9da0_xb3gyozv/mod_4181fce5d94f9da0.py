@@ -0,0 +1,4 @@
+def create_array_vals_2d():
+    from numpy.random import rand # pylint: disable=reimported
+    a = rand(2,2)*0.5 + 3
+    return a[0,0], a[0,1], a[1,0], a[1,1]
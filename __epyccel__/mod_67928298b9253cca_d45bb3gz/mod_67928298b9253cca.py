@@ -0,0 +1,5 @@
+@types('real','real')
+def log2_phrase(x,y):
+    from math import log2
+    a = log2(x)+log2(y)
+    return a
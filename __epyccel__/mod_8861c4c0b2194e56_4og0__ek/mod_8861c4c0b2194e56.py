@@ -0,0 +1,4 @@
+@types('real', 'real')
+def remainder_type(x, y):
+    from math import remainder
+    return remainder(x, y)
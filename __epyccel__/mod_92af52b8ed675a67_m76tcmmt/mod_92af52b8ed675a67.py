@@ -0,0 +1,4 @@
+@types('real', 'int')
+def ldexp_call(x, exp):
+    from math import ldexp
+    return ldexp(x, exp)
@@ -0,0 +1,5 @@
+@types('real','real')
+def log1p_phrase(x,y):
+    from math import log1p
+    a = log1p(x)+log1p(y)
+    return a
@@ -0,0 +1,4 @@
+@types('real')
+def log1p_call(x):
+    from math import log1p
+    return log1p(x)
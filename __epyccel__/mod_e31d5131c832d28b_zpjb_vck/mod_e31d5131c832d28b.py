@@ -0,0 +1,4 @@
+@types('real')
+def expm1_call(x):
+    from math import expm1
+    return expm1(x)
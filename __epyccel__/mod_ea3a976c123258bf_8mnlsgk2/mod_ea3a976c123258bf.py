@@ -0,0 +1,4 @@
+@types('real')
+def isfinite_call(x):
+    from math import isfinite
+    return isfinite(x)
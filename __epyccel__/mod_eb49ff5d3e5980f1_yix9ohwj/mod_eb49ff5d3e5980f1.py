@@ -0,0 +1,4 @@
+@types('real', 'int')
+def ldexp_type(x, exp):
+    from math import ldexp
+    return ldexp(x, exp)
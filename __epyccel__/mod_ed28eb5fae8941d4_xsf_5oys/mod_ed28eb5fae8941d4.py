@@ -0,0 +1,5 @@
+@types('real','real')
+def expm1_phrase(x,y):
+    from math import expm1
+    a = expm1(x)+expm1(y)
+    return a
@@ -0,0 +1,70 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark of the cost of calling tiny compiled kernels from python, which is
+dominated by the argument parsing of the generated wrappers.
+
+Usage:
+    python benchmarks/call_overhead.py [--number 1000000] [--repeat 5] [--language c]
+"""
+
+import argparse
+import timeit
+
+from pyccel.decorators import types
+from pyccel.epyccel import epyccel
+
+__all__ = ['KERNELS', 'main']
+
+#==============================================================================
+# Kernels
+#==============================================================================
+def noop():
+    x = 0 # pylint: disable=unused-variable
+
+@types('real', 'real')
+def axpy(x, y):
+    return 2.0*x + y
+
+@types('int', 'real', 'real')
+def axpy_default(n, x, y = 1.0):
+    return n*x + y
+
+KERNELS = {'noop'         : noop,
+           'axpy'         : axpy,
+           'axpy_default' : axpy_default}
+
+# Calls measured for each kernel. Literal calls are used as the keyword
+# arguments are passed differently when they are unpacked from a dictionary
+CALLS = {'noop'         : ['noop()'],
+         'axpy'         : ['axpy(1.5, 2.5)',
+                           'axpy(1.5, y=2.5)'],
+         'axpy_default' : ['axpy_default(3, 1.5)',
+                           'axpy_default(3, 1.5, y=2.5)']}
+
+#==============================================================================
+def main():
+    """ Print the cost of a call to each kernel in nanoseconds """
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0])
+    parser.add_argument('--number', type = int, default = 1000000,
+                        help = 'Number of calls in each measurement (default: 1000000)')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'Number of measurements (default: 5)')
+    parser.add_argument('--language', default = 'c', choices = ('c', 'fortran'),
+                        help = 'Backend used to compile the kernels (default: c)')
+    args = parser.parse_args()
+
+    print('{:28s} {:>10s} {:>10s}'.format('call', 'pyccel', 'python'))
+    print('{:28s} {:>10s} {:>10s}'.format('', '[ns/call]', '[ns/call]'))
+    for name, kernel in KERNELS.items():
+        f = epyccel(kernel, language = args.language)
+        for stmt in CALLS[name]:
+            times = [min(timeit.repeat(stmt, globals = {name : g}, number = args.number,
+                            repeat = args.repeat)) / args.number * 1e9 for g in (f, kernel)]
+            print('{:28s} {:10.1f} {:10.1f}'.format(stmt, *times))
+
+if __name__ == '__main__':
+    main()
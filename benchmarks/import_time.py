@@ -0,0 +1,75 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark of the time needed to import pyccel, measured with
+`python -X importtime -c "import pyccel.epyccel"`.
+
+Usage:
+    python benchmarks/import_time.py [--module pyccel.epyccel] [--repeat 5] [--top 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+__all__ = ['import_times', 'main']
+
+#==============================================================================
+def import_times(module):
+    """
+    Import a module in a new interpreter and return the cumulative import
+    time of each imported module.
+
+    Parameters
+    ----------
+    module : str
+            The name of the module to import
+
+    Returns
+    -------
+    times : dict
+            The cumulative time (in microseconds) of each imported module
+    """
+    p = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                       universal_newlines=True, check=True)
+    times = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+#==============================================================================
+def main():
+    """ Print the import time of a module and of its slowest dependencies """
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0])
+    parser.add_argument('--module', default = 'pyccel.epyccel',
+                        help = 'Module to import (default: pyccel.epyccel)')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'Number of measurements (default: 5)')
+    parser.add_argument('--top', type = int, default = 10,
+                        help = 'Number of slowest imports shown (default: 10)')
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    totals = [r[args.module] for r in runs]
+    print('import {}: median {:.1f} ms, min {:.1f} ms ({} runs)'.format(args.module,
+          statistics.median(totals)/1e3, min(totals)/1e3, args.repeat))
+
+    fastest = runs[totals.index(min(totals))]
+    print('Slowest imports:')
+    for name, t in sorted(fastest.items(), key = lambda i: -i[1])[1:args.top+1]:
+        print('  {:8.1f} ms  {}'.format(t/1e3, name))
+
+    for heavy in ('sympy', 'textx', 'pyccel.parser.parser'):
+        if heavy in fastest:
+            print('Warning: {} is imported'.format(heavy))
+
+if __name__ == '__main__':
+    main()
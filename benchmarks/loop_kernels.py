@@ -0,0 +1,123 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark of loop kernels indexing arrays element by element, compiled with
+the C and the Fortran backends.
+
+Usage:
+    python benchmarks/loop_kernels.py [--size 400] [--repeat 5] [--kernel stencil]
+"""
+
+import argparse
+import timeit
+
+from pyccel.decorators import types
+from pyccel.epyccel import epyccel
+
+__all__ = ['KERNELS', 'time_kernel', 'main']
+
+#==============================================================================
+# Kernels
+#==============================================================================
+@types('int')
+def fill_and_sum(n):
+    import numpy as np
+    a = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            a[i, j] = i - j
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            s += a[i, j]
+    return s
+
+@types('int')
+def stencil(n):
+    import numpy as np
+    u = np.ones((n, n))
+    v = np.zeros((n, n))
+    for k in range(10):
+        for i in range(1, n-1):
+            for j in range(1, n-1):
+                v[i, j] = 0.25 * (u[i-1, j] + u[i+1, j] + u[i, j-1] + u[i, j+1])
+        for i in range(1, n-1):
+            for j in range(1, n-1):
+                u[i, j] = v[i, j]
+    return u[n//2, n//2]
+
+@types('int')
+def matmul(n):
+    import numpy as np
+    a = np.ones((n, n))
+    b = np.ones((n, n))
+    c = np.zeros((n, n))
+    for i in range(n):
+        for k in range(n):
+            for j in range(n):
+                c[i, j] += a[i, k] * b[k, j]
+    return c[0, 0]
+
+@types('int')
+def strided_sum(n):
+    import numpy as np
+    a = np.ones((2*n, 2*n))
+    b = a[::2, ::2]
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            s += b[i, j]
+    return s
+
+KERNELS = {'fill_and_sum' : fill_and_sum,
+           'stencil'      : stencil,
+           'matmul'       : matmul,
+           'strided_sum'  : strided_sum}
+
+#==============================================================================
+def time_kernel(f, size, repeat):
+    """
+    Return the best execution time of a compiled kernel.
+
+    Parameters
+    ----------
+    f      : callable
+            The compiled kernel
+    size   : int
+            The argument passed to the kernel
+    repeat : int
+            Number of measurements
+
+    Returns
+    -------
+    time : float
+            The smallest execution time (in seconds)
+    """
+    return min(timeit.repeat(lambda: f(size), number = 1, repeat = repeat))
+
+#==============================================================================
+def main():
+    """ Print the execution time of each kernel with the C and the Fortran backends """
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0])
+    parser.add_argument('--size', type = int, default = 400,
+                        help = 'Size of the arrays (default: 400)')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'Number of measurements (default: 5)')
+    parser.add_argument('--kernel', choices = list(KERNELS), action = 'append',
+                        help = 'Kernel to run (default: all)')
+    args = parser.parse_args()
+
+    print('{:14s} {:>12s} {:>12s} {:>8s}'.format('kernel', 'c [ms]', 'fortran [ms]', 'c/f'))
+    for name in args.kernel or KERNELS:
+        times = {}
+        for language in ('c', 'fortran'):
+            f = epyccel(KERNELS[name], language = language)
+            times[language] = time_kernel(f, args.size, args.repeat)
+        print('{:14s} {:12.3f} {:12.3f} {:8.2f}'.format(name, times['c']*1e3,
+              times['fortran']*1e3, times['c']/times['fortran']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark of the products of square matrices compiled with and without a BLAS
+library, compared with numpy.matmul.
+
+Usage:
+    python benchmarks/matmul.py [--sizes 16 64 256 1000] [--repeat 5] [--language c] [--blas openblas]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from pyccel.decorators import types
+from pyccel.epyccel import epyccel
+
+__all__ = ['matrix_product', 'main']
+
+#==============================================================================
+# Kernel
+#==============================================================================
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def matrix_product(a, b, c):
+    from numpy import matmul
+    c[:,:] = matmul(a, b)
+
+#==============================================================================
+def main():
+    """ Print the time of the product of two matrices for each size """
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type = int, nargs = '+', default = [16, 64, 256, 1000],
+                        help = 'Sizes of the matrices (default: 16 64 256 1000)')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'Number of measurements (default: 5)')
+    parser.add_argument('--language', default = 'c', choices = ('c', 'fortran'),
+                        help = 'Backend used to compile the kernel (default: c)')
+    parser.add_argument('--blas', default = 'openblas', choices = ('openblas', 'reference'),
+                        help = 'BLAS library (default: openblas)')
+    args = parser.parse_args()
+
+    f_none = epyccel(matrix_product, language = args.language)
+    f_blas = epyccel(matrix_product, language = args.language, blas = args.blas)
+
+    print('{:>6s} {:>12s} {:>12s} {:>12s}'.format('size', 'numpy', 'pyccel', 'pyccel+blas'))
+    print('{:>6s} {:>12s} {:>12s} {:>12s}'.format('', '[ms]', '[ms]', '[ms]'))
+    for n in args.sizes:
+        a = np.random.random((n, n))
+        b = np.random.random((n, n))
+        c = np.empty((n, n))
+        number = max(1, int(1e7 / n**3))
+        times = [min(timeit.repeat(lambda f=f: f(a, b, c), number = number,
+                        repeat = args.repeat)) / number * 1e3
+                 for f in (lambda a, b, c: np.matmul(a, b, out = c), f_none, f_blas)]
+        print('{:6d} {:12.4f} {:12.4f} {:12.4f}'.format(n, *times))
+
+if __name__ == '__main__':
+    main()
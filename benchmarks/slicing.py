@@ -0,0 +1,81 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark of kernels creating array views inside loops, compiled with the
+C backend.
+
+Usage:
+    python benchmarks/slicing.py [--size 1000] [--repeat 5] [--language c]
+"""
+
+import argparse
+import timeit
+
+from pyccel.decorators import types
+from pyccel.epyccel import epyccel
+
+__all__ = ['KERNELS', 'main']
+
+#==============================================================================
+# Kernels
+#==============================================================================
+@types('int')
+def row_slices(n):
+    import numpy as np
+    a = np.ones((n, n))
+    s = 0.0
+    for i in range(n):
+        row = a[i:i+1, :]
+        for j in range(n):
+            s += row[0, j]
+    return s
+
+@types('int')
+def rows(n):
+    import numpy as np
+    a = np.ones((n, n))
+    s = 0.0
+    for i in range(n):
+        row = a[i, :]
+        for j in range(n):
+            s += row[j]
+    return s
+
+@types('int')
+def windows(n):
+    import numpy as np
+    a = np.ones((n, n))
+    s = 0.0
+    for i in range(n-2):
+        for j in range(n-2):
+            w = a[i:i+3, j:j+3]
+            s += w[0, 0] + w[1, 1] + w[2, 2]
+    return s
+
+KERNELS = {'row_slices' : row_slices,
+           'rows'       : rows,
+           'windows'    : windows}
+
+#==============================================================================
+def main():
+    """ Print the execution time of each kernel """
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0])
+    parser.add_argument('--size', type = int, default = 1000,
+                        help = 'Size of the arrays (default: 1000)')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'Number of measurements (default: 5)')
+    parser.add_argument('--language', default = 'c', choices = ('c', 'fortran'),
+                        help = 'Backend used to compile the kernels (default: c)')
+    args = parser.parse_args()
+
+    print('{:12s} {:>10s}'.format('kernel', 'time [ms]'))
+    for name, kernel in KERNELS.items():
+        f = epyccel(kernel, language = args.language)
+        t = min(timeit.repeat(lambda f=f: f(args.size), number = 1, repeat = args.repeat))
+        print('{:12s} {:10.3f}'.format(name, t*1e3))
+
+if __name__ == '__main__':
+    main()
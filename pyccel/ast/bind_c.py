@@ -4,8 +4,6 @@
 # go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
 #------------------------------------------------------------------------------------------#
 
-from sympy import Tuple
-
 from pyccel.ast.core import FunctionCall
 from pyccel.ast.core import FunctionAddress
 from pyccel.ast.core import FunctionDef, BindCFunctionDef
@@ -75,26 +73,14 @@ def as_static_function(func, name=None):
         if not isinstance(a, (Variable, FunctionAddress)):
             raise TypeError('Expecting a Variable or FunctionAddress type for {}'.format(a))
         if not isinstance(a, FunctionAddress) and a.rank > 0:
-            # ...
-            additional_args = []
-            for i in range(a.rank):
-                n_name = 'n{i}_{name}'.format(name=str(a.name), i=i)
-                n_arg  = Variable('int', n_name, precision=4)
-
-                additional_args += [n_arg]
-
-            shape_new = Tuple(*additional_args, sympify=False)
-            # ...
-
-            _args += additional_args
-            _arguments_inout += [False] * len(additional_args)
-
+            # Arrays are assumed-shape arguments, they are received from C
+            # as C descriptors which also hold their shapes and strides
             a_new = Variable( a.dtype, a.name,
                               allocatable = a.allocatable,
                               is_pointer  = a.is_pointer,
                               is_target   = a.is_target,
                               is_optional = a.is_optional,
-                              shape       = shape_new,
+                              shape       = None,
                               rank        = a.rank,
                               order       = a.order,
                               precision   = a.precision)
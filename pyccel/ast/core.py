@@ -8,6 +8,7 @@
 import importlib
 from collections.abc import Iterable
 from collections     import OrderedDict
+from itertools       import takewhile
 
 from pyccel.ast.datatypes  import str_dtype
 from sympy import sympify
@@ -160,9 +161,20 @@ __all__ = (
 #    'op_registry',
     'process_shape',
     'subs',
+    'OmpAnnotatedComment',
     'OMP_For_Loop',
     'OMP_Parallel_Construct',
     'OMP_Single_Construct',
+    'OMP_Simd_Construct',
+    'OMP_Atomic_Construct',
+    'OMP_Critical_Construct',
+    'OMP_Barrier_Construct',
+    'OMP_Master_Construct',
+    'OMP_Sections_Construct',
+    'OMP_Section_Construct',
+    'OMP_Task_Construct',
+    'OMP_Taskwait_Construct',
+    'OMP_Taskloop_Construct',
     'Omp_End_Clause'
 )
 
@@ -801,6 +813,8 @@ class Allocate(Basic):
     ----------
     variable : pyccel.ast.core.Variable
         The typed variable (usually an array) that needs memory allocation.
+        Stack arrays are also allocated by the languages which cannot declare
+        arrays with a shape known at run time (e.g. C).
 
     shape : int or iterable or None
         Shape of the array after allocation (None for scalars).
@@ -828,8 +842,8 @@ class Allocate(Basic):
         if not isinstance(variable, Variable):
             raise TypeError("Can only allocate a 'Variable' object, got {} instead".format(type(variable)))
 
-        if not variable.allocatable:
-            raise ValueError("Variable must be allocatable")
+        if not (variable.allocatable or variable.is_stack_array):
+            raise ValueError("Variable must be allocatable or a stack array")
 
         if shape and not isinstance(shape, (int, tuple, list)):
             raise TypeError("Cannot understand 'shape' parameter of type '{}'".format(type(shape)))
@@ -2421,6 +2435,8 @@ class Variable(Symbol, PyccelAstNode):
             is_polymorphic=kwargs.pop('is_polymorphic',self.is_polymorphic),
             is_optional=kwargs.pop('is_optional',self.is_optional),
             cls_base=kwargs.pop('cls_base',self.cls_base),
+            order=kwargs.pop('order',self.order),
+            precision=kwargs.pop('precision',self.precision),
             )
     def rename(self, newname):
         """Change variable name."""
@@ -2775,8 +2791,9 @@ class ValuedArgument(Basic):
     >>> n
     n=4
     """
-    def __new__(cls, *args, **kwargs):
-        return Basic.__new__(cls)
+    def __new__(cls, expr, value, **kwargs):
+        # the arguments are stored so the calls with different values differ
+        return Basic.__new__(cls, expr, value)
 
     def __init__(self, expr, value, *, kwonly = False):
         if isinstance(expr, str):
@@ -4644,25 +4661,106 @@ class AnnotatedComment(Basic):
         args = (self.accel, self.txt)
         return args
 
-class OMP_For_Loop(AnnotatedComment):
-    """ Represents an OpenMP Loop construct. """
-    def __new__(cls, txt):
-        return AnnotatedComment.__new__(cls, 'omp', txt)
+class OmpAnnotatedComment(AnnotatedComment):
+    """Represents an OpenMP directive.
+
+    Parameters
+    ----------
+    txt: str
+        the name of the construct followed by its clauses
+
+    Examples
+    --------
+    >>> from pyccel.ast.core import OMP_Parallel_Construct
+    >>> OMP_Parallel_Construct('parallel for private(i)').construct
+    'parallel for'
+    """
+    # The words which can form the name of the construct
+    _construct_words = ()
 
-class OMP_Parallel_Construct(AnnotatedComment):
-    """ Represents an OpenMP Parallel construct. """
     def __new__(cls, txt):
         return AnnotatedComment.__new__(cls, 'omp', txt)
 
-class OMP_Single_Construct(AnnotatedComment):
+    @property
+    def construct(self):
+        """ The name of the construct, as written in the directive which ends it """
+        words = str(self.txt).split()
+        return ' '.join(takewhile(lambda w: w in self._construct_words, words))
+
+    def __getnewargs__(self):
+        """used for Pickling self."""
+
+        args = (self.txt,)
+        return args
+
+class OMP_For_Loop(OmpAnnotatedComment):
+    """ Represents an OpenMP Loop construct. """
+    _construct_words = ('for', 'simd')
+
+class OMP_Parallel_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Parallel construct, which may be combined
+    with a Loop construct. """
+    _construct_words = ('parallel', 'for', 'simd')
+
+class OMP_Single_Construct(OmpAnnotatedComment):
     """ Represents an OpenMP Single construct. """
-    def __new__(cls, txt):
-        return AnnotatedComment.__new__(cls, 'omp', txt)
+    _construct_words = ('single',)
+
+class OMP_Simd_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Simd construct. """
+    _construct_words = ('simd',)
+
+class OMP_Atomic_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Atomic construct. """
+    _construct_words = ('atomic',)
+
+class OMP_Critical_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Critical construct. """
+    _construct_words = ('critical',)
+
+class OMP_Barrier_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Barrier directive. """
+    _construct_words = ('barrier',)
+
+class OMP_Master_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Master construct. """
+    _construct_words = ('master',)
+
+class OMP_Sections_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Sections construct. """
+    _construct_words = ('sections',)
 
-class Omp_End_Clause(AnnotatedComment):
+class OMP_Section_Construct(OmpAnnotatedComment):
+    """ Represents a section of an OpenMP Sections construct. """
+    _construct_words = ('section',)
+
+class OMP_Task_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Task construct. """
+    _construct_words = ('task',)
+
+class OMP_Taskwait_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Taskwait directive. """
+    _construct_words = ('taskwait',)
+
+class OMP_Taskloop_Construct(OmpAnnotatedComment):
+    """ Represents an OpenMP Taskloop construct. """
+    _construct_words = ('taskloop', 'simd')
+
+class Omp_End_Clause(OmpAnnotatedComment):
     """ Represents the End of an OpenMP block. """
-    def __new__(cls, txt):
-        return AnnotatedComment.__new__(cls, 'omp', txt)
+    _construct_words = ('parallel', 'for', 'simd', 'single', 'atomic', 'critical',
+            'master', 'sections', 'section', 'task', 'taskloop')
+
+    @property
+    def construct(self):
+        """ The name of the construct which is ended """
+        words = str(self.txt).split()[1:]
+        return ' '.join(takewhile(lambda w: w in self._construct_words, words))
+
+    @property
+    def nowait(self):
+        """ Indicates if the threads do not wait for each other at the end of the construct """
+        return 'nowait' in str(self.txt).split()
 
 class CommentBlock(Basic):
 
@@ -39,9 +39,12 @@ __all__ = (
 #
     'PyccelPyObject',
     'PyccelPyArrayObject',
+    'PyccelCFIDescriptor',
+    'PyccelPySsizeT',
     'PyArgKeywords',
-    'PyArg_ParseTupleNode',
+    'PyArg_ParseFastcallNode',
     'PyBuildValueNode',
+    'PyAllowThreadsBlock',
 #--------- CONSTANTS ----------
     'Py_True',
     'Py_False',
@@ -73,6 +76,9 @@ __all__ = (
     'numpy_flag_c_contig',
     'numpy_flag_f_contig',
     'numpy_dtype_registry',
+    'pyarray_to_ndarray',
+    'ndarray_to_pyarray',
+    'pyarray_to_cfi_desc',
 )
 
 class PyccelPyObject(DataType):
@@ -83,6 +89,16 @@ class PyccelPyArrayObject(DataType):
     class used to hold numpy objects"""
     _name = 'pyarrayobject'
 
+class PyccelCFIDescriptor(DataType):
+    """ Datatype representing the storage of a C descriptor
+    (Fortran 2018) used to pass numpy objects to Fortran"""
+    _name = 'cfidescriptor'
+
+class PyccelPySsizeT(DataType):
+    """ Datatype representing a Py_ssize_t which is the
+    type of the sizes in the python C API"""
+    _name = 'pyssizet'
+
 PyArray_Type = Variable(NativeGeneric(), 'PyArray_Type')
 
 #TODO: Is there an equivalent to static so this can be a static list of strings?
@@ -126,16 +142,21 @@ pytype_parse_registry = {
     (PyccelPyArrayObject(), 0) : 'O!',
     }
 
-class PyArg_ParseTupleNode(Basic):
+class PyArg_ParseFastcallNode(Basic):
     """
-    Represents a call to the function from Python.h which collects the expected arguments
+    Represents a call to the function from cwrapper.h which collects the expected
+    arguments of a function using the METH_FASTCALL calling convention. The format
+    is the same as the format of PyArg_ParseTupleAndKeywords
 
     Parameters
     ----------
     python_func_args: Variable
-        Args provided to the function in python
-    python_func_kwargs: Variable
-        Kwargs provided to the function in python
+        Array of the arguments provided to the function in python
+        (positional arguments followed by the values of the keyword arguments)
+    python_func_nargs: Variable
+        Number of positional arguments provided to the function in python
+    python_func_kwnames: Variable
+        Tuple of the names of the keyword arguments provided to the function in python
     c_func_args: list of Variable
         List of expected arguments. This helps determine the expected output types
     parse_args: list of Variable
@@ -147,15 +168,18 @@ class PyArg_ParseTupleNode(Basic):
     """
 
     def __init__(self, python_func_args,
-                        python_func_kwargs,
+                        python_func_nargs,
+                        python_func_kwnames,
                         c_func_args, parse_args,
                         arg_names,
                         is_interface=False):
         Basic.__init__(self)
         if not isinstance(python_func_args, Variable):
             raise TypeError('Python func args should be a Variable')
-        if not isinstance(python_func_kwargs, Variable):
-            raise TypeError('Python func kwargs should be a Variable')
+        if not isinstance(python_func_nargs, Variable):
+            raise TypeError('Python func nargs should be a Variable')
+        if not isinstance(python_func_kwnames, Variable):
+            raise TypeError('Python func kwnames should be a Variable')
         if not all(isinstance(c, (Variable, FunctionAddress)) for c in c_func_args):
             raise TypeError('C func args should be a list of Variables')
         if not isinstance(parse_args, list) and any(not isinstance(c, Variable) for c in parse_args):
@@ -190,7 +214,8 @@ class PyArg_ParseTupleNode(Basic):
         parse_args = [a for arg in parse_args for a in arg]
 
         self._pyarg      = python_func_args
-        self._pykwarg    = python_func_kwargs
+        self._pynargs    = python_func_nargs
+        self._pykwnames  = python_func_kwnames
         self._parse_args = parse_args
         self._arg_names  = arg_names
 
@@ -208,8 +233,12 @@ class PyArg_ParseTupleNode(Basic):
         return self._pyarg
 
     @property
-    def pykwarg(self):
-        return self._pykwarg
+    def pynargs(self):
+        return self._pynargs
+
+    @property
+    def pykwnames(self):
+        return self._pykwnames
 
     @property
     def flags(self):
@@ -223,6 +252,25 @@ class PyArg_ParseTupleNode(Basic):
     def arg_names(self):
         return self._arg_names
 
+class PyAllowThreadsBlock(Basic):
+    """
+    Represents a block of statements executed without holding the GIL, between
+    the macros Py_BEGIN_ALLOW_THREADS and Py_END_ALLOW_THREADS of Python.h.
+    The statements must not use any python object
+
+    Parameters
+    ----------
+    body : list of Basic
+        The statements executed without the GIL
+    """
+    def __init__(self, body):
+        Basic.__init__(self)
+        self._body = body
+
+    @property
+    def body(self):
+        return self._body
+
 class PyBuildValueNode(Basic):
     """
     Represents a call to the function from Python.h which create a new value based on a format string
@@ -331,6 +379,25 @@ numpy_get_type = FunctionDef(name      = 'PyArray_TYPE',
                        arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True)],
                        results   = [Variable(dtype=NativeInteger(), name = 'i', precision = 4)])
 
+# Functions of ndarrays_numpy.h sharing the data of numpy arrays with t_ndarray
+pyarray_to_ndarray = FunctionDef(name      = 'pyarray_to_ndarray',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True)],
+                       results   = [Variable(dtype=NativeGeneric(), name = 'array', rank=1)])
+
+ndarray_to_pyarray = FunctionDef(name      = 'ndarray_to_pyarray',
+                       body      = [],
+                       arguments = [Variable(dtype=NativeGeneric(), name = 'array', rank=1)],
+                       results   = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True)])
+
+# Function of cwrapper_cfi.h describing numpy arrays for the bind(c) functions
+pyarray_to_cfi_desc = FunctionDef(name      = 'pyarray_to_cfi_desc',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
+                                    Variable(dtype=PyccelCFIDescriptor(), name = 'desc', is_pointer=True),
+                                    Variable(dtype=NativeBool(), name = 'c_order')],
+                       results   = [Variable(dtype=NativeGeneric(), name = 'd', rank=1)])
+
 numpy_flag_own_data = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_OWNDATA')
 numpy_flag_c_contig = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_C_CONTIGUOUS')
 numpy_flag_f_contig = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_F_CONTIGUOUS')
@@ -16,7 +16,8 @@ from .core           import (ClassDef, FunctionDef,
                              PythonList, Variable, IndexedElement,
                              Nil, process_shape, ValuedArgument, Constant)
 
-from .operators      import (PyccelPow, PyccelAssociativeParenthesis, broadcast)
+from .operators      import (PyccelPow, PyccelAssociativeParenthesis, PyccelUnarySub,
+                             broadcast)
 
 from .builtins       import (PythonInt, PythonBool, PythonFloat, PythonTuple,
                              PythonComplex, PythonReal, PythonImag)
@@ -76,8 +77,10 @@ __all__ = (
     'NumpyOnes',
     'NumpyOnesLike',
     'NumpyProduct',
+    'NumpyReductionBase',
     'NumpyRand',
     'NumpyRandint',
+    'NumpyRandomSeed',
     'NumpyReal',
     'Shape',
     'NumpyWhere',
@@ -176,56 +179,107 @@ class NumpyArray(Application, NumpyNewArray):
         return self._args[0]
 
 #==============================================================================
-class NumpySum(Function, PyccelAstNode):
-    """Represents a call to  numpy.sum for code generation.
+class NumpyReductionBase(Function, PyccelAstNode):
+    """Base class for the reductions of the elements of an array.
 
-    arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
+    arg  : PyccelAstNode
+        The reduced array
+    axis : LiteralInteger
+        The reduced axis. If it is None all the elements are reduced and the
+        result is a scalar
     """
 
-    def __new__(cls, arg):
+    def __new__(cls, arg, axis=None):
         if not isinstance(arg, (list, tuple, PythonTuple, Tuple, PythonList,
                             Variable, Expr)):
             raise TypeError('Uknown type of  %s.' % type(arg))
-
-        return Basic.__new__(cls, arg)
-
-    def __init__(self, arg):
-        self._dtype = arg.dtype
-        self._rank  = 0
-        self._shape = ()
-        self._precision = default_precision[str_dtype(self._dtype)]
+        if isinstance(axis, ValuedArgument):
+            axis = axis.value
+        if axis is not None:
+            if isinstance(axis, PyccelUnarySub) and isinstance(axis.args[0], LiteralInteger):
+                value = -axis.args[0].python_value
+            elif isinstance(axis, LiteralInteger):
+                value = axis.python_value
+            else:
+                raise TypeError('The axis of a reduction must be a literal integer')
+            if not -arg.rank <= value < arg.rank:
+                raise ValueError('axis {} is out of bounds for an array of dimension {}'.format(
+                    value, arg.rank))
+            # negative axes are counted from the last dimension
+            axis = LiteralInteger(value % arg.rank)
+
+        return Basic.__new__(cls, arg, axis)
+
+    def __init__(self, arg, axis=None):
+        if self.axis is None:
+            self._rank  = 0
+            self._shape = ()
+        else:
+            self._rank  = arg.rank - 1
+            self._shape = tuple(s for i, s in enumerate(arg.shape) if i != self.axis.python_value)
+            self._order = arg.order
 
     @property
     def arg(self):
         return self._args[0]
 
+    @property
+    def axis(self):
+        return self._args[1]
+
 #==============================================================================
-class NumpyProduct(Function, PyccelAstNode):
-    """Represents a call to  numpy.prod for code generation.
+class NumpySum(NumpyReductionBase):
+    """Represents a call to  numpy.sum for code generation.
 
     arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
     """
 
-    def __new__(cls, arg):
-        if not isinstance(arg, (list, tuple, PythonTuple, Tuple, PythonList,
-                                Variable, Expr)):
-            raise TypeError('Uknown type of  %s.' % type(arg))
-        return Basic.__new__(cls, arg)
+    def __init__(self, arg, axis=None):
+        NumpyReductionBase.__init__(self, arg, axis)
+        self._dtype = NativeInteger() if arg.dtype is NativeBool() else arg.dtype
+        self._precision = default_precision[str_dtype(self._dtype)]
+
+#==============================================================================
+class NumpyProduct(NumpyReductionBase):
+    """Represents a call to  numpy.prod for code generation.
+
+    arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
+    """
 
-    def __init__(self, arg):
-        self._dtype = arg.dtype
-        self._rank  = 0
-        self._shape = ()
+    def __init__(self, arg, axis=None):
+        NumpyReductionBase.__init__(self, arg, axis)
+        self._dtype = NativeInteger() if arg.dtype is NativeBool() else arg.dtype
         self._precision = default_precision[str_dtype(self._dtype)]
 
-    @property
-    def arg(self):
-        return self._args[0]
+#==============================================================================
+class NumpyMin(NumpyReductionBase):
+    """Represents a call to  numpy.min for code generation.
 
+    arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
+    """
+
+    def __init__(self, arg, axis=None):
+        NumpyReductionBase.__init__(self, arg, axis)
+        self._dtype     = arg.dtype
+        self._precision = arg.precision
+
+#==============================================================================
+class NumpyMax(NumpyReductionBase):
+    """Represents a call to  numpy.max for code generation.
+
+    arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
+    """
+
+    def __init__(self, arg, axis=None):
+        NumpyReductionBase.__init__(self, arg, axis)
+        self._dtype     = arg.dtype
+        self._precision = arg.precision
 
 #==============================================================================
 class NumpyMatmul(Application, PyccelAstNode):
     """Represents a call to numpy.matmul for code generation.
+    It also represents numpy.dot, which computes the same product for
+    vectors and matrices.
     arg : list , tuple , PythonTuple, Tuple, PythonList, Variable
     """
 
@@ -241,14 +295,14 @@ class NumpyMatmul(Application, PyccelAstNode):
     def __init__(self, a ,b):
 
         args      = (a, b)
-        integers  = [e for e in args if e.dtype is NativeInteger() or a.dtype is NativeBool()]
+        integers  = [e for e in args if e.dtype is NativeInteger() or e.dtype is NativeBool()]
         reals     = [e for e in args if e.dtype is NativeReal()]
         complexs  = [e for e in args if e.dtype is NativeComplex()]
 
         if complexs:
             self._dtype     = NativeComplex()
             self._precision = max(e.precision for e in complexs)
-        if reals:
+        elif reals:
             self._dtype     = NativeReal()
             self._precision = max(e.precision for e in reals)
         elif integers:
@@ -257,18 +311,19 @@ class NumpyMatmul(Application, PyccelAstNode):
         else:
             raise TypeError('cannot determine the type of {}'.format(self))
 
-        if a.rank == 1 or b.rank == 1:
-            self._rank = 1
-        else:
-            self._rank = 2
+        if a.rank not in (1, 2) or b.rank not in (1, 2):
+            raise TypeError('Products of arrays of rank {} and {} are not supported.'.format(
+                a.rank, b.rank))
 
-        if not (a.shape is None or b.shape is None):
+        # The vectors are not kept in the shape of the product
+        self._rank = a.rank + b.rank - 2
 
-            m = 1 if a.rank < 2 else a.shape[0]
-            n = 1 if b.rank < 2 else b.shape[1]
-            self._shape = (m, n)
+        if not (a.shape is None or b.shape is None):
+            self._shape = tuple(a.shape[:-1]) + tuple(b.shape[1:])
 
-        if a.order == b.order:
+        if self._rank == 0:
+            self._order = None
+        elif a.order == b.order:
             self._order = a.order
         else:
             self._order = 'C'
@@ -451,7 +506,10 @@ class NumpyRandint(Function, NumpyNewArray):
     _precision = default_precision['integer']
 
     def __new__(cls, low, high = None, size = None):
-        return Function.__new__(cls)
+        # the arguments are passed to Function so that the calls with
+        # different arguments are not cached as the same object
+        args = [a for a in (low, high, size) if a is not None]
+        return Function.__new__(cls, *args)
 
     def __init__(self, low, high = None, size = None):
         if size is None:
@@ -483,6 +541,23 @@ class NumpyRandint(Function, NumpyNewArray):
         """ return low property of NumpyRandint"""
         return self._low
 
+#==============================================================================
+class NumpyRandomSeed(Basic):
+
+    """
+      Represents a call to numpy.random.seed for code generation.
+      The random number generator of each thread is restarted from the seed.
+
+    """
+
+    def __new__(cls, seed):
+        return Basic.__new__(cls, seed)
+
+    @property
+    def seed(self):
+        """ return the seed of NumpyRandomSeed"""
+        return self._args[0]
+
 #==============================================================================
 class NumpyFull(Application, NumpyNewArray):
     """
@@ -662,42 +737,17 @@ class NumpyZerosLike(Application):
 
 #=======================================================================================
 
-class NumpyNorm(Function, PyccelAstNode):
-    """ Represents call to numpy.norm"""
+class NumpyNorm(NumpyReductionBase):
+    """ Represents call to numpy.linalg.norm: the 2-norm of the vectors along
+    the axis, or the Frobenius norm of the array if the axis is None
+    """
 
     is_zero = False
 
-    def __new__(cls, arg, dim=None):
-        if isinstance(dim, ValuedArgument):
-            dim = dim.value
-        return Basic.__new__(cls, arg, dim)
-
-    @property
-    def arg(self):
-        return self._args[0]
-
-    @property
-    def dim(self):
-        return self._args[1]
-
-    @property
-    def dtype(self):
-        return 'real'
-
-
-    def shape(self, sh):
-        if self.dim is not None:
-            sh = list(sh)
-            del sh[self.dim]
-            return tuple(sh)
-        else:
-            return ()
-
-    @property
-    def rank(self):
-        if self.dim is not None:
-            return self.arg.rank-1
-        return 0
+    def __init__(self, arg, axis=None):
+        NumpyReductionBase.__init__(self, arg, axis)
+        self._dtype     = NativeReal()
+        self._precision = default_precision['real']
 
 #=====================================================
 class Sqrt(PyccelPow):
@@ -825,21 +875,6 @@ class NumpyMod(NumpyUfuncBinary):
         else:
             self._rank = max(a.rank for a in args)
 
-class NumpyMin(NumpyUfuncUnary):
-    def __init__(self, x):
-        self._shape     = ()
-        self._rank      = 0
-        self._dtype     = x.dtype
-        self._precision = x.precision
-
-class NumpyMax(NumpyUfuncUnary):
-    def __init__(self, x):
-        self._shape     = ()
-        self._rank      = 0
-        self._dtype     = x.dtype
-        self._precision = x.precision
-
-
 #=======================================================================================
 class NumpyComplex(PythonComplex):
     """ Represents a call to numpy.complex() function.
@@ -936,6 +971,7 @@ numpy_functions = {
     'complex128': NumpyComplex128,
     'complex64' : NumpyComplex64,
     'matmul'    : NumpyMatmul,
+    'dot'       : NumpyMatmul,
     'sum'       : NumpySum,
     'max'      : NumpyMax,
     'min'      : NumpyMin,
@@ -978,4 +1014,5 @@ numpy_random_functions = {
     'rand'      : NumpyRand,
     'random'    : NumpyRand,
     'randint'   : NumpyRandint,
+    'seed'      : NumpyRandomSeed,
 }
@@ -0,0 +1,480 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Automatic parallelisation of the loops with OpenMP.
+
+The pass is run on the annotated AST, between the semantic stage and the code
+generation. It looks for the loops over a range whose iterations are
+independent, and adds the directive 'parallel for' (with the private,
+lastprivate and reduction clauses which are needed) to the outermost of
+them. The analysis is conservative: a loop is only parallelised if all the
+variables it uses can be classified as follows:
+
+- the variables which are only read are shared
+- the scalars which are assigned before being read in each iteration are
+  private (lastprivate if they are used after the loop)
+- the scalars which are only updated by `s += e`, `s -= e`, `s *= e`,
+  `s = s + e`, `s = max((s, e))` or `s = min((s, e))` are reductions
+- the arrays which are written are only accessed at the index `i + c` along
+  one of their dimensions, where i is the index of the loop and c does not
+  change in the loop, so each iteration uses its own elements
+
+The loops which call functions which are not pure, allocate arrays or use
+expressions computed in temporaries by the printers (reductions, products
+of matrices, optional arguments) are not parallelised. The arrays passed as arguments
+are assumed not to overlap, as in Fortran.
+"""
+
+from sympy.core.basic import Basic
+
+from pyccel.ast.basic     import PyccelAstNode
+from pyccel.ast.builtins  import PythonRange, PythonMax, PythonMin, PythonTuple
+from pyccel.ast.core      import (Assign, AugAssign, CodeBlock, For, If, While,
+                                  FunctionCall, FunctionDef, Variable,
+                                  DottedVariable, IndexedElement, IndexedVariable,
+                                  Slice, Comment, CommentBlock, EmptyNode, NewLine,
+                                  Pass, Continue, AnnotatedComment,
+                                  OMP_Parallel_Construct, Omp_End_Clause)
+from pyccel.ast.datatypes import NativeInteger, NativeReal
+from pyccel.ast.literals  import Literal
+from pyccel.ast.numpyext  import (NumpyNewArray, NumpyReductionBase, NumpyMatmul,
+                                  NumpyRand, NumpyRandint)
+from pyccel.ast.operators import (PyccelAdd, PyccelMinus, PyccelMul, PyccelDiv,
+                                  PyccelFloorDiv, PyccelMod, PyccelUnarySub,
+                                  PyccelAssociativeParenthesis)
+
+__all__ = ['auto_parallelize', 'LoopParallelizer']
+
+# The statements which do not use any variable
+_ignored_statements = (Comment, CommentBlock, EmptyNode, NewLine, Pass, Continue)
+
+# The operators of the augmented assignments which are reductions
+_reduction_operators = {'+' : '+', '-' : '+', '*' : '*'}
+
+#==============================================================================
+class _Unsafe(Exception):
+    """ Raised when a loop cannot be parallelised, with the reason """
+
+#==============================================================================
+class _Access:
+    """ A read or a write of a variable in the body of a loop
+
+    Parameters
+    ----------
+    var         : Variable
+                  The accessed variable
+    indices     : tuple or None
+                  The indices of the accessed element, or None if the whole
+                  variable is accessed
+    write       : bool
+                  Indicates if the variable is written
+    conditional : bool
+                  Indicates if the access is not done in every iteration
+    reduction   : str or None
+                  The operator of the reduction if the write updates the
+                  variable with a reduction operator
+    """
+    __slots__ = ('var', 'indices', 'write', 'conditional', 'reduction')
+
+    def __init__(self, var, indices, write, conditional, reduction = None):
+        self.var         = var
+        self.indices     = indices
+        self.write       = write
+        self.conditional = conditional
+        self.reduction   = reduction
+
+#==============================================================================
+def _code(expr):
+    """ Get the python code of an index expression, for the report """
+    operators = {PyccelAdd : '+', PyccelMinus : '-', PyccelMul : '*', PyccelDiv : '/',
+                 PyccelFloorDiv : '//', PyccelMod : '%'}
+    if isinstance(expr, IndexedElement):
+        return _element_code(expr.base, expr.indices)
+    if isinstance(expr, Slice):
+        parts = [expr.start, expr.stop] + ([expr.step] if expr.step is not None else [])
+        return ':'.join('' if p is None else _code(p) for p in parts)
+    if type(expr) in operators:
+        return ' {} '.format(operators[type(expr)]).join(_code(a) for a in expr.args)
+    if isinstance(expr, PyccelUnarySub):
+        return '-' + _code(expr.args[0])
+    if isinstance(expr, PyccelAssociativeParenthesis):
+        return '({})'.format(_code(expr.args[0]))
+    return str(expr)
+
+def _element_code(var, indices):
+    """ Get the python code of the element of var at the indices """
+    return '{}[{}]'.format(var, ', '.join(_code(i) for i in indices))
+
+#==============================================================================
+class LoopParallelizer:
+    """
+    Add OpenMP directives to the loops of the functions of an annotated
+    module whose iterations are independent.
+
+    Parameters
+    ----------
+    filename : str
+               The name of the file, used in the report
+    """
+    def __init__(self, filename):
+        self._filename = filename
+        self._report   = []
+
+    @property
+    def report(self):
+        """ The lines describing the loops which were parallelised, and why
+        the other ones were not """
+        return self._report
+
+    def _add_to_report(self, func, loop, message):
+        fst = getattr(loop, 'fst', None)
+        line = ':{}'.format(fst.lineno) if fst is not None else ''
+        self._report.append('{}{}: {}: loop over {}: {}'.format(self._filename,
+                line, func.name, loop.target, message))
+
+    #--------------------------------------------------------------------------
+    def parallelize_function(self, func):
+        """ Parallelise the loops of the function func. The directives are
+        inserted in the body of the function, which is modified in place """
+        if self._contains_directives(func.body):
+            self._report.append('{}: {}: not parallelised: the function already contains '
+                    'OpenMP directives'.format(self._filename, func.name))
+            return
+        self._parallelize_block(func, func.body)
+
+    def _contains_directives(self, expr):
+        """ Indicate if the statement expr (or one of its blocks) contains a
+        directive for an accelerator """
+        if isinstance(expr, AnnotatedComment):
+            return True
+        return any(self._contains_directives(b) for b in self._blocks(expr))
+
+    @staticmethod
+    def _blocks(stmt):
+        """ Get the blocks of statements which are contained in the statement """
+        if isinstance(stmt, CodeBlock):
+            return stmt.body
+        if isinstance(stmt, (For, While)):
+            return [stmt.body]
+        if isinstance(stmt, If):
+            return stmt.bodies
+        return []
+
+    def _parallelize_block(self, func, block):
+        """ Parallelise the outermost independent loops of the block, which
+        is modified in place """
+        body = block.body
+        i = 0
+        while i < len(body):
+            stmt = body[i]
+            if isinstance(stmt, For):
+                clauses = self._loop_clauses(func, stmt)
+                if clauses is not None:
+                    txt = ' '.join(['parallel for', *clauses])
+                    body[i:i+1] = [OMP_Parallel_Construct(txt), stmt, Omp_End_Clause('end parallel for')]
+                    self._add_to_report(func, stmt, 'parallelised ({})'.format(txt))
+                    i += 3
+                    continue
+            for b in self._blocks(stmt):
+                self._parallelize_block(func, b)
+            i += 1
+
+    #--------------------------------------------------------------------------
+    def _loop_clauses(self, func, loop):
+        """ Get the clauses of the directive parallelising the loop, or None
+        if its iterations may depend on each other """
+        try:
+            if not isinstance(loop.iterable, PythonRange):
+                raise _Unsafe('it is not a loop over a range')
+            index = loop.target
+            accesses = []
+            self._block_accesses(loop.body, False, accesses)
+            written = {a.var.name for a in accesses if a.write}
+            if index.name in written:
+                raise _Unsafe('the index of the loop is modified')
+
+            # the variables which are used by the rest of the function
+            used_outside = self._used_names(func.body, loop)
+            used_outside.update(v.name for v in func.arguments)
+            used_outside.update(v.name for v in func.results)
+            used_outside.update(v.name for v in func.global_vars)
+
+            private, lastprivate, reductions = [], [], {}
+            for name in sorted(written):
+                var_accesses = [a for a in accesses if a.var.name == name]
+                var = var_accesses[0].var
+                if var.rank > 0:
+                    self._check_array(var, var_accesses, index, written)
+                    continue
+                op = self._reduction_operator(var, var_accesses)
+                if op:
+                    reductions.setdefault(op, []).append(name)
+                elif var_accesses[0].write and not var_accesses[0].reduction \
+                        and not var_accesses[0].conditional:
+                    # the value of the previous iteration is never used
+                    if name in used_outside:
+                        lastprivate.append(name)
+                    else:
+                        private.append(name)
+                else:
+                    raise _Unsafe('the value of {} is carried from one iteration to '
+                            'the next'.format(name))
+        except _Unsafe as e:
+            self._add_to_report(func, loop, 'not parallelised: {}'.format(e))
+            return None
+
+        clauses = []
+        if private:
+            clauses.append('private({})'.format(', '.join(private)))
+        if lastprivate:
+            clauses.append('lastprivate({})'.format(', '.join(lastprivate)))
+        for op, names in reductions.items():
+            clauses.append('reduction({}:{})'.format(op, ', '.join(names)))
+        return clauses
+
+    @staticmethod
+    def _reduction_operator(var, accesses):
+        """ Get the operator of the reduction computed in the scalar var, or
+        None if it is not only updated by a reduction operator """
+        ops = {a.reduction for a in accesses}
+        if len(ops) != 1 or None in ops:
+            return None
+        if not isinstance(var.dtype, (NativeInteger, NativeReal)):
+            return None
+        return ops.pop()
+
+    @staticmethod
+    def _check_array(var, accesses, index, written):
+        """ Check that the iterations only access their own elements of the
+        array var, which is written in the loop """
+        if var.is_pointer:
+            raise _Unsafe('{} is written through a pointer'.format(var.name))
+        for a in accesses:
+            if a.indices is None:
+                raise _Unsafe('the whole array {} is {} in each iteration'.format(var.name,
+                    'written' if a.write else 'read'))
+
+        def is_own_index(expr):
+            """ Indicate if the index expression is i + c, with c invariant """
+            if expr == index:
+                return True
+            if isinstance(expr, (PyccelAdd, PyccelMinus)):
+                a, b = expr.args
+                if isinstance(expr, PyccelAdd) and b == index:
+                    a, b = b, a
+                return a == index and not LoopParallelizer._depends_on(b, written | {index.name})
+            return False
+
+        first = accesses[0].indices
+        for dim, ind in enumerate(first):
+            if is_own_index(ind) and \
+                    all(len(a.indices) > dim and a.indices[dim] == ind for a in accesses):
+                return
+        write = [a for a in accesses if a.write][0]
+        others = [a for a in accesses if a.indices != write.indices]
+        element = _element_code(var, write.indices)
+        if others:
+            raise _Unsafe('{} is written at {} and accessed at {}'.format(var.name, element,
+                _element_code(var, others[0].indices)))
+        raise _Unsafe('the element {} is written by several iterations'.format(element))
+
+    @staticmethod
+    def _depends_on(expr, names):
+        """ Indicate if the expression uses one of the variables names """
+        if isinstance(expr, Variable):
+            return expr.name in names
+        if isinstance(expr, Basic):
+            return any(LoopParallelizer._depends_on(a, names) for a in expr.args)
+        return False
+
+    #--------------------------------------------------------------------------
+    def _block_accesses(self, block, conditional, accesses):
+        """ Append the accesses of the statements of the block, in the order
+        in which they are executed """
+        for stmt in block.body:
+            self._statement_accesses(stmt, conditional, accesses)
+
+    def _used_names(self, expr, excluded):
+        """ Get the names of the variables used in expr, except in the
+        statement excluded """
+        if expr is excluded:
+            return set()
+        if isinstance(expr, IndexedElement):
+            args = [expr.base.internal_variable, *expr.indices]
+        elif isinstance(expr, Variable):
+            return {expr.name}
+        elif isinstance(expr, For):
+            args = [expr.target, expr.iterable, expr.body]
+        elif isinstance(expr, CodeBlock):
+            args = expr.body
+        elif isinstance(expr, (list, tuple)):
+            args = expr
+        elif isinstance(expr, Basic) and not isinstance(expr, FunctionDef):
+            args = expr.args
+        else:
+            args = []
+        return set().union(*[self._used_names(a, excluded) for a in args])
+
+    def _statement_accesses(self, stmt, conditional, accesses):
+        """ Append the accesses of the statement to accesses. Raise _Unsafe
+        if the statement cannot be executed in parallel """
+        if isinstance(stmt, _ignored_statements):
+            return
+        if isinstance(stmt, AugAssign):
+            op = stmt.op._symbol
+            self._expression_accesses(stmt.rhs, conditional, accesses)
+            if op in _reduction_operators and stmt.lhs.rank == 0 and \
+                    not self._depends_on(stmt.rhs, {self._name(stmt.lhs)}):
+                self._write_accesses(stmt.lhs, conditional, accesses, _reduction_operators[op])
+            else:
+                self._expression_accesses(stmt.lhs, conditional, accesses)
+                self._write_accesses(stmt.lhs, conditional, accesses)
+        elif isinstance(stmt, Assign):
+            value = self._reduction_value(stmt)
+            if value is not None:
+                op, rhs = value
+                self._expression_accesses(rhs, conditional, accesses)
+                self._write_accesses(stmt.lhs, conditional, accesses, op)
+            else:
+                self._expression_accesses(stmt.rhs, conditional, accesses)
+                self._write_accesses(stmt.lhs, conditional, accesses)
+        elif isinstance(stmt, For):
+            if not isinstance(stmt.iterable, PythonRange):
+                raise _Unsafe('it contains a loop which is not over a range')
+            self._expression_accesses(stmt.iterable, conditional, accesses)
+            self._write_accesses(stmt.target, conditional, accesses)
+            self._block_accesses(stmt.body, True, accesses)
+        elif isinstance(stmt, While):
+            self._expression_accesses(stmt.test, conditional, accesses)
+            self._block_accesses(stmt.body, True, accesses)
+            self._expression_accesses(stmt.test, True, accesses)
+        elif isinstance(stmt, If):
+            for cond, body in stmt.args:
+                self._expression_accesses(cond, conditional, accesses)
+                self._block_accesses(body, True, accesses)
+        elif isinstance(stmt, CodeBlock):
+            self._block_accesses(stmt, conditional, accesses)
+        elif isinstance(stmt, FunctionCall):
+            self._expression_accesses(stmt, conditional, accesses)
+        else:
+            raise _Unsafe('it contains a statement which is not supported ({})'.format(
+                type(stmt).__name__))
+
+    @staticmethod
+    def _name(var):
+        """ The name of the variable of a Variable or of an IndexedElement """
+        if isinstance(var, IndexedElement):
+            return var.base.internal_variable.name
+        return var.name
+
+    def _reduction_value(self, stmt):
+        """ Get the reduction operator and the reduced value of an assignment
+        of the form s = s + e, s = s * e, s = max((s, e)) or s = min((s, e)),
+        or None if it is not a reduction """
+        lhs, rhs = stmt.lhs, stmt.rhs
+        if not isinstance(lhs, Variable) or lhs.rank > 0:
+            return None
+        if isinstance(rhs, (PythonMax, PythonMin)):
+            args = rhs.args[0]
+            op = 'max' if isinstance(rhs, PythonMax) else 'min'
+        elif isinstance(rhs, PyccelAdd):
+            args, op = rhs.args, '+'
+        elif isinstance(rhs, PyccelMul):
+            args, op = rhs.args, '*'
+        elif isinstance(rhs, PyccelMinus):
+            args, op = rhs.args[:1], '+'
+            if rhs.args[0] == lhs and not self._depends_on(rhs.args[1], {lhs.name}):
+                return op, rhs.args[1]
+            return None
+        else:
+            return None
+        args = list(args)
+        if len(args) != 2 or lhs not in args:
+            return None
+        args.remove(lhs)
+        if self._depends_on(args[0], {lhs.name}):
+            return None
+        return op, args[0]
+
+    def _write_accesses(self, lhs, conditional, accesses, reduction = None):
+        """ Append the writes of the variables of the left hand side of an
+        assignment """
+        if isinstance(lhs, (list, tuple, PythonTuple)):
+            for l in lhs:
+                self._write_accesses(l, conditional, accesses)
+        elif isinstance(lhs, IndexedElement):
+            for i in lhs.indices:
+                self._expression_accesses(i, conditional, accesses)
+            var = lhs.base.internal_variable
+            accesses.append(_Access(var, tuple(lhs.indices), True, conditional))
+        elif isinstance(lhs, DottedVariable):
+            raise _Unsafe('it modifies the attribute {}'.format(lhs))
+        elif isinstance(lhs, Variable):
+            if lhs.rank > 0:
+                accesses.append(_Access(lhs, None, True, conditional))
+            else:
+                accesses.append(_Access(lhs, (), True, conditional, reduction))
+        else:
+            raise _Unsafe('it assigns {}'.format(lhs))
+
+    def _expression_accesses(self, expr, conditional, accesses):
+        """ Append the reads of the variables used in the expression """
+        if isinstance(expr, (NumpyReductionBase, NumpyMatmul)):
+            raise _Unsafe('the value of {} is computed in a temporary'.format(type(expr).__name__))
+        if isinstance(expr, NumpyNewArray) and expr.rank > 0:
+            raise _Unsafe('it creates an array')
+        if isinstance(expr, PyccelAstNode) and expr.rank and \
+                any(a.rank == 0 for a in expr.atoms(NumpyRand, NumpyRandint)):
+            raise _Unsafe('the random number used in an array expression is computed in a temporary')
+        if isinstance(expr, IndexedElement):
+            for i in expr.indices:
+                self._expression_accesses(i, conditional, accesses)
+            var = expr.base.internal_variable
+            accesses.append(_Access(var, tuple(expr.indices), False, conditional))
+        elif isinstance(expr, DottedVariable):
+            raise _Unsafe('it uses the attribute {}'.format(expr))
+        elif isinstance(expr, Variable):
+            accesses.append(_Access(expr, None if expr.rank > 0 else (), False, conditional))
+        elif isinstance(expr, FunctionCall):
+            func = expr.funcdef
+            if not func.is_pure or any(func.arguments_inout):
+                raise _Unsafe('it calls {}, which may have side effects'.format(func.name))
+            if any(a.is_optional for a in func.arguments):
+                raise _Unsafe('the optional arguments of {} are passed through temporaries'.format(func.name))
+            for a in expr.arguments:
+                self._expression_accesses(a, conditional, accesses)
+        elif isinstance(expr, (list, tuple)):
+            for a in expr:
+                self._expression_accesses(a, conditional, accesses)
+        elif isinstance(expr, (Literal, IndexedVariable, FunctionDef)) or expr is None:
+            pass
+        elif isinstance(expr, Basic):
+            for a in expr.args:
+                self._expression_accesses(a, conditional, accesses)
+
+#==============================================================================
+def auto_parallelize(parser):
+    """
+    Parallelise with OpenMP the independent loops of the functions of the
+    module annotated by the semantic parser. The AST of the functions is
+    modified in place.
+
+    Parameters
+    ----------
+    parser : SemanticParser
+             The parser of the module
+
+    Returns
+    -------
+    report : list of str
+             The description of the loops which were parallelised, and the
+             reason why the other ones were not
+    """
+    parallelizer = LoopParallelizer(parser.filename)
+    for func in parser.namespace.functions.values():
+        if isinstance(func, FunctionDef) and not func.is_header:
+            parallelizer.parallelize_function(func)
+    return parallelizer.report
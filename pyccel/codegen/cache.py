@@ -0,0 +1,443 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Persistent on-disk cache of the shared libraries generated by epyccel.
+
+Every entry is stored in its own sub-folder of the cache directory. The name of
+this folder is a hash of everything which can influence the generated library:
+the Python source code, the local modules which it imports, the compilation
+options, and the version of Pyccel, Python and NumPy which are used.
+The cache has a maximum size; when it is exceeded the least recently used
+entries are removed.
+
+The location of the cache can be set with the environment variable
+PYCCEL_CACHE_DIR (default: $XDG_CACHE_HOME/pyccel or ~/.cache/pyccel), and its
+maximum size in bytes with PYCCEL_CACHE_SIZE (default: 1 GiB).
+The cache can be shared by several processes: the entries are written
+atomically, and the cache is locked (see EpyccelCache.lock) while an entry is
+added or removed.
+
+The same mechanism is used to save the parsers of the imported modules in the
+sub-folder 'parsers' of the cache (see pyccel.parser.base.get_parser_cache).
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from pyccel.version          import __version__
+from pyccel.codegen.filelock import FileLock
+
+__all__ = ['EpyccelCache',
+           'get_default_cache_dir',
+           'get_default_cache_size',
+           'get_pyccel_fingerprint',
+           'get_local_dependencies',
+           'cache_info',
+           'clear_cache']
+
+#==============================================================================
+DEFAULT_CACHE_SIZE = 1 << 30
+
+# Name of the file describing a cache entry
+_info_filename = 'info.json'
+
+# Name of the lock file of the cache
+_lock_filename = '.lock'
+
+# Files of the pyccel package which influence the generated code
+_pyccel_source_extensions = ('.py', '.pyh', '.tx', '.c', '.h', '.f90')
+
+_pyccel_fingerprint = None
+
+#==============================================================================
+def get_default_cache_dir():
+    """ Return the absolute path to the folder containing the epyccel cache
+    """
+    folder = os.environ.get('PYCCEL_CACHE_DIR')
+    if not folder:
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+        folder = os.path.join(cache_home, 'pyccel')
+    return os.path.abspath(os.path.expanduser(folder))
+
+def get_default_cache_size():
+    """ Return the maximum size (in bytes) of the epyccel cache
+    """
+    size = os.environ.get('PYCCEL_CACHE_SIZE')
+    return int(size) if size else DEFAULT_CACHE_SIZE
+
+#==============================================================================
+def get_pyccel_fingerprint():
+    """
+    Compute a hash which identifies the version of Pyccel and the environment
+    in which the shared libraries are built.
+
+    The hash covers the version number and the contents of the source files of
+    the pyccel package (so that development versions are also distinguished),
+    as well as the Python implementation and the NumPy version which determine
+    the ABI of the generated extension modules.
+    The result is computed once per process.
+
+    Returns
+    -------
+    fingerprint : str
+            The hexadecimal digest
+    """
+    global _pyccel_fingerprint # pylint: disable=global-statement
+
+    if _pyccel_fingerprint is None:
+        import numpy
+        h = hashlib.sha256()
+        h.update(' '.join([__version__, sys.version, sys.platform,
+                           numpy.__version__]).encode('utf-8'))
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('__'))
+            for f in sorted(filenames):
+                if os.path.splitext(f)[1] in _pyccel_source_extensions:
+                    filepath = os.path.join(dirpath, f)
+                    h.update(os.path.relpath(filepath, root).encode('utf-8'))
+                    with open(filepath, 'rb') as source:
+                        h.update(source.read())
+
+        _pyccel_fingerprint = h.hexdigest()
+
+    return _pyccel_fingerprint
+
+#==============================================================================
+def _find_local_module(name, level, folders):
+    """ Return the path to the .pyh/.py file defining the module 'name',
+    searching in the folders provided (or None if it is not found there)
+    """
+    filename = name.replace('.', os.sep)
+    for folder in folders:
+        for _ in range(max(level-1, 0)):
+            folder = os.path.dirname(folder)
+        for ext in ('.pyh', '.py'):
+            filepath = os.path.join(folder, filename + ext)
+            if os.path.isfile(filepath):
+                return filepath
+    return None
+
+def get_local_dependencies(code, folders):
+    """
+    Find the local files imported (directly or indirectly) by some Python code.
+
+    Only the modules which are found in the folders provided are considered:
+    modules installed in site-packages (e.g. numpy) are not part of the
+    compiled shared library.
+
+    Parameters
+    ----------
+    code    : str
+            The Python code
+
+    folders : list of str
+            The folders in which imports are resolved
+
+    Returns
+    -------
+    dependencies : dict
+            A dictionary mapping the absolute path of each imported file to
+            the hash of its contents
+    """
+    dependencies = {}
+    to_treat = [(code, [os.path.abspath(f) for f in folders])]
+
+    while to_treat:
+        code, search_folders = to_treat.pop()
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            continue
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [(a.name, 0) for a in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                # The imported objects may be submodules
+                prefix = node.module + '.' if node.module else ''
+                names  = [(prefix + a.name, node.level) for a in node.names]
+                if node.module:
+                    names.append((node.module, node.level))
+            else:
+                continue
+
+            for name, level in names:
+                filepath = _find_local_module(name, level, search_folders)
+                if filepath is None or filepath in dependencies:
+                    continue
+                with open(filepath, 'rb') as f:
+                    contents = f.read()
+                dependencies[filepath] = hashlib.sha256(contents).hexdigest()
+                to_treat.append((contents.decode('utf-8', errors='replace'),
+                                 [os.path.dirname(filepath)]))
+
+    return dependencies
+
+#==============================================================================
+class EpyccelCache:
+    """
+    Persistent cache of shared libraries indexed by a content hash.
+
+    Parameters
+    ----------
+    path     : str
+            Folder containing the cache
+            Default : provided by get_default_cache_dir
+
+    max_size : int
+            Maximum total size of the cached files in bytes
+            Default : provided by get_default_cache_size
+    """
+    def __init__(self, path = None, max_size = None):
+        self._path     = os.path.abspath(path) if path else get_default_cache_dir()
+        self._max_size = get_default_cache_size() if max_size is None else max_size
+
+    @property
+    def path(self):
+        """ Folder containing the cache """
+        return self._path
+
+    @property
+    def max_size(self):
+        """ Maximum size of the cache in bytes """
+        return self._max_size
+
+    @staticmethod
+    def make_key(code, **options):
+        """
+        Compute the key identifying a shared library.
+
+        Parameters
+        ----------
+        code    : str
+                The Python code which is translated
+
+        options : dict
+                All other parameters which influence the generated library
+                (compiler, flags, accelerator, dependencies, ...).
+                The values must be JSON serialisable.
+
+        Returns
+        -------
+        key : str
+                The hexadecimal hash of all the inputs
+        """
+        h = hashlib.sha256()
+        h.update(get_pyccel_fingerprint().encode('utf-8'))
+        h.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+        h.update(code.encode('utf-8'))
+        return h.hexdigest()
+
+    def lock(self):
+        """
+        Get an inter-process lock on the cache. It must be held to store or
+        remove entries, and to use an entry which could otherwise be evicted
+        by another process in the meantime.
+
+        Returns
+        -------
+        lock : FileLock
+                The lock (not acquired yet), to be used as a context manager
+        """
+        return FileLock(os.path.join(self._path, _lock_filename))
+
+    def _entry_path(self, key):
+        return os.path.join(self._path, key)
+
+    def _entries(self):
+        """ Iterate over the (key, folder) pairs of the valid cache entries """
+        if not os.path.isdir(self._path):
+            return
+        for key in os.listdir(self._path):
+            if key.startswith('.'):
+                # Entry which is being written
+                continue
+            folder = self._entry_path(key)
+            if os.path.isfile(os.path.join(folder, _info_filename)):
+                yield key, folder
+
+    def lookup(self, key):
+        """
+        Find the shared library stored in the cache under the given key.
+        If it exists, the entry is marked as recently used.
+
+        Parameters
+        ----------
+        key : str
+                Key returned by make_key
+
+        Returns
+        -------
+        filepath : str
+                Absolute path to the shared library, or None if the key is not
+                in the cache
+        """
+        folder    = self._entry_path(key)
+        info_file = os.path.join(folder, _info_filename)
+        try:
+            with open(info_file, 'r') as f:
+                info = json.load(f)
+            filepath = os.path.join(folder, info['filename'])
+            if not os.path.isfile(filepath):
+                return None
+            os.utime(info_file)
+        except (OSError, ValueError, KeyError):
+            return None
+        return filepath
+
+    def store(self, key, filepath, **info):
+        """
+        Copy a shared library into the cache, then evict the least recently
+        used entries if the cache is too large.
+
+        The new entry is written to a temporary folder and renamed at the end,
+        so that a partially written entry is never visible.
+
+        Parameters
+        ----------
+        key      : str
+                Key returned by make_key
+
+        filepath : str
+                Path to the shared library
+
+        info     : dict
+                Additional information saved with the entry
+
+        Returns
+        -------
+        filepath : str
+                Absolute path to the cached shared library
+        """
+        os.makedirs(self._path, exist_ok=True)
+        filename = os.path.basename(filepath)
+        folder   = self._entry_path(key)
+
+        tmp_folder = tempfile.mkdtemp(prefix='.tmp_', dir=self._path)
+        try:
+            shutil.copy2(filepath, os.path.join(tmp_folder, filename))
+            info.update(filename = filename, created = time.time())
+            with open(os.path.join(tmp_folder, _info_filename), 'w') as f:
+                json.dump(info, f, indent=1)
+            with self.lock():
+                os.rename(tmp_folder, folder)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+
+        with self.lock():
+            self.evict(keep = key)
+
+        return os.path.join(folder, filename)
+
+    def info(self):
+        """
+        Describe the contents of the cache.
+
+        Returns
+        -------
+        entries : list of dict
+                One dictionary per entry, containing the key, the size in
+                bytes, the time of the last use, and the information saved
+                when the entry was stored. The most recently used entries
+                come first.
+        """
+        entries = []
+        for key, folder in self._entries():
+            info_file = os.path.join(folder, _info_filename)
+            try:
+                with open(info_file, 'r') as f:
+                    info = json.load(f)
+                size = sum(os.path.getsize(os.path.join(folder, f)) for f in os.listdir(folder))
+                info.update(key = key, size = size, last_used = os.path.getmtime(info_file))
+            except (OSError, ValueError):
+                continue
+            entries.append(info)
+        entries.sort(key = lambda e: e['last_used'], reverse = True)
+        return entries
+
+    def size(self):
+        """ Total size of the cache entries in bytes """
+        return sum(e['size'] for e in self.info())
+
+    def evict(self, keep = None):
+        """
+        Remove the least recently used entries until the size of the cache
+        is smaller than max_size. The cache should be locked by the caller.
+
+        Parameters
+        ----------
+        keep : str
+                Key of an entry which must not be removed
+
+        Returns
+        -------
+        removed : list of str
+                The keys of the removed entries
+        """
+        entries = self.info()
+        total   = sum(e['size'] for e in entries)
+        removed = []
+        while total > self._max_size and entries:
+            entry = entries.pop()
+            if entry['key'] == keep:
+                continue
+            shutil.rmtree(self._entry_path(entry['key']), ignore_errors=True)
+            total -= entry['size']
+            removed.append(entry['key'])
+        return removed
+
+    def clear(self):
+        """ Remove all entries from the cache """
+        if os.path.isdir(self._path):
+            with self.lock():
+                for f in os.listdir(self._path):
+                    if f != _lock_filename:
+                        shutil.rmtree(os.path.join(self._path, f), ignore_errors=True)
+
+#==============================================================================
+def cache_info(path = None):
+    """
+    Describe the contents of the epyccel cache.
+
+    Parameters
+    ----------
+    path : str
+            Folder containing the cache
+            Default : provided by get_default_cache_dir
+
+    Returns
+    -------
+    info : dict
+            Dictionary containing the path, the total size and the maximum size
+            of the cache (in bytes), and the list of entries (see EpyccelCache.info)
+    """
+    cache   = EpyccelCache(path)
+    entries = cache.info()
+    return {'path'     : cache.path,
+            'size'     : sum(e['size'] for e in entries),
+            'max_size' : cache.max_size,
+            'entries'  : entries}
+
+def clear_cache(path = None):
+    """
+    Remove all entries from the epyccel cache.
+
+    Parameters
+    ----------
+    path : str
+            Folder containing the cache
+            Default : provided by get_default_cache_dir
+    """
+    EpyccelCache(path).clear()
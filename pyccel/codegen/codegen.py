@@ -5,9 +5,7 @@
 # go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
 #------------------------------------------------------------------------------------------#
 
-from pyccel.codegen.printing.fcode  import FCodePrinter
-from pyccel.codegen.printing.ccode  import CCodePrinter
-from pyccel.codegen.printing.pycode import PythonCodePrinter
+import importlib
 
 from pyccel.ast.core      import FunctionDef, Module, Program, Interface, ModuleHeader
 from pyccel.ast.core      import EmptyNode, NewLine, Comment, CommentBlock
@@ -16,12 +14,18 @@ from pyccel.errors.errors import Errors
 
 _extension_registry = {'fortran': 'f90', 'c':'c',  'python':'py'}
 _header_extension_registry = {'fortran': None, 'c':'h',  'python':None}
+# The printers are only imported when a file is generated in their language
 printer_registry    = {
-                        'fortran':FCodePrinter,
-                        'c':CCodePrinter,
-                        'python':PythonCodePrinter
+                        'fortran':('pyccel.codegen.printing.fcode', 'FCodePrinter'),
+                        'c':('pyccel.codegen.printing.ccode', 'CCodePrinter'),
+                        'python':('pyccel.codegen.printing.pycode', 'PythonCodePrinter')
                       }
 
+def get_printer_class(language):
+    """ Return the code printer class of a language (imported on first use) """
+    module_name, class_name = printer_registry[language]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class Codegen(object):
 
@@ -169,7 +173,7 @@ class Codegen(object):
         self._language = language
 
         # instantiate codePrinter
-        code_printer = printer_registry[language]
+        code_printer = get_printer_class(language)
         errors = Errors()
         errors.set_parser_stage('codegen')
         # set the code printer
@@ -0,0 +1,124 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Contains the inter-process locks which protect the folders shared by several
+builds (the __pyccel__ folders of the imported modules, the epyccel cache).
+
+A lock is an exclusive lock on a file, taken with flock on POSIX systems and
+with msvcrt.locking on Windows. As every FileLock opens its own file
+descriptor, two threads of the same process also exclude each other.
+The lock is released by the operating system if the process dies.
+"""
+
+import os
+import time
+from contextlib import ExitStack
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+__all__ = ['FileLock', 'lock_folders']
+
+#==============================================================================
+class FileLock:
+    """
+    Exclusive lock on a file, which can be used as a context manager.
+    The lock is not re-entrant.
+
+    Parameters
+    ----------
+    filepath : str
+            Path to the lock file. It is created if it does not exist
+    """
+    def __init__(self, filepath):
+        self._filepath = os.path.abspath(filepath)
+        self._fd       = None
+
+    @property
+    def filepath(self):
+        """ Path to the lock file """
+        return self._filepath
+
+    @property
+    def is_locked(self):
+        """ True if the lock is held by this object """
+        return self._fd is not None
+
+    def acquire(self):
+        """ Wait until the lock is available and take it """
+        if self._fd is not None:
+            raise RuntimeError('Lock {} is already held'.format(self._filepath))
+
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        fd = os.open(self._filepath, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                # LK_LOCK only retries for 10 seconds
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        """ Release the lock """
+        if self._fd is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+#==============================================================================
+def lock_folders(folders, filename = '.lock'):
+    """
+    Lock several folders. The locks are always taken in the same order (the
+    order of the absolute paths) so that two builds locking overlapping sets
+    of folders cannot deadlock.
+
+    Parameters
+    ----------
+    folders  : iterable of str
+            The folders to lock
+
+    filename : str
+            Name of the lock file created in each folder
+
+    Returns
+    -------
+    stack : contextlib.ExitStack
+            Context manager releasing all the locks
+    """
+    stack = ExitStack()
+    try:
+        for folder in sorted({os.path.abspath(f) for f in folders}):
+            stack.enter_context(FileLock(os.path.join(folder, filename)))
+    except BaseException:
+        stack.close()
+        raise
+    return stack
@@ -0,0 +1,174 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Contains the manifest used to skip the steps of a build whose inputs have not
+changed since the last build.
+
+Each __pyccel__ folder contains a file manifest.json which records, for each
+target built in this folder, a fingerprint of its inputs, the files it depends
+on and the files it produced. The fingerprint is a hash of the compilation
+options (including the compiler version) and of the contents of the source
+file and of all the files it depends on.
+A target is up to date if its fingerprint is unchanged and all the files it
+produced still exist.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+__all__ = ['BuildManifest', 'hash_file', 'compute_fingerprint']
+
+#==============================================================================
+def hash_file(filepath):
+    """
+    Compute the hash of the contents of a file.
+
+    Parameters
+    ----------
+    filepath : str
+            Path to the file
+
+    Returns
+    -------
+    hash : str
+            The hexadecimal digest, or None if the file does not exist
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def compute_fingerprint(options, files):
+    """
+    Compute the fingerprint of a target.
+
+    Parameters
+    ----------
+    options : dict
+            The options which influence the build. The values must be JSON
+            serialisable
+
+    files   : iterable of str
+            The source files of the target and the files it depends on
+
+    Returns
+    -------
+    fingerprint : str
+            The hexadecimal digest
+    """
+    contents = {os.path.abspath(f) : hash_file(f) for f in files}
+    data = json.dumps([options, contents], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+#==============================================================================
+class BuildManifest:
+    """
+    The manifest describing the targets built in a folder.
+
+    Parameters
+    ----------
+    folder : str
+            The folder where the targets are built (usually __pyccel__)
+    """
+    filename = 'manifest.json'
+
+    def __init__(self, folder):
+        self._filepath = os.path.join(folder, self.filename)
+        self._entries  = self._read()
+        self._modified = set()
+
+    def _read(self):
+        try:
+            with open(self._filepath, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key):
+        """ Return the entry describing the target 'key' (or None) """
+        return self._entries.get(key, None)
+
+    def is_up_to_date(self, key, fingerprint):
+        """
+        Determine whether a target needs to be rebuilt.
+
+        Parameters
+        ----------
+        key         : str
+                The name of the target
+
+        fingerprint : str
+                The fingerprint of the current inputs of the target
+
+        Returns
+        -------
+        up_to_date : bool
+                True if the target was built from the same inputs and all the
+                files it produced still exist
+        """
+        entry = self.get(key)
+        return entry is not None and entry['fingerprint'] == fingerprint and \
+                all(os.path.exists(f) for f in entry['outputs'])
+
+    def update(self, key, fingerprint, dependencies = (), outputs = ()):
+        """
+        Record that a target was built.
+
+        Parameters
+        ----------
+        key          : str
+                The name of the target
+
+        fingerprint  : str
+                The fingerprint of the inputs used for the build
+
+        dependencies : iterable of str
+                The files (other than the source file) which the target
+                depends on
+
+        outputs      : iterable of str
+                The files produced by the build
+        """
+        self._entries[key] = {'fingerprint'  : fingerprint,
+                              'dependencies' : [os.path.abspath(f) for f in dependencies],
+                              'outputs'      : [os.path.abspath(f) for f in outputs]}
+        self._modified.add(key)
+
+    def remove(self, key):
+        """ Forget the target 'key' (e.g. because its build failed) """
+        if self._entries.pop(key, None) is not None:
+            self._modified.add(key)
+
+    def save(self):
+        """
+        Write the modified entries to the manifest file.
+
+        The file is read again before writing so that the entries saved by
+        another build in the meantime are kept, and it is replaced atomically.
+        """
+        if not self._modified:
+            return
+
+        entries = self._read()
+        for key in self._modified:
+            if key in self._entries:
+                entries[key] = self._entries[key]
+            else:
+                entries.pop(key, None)
+
+        folder = os.path.dirname(self._filepath)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_filepath = tempfile.mkstemp(prefix='.manifest_', dir=folder)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f, indent=1)
+        os.replace(tmp_filepath, self._filepath)
+
+        self._entries  = entries
+        self._modified = set()
@@ -11,24 +11,41 @@ import os
 import sys
 import shutil
 from collections import OrderedDict
+from contextlib  import ExitStack
 
 from pyccel.errors.errors          import Errors, PyccelError
 from pyccel.errors.errors          import PyccelSyntaxError, PyccelSemanticError, PyccelCodegenError
 from pyccel.errors.messages        import PYCCEL_RESTRICTION_TODO
 from pyccel.parser.parser          import Parser
 from pyccel.codegen.codegen        import Codegen
+from pyccel.codegen.auto_parallel  import auto_parallelize
 from pyccel.codegen.utilities      import construct_flags
 from pyccel.codegen.utilities      import compile_files
+from pyccel.codegen.utilities      import get_compiler_version
 from pyccel.codegen.python_wrapper import create_shared_library
+from pyccel.codegen.scheduler      import BuildGraph, topological_order
+from pyccel.codegen.manifest       import BuildManifest, compute_fingerprint
+from pyccel.codegen.cache          import get_pyccel_fingerprint
+from pyccel.codegen.profiling      import Profiler
+from pyccel.codegen.filelock       import lock_folders
 
 import pyccel.stdlib as stdlib_folder
 
-__all__ = ['execute_pyccel']
+__all__ = ['execute_pyccel', 'get_module_dependencies', 'get_dependency_files',
+           'get_module_fingerprint', 'get_buildable_modules', 'get_modules_to_build']
 
 # map internal libraries to their folders inside pyccel/stdlib
 internal_libs = {
     "ndarrays" : "ndarrays",
     "pyc_math" : "math",
+    "pyc_blas" : "blas",
+    "pyc_random" : "random",
+}
+
+# map the BLAS option to the library which is linked
+blas_libs = {
+    "openblas"  : "openblas",
+    "reference" : "blas",
 }
 
 # map language to its file extension
@@ -37,6 +54,156 @@ lang_ext_dict = {
     "fortran": ".f90",
 }
 
+#==============================================================================
+def is_ignored_at_import(parser):
+    """ Return True if the module does not need to be compiled and linked
+    when it is imported
+    """
+    return parser.metavars.get('ignore_at_import', False) or \
+           parser.metavars.get('module_name', None) == 'omp_lib'
+
+#==============================================================================
+def get_module_object(parser):
+    """ Return the path (without extension) of the object file generated for
+    the module parsed by parser
+    """
+    mod_folder = os.path.join(os.path.dirname(parser.filename), "__pyccel__")
+    mod_base = os.path.splitext(os.path.basename(parser.filename))[0]
+    return os.path.join(mod_folder, mod_base)
+
+#==============================================================================
+def get_module_dependencies(parser, mods=(), folders=()):
+    """
+    Determine all .o files and all folders needed by an executable or a
+    shared library, by walking the modules imported by parser recursively
+
+    Parameters
+    ----------
+    parser  : Parser
+              The parser of the module being compiled
+
+    mods    : tuple
+              The object files (without extension) already found
+
+    folders : tuple
+              The folders already found
+
+    Returns
+    -------
+    mods    : list
+              The object files (without extension)
+
+    folders : list
+              The folders containing the object files and the module files
+    """
+    # Stop conditions
+    if is_ignored_at_import(parser):
+        return mods, folders
+
+    # Update lists
+    mod_object = get_module_object(parser)
+    mods = [*mods, mod_object]
+    folders = [*folders, os.path.dirname(mod_object)]
+
+    # Proceed recursively
+    for son in parser.sons:
+        mods, folders = get_module_dependencies(son, mods, folders)
+
+    return mods, folders
+
+#==============================================================================
+def get_dependency_files(parser):
+    """ Return the files of all the modules imported (directly or indirectly)
+    by the module parsed by parser
+    """
+    return [p.filename for p in topological_order(parser.sons, lambda p: p.sons)]
+
+#==============================================================================
+def get_module_fingerprint(parser, options):
+    """
+    Compute the fingerprint of the object file generated for a module.
+    It changes if the compilation options, the source file, or one of the
+    files imported by the module change.
+
+    Parameters
+    ----------
+    parser  : Parser
+              The parser of the module
+
+    options : dict
+              The options which influence the build
+
+    Returns
+    -------
+    fingerprint : str
+              The hexadecimal digest
+    """
+    return compute_fingerprint(options, [parser.filename, *get_dependency_files(parser)])
+
+#==============================================================================
+def get_buildable_modules(parser):
+    """
+    Find the Python modules imported (directly or indirectly) by parser which
+    are compiled by pyccel when they are out of date. Header files, modules
+    which are ignored at import, and the modules of the pyccel standard
+    library are never built.
+
+    Parameters
+    ----------
+    parser  : Parser
+              The parser of the module being compiled
+
+    Returns
+    -------
+    parsers : list of Parser
+              The parsers of the modules, in topological order
+              (a module always appears after the modules it imports)
+    """
+    stdlib_path = os.path.dirname(stdlib_folder.__file__)
+
+    def get_sons(p):
+        return [] if is_ignored_at_import(p) else p.sons
+
+    return [son for son in topological_order(parser.sons, get_sons)
+            if not is_ignored_at_import(son) and son.filename.endswith('.py')
+            and not son.filename.startswith(stdlib_path)]
+
+#==============================================================================
+def get_modules_to_build(parser, options, ignore=()):
+    """
+    Find the Python modules imported (directly or indirectly) by parser whose
+    object file is missing or out of date, i.e. whose fingerprint differs
+    from the one recorded in the manifest of their __pyccel__ folder.
+    Only the modules returned by get_buildable_modules are considered.
+
+    Parameters
+    ----------
+    parser  : Parser
+              The parser of the module being compiled
+
+    options : dict
+              The options which influence the build
+
+    ignore  : iterable of Parser
+              Parsers which must not be returned
+
+    Returns
+    -------
+    parsers : list of Parser
+              The parsers of the modules to build, in topological order
+              (a module always appears after the modules it imports)
+    """
+    to_build = []
+    for son in get_buildable_modules(parser):
+        if any(son is p for p in ignore):
+            continue
+        manifest = BuildManifest(os.path.dirname(get_module_object(son)))
+        if not manifest.is_up_to_date('object:' + son.filename,
+                                      get_module_fingerprint(son, options)):
+            to_build.append(son)
+
+    return to_build
+
 #==============================================================================
 # NOTE:
 # [..]_dirname is the name of a directory
@@ -60,7 +227,12 @@ def execute_pyccel(fname, *,
                    libs          = (),
                    debug         = False,
                    accelerator   = None,
-                   output_name   = None):
+                   auto_parallel = False,
+                   blas          = None,
+                   output_name   = None,
+                   jobs          = 1,
+                   profile       = False,
+                   cprofile      = None):
     """
     Carries out the main steps required to execute pyccel
     - Parses the python file (syntactic stage)
@@ -68,6 +240,19 @@ def execute_pyccel(fname, *,
     - Generates the translated file(s) (codegen stage)
     - Compiles the files to generate an executable and/or a shared library
 
+    The imported Python modules whose object files are missing or out of
+    date are translated and compiled too. The independent compilation steps
+    are run in parallel if more than one job is requested.
+
+    A manifest saved in the __pyccel__ folder records the fingerprint of each
+    target (see pyccel.codegen.manifest). The targets whose fingerprint has
+    not changed since the last build are not generated or compiled again.
+
+    The working directory and sys.path are not modified, and the __pyccel__
+    folders in which files are generated are locked during the build (see
+    pyccel.codegen.filelock), so that several builds can be run
+    simultaneously by different threads or processes.
+
     Parameters
     ----------
     fname         : str
@@ -133,15 +318,135 @@ def execute_pyccel(fname, *,
     accelerator   : str
                     Tool used to accelerate the code (e.g. openmp openacc)
 
+    auto_parallel : bool
+                    Parallelise with OpenMP the loops over a range whose
+                    iterations are independent (see pyccel.codegen.auto_parallel).
+                    This implies accelerator='openmp'. The report describing
+                    which loops were parallelised is saved in the file
+                    <module>_parallel.txt in the __pyccel__ folder
+                    Default : False
+
+    blas          : str
+                    BLAS library used to compute the products of matrices of
+                    double precision reals which are large enough
+                    ('openblas', 'reference' or 'none')
+                    Default : None (the products are computed by the
+                    intrinsic functions or by loops)
+
     output_name   : str
                     Name of the generated module
                     Default : Same name as the file which was translated
+
+    jobs          : int
+                    Maximum number of compilations run simultaneously
+                    Default : 1
+
+    profile       : bool or str
+                    Record the wall time and the memory usage of each stage
+                    of the pipeline for each module (see
+                    pyccel.codegen.profiling), and save them in a JSON file.
+                    If a string is provided it is the path to this file,
+                    otherwise the file <module>_profile.json is saved in the
+                    __pyccel__ folder
+                    Default : False
+
+    cprofile      : str
+                    Path to the file where the cProfile statistics of the
+                    Python stages (parsing, annotation, code generation) are
+                    saved. They can be read with the pstats module
+                    Default : None
+    """
+
+    kwargs = dict(syntax_only   = syntax_only,
+                  semantic_only = semantic_only,
+                  convert_only  = convert_only,
+                  verbose       = verbose,
+                  folder        = folder,
+                  language      = language,
+                  compiler      = compiler,
+                  mpi_compiler  = mpi_compiler,
+                  fflags        = fflags,
+                  includes      = includes,
+                  libdirs       = libdirs,
+                  modules       = modules,
+                  libs          = libs,
+                  debug         = debug,
+                  accelerator   = accelerator,
+                  auto_parallel = auto_parallel,
+                  blas          = blas,
+                  output_name   = output_name,
+                  jobs          = jobs)
+
+    # The locks taken on the __pyccel__ folders are released when the
+    # build is finished
+    locks = ExitStack()
+
+    if not (profile or cprofile):
+        with locks:
+            _execute_pyccel(fname, locks, **kwargs)
+        return
+
+    pymod_filepath = os.path.abspath(fname)
+    module_name    = os.path.splitext(os.path.basename(pymod_filepath))[0]
+    if profile and not isinstance(profile, str):
+        pyccel_dirpath = os.path.join(os.path.abspath(folder) if folder else os.path.dirname(pymod_filepath),
+                                      '__pyccel__')
+        profile = os.path.join(pyccel_dirpath, module_name + '_profile.json')
+    elif profile:
+        profile = os.path.abspath(profile)
+    cprofile = os.path.abspath(cprofile) if cprofile else None
+
+    profiler = Profiler()
+    profiler.start(cprofile = cprofile is not None)
+    try:
+        with locks:
+            _execute_pyccel(fname, locks, **kwargs)
+    finally:
+        profiler.stop()
+        if profile:
+            os.makedirs(os.path.dirname(profile), exist_ok=True)
+            profiler.write(profile,
+                           file     = pymod_filepath,
+                           language = language or 'fortran',
+                           compiler = compiler,
+                           jobs     = jobs)
+            print('> Profile has been saved: {}'.format(profile))
+        if cprofile:
+            profiler.dump_stats(cprofile)
+            print('> cProfile statistics have been saved: {}'.format(cprofile))
+
+#==============================================================================
+def _execute_pyccel(fname, locks, *,
+                    syntax_only   = False,
+                    semantic_only = False,
+                    convert_only  = False,
+                    verbose       = False,
+                    folder        = None,
+                    language      = None,
+                    compiler      = None,
+                    mpi_compiler  = None,
+                    fflags        = None,
+                    includes      = (),
+                    libdirs       = (),
+                    modules       = (),
+                    libs          = (),
+                    debug         = False,
+                    accelerator   = None,
+                    auto_parallel = False,
+                    blas          = None,
+                    output_name   = None,
+                    jobs          = 1):
+    """
+    Implementation of execute_pyccel (see its documentation).
+    The locks taken are added to the ExitStack 'locks'.
     """
 
     # Reset Errors singleton before parsing a new file
     errors = Errors()
     errors.reset()
 
+    profiler = Profiler()
+
     # TODO [YG, 03.02.2020]: test validity of function arguments
 
     # Copy list arguments to local lists to avoid unexpected behavior
@@ -150,17 +455,11 @@ def execute_pyccel(fname, *,
     modules  = [*modules]
     libs     = [*libs]
 
-    # Store current directory and add it to sys.path
-    # variable to imitate Python's import behavior
-    base_dirpath = os.getcwd()
-    sys.path.insert(0, base_dirpath)
-
-    # Unified way to handle errors: print formatted error message, then move
-    # to original working directory. Caller should then raise exception.
+    # Unified way to handle errors: print formatted error message.
+    # Caller should then raise exception.
     def handle_error(stage):
         print('\nERROR at {} stage'.format(stage))
         errors.check()
-        os.chdir(base_dirpath)
 
     # Identify absolute path, directory, and filename
     pymod_filepath = os.path.abspath(fname)
@@ -183,9 +482,6 @@ def execute_pyccel(fname, *,
     os.makedirs(folder, exist_ok=True)
     os.makedirs(pyccel_dirpath, exist_ok=True)
 
-    # Change working directory to 'folder'
-    os.chdir(folder)
-
     if language is None:
         language = 'fortran'
 
@@ -198,8 +494,24 @@ def execute_pyccel(fname, *,
 
     f90exec = mpi_compiler if mpi_compiler else compiler
 
-    if (language == "c"):
-        libs = libs + ['m']
+    if blas == 'none':
+        blas = None
+    if blas is not None and blas not in blas_libs:
+        raise ValueError('{} BLAS library is not available'.format(blas))
+    # The python code uses numpy
+    if language == 'python':
+        blas = None
+        auto_parallel = False
+
+    # The parallel loops are generated with OpenMP
+    if auto_parallel:
+        if accelerator not in (None, 'openmp'):
+            raise ValueError('The loops cannot be parallelised automatically with {}'.format(accelerator))
+        accelerator = 'openmp'
+
+    # The vectorised loops may call the simd versions of the math functions
+    # (libmvec), which are found through libm for both languages
+    libs = libs + ['m']
     if accelerator == 'openmp':
         if compiler in ["gcc","gfortran"]:
             if sys.platform == "darwin" and compiler == "gcc":
@@ -209,6 +521,8 @@ def execute_pyccel(fname, *,
 
         elif compiler == 'ifort':
             libs.append('iomp5')
+    if blas:
+        libs = libs + [blas_libs[blas]]
 
     # ...
     # Construct flags for the Fortran compiler
@@ -223,6 +537,37 @@ def execute_pyccel(fname, *,
     fflags = ' {} -fPIC '.format(fflags)
     # ...
 
+    # Options which influence the generated files. They are part of the
+    # fingerprints used to determine which targets are up to date
+    build_options = {'language'     : language,
+                     'compiler'     : compiler,
+                     'mpi_compiler' : mpi_compiler,
+                     'version'      : get_compiler_version(f90exec),
+                     'fflags'       : fflags,
+                     'includes'     : [os.path.abspath(i) for i in includes],
+                     'libdirs'      : [os.path.abspath(i) for i in libdirs],
+                     'modules'      : [os.path.abspath(i) for i in modules],
+                     'libs'         : libs,
+                     'debug'        : debug,
+                     'accelerator'  : accelerator,
+                     'auto_parallel': auto_parallel,
+                     'blas'         : blas,
+                     'pyccel'       : get_pyccel_fingerprint()}
+
+    manifest = BuildManifest(pyccel_dirpath)
+    target_key = 'target:{}:{}'.format(pymod_filepath, output_name or module_name)
+
+    # Stop here if the file and its dependencies did not change since the last build
+    if not (syntax_only or semantic_only or convert_only):
+        entry = manifest.get(target_key)
+        if entry is not None:
+            fingerprint = compute_fingerprint(build_options,
+                                              [pymod_filepath, *entry['dependencies']])
+            if manifest.is_up_to_date(target_key, fingerprint):
+                if verbose:
+                    print('> Nothing to be done, up to date: {}'.format(', '.join(entry['outputs'])))
+                return
+
     # Parse Python file
     try:
         parser = Parser(pymod_filepath, show_traceback=verbose)
@@ -269,6 +614,14 @@ def execute_pyccel(fname, *,
         parsers = [parser]
         module_names = [module_name]
 
+    # Lock the folders in which files are generated until the end of the
+    # build. They are all locked at once to avoid deadlocks
+    build_folders = [pyccel_dirpath]
+    if not convert_only:
+        build_folders += [os.path.dirname(get_module_object(son))
+                          for p in parsers for son in get_buildable_modules(p)]
+    locks.enter_context(lock_folders(build_folders))
+
     # -------------------------------------------------------------------------
     # get path to pyccel/stdlib/lib_name
     stdlib_path = os.path.dirname(stdlib_folder.__file__)
@@ -276,13 +629,21 @@ def execute_pyccel(fname, *,
     internal_libs_name = set()
     internal_libs_path = []
     internal_libs_files = []
+    built_modules = []
+    main_parser = parser
+    outputs = []
     for parser, module_name in zip(parsers, module_names):
         semantic_parser = parser.semantic_parser
+        parallel_report = []
         # Generate .f90 file
         try:
-            codegen = Codegen(semantic_parser, module_name)
-            fname = os.path.join(pyccel_dirpath, module_name)
-            fname = codegen.export(fname, language=language)
+            if auto_parallel:
+                with profiler.stage('auto-parallel', parser.filename):
+                    parallel_report += auto_parallelize(semantic_parser)
+            with profiler.stage('codegen', parser.filename):
+                codegen = Codegen(semantic_parser, module_name)
+                fname = os.path.join(pyccel_dirpath, module_name)
+                fname = codegen.export(fname, language=language, blas=blas)
         except NotImplementedError as error:
             msg = str(error)
             errors.report(msg+'\n'+PYCCEL_RESTRICTION_TODO,
@@ -296,58 +657,111 @@ def execute_pyccel(fname, *,
             handle_error('code generation')
             raise PyccelCodegenError('Code generation failed')
 
-        #------------------------------------------------------
-        # TODO: collect dependencies and proceed recursively
-        # if recursive:
-        #     for dep in parser.sons:
-        #         # Call same function on 'dep'
-        #         pass
-        #------------------------------------------------------
+        # Generate the code of the imported modules which have not been
+        # compiled yet (or whose fingerprint changed since)
+        sons_to_build = []
+        if not convert_only:
+            sons = get_modules_to_build(parser, build_options,
+                                        ignore = [*parsers, *built_modules])
+            for son in sons:
+                son_object = get_module_object(son)
+                os.makedirs(os.path.dirname(son_object), exist_ok=True)
+                try:
+                    if auto_parallel:
+                        with profiler.stage('auto-parallel', son.filename):
+                            parallel_report += auto_parallelize(son.semantic_parser)
+                    with profiler.stage('codegen', son.filename):
+                        son_codegen = Codegen(son.semantic_parser, os.path.basename(son_object))
+                        son_fname   = son_codegen.export(son_object, language=language, blas=blas)
+                except NotImplementedError as error:
+                    msg = str(error)
+                    errors.report(msg+'\n'+PYCCEL_RESTRICTION_TODO,
+                        severity='error')
+                except PyccelError:
+                    handle_error('code generation')
+                    raise PyccelCodegenError('Code generation failed') from None
+
+                if errors.has_errors():
+                    handle_error('code generation')
+                    raise PyccelCodegenError('Code generation failed')
+
+                if son_codegen.is_module:
+                    sons_to_build.append((son, son_codegen, son_fname))
+                    built_modules.append(son)
+
+        if auto_parallel:
+            report_file = os.path.join(pyccel_dirpath, module_name + '_parallel.txt')
+            with open(report_file, 'w') as f:
+                f.writelines(line + '\n' for line in parallel_report)
+            if verbose:
+                print(''.join(line + '\n' for line in parallel_report), end='')
+                print('> Parallelisation report has been saved: {}'.format(report_file))
+
+        # The compilation steps are collected in a graph describing their
+        # dependencies, so that the independent ones can be run in parallel
+        build = BuildGraph()
+        build_stages = {}
+
+        # Targets which are recorded in a manifest once the build succeeds
+        manifest_updates = []
 
         # Iterate over the internal_libs list and determine if the printer
         # requires an internal lib to be included.
+        all_codegens = [codegen, *[c for _, c, _ in sons_to_build]]
         for lib in internal_libs:
-            if lib in codegen.get_printer_imports():
+            if any(lib in c.get_printer_imports() for c in all_codegens):
                 # get the include folder path and library files
                 if lib not in internal_libs_name:
                     # get the library folder name
                     lib_name = internal_libs[lib]
                     # get lib path (stdlib_path/lib_name)
                     lib_path = os.path.join(stdlib_path, lib_name)
-                    # remove library folder to avoid missing files and copy
-                    # new one from pyccel stdlib
                     lib_dest_path = os.path.join(pyccel_dirpath, lib_name)
-                    if os.path.exists(lib_dest_path):
-                        shutil.rmtree(lib_dest_path)
-                    shutil.copytree(lib_path, lib_dest_path)
+                    lib_files = sorted(os.listdir(lib_path))
+
+                    # get library source files
+                    source_files = [os.path.join(lib_dest_path, e) for e in lib_files
+                                    if e.endswith(lang_ext_dict[language])]
+
+                    # the library only needs to be copied and compiled if
+                    # it changed since the last build
+                    lib_key = 'library:' + lib_name
+                    lib_fingerprint = compute_fingerprint(build_options,
+                            [os.path.join(lib_path, e) for e in lib_files])
+                    lib_up_to_date = manifest.is_up_to_date(lib_key, lib_fingerprint)
+
+                    if not lib_up_to_date:
+                        # remove library folder to avoid missing files and copy
+                        # new one from pyccel stdlib
+                        if os.path.exists(lib_dest_path):
+                            shutil.rmtree(lib_dest_path)
+                        shutil.copytree(lib_path, lib_dest_path)
 
                     # stop after copying lib to __pyccel__ directory for
                     # convert only
                     if convert_only:
                         continue
 
-                    # get library source files
-                    source_files = []
-                    for e in os.listdir(lib_dest_path):
-                        if e.endswith(lang_ext_dict[language]):
-                            source_files.append(os.path.join(lib_dest_path, e))
-
-                    # compile library source files
-                    flags = construct_flags(f90exec,
-                                            fflags=fflags,
-                                            debug=debug,
-                                            includes=[lib_dest_path])
-                    try:
+                    if not lib_up_to_date:
+                        # compile library source files, which may use the
+                        # headers of the libraries found before them
+                        flags = construct_flags(f90exec,
+                                                fflags=fflags,
+                                                debug=debug,
+                                                includes=[*internal_libs_path, lib_dest_path])
                         for f in source_files:
-                            compile_files(f, f90exec, flags,
+                            build.add_task(f, profiler.wrap('library compilation', f, compile_files),
+                                            f, f90exec, flags,
                                             binary=None,
                                             verbose=verbose,
                                             is_module=True,
                                             output=lib_dest_path,
                                             language=language)
-                    except Exception:
-                        handle_error('C {} library compilation'.format(lib))
-                        raise
+                            build_stages[f] = 'C {} library compilation'.format(lib)
+
+                        lib_outputs = [*[os.path.join(lib_dest_path, e) for e in lib_files],
+                                       *[os.path.splitext(f)[0] + '.o' for f in source_files]]
+                        manifest_updates.append((manifest, lib_key, lib_fingerprint, (), lib_outputs))
                     # Add internal lib to internal_libs_name set
                     internal_libs_name.add(lib)
                     # add source file without extension to internal_libs_files
@@ -358,27 +772,38 @@ def execute_pyccel(fname, *,
         if convert_only:
             continue
 
-        # ...
-        # Determine all .o files and all folders needed by executable
-        def get_module_dependencies(parser, mods=(), folders=()):
-            mod_folder = os.path.join(os.path.dirname(parser.filename), "__pyccel__")
-            mod_base = os.path.splitext(os.path.basename(parser.filename))[0]
-
-            # Stop conditions
-            if parser.metavars.get('ignore_at_import', False) or \
-               parser.metavars.get('module_name', None) == 'omp_lib':
-                return mods, folders
-
-            # Update lists
-            mods = [*mods, os.path.join(mod_folder, mod_base)]
-            folders = [*folders, mod_folder]
-
-            # Proceed recursively
-            for son in parser.sons:
-                mods, folders = get_module_dependencies(son, mods, folders)
+        # Fortran modules can only be compiled once the modules they use are
+        # compiled. For simplicity the libraries are always compiled first
+        lib_tasks = list(build_stages.keys())
+
+        # Compile the imported modules
+        for son, son_codegen, son_fname in sons_to_build:
+            _, son_inc_dirs = get_module_dependencies(son)
+            son_inc_dirs = tuple(OrderedDict.fromkeys([*son_inc_dirs, *internal_libs_path]))
+            son_flags = construct_flags(f90exec,
+                                        fflags=fflags,
+                                        debug=debug,
+                                        accelerator=accelerator,
+                                        includes=[*includes, *son_inc_dirs])
+            son_deps = [get_module_object(p) + '.o' for p in son.sons]
+            son_task = get_module_object(son) + '.o'
+            build.add_task(son_task, profiler.wrap('compilation', son.filename, compile_files),
+                            son_fname, f90exec, son_flags,
+                            binary=None,
+                            verbose=verbose,
+                            is_module=True,
+                            output=os.path.dirname(son_fname),
+                            language=language,
+                            dependencies=[*lib_tasks, *son_deps])
+            build_stages[son_task] = 'Fortran compilation'
 
-            return mods, folders
+            son_manifest = BuildManifest(os.path.dirname(son_fname))
+            manifest_updates.append((son_manifest, 'object:' + son.filename,
+                                     get_module_fingerprint(son, build_options),
+                                     get_dependency_files(son), [son_task]))
 
+        # ...
+        # Determine all .o files and all folders needed by executable
         dep_mods, inc_dirs = get_module_dependencies(parser)
 
         # Add internal dependencies
@@ -408,26 +833,45 @@ def execute_pyccel(fname, *,
         # TODO: stop at object files, do not compile executable
         #       This allows for properly linking program to modules
         #
+        build.add_task(fname, profiler.wrap('compilation', parser.filename, compile_files),
+                        fname, f90exec, flags,
+                        binary=os.path.join(folder, module_name) if codegen.is_program else None,
+                        verbose=verbose,
+                        modules=modules,
+                        is_module=codegen.is_module,
+                        output=pyccel_dirpath,
+                        libs=libs,
+                        libdirs=libdirs,
+                        language=language,
+                        dependencies=build_stages.keys())
+        build_stages[fname] = 'Fortran compilation'
+
+        # The object file of a module can also be reused when it is imported
+        mod_object = os.path.join(pyccel_dirpath, module_name) + '.o'
+        if codegen.is_module and os.path.isfile(parser.filename) and \
+                get_module_object(parser) + '.o' == mod_object:
+            manifest_updates.append((manifest, 'object:' + parser.filename,
+                                     get_module_fingerprint(parser, build_options),
+                                     get_dependency_files(parser), [mod_object]))
+
         try:
-            compile_files(fname, f90exec, flags,
-                            binary=None,
-                            verbose=verbose,
-                            modules=modules,
-                            is_module=codegen.is_module,
-                            output=pyccel_dirpath,
-                            libs=libs,
-                            libdirs=libdirs,
-                            language=language)
+            build.run(jobs)
         except Exception:
-            handle_error('Fortran compilation')
+            handle_error(build_stages.get(build.failed, 'compilation'))
             raise
 
+        for m, key, fingerprint, dependencies, files in manifest_updates:
+            m.update(key, fingerprint, dependencies, files)
+            m.save()
+
         # For a program stop here
         if codegen.is_program:
+            exec_filepath = os.path.join(folder, module_name)
+            if sys.platform == "win32":
+                exec_filepath += '.exe'
+            outputs.append(exec_filepath)
             if verbose:
-                exec_filepath = os.path.join(folder, module_name)
                 print( '> Executable has been created: {}'.format(exec_filepath))
-            os.chdir(base_dirpath)
             continue
 
         # Create shared library
@@ -463,18 +907,27 @@ def execute_pyccel(fname, *,
             raise PyccelCodegenError('Code generation failed')
 
         # Move shared library to folder directory
-        # (First construct absolute path of target location)
+        # (First construct absolute path of target location). The file is
+        # replaced atomically, so that it is never seen partially written
         sharedlib_filename = os.path.basename(sharedlib_filepath)
         target = os.path.join(folder, sharedlib_filename)
-        shutil.move(sharedlib_filepath, target)
+        os.replace(sharedlib_filepath, target)
         sharedlib_filepath = target
+        outputs.append(sharedlib_filepath)
 
         if verbose:
             print( '> Shared library has been created: {}'.format(sharedlib_filepath))
 
+    # Record the fingerprint of the target so that it is not built again
+    # until one of its inputs is modified. A build which emitted warnings is
+    # never up to date, so that the warnings are printed again
+    if not convert_only and not errors.has_warnings():
+        dependencies = get_dependency_files(main_parser)
+        manifest.update(target_key,
+                        compute_fingerprint(build_options, [pymod_filepath, *dependencies]),
+                        dependencies, outputs)
+        manifest.save()
+
     # Print all warnings now
     if errors.has_warnings():
         errors.check()
-
-    # Change working directory back to starting point
-    os.chdir(base_dirpath)
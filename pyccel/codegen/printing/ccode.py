@@ -9,20 +9,22 @@ import functools
 import operator
 
 from sympy.core           import Tuple
+from pyccel.ast.basic     import PyccelAstNode
 from pyccel.ast.builtins  import PythonRange, PythonFloat, PythonComplex
 
-from pyccel.ast.core      import Declare, IndexedVariable, Slice, ValuedVariable
+from pyccel.ast.core      import Declare, IndexedVariable, IndexedElement, Slice, ValuedVariable
 from pyccel.ast.core      import FuncAddressDeclare, FunctionCall
 from pyccel.ast.core      import Deallocate
 from pyccel.ast.core      import FunctionAddress, PyccelArraySize
 from pyccel.ast.core      import Nil, IfTernaryOperator
-from pyccel.ast.core      import Assign, datatype, Variable, Import
+from pyccel.ast.core      import Assign, datatype, Variable, Import, Return
 from pyccel.ast.core      import SeparatorComment, VariableAddress
 from pyccel.ast.core      import DottedName
+from pyccel.ast.core      import OmpAnnotatedComment, Omp_End_Clause
 from pyccel.ast.core      import create_incremented_string
 
 from pyccel.ast.operators import PyccelAdd, PyccelMul, PyccelMinus, PyccelLt, PyccelGt
-from pyccel.ast.operators import PyccelAssociativeParenthesis
+from pyccel.ast.operators import PyccelAssociativeParenthesis, PyccelOperator
 from pyccel.ast.operators import PyccelUnarySub, PyccelLt
 
 from pyccel.ast.datatypes import default_precision, str_dtype
@@ -32,7 +34,9 @@ from pyccel.ast.literals  import LiteralTrue, LiteralImaginaryUnit, LiteralFloat
 from pyccel.ast.literals  import LiteralString, LiteralInteger, Literal
 
 from pyccel.ast.numpyext import NumpyFull, NumpyArray
-from pyccel.ast.numpyext import NumpyReal, NumpyImag, NumpyFloat
+from pyccel.ast.numpyext import NumpyReal, NumpyImag, NumpyFloat, NumpyUfuncBase
+from pyccel.ast.numpyext import NumpyReductionBase, NumpySum, NumpyProduct, NumpyMin, NumpyMax, NumpyNorm
+from pyccel.ast.numpyext import NumpyMatmul, NumpyRand, NumpyRandint
 
 
 from pyccel.codegen.printing.codeprinter import CodePrinter
@@ -49,6 +53,18 @@ errors = Errors()
 
 __all__ = ["CCodePrinter", "ccode"]
 
+# Number of elements added by the vectorised loops of the real and complex
+# sums before the compensated summation of the partial sums
+REDUCTION_BLOCK_SIZE = 128
+# Number of elements above which the reductions are computed in parallel
+# when the code is compiled with openmp
+REDUCTION_PARALLEL_SIZE = 32768
+
+# OpenMP constructs which apply to the statement following them, rather than
+# to a block
+omp_statement_constructs = ('for', 'for simd', 'simd', 'parallel for', 'parallel for simd',
+        'taskloop', 'taskloop simd', 'atomic', 'barrier', 'taskwait')
+
 # dictionary mapping sympy function to (argument_conditions, C_function).
 # Used in CCodePrinter._print_Function(self)
 known_functions = {
@@ -79,8 +95,6 @@ known_functions = {
 numpy_ufunc_to_c_real = {
     'NumpyAbs'  : 'fabs',
     'NumpyFabs'  : 'fabs',
-    'NumpyMin'  : 'minval',
-    'NumpyMax'  : 'maxval',
     'NumpyFloor': 'floor',  # TODO: might require special treatment with casting
     # ---
     'NumpyExp' : 'exp',
@@ -104,8 +118,6 @@ numpy_ufunc_to_c_real = {
 
 numpy_ufunc_to_c_complex = {
     'NumpyAbs'  : 'cabs',
-    'NumpyMin'  : 'minval',
-    'NumpyMax'  : 'maxval',
     # ---
     'NumpyExp' : 'cexp',
     'NumpyLog' : 'clog',
@@ -220,6 +232,9 @@ ndarray_type_registry = {('real',8)    : 'nd_double',
 
 import_dict = {'omp_lib' : 'omp' }
 
+# MAX_NDIM in ndarrays.h
+ndarray_max_rank = 15
+
 class CCodePrinter(CodePrinter):
     """A printer to convert python expressions to strings of c code"""
     printmethod = "_ccode"
@@ -240,18 +255,26 @@ class CCodePrinter(CodePrinter):
             errors.set_target(parser.filename, 'file')
 
         prefix_module = None if settings is None else settings.pop('prefix_module', None)
+        blas = None if settings is None else settings.pop('blas', None)
         CodePrinter.__init__(self, settings)
         self.known_functions = dict(known_functions)
         userfuncs = {} if settings is None else settings.get('user_functions', {})
         self.known_functions.update(userfuncs)
         self._dereference = set([] if settings is None else settings.get('dereference', []))
         self.prefix_module = prefix_module
+        # BLAS library used to compute the products of matrices, if any
+        self._blas = blas
         self._additional_imports = set(['stdlib'])
         self._parser = parser
         self._additional_code = ''
         self._additional_declare = []
         self._additional_args = []
         self._temporary_args = []
+        self._loop_indices = []
+        self._current_function = None
+        self._scratch_mark = None
+        # number of loops and OpenMP parallel regions containing the printed code
+        self._loop_level = 0
 
     def get_additional_imports(self):
         """return the additional imports collected in printing stage"""
@@ -345,8 +368,17 @@ class CCodePrinter(CodePrinter):
         return 'continue;'
 
     def _print_While(self, expr):
+        self._loop_level += 1
         body = self._print(expr.body)
+        self._loop_level -= 1
+        code = self._additional_code
+        self._additional_code = ''
         cond = self._print(expr.test)
+        if self._additional_code:
+            # the code computing the condition is run at each iteration
+            body = '{}if (!({}))\n{{\nbreak;\n}}\n{}'.format(self._additional_code, cond, body)
+            cond = '1'
+        self._additional_code = code
         return 'while({condi})\n{{\n{body}\n}}'.format(condi = cond, body = body)
 
     def _print_If(self, expr):
@@ -568,7 +600,11 @@ class CCodePrinter(CodePrinter):
         dtype = self.find_in_dtype_registry(dtype, prec)
         if rank > 0:
             if expr.is_ndarray:
-                return 't_ndarray '
+                self._additional_imports.add('ndarrays')
+                if rank > ndarray_max_rank:
+                    errors.report(PYCCEL_RESTRICTION_TODO, symbol="rank > {}".format(ndarray_max_rank),
+                            severity='fatal')
+                return 't_ndarray *' if self.stored_in_c_pointer(expr) else 't_ndarray '
             errors.report(PYCCEL_RESTRICTION_TODO, symbol="rank > 0",severity='fatal')
 
         if self.stored_in_c_pointer(expr):
@@ -599,6 +635,9 @@ class CCodePrinter(CodePrinter):
         declaration_type = self.get_declare_type(expr.variable)
         variable = self._print(expr.variable.name)
 
+        if declaration_type.strip() == 't_ndarray':
+            # the data pointer is used to know if the array is allocated
+            return '{0}{1} = {{.raw_data = NULL}};'.format(declaration_type, variable)
         return '{0}{1};'.format(declaration_type, variable)
 
     def _print_NativeBool(self, expr):
@@ -627,6 +666,8 @@ class CCodePrinter(CodePrinter):
         elif len(expr.results) > 1:
             ret_type = self._print(datatype('int')) + ' '
             args += [a.clone(name = a.name, is_pointer =True) for a in expr.results]
+            # the results are passed by address
+            self._additional_args.append(expr.results)
         else:
             ret_type = self._print(datatype('void')) + ' '
         name = expr.name
@@ -636,6 +677,8 @@ class CCodePrinter(CodePrinter):
             arg_code = ', '.join('{}'.format(self.function_signature(i))
                         if isinstance(i, FunctionAddress) else '{0}{1}'.format(self.get_declare_type(i), i)
                         for i in args)
+        if len(expr.results) > 1:
+            self._additional_args.pop()
         if isinstance(expr, FunctionAddress):
             return '{}(*{})({})'.format(ret_type, name, arg_code)
         else:
@@ -664,20 +707,56 @@ class CCodePrinter(CodePrinter):
         #set dtype to the C struct types
         dtype = self._print(expr.dtype)
         dtype = self.find_in_ndarray_type_registry(dtype, expr.precision)
-        base_name = self._print(base.name)
+        base_name = self._print(base)
         if base.is_ndarray:
             if expr.rank > 0:
+                #the missing indices select the whole dimension
+                inds += [Slice(None, None)] * (base.rank - len(inds))
                 #managing the Slice input
                 for i , ind in enumerate(inds):
                     if isinstance(ind, Slice):
-                        inds[i] = self._new_slice_with_processed_arguments(ind, PyccelArraySize(base, i),
-                            allow_negative_indexes)
-                inds = [self._print(i) for i in inds]
+                        inds[i] = self._print(self._new_slice_with_processed_arguments(ind,
+                            PyccelArraySize(base, i), allow_negative_indexes))
+                    else:
+                        #the dimensions indexed by an integer are removed from the view
+                        inds[i] = "new_element({})".format(self._print(ind))
                 return "array_slicing(%s, %s)" % (base_name, ", ".join(inds))
-            inds = [self._print(i) for i in inds]
         else:
             raise NotImplementedError(expr)
-        return "%s.%s[get_index(%s, %s)]" % (base_name, dtype, base_name, ", ".join(inds))
+        return "%s.%s[%s]" % (base_name, dtype, self._print_flat_index(base, base_name, inds))
+
+    def _print_flat_index(self, base, base_name, inds):
+        """ Print the position of an element in the data buffer of an array
+
+        Arrays allocated by the function are C contiguous, so the position is
+        computed directly (the stride of the last dimension is 1). The strides
+        of the array arguments and of the views are only known at run time, so
+        the inline accessors get_index_<rank> of ndarrays.h are used instead.
+
+        Parameters
+        ----------
+            base : Variable
+                the indexed array
+            base_name : str
+                the printed name of the array
+            inds : list
+                the indices of the element
+        Returns
+        -------
+            str
+        """
+        if len(inds) > 4:
+            inds = [self._print(i) for i in inds]
+            return "get_index(%s, %s)" % (base_name, ", ".join(inds))
+        if base.is_pointer or base.is_argument:
+            inds = [self._print(i) for i in inds]
+            return "get_index_%d(%s, %s)" % (len(inds), base_name, ", ".join(inds))
+
+        inds = [i if isinstance(i, (Variable, Literal)) else PyccelAssociativeParenthesis(i)
+                for i in inds]
+        inds = [self._print(i) for i in inds]
+        terms = ["%s * %s.strides[%d]" % (ind, base_name, i) for i, ind in enumerate(inds[:-1])]
+        return " + ".join(terms + [inds[-1]])
 
     @staticmethod
     def _new_slice_with_processed_arguments(_slice, array_size, allow_negative_index):
@@ -731,13 +810,13 @@ class CCodePrinter(CodePrinter):
         return Slice(start, stop, step)
 
     def _print_PyccelArraySize(self, expr):
-        return '{}.shape[{}]'.format(expr.arg, expr.index)
+        return '{}.shape[{}]'.format(self._print(expr.arg), expr.index)
 
     def _print_Allocate(self, expr):
         free_code = ''
         #free the array if its already allocated and checking if its not null if the status is unknown
         if  (expr.status == 'unknown'):
-            free_code = 'if (%s.shape != NULL)\n' % self._print(expr.variable.name)
+            free_code = 'if (%s.raw_data != NULL)\n' % self._print(expr.variable)
             free_code += "{{\n{};\n}}\n".format(self._print(Deallocate(expr.variable)))
         elif  (expr.status == 'allocated'):
             free_code += self._print(Deallocate(expr.variable))
@@ -747,14 +826,57 @@ class CCodePrinter(CodePrinter):
         shape = ", ".join(a for a in shape)
         dtype = self._print(expr.variable.dtype)
         dtype = self.find_in_ndarray_type_registry(dtype, expr.variable.precision)
-        shape_dtype = self.find_in_dtype_registry('int', 4)
+        shape_dtype = self.find_in_dtype_registry('int', 8)
         shape_Assign = "("+ shape_dtype +"[]){" + shape + "}"
-        alloc_code = "{} = array_create({}, {}, {});".format(expr.variable, len(expr.shape), shape_Assign, dtype)
+        data = self._allocation_memory(expr)
+        if data:
+            alloc_code = "{} = array_create_with_data({}, {}, {}, {});".format(self._print(expr.variable),
+                    len(expr.shape), shape_Assign, dtype, data)
+        else:
+            alloc_code = "{} = array_create({}, {}, {});".format(self._print(expr.variable), len(expr.shape), shape_Assign, dtype)
         return '{}\n{}'.format(free_code, alloc_code)
 
+    def _allocation_memory(self, expr):
+        """ Print the allocation of the memory of the array allocated by expr
+        when it is not allocated by array_create with malloc:
+        - the stack arrays are allocated with alloca
+        - the local arrays of a function which are allocated once, outside of
+          the loops, use the scratch memory which is released at once when the
+          function returns, so the functions called in loops do not call malloc
+        The arrays returned by the function are always allocated with malloc.
+
+        Parameters
+        ----------
+            expr : Allocate
+                The allocation of the array
+        Returns
+        -------
+            str or None
+        """
+        variable = expr.variable
+        func = self._current_function
+        if func is not None and variable.name in [r.name for r in func.results]:
+            return None
+        if variable.is_stack_array:
+            allocator = 'alloca'
+        elif func is not None and expr.status == 'unallocated' and self._loop_level == 0:
+            # the returns printed before the first use of the scratch memory
+            # cannot be reached after it, so the mark is created here
+            if self._scratch_mark is None:
+                self._scratch_mark = self._parser.get_new_name('scratch')
+            allocator = 'scratch_alloc'
+        else:
+            return None
+        dtype = self.find_in_dtype_registry(self._print(variable.dtype), variable.precision)
+        shape = [i if isinstance(i, (Variable, Literal)) else PyccelAssociativeParenthesis(i)
+                for i in expr.shape]
+        size = ' * '.join([self._print(i) for i in shape] + ['sizeof({})'.format(dtype)])
+        return '{}({})'.format(allocator, size)
+
     def _print_Deallocate(self, expr):
         if expr.variable.is_pointer:
-            return 'free_pointer({});'.format(self._print(expr.variable))
+            # the shape and strides of a view are stored in the t_ndarray
+            return ''
         return 'free_array({});'.format(self._print(expr.variable))
 
     def _print_Slice(self, expr):
@@ -912,11 +1034,25 @@ class CCodePrinter(CodePrinter):
     def _print_FunctionAddress(self, expr):
         return expr.name
 
-    def _print_Rand(self, expr):
-        raise NotImplementedError("Rand not implemented")
+    def _print_NumpyRand(self, expr):
+        if expr.rank != 0:
+            errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr, severity='fatal')
+        self._additional_imports.add('pyc_random')
+        return 'pyc_random_uniform()'
 
     def _print_NumpyRandint(self, expr):
-        raise NotImplementedError("Randint not implemented")
+        if expr.rank != 0:
+            errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr, severity='fatal')
+        self._additional_imports.add('pyc_random')
+        if expr.high is None:
+            low, high = LiteralInteger(0), expr.low
+        else:
+            low, high = expr.low, expr.high
+        return 'pyc_randint({}, {})'.format(self._print(low), self._print(high))
+
+    def _print_NumpyRandomSeed(self, expr):
+        self._additional_imports.add('pyc_random')
+        return 'pyc_random_seed({});'.format(self._print(expr.seed))
 
     def _print_Interface(self, expr):
         return ""
@@ -925,13 +1061,22 @@ class CCodePrinter(CodePrinter):
 
         if len(expr.results) > 1:
             self._additional_args.append(expr.results)
+        self._current_function = expr
         body  = self._print(expr.body)
         decs  = [Declare(i.dtype, i) if isinstance(i, Variable) else FuncAddressDeclare(i) for i in expr.local_vars]
         if len(expr.results) <= 1 :
             decs += [Declare(i.dtype, i) if isinstance(i, Variable) else FuncAddressDeclare(i) for i in expr.results]
         decs += [Declare(i.dtype, i) for i in self._additional_declare]
-        decs  = '\n'.join(self._print(i) for i in decs)
+        decs  = [self._print(i) for i in decs]
+        if self._scratch_mark:
+            # the scratch memory used by the local arrays is released when the function returns
+            decs.append('t_scratch_mark {} = scratch_mark();'.format(self._scratch_mark))
+            if not (expr.body.body and isinstance(expr.body.body[-1], Return)):
+                body += '\nscratch_release({});'.format(self._scratch_mark)
+        decs  = '\n'.join(decs)
         self._additional_declare.clear()
+        self._current_function = None
+        self._scratch_mark = None
 
         sep = self._print(SeparatorComment(40))
         if self._additional_args :
@@ -1011,6 +1156,8 @@ class CCodePrinter(CodePrinter):
         args = [VariableAddress(a) if self.stored_in_c_pointer(a) else a for a in expr.expr]
         if expr.stmt:
             code += self._print(expr.stmt)+'\n'
+        if self._scratch_mark:
+            code += 'scratch_release({});\n'.format(self._scratch_mark)
         if len(args) == 1:
             code +='return {0};'.format(self._print(args[0]))
         elif len(args) > 1:
@@ -1046,6 +1193,9 @@ class CCodePrinter(CodePrinter):
         else:
             args = expr.args
         code = ' / '.join(self._print(a) for a in args)
+        if expr.dtype is NativeInteger():
+            type_name = self.find_in_dtype_registry('int', expr.precision)
+            return "({})floor({})".format(type_name, code)
         return "floor({})".format(code)
 
     def _print_PyccelRShift(self, expr):
@@ -1082,8 +1232,12 @@ class CCodePrinter(CodePrinter):
         return '-{}'.format(self._print(expr.args[0]))
 
     def _print_AugAssign(self, expr):
-        lhs_code = self._print(expr.lhs)
         op = expr.op._symbol
+        if isinstance(expr.rhs, NumpyReductionBase):
+            return self._print_reduction(expr.lhs, expr.rhs, op)
+        if expr.lhs.rank > 0 and self._is_elementwise(expr.rhs):
+            return self._print_array_assign(expr.lhs, expr.rhs, op)
+        lhs_code = self._print(expr.lhs)
         rhs_code = self._print(expr.rhs)
         return "{0} {1}= {2};".format(lhs_code, op, rhs_code)
 
@@ -1119,29 +1273,542 @@ class CCodePrinter(CodePrinter):
                 return ''
             return '{}\n'.format(code_init)
 
+        if isinstance(rhs, NumpyReductionBase):
+            return self._print_reduction(expr.lhs, rhs)
+
+        if isinstance(rhs, NumpyMatmul):
+            return self._print_matmul(expr.lhs, rhs)
+
+        if expr.lhs.rank > 0 and self._is_elementwise(rhs):
+            return self._print_array_assign(expr.lhs, rhs)
+
         rhs = self._print(rhs)
         return '{} = {};'.format(lhs, rhs)
 
+    @staticmethod
+    def _array_base(expr):
+        """ Get the array variable of a Variable or of an IndexedElement """
+        return expr.base.internal_variable if isinstance(expr, IndexedElement) else expr
+
+    def _is_elementwise(self, expr):
+        """ Indicate if the rank > 0 expression can be computed element by
+        element in a loop nest, i.e. if it only contains arrays, scalars and
+        element-wise operators or numpy universal functions
+        """
+        if not isinstance(expr, PyccelAstNode):
+            return False
+        if expr.rank == 0:
+            return True
+        if isinstance(expr, (Variable, IndexedElement)):
+            base = self._array_base(expr)
+            return isinstance(base, Variable) and base.is_ndarray
+        if isinstance(expr, (PyccelOperator, NumpyUfuncBase)):
+            return all(self._is_elementwise(a) for a in expr.args)
+        # the random arrays are drawn one element at a time
+        return isinstance(expr, (NumpyRand, NumpyRandint))
+
+    def _is_random(self, expr):
+        """ Indicate if the expression draws random numbers, so its elements
+        must be computed one after the other
+        """
+        if isinstance(expr, (NumpyRand, NumpyRandint)):
+            return True
+        if isinstance(expr, (PyccelOperator, NumpyUfuncBase)):
+            return any(self._is_random(a) for a in expr.args)
+        return False
+
+    def _array_loop_indices(self, rank):
+        """ Get the variables used as indices of the loops computing the array
+        expressions. The names are reused by all the loop nests as the indices
+        are declared in the for statements
+        """
+        while len(self._loop_indices) < rank:
+            name = self._parser.get_new_name('i')
+            self._loop_indices.append(Variable('int', name, precision = 8))
+        return self._loop_indices[:rank]
+
+    def _array_loop_ranges(self, expr):
+        """ Get the element indices of the array expr (a Variable or an
+        IndexedElement) which are scanned by a loop, and the number of
+        iterations of these loops
+
+        Returns
+        -------
+            inds : list
+                The indices of all the dimensions of the base array. The
+                loops scan the dimensions whose index is a Slice
+            extents : list of str
+                The number of iterations of each loop
+        """
+        base = self._array_base(expr)
+        inds = list(expr.indices) if isinstance(expr, IndexedElement) else []
+        inds += [Slice(None, None)] * (base.rank - len(inds))
+        allow_negative_indexes = isinstance(expr, IndexedElement) and base.allows_negative_indexes
+
+        extents = []
+        for i, ind in enumerate(inds):
+            if not isinstance(ind, Slice):
+                continue
+            size = PyccelArraySize(base, i)
+            _slice = self._new_slice_with_processed_arguments(ind, size, allow_negative_indexes)
+            start, stop, step = _slice.start, _slice.stop, _slice.step
+            if isinstance(step, PyccelUnarySub) and ind.stop is None:
+                # the first element is included
+                stop = LiteralInteger(-1)
+            inds[i] = Slice(start, stop, step)
+
+            extent = stop if start == LiteralInteger(0) else PyccelMinus(stop, start)
+            if step == LiteralInteger(1):
+                extents.append(self._print(extent))
+            else:
+                # the number of iterations is rounded up
+                if isinstance(step, PyccelUnarySub):
+                    extent = PyccelAdd(extent, PyccelAdd(step, LiteralInteger(1)))
+                else:
+                    extent = PyccelAdd(extent, PyccelMinus(step, LiteralInteger(1)))
+                extents.append('({}) / {}'.format(self._print(extent), self._print(step)))
+        return inds, extents
+
+    def _array_element(self, expr, indices):
+        """ Get the element of the rank > 0 expression expr which is computed at
+        the iteration indices of the loop nest. The trailing dimensions of expr
+        match the loops, as in numpy's broadcasting
+        """
+        if expr.rank == 0:
+            if self._is_random(expr):
+                # the scalar is drawn once, not for each element
+                tmp = Variable(expr.dtype, self._parser.get_new_name('tmp'), precision = expr.precision)
+                self._additional_declare.append(tmp)
+                self._additional_code += self._print(Assign(tmp, expr)) + '\n'
+                return tmp
+            return expr
+        if isinstance(expr, (PyccelOperator, NumpyUfuncBase)):
+            return type(expr)(*[self._array_element(a, indices) for a in expr.args])
+        if isinstance(expr, NumpyRand):
+            return NumpyRand()
+        if isinstance(expr, NumpyRandint):
+            return NumpyRandint(expr.low, expr.high)
+
+        base = self._array_base(expr)
+        inds, _ = self._array_loop_ranges(expr)
+        loop_indices = iter(indices[len(indices) - expr.rank:])
+        for i, ind in enumerate(inds):
+            if isinstance(ind, Slice):
+                k = next(loop_indices)
+                if ind.step != LiteralInteger(1):
+                    k = PyccelMul(k, ind.step)
+                inds[i] = k if ind.start == LiteralInteger(0) else PyccelAdd(ind.start, k)
+        indexed = IndexedVariable(base, dtype = base.dtype, shape = base.shape,
+                prec = base.precision, order = base.order, rank = base.rank)
+        return indexed[inds]
+
+    def _array_leaves(self, expr):
+        """ Get the arrays (Variables and IndexedElements) used in the rank > 0
+        element-wise expression expr
+        """
+        if expr.rank == 0 or isinstance(expr, (NumpyRand, NumpyRandint)):
+            return []
+        if isinstance(expr, (PyccelOperator, NumpyUfuncBase)):
+            return [l for a in expr.args for l in self._array_leaves(a)]
+        return [expr]
+
+    def _print_array_loops(self, indices, extents, body, order, vectorise = True):
+        """ Print the loop nest scanning the elements of an array of order
+        order. The innermost loop scans the contiguous dimension and is
+        vectorised, unless vectorise is False
+        """
+        int_type = self.find_in_dtype_registry('int', 8)
+        loops = list(zip(indices, extents))
+        if order == 'F':
+            loops = loops[::-1]
+        code = body
+        for i, (index, extent) in enumerate(reversed(loops)):
+            index = self._print(index)
+            code = ('for ({type} {index} = 0; {index} < {extent}; {index}++)\n'
+                    '{{\n{body}\n}}').format(type = int_type, index = index,
+                            extent = extent, body = code)
+            if i == 0 and vectorise:
+                code = '#pragma omp simd\n' + code
+        return code
+
+    def _print_array_assign(self, lhs, rhs, op = ''):
+        """ Print the assignment (or the augmented assignment with the operator
+        op) of the element-wise expression rhs to the array lhs. The elements
+        are computed one at a time by a loop nest, so no temporary array is
+        created unless the right hand side reads elements of lhs which are
+        modified before they are used.
+
+        Parameters
+        ----------
+            lhs : Variable or IndexedElement
+                The array which is assigned
+            rhs : PyccelAstNode
+                The element-wise expression
+            op : str
+                The operator of an augmented assignment
+        Returns
+        -------
+            str
+        """
+        _, extents = self._array_loop_ranges(lhs)
+        indices = self._array_loop_indices(len(extents))
+        lhs_base = self._array_base(lhs)
+        lhs_element = self._array_element(lhs, indices)
+        rhs_element = self._array_element(rhs, indices)
+
+        # numpy computes the right hand side before the assignment, so the
+        # elements of lhs (or of an array which may share its data) can only
+        # be read at the position where they are written
+        lhs_code = self._print(lhs_element)
+        aliases = [l for l in self._array_leaves(rhs) if lhs_base.is_pointer or
+                self._array_base(l).is_pointer or self._array_base(l).name == lhs_base.name]
+        overlap = any(self._print(self._array_element(l, indices)) != lhs_code for l in aliases)
+
+        vectorise = not self._is_random(rhs)
+
+        if not overlap:
+            body = '{} {}= {};'.format(lhs_code, op, self._print(rhs_element))
+            return self._print_array_loops(indices, extents, body, lhs_base.order, vectorise)
+
+        tmp = Variable(rhs.dtype, self._parser.get_new_name('tmp'), rank = len(extents),
+                precision = rhs.precision, allocatable = True)
+        tmp_element = IndexedVariable(tmp, dtype = tmp.dtype, prec = tmp.precision,
+                rank = tmp.rank)[indices]
+        tmp_code = self._print(tmp_element)
+        dtype = self.find_in_ndarray_type_registry(self._print(tmp.dtype), tmp.precision)
+        shape_dtype = self.find_in_dtype_registry('int', 8)
+        alloc_code = '{} = array_create({}, ({}[]){{{}}}, {});'.format(self._print(tmp),
+                tmp.rank, shape_dtype, ', '.join(extents), dtype)
+        compute = self._print_array_loops(indices, extents,
+                '{} = {};'.format(tmp_code, self._print(rhs_element)), 'C', vectorise)
+        assign = self._print_array_loops(indices, extents,
+                '{} {}= {};'.format(lhs_code, op, tmp_code), 'C')
+        return '{{\n{}\n{}\n{}\n{}\n{}\n}}'.format(self._print(Declare(tmp.dtype, tmp)),
+                alloc_code, compute, assign, self._print(Deallocate(tmp)))
+
+    #============================== Reductions ================================
+    def _print_NumpyReductionBase(self, expr):
+        """ Print a numpy reduction of all the elements of an array used in an
+        expression. The result is computed in a temporary variable by a loop
+        nest which is printed before the current statement
+        """
+        if expr.rank > 0:
+            errors.report("Reductions along an axis can only be assigned to an array",
+                    symbol=expr, severity='fatal')
+        tmp = Variable(expr.dtype, self._parser.get_new_name('tmp'), precision = expr.precision)
+        self._additional_declare.append(tmp)
+        self._additional_code += self._print_reduction(tmp, expr) + '\n'
+        return self._print(tmp)
+
+    def _print_reduction(self, lhs, expr, op = ''):
+        """ Print the loop nest computing the numpy reduction expr and storing
+        (or with the operator op of an augmented assignment, accumulating)
+        its result in lhs, which is a scalar or an array whose rank is the
+        rank of the reduced array minus one when the reduction is along an
+        axis.
+
+        The elements are scanned in memory order and each result is computed
+        in a local accumulator:
+        - The real and complex sums (and the norms) add blocks of
+          REDUCTION_BLOCK_SIZE elements in vectorised loops and accumulate the
+          partial sums with Kahan's compensated summation, so the rounding
+          error does not grow with the number of elements
+        - The loop computing a scalar, or the outermost loop over the
+          elements of an array result, is parallelised with OpenMP when the
+          code is compiled with openmp, each thread keeping its own
+          accumulators
+
+        Parameters
+        ----------
+            lhs : Variable or IndexedElement
+                The result of the reduction
+            expr : NumpyReductionBase
+                The reduction
+            op : str
+                The operator of an augmented assignment
+        Returns
+        -------
+            str
+        """
+        arg = expr.arg
+        if arg.rank == 0 or not self._is_elementwise(arg) or self._is_random(arg):
+            errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr, severity='fatal')
+        if arg.dtype is NativeComplex() and isinstance(expr, (NumpyMin, NumpyMax)):
+            errors.report("The minimum and the maximum of complex arrays are not supported",
+                    symbol=expr, severity='fatal')
+        if lhs.rank > 0:
+            lhs_base = self._array_base(lhs)
+            if any(self._array_base(l).name == lhs_base.name for l in self._array_leaves(arg)):
+                errors.report("The result of a reduction along an axis cannot be stored in the reduced array",
+                        symbol=expr, severity='fatal')
+
+        # the loops are defined by an array with the rank of arg
+        leaf = [l for l in self._array_leaves(arg) if l.rank == arg.rank][0]
+        _, extents = self._array_loop_ranges(leaf)
+        indices = self._array_loop_indices(arg.rank)
+        dims = list(range(arg.rank))
+        if self._array_base(leaf).order == 'F':
+            dims = dims[::-1]
+        if expr.axis is None:
+            out_dims = []
+            red_dims = dims
+        else:
+            out_dims = [d for d in dims if d != expr.axis.python_value]
+            red_dims = [expr.axis.python_value]
+
+        int_type = self.find_in_dtype_registry('int', 8)
+        acc_type = self.find_in_dtype_registry(self._print(expr.dtype), expr.precision)
+        acc = self._parser.get_new_name('acc')
+        element = self._print(self._array_element(arg, indices))
+        value = self._parser.get_new_name('value')
+        value_type = self.find_in_dtype_registry(self._print(arg.dtype), arg.precision)
+        if isinstance(expr, NumpyNorm):
+            # the sum of the squared moduli
+            if arg.dtype is NativeComplex():
+                square = 'creal({0}) * creal({0}) + cimag({0}) * cimag({0})'.format(value)
+            else:
+                square = '({1}){0} * {0}'.format(value, acc_type)
+            update = lambda a: '{{\n{} {} = {};\n{} += {};\n}}'.format(value_type, value,
+                    element, a, square)
+        elif isinstance(expr, (NumpyMin, NumpyMax)):
+            comparison = '<' if isinstance(expr, NumpyMin) else '>'
+            nan = ''
+            if arg.dtype is NativeReal():
+                # the nan values are propagated as by numpy
+                self._additional_imports.add('math')
+                nan = ' || isnan({})'.format(value)
+            update = lambda a: '{{\n{0} {1} = {2};\n{3} = {1} {4} {3}{5} ? {1} : {3};\n}}'.format(
+                    value_type, value, element, a, comparison, nan)
+        elif isinstance(expr, NumpyProduct):
+            update = lambda a: '{} *= {};'.format(a, element)
+        else:
+            update = lambda a: '{} += {};'.format(a, element)
+
+        if isinstance(expr, NumpyMin):
+            init = self._reduction_limit(expr, 'max')
+            omp_op = 'min'
+        elif isinstance(expr, NumpyMax):
+            init = self._reduction_limit(expr, 'min')
+            omp_op = 'max'
+        elif isinstance(expr, NumpyProduct):
+            init = '1'
+            omp_op = '*'
+        else:
+            init = '0'
+            omp_op = '+'
+        # the comparisons of the minimum and the maximum are not vectorised,
+        # as the order of the nan and of the equal elements must be kept
+        simd = not isinstance(expr, (NumpyMin, NumpyMax))
+        compensated = isinstance(expr, NumpyNorm) or \
+                (isinstance(expr, NumpySum) and expr.dtype in (NativeReal(), NativeComplex()))
+
+        loops = [(self._print(indices[d]), extents[d]) for d in red_dims]
+        red_size = ' * '.join('({})'.format(extents[d]) for d in red_dims)
+        out_size = ' * '.join('({})'.format(extents[d]) for d in out_dims)
+        if compensated:
+            comp = self._parser.get_new_name('comp')
+            block = self._parser.get_new_name('block')
+            total = self._parser.get_new_name('total')
+            block_start = self._parser.get_new_name('ib')
+            block_end = self._parser.get_new_name('ie')
+            index, extent = loops[-1]
+            code = ('#pragma omp simd reduction(+:{block})\n'
+                    'for ({int} {index} = {start}; {index} < {end}; {index}++)\n'
+                    '{{\n{element}\n}}').format(int = int_type, index = index,
+                            start = block_start, end = block_end, block = block,
+                            element = update(block))
+            code = ('for ({int} {start} = 0; {start} < {extent}; {start} += {size})\n{{\n'
+                    '{type} {block} = 0;\n'
+                    '{int} {end} = {start} + {size} < {extent} ? {start} + {size} : {extent};\n'
+                    '{code}\n'
+                    '{block} -= {comp};\n'
+                    '{type} {total} = {acc} + {block};\n'
+                    '{comp} = ({total} - {acc}) - {block};\n'
+                    '{acc} = {total};\n}}').format(int = int_type, type = acc_type,
+                            start = block_start, end = block_end, extent = extent,
+                            size = REDUCTION_BLOCK_SIZE, block = block, comp = comp,
+                            total = total, acc = acc, code = code)
+            loops = loops[:-1]
+            accumulators = [acc, comp]
+            result = '{} - {}'.format(acc, comp)
+        else:
+            code = update(acc)
+            accumulators = [acc]
+            result = acc
+        vectorised = simd and not compensated
+        for i, (index, extent) in enumerate(reversed(loops)):
+            code = ('for ({int} {index} = 0; {index} < {extent}; {index}++)\n'
+                    '{{\n{code}\n}}').format(int = int_type, index = index,
+                            extent = extent, code = code)
+            if i == 0 and vectorised and (out_dims or len(loops) > 1):
+                code = '#pragma omp simd reduction({}:{})\n'.format(omp_op, acc) + code
+        if not out_dims:
+            construct = 'parallel for simd' if vectorised and len(loops) == 1 else 'parallel for'
+            code = '#pragma omp {} reduction({}:{}) if({} > {})\n'.format(construct,
+                    omp_op, ','.join(accumulators), red_size, REDUCTION_PARALLEL_SIZE) + code
+        if isinstance(expr, NumpyNorm):
+            self._additional_imports.add('math')
+            result = 'sqrt({})'.format(result)
+
+        declarations = '\n'.join('{} {} = {};'.format(acc_type, a, v)
+                for a, v in zip(accumulators, [init, '0']))
+        out_indices = [indices[d] for d in range(arg.rank) if expr.axis is None or d != expr.axis.python_value]
+        target = self._print(self._array_element(lhs, out_indices))
+        code = '{{\n{}\n{}\n{} {}= {};\n}}'.format(declarations, code, target, op, result)
+
+        for i, d in enumerate(reversed(out_dims)):
+            code = ('for ({int} {index} = 0; {index} < {extent}; {index}++)\n'
+                    '{{\n{code}\n}}').format(int = int_type, index = self._print(indices[d]),
+                            extent = extents[d], code = code)
+            if i == len(out_dims) - 1:
+                code = '#pragma omp parallel for if({} > {})\n'.format(
+                        out_size + ' * ' + red_size, REDUCTION_PARALLEL_SIZE) + code
+        return code
+
+    def _reduction_limit(self, expr, limit):
+        """ Print the largest (if limit is 'max') or the smallest (if limit is
+        'min') value of the type of the result of the reduction expr
+        """
+        if expr.dtype is NativeReal():
+            self._additional_imports.add('math')
+            return 'INFINITY' if limit == 'max' else '-INFINITY'
+        if expr.dtype is NativeBool():
+            return '1' if limit == 'max' else '0'
+        return 'INT{}_{}'.format(8 * expr.precision, limit.upper())
+
+    #============================ Matrix products =============================
+    def _print_NumpyMatmul(self, expr):
+        """ Print the product of two vectors used in an expression. The result
+        is computed in a temporary variable by a loop which is printed before
+        the current statement
+        """
+        if expr.rank > 0:
+            errors.report("The products of matrices can only be assigned to an array",
+                    symbol=expr, severity='fatal')
+        tmp = Variable(expr.dtype, self._parser.get_new_name('tmp'), precision = expr.precision)
+        self._additional_declare.append(tmp)
+        self._additional_code += self._print_matmul(tmp, expr) + '\n'
+        return self._print(tmp)
+
+    def _print_matmul(self, lhs, expr):
+        """ Print the code computing the product expr of two matrices (or of
+        a matrix and a vector, or of two vectors) and storing it in lhs.
+
+        The elements are computed by loop nests whose innermost loop is
+        vectorised: it either accumulates a column (or a row) of one argument
+        in the contiguous dimension of lhs, or computes a dot product in a
+        local accumulator, depending on the order of the arguments.
+        When pyccel is run with a BLAS library, the products of arrays of
+        double precision reals which need more than PYC_BLAS_THRESHOLD
+        multiplications are computed by BLAS instead, if the elements of the
+        arrays are contiguous along one dimension (see pyccel/stdlib/blas)
+
+        Parameters
+        ----------
+            lhs : Variable or IndexedElement
+                The result of the product
+            expr : NumpyMatmul
+                The product
+        Returns
+        -------
+            str
+        """
+        a, b = expr.a, expr.b
+        if a.rank == 0 or b.rank == 0 or not (self._is_elementwise(a) and self._is_elementwise(b)) \
+                or self._is_random(a) or self._is_random(b):
+            errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr, severity='fatal')
+        if lhs.rank > 0:
+            lhs_base = self._array_base(lhs)
+            if any(self._array_base(l).name == lhs_base.name for l in
+                    self._array_leaves(a) + self._array_leaves(b)):
+                errors.report("The result of a product of matrices cannot be stored in one of its arguments",
+                        symbol=expr, severity='fatal')
+
+        # the loops are defined by arrays with the ranks of the arguments
+        leaf_a = [l for l in self._array_leaves(a) if l.rank == a.rank][0]
+        leaf_b = [l for l in self._array_leaves(b) if l.rank == b.rank][0]
+        _, extents_a = self._array_loop_ranges(leaf_a)
+        _, extents_b = self._array_loop_ranges(leaf_b)
+        i, j, k = self._array_loop_indices(3)
+        m = extents_a[0]
+        n = extents_b[-1]
+        inner = extents_a[-1]
+        a_element = self._print(self._array_element(a, [i, k][2 - a.rank:]))
+        b_element = self._print(self._array_element(b, [k, j][:b.rank]))
+        product = '{} * {}'.format(a_element, b_element)
+
+        int_type = self.find_in_dtype_registry('int', 8)
+        acc_type = self.find_in_dtype_registry(self._print(expr.dtype), expr.precision)
+        def loop(index, extent, body, pragma = ''):
+            code = ('for ({int} {index} = 0; {index} < {extent}; {index}++)\n'
+                    '{{\n{body}\n}}').format(int = int_type, index = self._print(index),
+                            extent = extent, body = body)
+            return '#pragma omp {}\n{}'.format(pragma, code) if pragma else code
+        def dot_product(target):
+            acc = self._parser.get_new_name('acc')
+            return '{type} {acc} = 0;\n{loop}\n{target} = {acc};'.format(type = acc_type,
+                    acc = acc, target = target, loop = loop(k, inner, '{} += {};'.format(acc, product),
+                        'simd reduction(+:{})'.format(acc)))
+        def accumulation(target, index, extent):
+            init = loop(index, extent, '{} = 0;'.format(target), 'simd')
+            update = loop(k, inner, loop(index, extent, '{} += {};'.format(target, product), 'simd'))
+            return '{}\n{}'.format(init, update)
+
+        if a.rank == 2 and b.rank == 2:
+            target = self._print(self._array_element(lhs, [i, j]))
+            if self._array_base(lhs).order == 'F':
+                code = loop(j, n, accumulation(target, i, m))
+            else:
+                code = loop(i, m, accumulation(target, j, n))
+            blas = 'pyc_dgemm({}, {}, {})'.format(self._print(a), self._print(b), self._print(lhs))
+            size = [m, n, inner]
+        elif a.rank == 2:
+            target = self._print(self._array_element(lhs, [i]))
+            if self._array_base(leaf_a).order == 'F':
+                code = accumulation(target, i, m)
+            else:
+                code = loop(i, m, dot_product(target))
+            blas = 'pyc_dgemv({}, {}, {}, false)'.format(self._print(a), self._print(b), self._print(lhs))
+            size = [m, inner]
+        elif b.rank == 2:
+            target = self._print(self._array_element(lhs, [j]))
+            if self._array_base(leaf_b).order == 'F':
+                code = loop(j, n, dot_product(target))
+            else:
+                code = accumulation(target, j, n)
+            blas = 'pyc_dgemv({}, {}, {}, true)'.format(self._print(b), self._print(a), self._print(lhs))
+            size = [inner, n]
+        else:
+            target = self._print(lhs)
+            code = '{{\n{}\n}}'.format(dot_product(target))
+            blas = 'pyc_ddot({}, {}, &{})'.format(self._print(a), self._print(b), target)
+            size = [inner]
+
+        real = (NativeReal(), 8)
+        if self._blas and all((e.dtype, e.precision) == real for e in (expr, a, b)) and \
+                all(isinstance(e, (Variable, IndexedElement)) for e in (a, b)):
+            self._additional_imports.add('pyc_blas')
+            condition = '{} <= PYC_BLAS_THRESHOLD || !{}'.format(' * '.join('({})'.format(s)
+                for s in size), blas)
+            code = 'if ({})\n{{\n{}\n}}'.format(condition, code)
+        return code
+
     def _print_AliasAssign(self, expr):
         lhs = expr.lhs
         rhs = expr.rhs
-        if isinstance(rhs, Variable):
+        if isinstance(rhs, Variable) and not rhs.is_ndarray:
             rhs = VariableAddress(rhs)
 
         lhs = self._print(lhs.name)
         rhs = self._print(rhs)
 
-        # the below condition handles the case of reassinging a pointer to an array view.
-        # setting the pointer's is_view attribute to false so it can be ignored by the free_pointer function.
-        if isinstance(expr.lhs, Variable) and expr.lhs.is_ndarray \
-                and isinstance(expr.rhs, Variable) and expr.rhs.is_ndarray and expr.rhs.is_pointer:
-            return 'alias_assign(&{}, {});'.format(lhs, rhs)
-
         return '{} = {};'.format(lhs, rhs)
 
     def _print_For(self, expr):
         target = self._print(expr.target)
+        self._loop_level += 1
         body  = self._print(expr.body)
+        self._loop_level -= 1
         if isinstance(expr.iterable, PythonRange):
             start, stop, step = [self._print(e) for e in expr.iterable.args]
         else:
@@ -1152,11 +1819,12 @@ class CCodePrinter(CodePrinter):
 
     def _print_CodeBlock(self, expr):
         body = []
-        for b in expr.body :
+        for b in self._move_omp_nowait(expr.body):
             code = self._print(b)
             code = self._additional_code + code
             self._additional_code = ''
-            body.append(code)
+            if code:
+                body.append(code)
         return '\n'.join(self._print(b) for b in body)
 
     def _print_Indexed(self, expr):
@@ -1260,7 +1928,8 @@ class CCodePrinter(CodePrinter):
             return expr.name
 
     def _print_VariableAddress(self, expr):
-        if self.stored_in_c_pointer(expr.variable) or expr.variable.rank > 0:
+        if self.stored_in_c_pointer(expr.variable) or \
+                (expr.variable.rank > 0 and not expr.variable.is_ndarray):
             return '{}'.format(expr.variable.name)
         else:
             return '&{}'.format(expr.variable.name)
@@ -1297,20 +1966,44 @@ class CCodePrinter(CodePrinter):
         return '\n'
 
     #=================== OMP ==================
-    def _print_OMP_For_Loop(self, expr):
-        omp_expr   = str(expr.txt)
-        return '#pragma omp for{}\n{{'.format(omp_expr)
+    def _print_OmpAnnotatedComment(self, expr):
+        omp_expr = '#pragma omp {}'.format(expr.txt)
+        if expr.construct in omp_statement_constructs:
+            return omp_expr
+        return omp_expr + '\n{'
 
     def _print_OMP_Parallel_Construct(self, expr):
-        omp_expr   = str(expr.txt)
-        return '#pragma omp {}\n{{'.format(omp_expr)
-
-    def _print_OMP_Single_Construct(self, expr):
-        omp_expr   = str(expr.txt)
-        return '#pragma omp {}\n{{'.format(omp_expr)
+        # the arrays allocated in the region may be allocated by several threads
+        if expr.construct == 'parallel':
+            self._loop_level += 1
+        return self._print_OmpAnnotatedComment(expr)
 
     def _print_Omp_End_Clause(self, expr):
+        if expr.construct == 'parallel':
+            self._loop_level -= 1
+        if expr.construct in omp_statement_constructs:
+            return ''
         return '}'
+
+    @staticmethod
+    def _move_omp_nowait(body):
+        """ Move the nowait clauses of the directives ending OpenMP constructs
+        to the directives starting them, where they are expected in C
+        """
+        body = list(body)
+        started = []
+        for i, b in enumerate(body):
+            if isinstance(b, Omp_End_Clause):
+                # the end of the loop constructs is optional
+                while started and body[started[-1]].construct != b.construct:
+                    started.pop()
+                if started:
+                    start = started.pop()
+                    if b.nowait:
+                        body[start] = type(body[start])('{} nowait'.format(body[start].txt))
+            elif isinstance(b, OmpAnnotatedComment):
+                started.append(i)
+        return body
     #=====================================
 
     def _print_Program(self, expr):
@@ -11,30 +11,30 @@ import numpy as np
 
 from pyccel.codegen.printing.ccode import CCodePrinter
 
-from pyccel.ast.literals  import LiteralTrue, LiteralInteger, LiteralString
+from pyccel.ast.literals  import LiteralTrue, LiteralFalse, LiteralInteger, LiteralString
 
 from pyccel.ast.builtins import PythonPrint
 
 from pyccel.ast.core import Variable, ValuedVariable, Assign, AliasAssign, FunctionDef, FunctionAddress
 from pyccel.ast.core import If, Nil, Return, FunctionCall
 from pyccel.ast.core import create_incremented_string, SeparatorComment
-from pyccel.ast.core import VariableAddress, Import, IfTernaryOperator
+from pyccel.ast.core import VariableAddress, Import
 from pyccel.ast.core import AugAssign
 
 from pyccel.ast.operators import PyccelEq, PyccelNot, PyccelAnd, PyccelNe, PyccelOr, PyccelAssociativeParenthesis
 
 from pyccel.ast.datatypes import NativeInteger, NativeBool, NativeComplex, NativeReal, str_dtype, default_precision
 
-from pyccel.ast.cwrapper import PyccelPyObject, PyArg_ParseTupleNode, PyBuildValueNode
-from pyccel.ast.cwrapper import PyArgKeywords, collect_function_registry
+from pyccel.ast.cwrapper import PyccelPyObject, PyccelPySsizeT, PyArg_ParseFastcallNode, PyBuildValueNode
+from pyccel.ast.cwrapper import PyArgKeywords, PyAllowThreadsBlock, collect_function_registry
 from pyccel.ast.cwrapper import Py_None, flags_registry
 from pyccel.ast.cwrapper import PyErr_SetString, PythonType_Check
 from pyccel.ast.cwrapper import cast_function_registry, Py_DECREF
-from pyccel.ast.cwrapper import PyccelPyArrayObject, NumpyType_Check
-from pyccel.ast.cwrapper import numpy_get_ndims, numpy_get_data, numpy_get_dim
+from pyccel.ast.cwrapper import PyccelPyArrayObject, PyccelCFIDescriptor, NumpyType_Check
+from pyccel.ast.cwrapper import numpy_get_ndims, numpy_get_data
 from pyccel.ast.cwrapper import numpy_get_type, numpy_dtype_registry
-from pyccel.ast.cwrapper import numpy_check_flag, numpy_flag_c_contig, numpy_flag_f_contig
 from pyccel.ast.cwrapper import PyArray_CheckScalar, PyArray_ScalarAsCtype
+from pyccel.ast.cwrapper import pyarray_to_ndarray, ndarray_to_pyarray, pyarray_to_cfi_desc
 
 from pyccel.ast.bind_c   import as_static_function_call
 
@@ -46,7 +46,9 @@ errors = Errors()
 __all__ = ["CWrapperCodePrinter", "cwrappercode"]
 
 dtype_registry = {('pyobject'     , 0) : 'PyObject',
-                  ('pyarrayobject', 0) : 'PyArrayObject'}
+                  ('pyarrayobject', 0) : 'PyArrayObject',
+                  ('cfidescriptor', 0) : 't_cfi_desc',
+                  ('pyssizet'     , 0) : 'Py_ssize_t'}
 
 class CWrapperCodePrinter(CCodePrinter):
     """A printer to convert a python module to strings of c code creating
@@ -85,6 +87,15 @@ class CWrapperCodePrinter(CCodePrinter):
             return CCodePrinter.function_signature(self, expr)
 
     def get_declare_type(self, expr):
+        if isinstance(expr.dtype, PyccelPyObject) and expr.rank > 0:
+            # Array of the arguments of a METH_FASTCALL function
+            return 'PyObject *const *'
+        if self._target_language == 'c' and isinstance(expr, Variable) and expr.is_ndarray:
+            return CCodePrinter.get_declare_type(self, expr)
+        if self._target_language == 'fortran' and isinstance(expr, Variable) and expr.rank > 0 \
+                and not isinstance(expr.dtype, PyccelPyArrayObject):
+            # Arrays are passed to the bind(c) functions using C descriptors
+            return 'CFI_cdesc_t *'
         dtype = self._print(expr.dtype)
         prec  = expr.precision
         dtype = self.find_in_dtype_registry(dtype, prec)
@@ -99,6 +110,24 @@ class CWrapperCodePrinter(CCodePrinter):
                         name=self.get_new_name(used_names, name),
                         is_pointer=True)
 
+    def get_wrapper_arguments(self, used_names):
+        """
+        Create the arguments of a wrapper using the METH_FASTCALL calling
+        convention : (self, args, nargs, kwnames)
+        where args = array of the positional arguments followed by the values
+                     of the keyword arguments
+              nargs = number of positional arguments
+              kwnames = tuple of the names of the keyword arguments (or NULL)
+        """
+        python_func_selfarg = self.get_new_PyObject("self", used_names)
+        python_func_args    = Variable(dtype=PyccelPyObject(),
+                                name=self.get_new_name(used_names, "args"),
+                                is_pointer=True, rank=1)
+        python_func_nargs   = Variable(dtype=PyccelPySsizeT(),
+                                name=self.get_new_name(used_names, "nargs"))
+        python_func_kwnames = self.get_new_PyObject("kwnames", used_names)
+        return [python_func_selfarg, python_func_args, python_func_nargs, python_func_kwnames]
+
     def find_in_dtype_registry(self, dtype, prec):
         try :
             return dtype_registry[(dtype, prec)]
@@ -131,31 +160,19 @@ class CWrapperCodePrinter(CCodePrinter):
 
     def _get_static_function(self, used_names, function, collect_dict):
         """
-        Create arguments and functioncall for arguments rank > 0 in fortran.
-        Format : a is numpy array
-        func(a) ==> static_func(a.DIM , a.DATA)
-        where a.DATA = buffer holding data
-              a.DIM = size of array
+        Create the function called by the wrapper and its arguments.
+        In fortran the bind(c) function is called. Its arguments of rank > 0
+        are assumed-shape arrays which receive the C descriptors of the
+        numpy arrays:
+        func(a) ==> bind_c_func(a)
+        where a = C descriptor of the numpy array (see _body_array)
         """
         additional_body = []
         if self._target_language == 'fortran':
-            static_args = []
-            for a in function.arguments:
-                if isinstance(a, Variable) and a.rank>0:
-                    # Add shape arguments for static function
-                    for i in range(collect_dict[a].rank):
-                        var = Variable(dtype=NativeInteger() ,name = self.get_new_name(used_names, a.name + "_dim"))
-                        body = FunctionCall(numpy_get_dim, [collect_dict[a], i])
-                        if a.is_optional:
-                            body = IfTernaryOperator(VariableAddress(collect_dict[a]), body , LiteralInteger(0))
-                        body = Assign(var, body)
-                        additional_body.append(body)
-                        static_args.append(var)
-                static_args.append(a)
             static_function = as_static_function_call(function, self._module_name, name=function.name)
         else:
             static_function = function
-            static_args = function.arguments
+        static_args = function.arguments
         return static_function, static_args, additional_body
 
     def _get_check_type_statement(self, variable, collect_var):
@@ -348,7 +365,7 @@ class CWrapperCodePrinter(CCodePrinter):
 
         return body
 
-    def _body_array(self, variable, collect_var, check_type = False) :
+    def _body_array(self, variable, collect_var, check_type = False, tmp_variable = None) :
         """
         Responsible for collecting value and managing error and create the body
         of arguments with rank greater than 0 in format
@@ -358,11 +375,10 @@ class CWrapperCodePrinter(CCodePrinter):
                 }else if(Type Check == False){
                     Print TypeError Wrong type
                     return Null
-                }else if (order check == False){ #check for order for rank > 1
-                    Print NotImplementedError Wrong Order
-                    return Null
                 }
                 collect the value from PyArrayObject
+        The data is never copied, the strides of the numpy array are kept
+        so non contiguous arrays can be passed
 
         Parameters:
         ----------
@@ -372,6 +388,8 @@ class CWrapperCodePrinter(CCodePrinter):
             the pyobject type variable  holder of value
         check_type : Boolean
             True if the type is needed
+        tmp_variable : Variable
+            The storage of the C descriptor (fortran only)
 
         Returns
         -------
@@ -397,16 +415,18 @@ class CWrapperCodePrinter(CCodePrinter):
             error = PyErr_SetString('PyExc_TypeError', '"{} must be {}"'.format(variable, arg_dtype))
             body += [(check, [info_dump, error, Return([Nil()])])]
 
-        if collect_var.rank > 1 and self._target_language == 'fortran' :#Order check
-            if collect_var.order == 'F':
-                check = FunctionCall(numpy_check_flag,[collect_var, numpy_flag_f_contig])
-            else:
-                check = FunctionCall(numpy_check_flag,[collect_var, numpy_flag_c_contig])
-                error = PyErr_SetString('PyExc_NotImplementedError',
-                        '"Argument does not have the expected ordering ({})"'.format(collect_var.order))
-                body += [(PyccelNot(check), [error, Return([Nil()])])]
-        body += [(LiteralTrue(), [Assign(VariableAddress(variable),
-                                self.get_collect_function_call(variable, collect_var))])]
+        if self._target_language == 'c':
+            # The t_ndarray is a view of the numpy data
+            self._additional_imports.add('ndarrays_numpy')
+            collect_value = Assign(variable, FunctionCall(pyarray_to_ndarray, [collect_var]))
+        else:
+            # The C descriptor describes the numpy data, C ordered arrays are
+            # seen as their transpose by the fortran function
+            self._additional_imports.add('cwrapper_cfi')
+            c_order = LiteralTrue() if collect_var.order == 'C' else LiteralFalse()
+            collect_value = Assign(VariableAddress(variable),
+                                FunctionCall(pyarray_to_cfi_desc, [collect_var, tmp_variable, c_order]))
+        body += [(LiteralTrue(), [collect_value])]
         body = [If(*body)]
 
         return body
@@ -419,7 +439,9 @@ class CWrapperCodePrinter(CCodePrinter):
         body = []
 
         if variable.rank > 0:
-            body = self._body_array(variable, collect_var, check_type)
+            if self._target_language == 'fortran':
+                tmp_variable = Variable(dtype=PyccelCFIDescriptor(), name = self.get_new_name(used_names, variable.name+"_desc"))
+            body = self._body_array(variable, collect_var, check_type, tmp_variable)
 
         elif variable.is_optional:
             tmp_variable = Variable(dtype=variable.dtype, name = self.get_new_name(used_names, variable.name+"_tmp"))
@@ -510,6 +532,16 @@ class CWrapperCodePrinter(CCodePrinter):
         collect_var = variable
         cast_function = None
 
+        if variable.rank > 0 and self._target_language == 'c':
+            # The numpy array takes the ownership of the data
+            self._additional_imports.add('ndarrays_numpy')
+            collect_type = PyccelPyObject()
+            collect_var = Variable(dtype=collect_type, is_pointer=True,
+                name = self.get_new_name(used_names, variable.name+"_tmp"))
+            cast_function = FunctionCall(ndarray_to_pyarray, [variable])
+            self._to_free_PyObject_list.append(collect_var)
+            return collect_var, cast_function
+
         if variable.dtype is NativeBool():
             collect_type = PyccelPyObject()
             collect_var = Variable(dtype=collect_type, is_pointer=True,
@@ -536,13 +568,8 @@ class CWrapperCodePrinter(CCodePrinter):
         wrapper_name = self._get_wrapper_name(used_names, expr)
         self._global_names.add(wrapper_name)
 
-        # Collect local variables
-        python_func_args    = self.get_new_PyObject("args"  , used_names)
-        python_func_kwargs  = self.get_new_PyObject("kwargs", used_names)
-        python_func_selfarg = self.get_new_PyObject("self"  , used_names)
-
         # Collect wrapper arguments and results
-        wrapper_args    = [python_func_selfarg, python_func_args, python_func_kwargs]
+        wrapper_args    = self.get_wrapper_arguments(used_names)
         wrapper_results = [self.get_new_PyObject("result", used_names)]
 
         # Collect parser arguments
@@ -615,6 +642,9 @@ class CWrapperCodePrinter(CCodePrinter):
                 results   = func.results if len(func.results)>1 else func.results[0]
                 func_call = Assign(results,FunctionCall(static_function, static_args))
 
+            if 'nogil' in func.decorators:
+                func_call = PyAllowThreadsBlock([func_call])
+
             mini_wrapper_func_body.append(func_call)
 
             # Loop for all res in every functions and create the corresponding body and cast
@@ -659,7 +689,7 @@ class CWrapperCodePrinter(CCodePrinter):
         wrapper_body_translations = [If(*body_tmp)]
 
         # Parsing Arguments
-        parse_node = PyArg_ParseTupleNode(python_func_args, python_func_kwargs, funcs[0].arguments, parse_args, keyword_list, True)
+        parse_node = PyArg_ParseFastcallNode(*wrapper_args[1:], funcs[0].arguments, parse_args, keyword_list, True)
         wrapper_body += list(default_value.values())
         wrapper_body.append(If((PyccelNot(parse_node), [Return([Nil()])])))
 
@@ -733,27 +763,36 @@ class CWrapperCodePrinter(CCodePrinter):
     def _print_PyccelPyArrayObject(self, expr):
         return 'pyarrayobject'
 
-    def _print_PyArg_ParseTupleNode(self, expr):
-        name    = 'PyArg_ParseTupleAndKeywords'
-        pyarg   = expr.pyarg
-        pykwarg = expr.pykwarg
-        flags   = expr.flags
+    def _print_PyccelCFIDescriptor(self, expr):
+        return 'cfidescriptor'
+
+    def _print_PyccelPySsizeT(self, expr):
+        return 'pyssizet'
+
+    def _print_PyArg_ParseFastcallNode(self, expr):
+        name      = 'pyarg_parse_fastcall'
+        pyarg     = expr.pyarg
+        pynargs   = expr.pynargs
+        pykwnames = expr.pykwnames
+        flags     = expr.flags
         # All args are modified so even pointers are passed by address
         args    = ', '.join(['&{}'.format(a.name) for a in expr.args])
 
         if expr.args:
-            code = '{name}({pyarg}, {pykwarg}, "{flags}", {kwlist}, {args})'.format(
+            code = '{name}({pyarg}, {pynargs}, {pykwnames}, "{flags}", {kwlist}, {args})'.format(
                             name=name,
                             pyarg=pyarg,
-                            pykwarg=pykwarg,
+                            pynargs=pynargs,
+                            pykwnames=pykwnames,
                             flags = flags,
                             kwlist = expr.arg_names.name,
                             args = args)
         else :
-            code ='{name}({pyarg}, {pykwarg}, "", {kwlist})'.format(
+            code ='{name}({pyarg}, {pynargs}, {pykwnames}, "", {kwlist})'.format(
                     name=name,
                     pyarg=pyarg,
-                    pykwarg=pykwarg,
+                    pynargs=pynargs,
+                    pykwnames=pykwnames,
                     kwlist = expr.arg_names.name)
 
         return code
@@ -769,6 +808,10 @@ class CWrapperCodePrinter(CCodePrinter):
             code = '{name}("")'.format(name=name)
         return code
 
+    def _print_PyAllowThreadsBlock(self, expr):
+        body = '\n'.join(self._print(b) for b in expr.body)
+        return 'Py_BEGIN_ALLOW_THREADS\n{}\nPy_END_ALLOW_THREADS'.format(body)
+
     def _print_PyArgKeywords(self, expr):
         arg_names = ',\n'.join(['"{}"'.format(a) for a in expr.arg_names] + [self._print(Nil())])
         return ('static char *{name}[] = {{\n'
@@ -785,12 +828,9 @@ class CWrapperCodePrinter(CCodePrinter):
         # Collect local variables
         wrapper_vars        = {a.name : a for a in expr.arguments}
         wrapper_vars.update({r.name : r for r in expr.results})
-        python_func_args    = self.get_new_PyObject("args"  , used_names)
-        python_func_kwargs  = self.get_new_PyObject("kwargs", used_names)
-        python_func_selfarg = self.get_new_PyObject("self"  , used_names)
 
         # Collect arguments and results
-        wrapper_args    = [python_func_selfarg, python_func_args, python_func_kwargs]
+        wrapper_args    = self.get_wrapper_arguments(used_names)
         wrapper_results = [self.get_new_PyObject("result", used_names)]
 
         if expr.is_private:
@@ -841,7 +881,7 @@ class CWrapperCodePrinter(CCodePrinter):
                 wrapper_body.append(self.get_default_assign(parse_args[-1], arg))
 
         # Parse arguments
-        parse_node = PyArg_ParseTupleNode(python_func_args, python_func_kwargs, expr.arguments, parse_args, keyword_list)
+        parse_node = PyArg_ParseFastcallNode(*wrapper_args[1:], expr.arguments, parse_args, keyword_list)
         wrapper_body.append(If((PyccelNot(parse_node), [Return([Nil()])])))
         wrapper_body.extend(wrapper_body_translations)
 
@@ -857,6 +897,10 @@ class CWrapperCodePrinter(CCodePrinter):
             results   = expr.results if len(expr.results)>1 else expr.results[0]
             func_call = Assign(results,FunctionCall(static_function, static_args))
 
+        # The GIL is released once the arguments are collected
+        if 'nogil' in expr.decorators:
+            func_call = PyAllowThreadsBlock([func_call])
+
         wrapper_body.append(func_call)
 
         # Loop over results to carry out necessary casts and collect Py_BuildValue type string
@@ -905,8 +949,8 @@ class CWrapperCodePrinter(CCodePrinter):
                                         for f in self._cast_functions_dict.values())
         method_def_func = ',\n'.join(('{{\n'
                                      '"{name}",\n'
-                                     '(PyCFunction){wrapper_name},\n'
-                                     'METH_VARARGS | METH_KEYWORDS,\n'
+                                     '(PyCFunction)(void (*)(void)){wrapper_name},\n'
+                                     'PYCCEL_METH_FASTCALL,\n'
                                      '{doc_string}\n'
                                      '}}').format(
                                             name = f.name,
@@ -941,9 +985,11 @@ class CWrapperCodePrinter(CCodePrinter):
                 'return m;\n}}'.format(mod_name=expr.name, module_def_name = module_def_name))
 
         # Print imports last to be sure that all additional_imports have been collected
-        imports  = [Import(s) for s in self._additional_imports]
-        imports += [Import('Python')]
+        # Python.h must be included first and ndarrays_numpy.h uses the numpy API
+        imports  = [Import('Python')]
         imports += [Import('numpy/arrayobject')]
+        imports += [Import('cwrapper')]
+        imports += [Import(s) for s in self._additional_imports]
         imports  = '\n'.join(self._print(i) for i in imports)
 
         numpy_max_acceptable_version = [1, 19]
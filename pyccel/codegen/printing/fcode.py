@@ -11,6 +11,7 @@ www.fortran90.org as much as possible."""
 
 
 import string
+import re
 from itertools import chain
 from collections import OrderedDict
 
@@ -53,7 +54,7 @@ from pyccel.ast.builtins  import PythonComplex, PythonBool
 from pyccel.ast.datatypes import is_pyccel_datatype
 from pyccel.ast.datatypes import is_iterable_datatype, is_with_construct_datatype
 from pyccel.ast.datatypes import NativeSymbol, NativeString, str_dtype
-from pyccel.ast.datatypes import NativeInteger, NativeBool, NativeReal
+from pyccel.ast.datatypes import NativeInteger, NativeBool, NativeReal, NativeComplex
 from pyccel.ast.datatypes import iso_c_binding
 from pyccel.ast.datatypes import NativeRange, NativeTensor, NativeTuple
 from pyccel.ast.datatypes import CustomDataType
@@ -63,8 +64,8 @@ from pyccel.ast.literals  import LiteralTrue
 from pyccel.ast.utilities import builtin_import_registery as pyccel_builtin_import_registery
 
 from pyccel.ast.numpyext import NumpyEmpty
-from pyccel.ast.numpyext import NumpyMod, NumpyFloat
-from pyccel.ast.numpyext import NumpyRand
+from pyccel.ast.numpyext import NumpyMod, NumpyFloat, NumpyAbs
+from pyccel.ast.numpyext import NumpyRand, NumpyRandint, NumpyMatmul
 from pyccel.ast.numpyext import NumpyNewArray
 from pyccel.ast.numpyext import Shape
 
@@ -86,8 +87,6 @@ known_functions = {
 numpy_ufunc_to_fortran = {
     'NumpyAbs'  : 'abs',
     'NumpyFabs'  : 'abs',
-    'NumpyMin'  : 'minval',
-    'NumpyMax'  : 'maxval',
     'NumpyFloor': 'floor',  # TODO: might require special treatment with casting
     # ---
     'NumpyExp' : 'exp',
@@ -202,6 +201,7 @@ class FCodePrinter(CodePrinter):
     def __init__(self, parser, settings={}):
 
         prefix_module = settings.pop('prefix_module', None)
+        blas = settings.pop('blas', None)
 
         if parser.filename:
             errors.set_target(parser.filename, 'file')
@@ -218,6 +218,8 @@ class FCodePrinter(CodePrinter):
         self._additional_imports = set([])
 
         self.prefix_module = prefix_module
+        # BLAS library used to compute the products of matrices, if any
+        self._blas = blas
 
     def get_additional_imports(self):
         """return the additional imports collected in printing stage"""
@@ -627,33 +629,127 @@ class FCodePrinter(CodePrinter):
 
     #========================== Numpy Elements ===============================#
 
+    def _print_reduction_args(self, expr, arg = None):
+        """ Print the arguments of the Fortran intrinsic computing the numpy
+        reduction expr: the array (arg if it is given) and the dimension,
+        which is counted from the end for the C ordered arrays as their
+        dimensions are reversed in Fortran
+        """
+        args = [self._print(expr.arg if arg is None else arg)]
+        if expr.axis is not None:
+            axis = expr.axis.python_value
+            dim  = axis + 1 if expr.arg.order == 'F' else expr.arg.rank - axis
+            args.append(self._print(LiteralInteger(dim)))
+        return ', '.join(args)
+
     def _print_NumpySum(self, expr):
         """Fortran print."""
 
-        rhs_code = self._print(expr.arg)
-        return 'sum({0})'.format(rhs_code)
+        if expr.arg.dtype is NativeBool():
+            return 'count({0})'.format(self._print_reduction_args(expr))
+        return 'sum({0})'.format(self._print_reduction_args(expr))
 
     def _print_NumpyProduct(self, expr):
         """Fortran print."""
 
-        rhs_code = self._print(expr.arg)
-        return 'product({0})'.format(rhs_code)
+        return 'product({0})'.format(self._print_reduction_args(expr))
 
-    def _print_NumpyMatmul(self, expr):
+    def _print_NumpyMin(self, expr):
         """Fortran print."""
-        a_code = self._print(expr.a)
-        b_code = self._print(expr.b)
 
-        if expr.a.order and expr.b.order:
-            if expr.a.order != expr.b.order:
-                raise NotImplementedError("Mixed order matmul not supported.")
+        return 'minval({0})'.format(self._print_reduction_args(expr))
 
-        # Fortran ordering
-        if expr.a.order == 'F':
-            return 'matmul({0},{1})'.format(a_code, b_code)
+    def _print_NumpyMax(self, expr):
+        """Fortran print."""
 
-        # C ordering
-        return 'matmul({1},{0})'.format(a_code, b_code)
+        return 'maxval({0})'.format(self._print_reduction_args(expr))
+
+    def _print_NumpyMatmul(self, expr):
+        """Fortran print."""
+        a, b = expr.a, expr.b
+        a_code = self._print(a)
+        b_code = self._print(b)
+
+        if a.rank == 1 and b.rank == 1:
+            # dot_product conjugates its first argument
+            if expr.dtype is NativeComplex():
+                return 'sum({0} * {1})'.format(a_code, b_code)
+            return 'dot_product({0},{1})'.format(a_code, b_code)
+
+        # The arrays of order C are stored transposed, and
+        # transpose(a @ b) = transpose(b) @ transpose(a)
+        if a.rank == 1:
+            args = (a_code, b_code) if b.order == 'F' else (b_code, a_code)
+        elif b.rank == 1:
+            args = (a_code, b_code) if a.order == 'F' else (b_code, a_code)
+        else:
+            order = expr.order
+            transpose = lambda x, code: code if x.order == order else 'transpose({})'.format(code)
+            args = (transpose(a, a_code), transpose(b, b_code))
+            if order == 'C':
+                args = args[::-1]
+        return 'matmul({0},{1})'.format(*args)
+
+    def _use_blas(self, lhs, expr):
+        """ Indicate if the product expr of arrays, which is assigned to lhs,
+        can be computed by BLAS: pyccel must be run with a BLAS library, the
+        arguments must be arrays of double precision reals and lhs must not
+        share its data with them
+        """
+        if not self._blas:
+            return False
+        args = (expr.a, expr.b)
+        if any(e.dtype is not NativeReal() or e.precision != 8 for e in (expr, *args)):
+            return False
+        if not all(isinstance(a, (Variable, IndexedElement)) for a in args):
+            return False
+        base = lambda x: x.base.internal_variable if isinstance(x, IndexedElement) else x
+        lhs_base = base(lhs)
+        return not any(lhs_base.is_pointer or base(a).is_pointer or base(a).name == lhs_base.name
+                for a in args)
+
+    def _print_blas_matmul(self, lhs, expr):
+        """ Print the assignment of the product expr of two matrices (or of a
+        matrix and a vector, or of two vectors) to lhs. The product is computed
+        by the intrinsic functions if it needs less than pyc_blas_threshold
+        multiplications, and by BLAS otherwise (see pyccel/stdlib/blas)
+        """
+        a, b = expr.a, expr.b
+        a_code = self._print(a)
+        b_code = self._print(b)
+        lhs_code = self._print(lhs)
+        kind = 'kind={}'.format(iso_c_binding["integer"][8])
+        size = lambda code, *dim: 'size({})'.format(', '.join([code, *dim, kind]))
+
+        if a.rank == 1 and b.rank == 1:
+            sizes = [size(a_code)]
+            call = '{} = pyc_ddot({}, {})'.format(lhs_code, a_code, b_code)
+        elif b.rank == 1:
+            # the matrix is stored transposed if its order is C
+            trans = 'N' if a.order == 'F' else 'T'
+            sizes = [size(a_code, '1'), size(a_code, '2')]
+            call = "call pyc_dgemv('{}', {}, {}, {})".format(trans, a_code, b_code, lhs_code)
+        elif a.rank == 1:
+            trans = 'T' if b.order == 'F' else 'N'
+            sizes = [size(b_code, '1'), size(b_code, '2')]
+            call = "call pyc_dgemv('{}', {}, {}, {})".format(trans, b_code, a_code, lhs_code)
+        else:
+            # the transposed product is computed if the order of the result is C
+            order = expr.order
+            args = [a, b] if order == 'F' else [b, a]
+            trans = ['N' if x.order == order else 'T' for x in args]
+            args_code = [self._print(x) for x in args]
+            sizes = [size(lhs_code, '1'), size(lhs_code, '2'),
+                     size(args_code[0], '2' if trans[0] == 'N' else '1')]
+            call = "call pyc_dgemm('{}', '{}', {}, {}, {})".format(*trans, *args_code, lhs_code)
+
+        self._additional_imports.add('pyc_blas')
+        return ('if ({size} <= pyc_blas_threshold) then\n'
+                '{lhs} = {intrinsic}\n'
+                'else\n'
+                '{call}\n'
+                'end if\n').format(size = ' * '.join(sizes), lhs = lhs_code,
+                        intrinsic = self._print(expr), call = call)
 
     def _print_NumpyEmpty(self, expr):
         errors.report(FORTRAN_ALLOCATABLE_IN_EXPRESSION, symbol=expr, severity='fatal')
@@ -661,12 +757,13 @@ class FCodePrinter(CodePrinter):
     def _print_NumpyNorm(self, expr):
         """Fortran print."""
 
-        if expr.dim:
-            rhs = 'Norm2({},{})'.format(self._print(expr.arg),self._print(expr.dim))
-        else:
-            rhs = 'Norm2({})'.format(self._print(expr.arg))
+        arg = expr.arg
+        if arg.dtype is NativeComplex():
+            arg = NumpyAbs(arg)
+        elif arg.dtype is not NativeReal():
+            arg = NumpyFloat(arg)
 
-        return rhs
+        return 'Norm2({})'.format(self._print_reduction_args(expr, arg))
 
     def _print_NumpyLinspace(self, expr):
 
@@ -805,34 +902,28 @@ class FCodePrinter(CodePrinter):
             errors.report(FORTRAN_ALLOCATABLE_IN_EXPRESSION,
                           symbol=expr, severity='fatal')
 
-        if (not self._additional_code):
-            self._additional_code = ''
-        var_name = self.parser.get_new_name()
-        var = Variable(expr.dtype, var_name, is_stack_array = all([s.is_constant for s in expr.shape]),
-                shape = expr.shape, precision = expr.precision,
-                order = expr.order, rank = expr.rank)
-
-        if self._current_function:
-            name = self._current_function
-            func = self.get_function(name)
-            func.local_vars.append(var)
-        else:
-            self._namespace.variables[var.name] = var
-
-        self._additional_code = self._additional_code + self._print(Assign(var,expr)) + '\n'
-        return self._print(var)
+        self._additional_imports.add('pyc_random')
+        return 'pyc_random_uniform()'
 
     def _print_NumpyRandint(self, expr):
         if expr.rank != 0:
             errors.report(FORTRAN_ALLOCATABLE_IN_EXPRESSION,
                           symbol=expr, severity='fatal')
+
+        self._additional_imports.add('pyc_random')
+        return 'pyc_randint({})'.format(self._print_randint_bounds(expr))
+
+    def _print_randint_bounds(self, expr):
+        """ Print the lower and upper bounds of the integers drawn by numpy.random.randint """
         if expr.high is None:
-            randreal = self._print(PyccelMul(expr.low, NumpyRand()))
+            low, high = LiteralInteger(0), expr.low
         else:
-            randreal = self._print(PyccelAdd(PyccelMul(PyccelMinus(expr.high, expr.low), NumpyRand()), expr.low))
+            low, high = expr.low, expr.high
+        return '{}, {}'.format(self._print(low), self._print(high))
 
-        prec_code = self._print(iso_c_binding["integer"][expr.precision])
-        return 'floor({}, kind={})'.format(randreal, prec_code)
+    def _print_NumpyRandomSeed(self, expr):
+        self._additional_imports.add('pyc_random')
+        return 'call pyc_random_seed({})\n'.format(self._print(expr.seed))
 
     def _print_NumpyFull(self, expr):
 
@@ -1110,7 +1201,11 @@ class FCodePrinter(CodePrinter):
 
         # Compute rank string
         # TODO: improve
-        if ((rank == 1) and (isinstance(shape, (int, LiteralInteger, Variable, PyccelAdd))) and
+        if (rank > 0) and is_static and intent and all(i is None for i in var.alloc_shape):
+            # assumed-shape argument of a bind(c) function (C descriptor)
+            rankstr = '({})'.format(','.join(['0:'] * rank))
+
+        elif ((rank == 1) and (isinstance(shape, (int, LiteralInteger, Variable, PyccelAdd))) and
             (not(allocatable or is_pointer) or is_static or is_stack_array)):
             rankstr = '({0}:{1}-1)'.format(self._print(s), self._print(shape))
 
@@ -1226,7 +1321,13 @@ class FCodePrinter(CodePrinter):
             return ''
 
         if isinstance(rhs, NumpyRand):
-            return 'call random_number({0})\n'.format(self._print(expr.lhs))
+            self._additional_imports.add('pyc_random')
+            return 'call pyc_random_number({0})\n'.format(lhs_code)
+
+        if isinstance(rhs, NumpyRandint) and rhs.rank > 0:
+            self._additional_imports.add('pyc_random')
+            return 'call pyc_random_integer({0}, {1})\n'.format(lhs_code,
+                    self._print_randint_bounds(rhs))
 
         if isinstance(rhs, NumpyEmpty):
             return ''
@@ -1237,6 +1338,9 @@ class FCodePrinter(CodePrinter):
             rhs  = 'modulo({})'.format(args)
             return '{0} = {1}\n'.format(lhs, rhs)
 
+        if isinstance(rhs, NumpyMatmul) and self._use_blas(expr.lhs, rhs):
+            return self._print_blas_matmul(expr.lhs, rhs)
+
         if isinstance(rhs, ConstructorCall):
             func = rhs.func
             name = str(func.name)
@@ -1323,6 +1427,10 @@ class FCodePrinter(CodePrinter):
 #------------------------------------------------------------------------------
     def _print_Allocate(self, expr):
 
+        # Stack arrays are declared with their shape
+        if expr.variable.is_stack_array:
+            return ''
+
         # Transpose indices because of Fortran column-major ordering
         shape = expr.shape if expr.order == 'F' else expr.shape[::-1]
 
@@ -1600,6 +1708,11 @@ class FCodePrinter(CodePrinter):
         return parts
 
     def _print_FunctionDef(self, expr):
+        # Arrays can only be returned if they are among the arguments, hence intent(out)
+        for r in expr.results:
+            if r.rank > 0 and r not in expr.arguments:
+                errors.report(UNSUPPORTED_ARRAY_RETURN_VALUE, symbol=r, severity='fatal')
+
         self._handle_fortran_specific_a_prioris(list(expr.local_vars) +
                                                 list(expr.arguments)  +
                                                 list(expr.results))
@@ -1865,26 +1978,21 @@ class FCodePrinter(CodePrinter):
     # .....................................................
     #                   OpenMP statements
     # .....................................................
-    def _print_OMP_Parallel_Construct(self, expr):
-        omp_expr   = str(expr.txt)
+    def _print_OmpAnnotatedComment(self, expr):
+        omp_expr = str(expr.txt)
+        omp_expr = re.sub(r'\bfor\b', 'do', omp_expr)
         ompexpr = '!$omp {}\n'.format(omp_expr)
         return ompexpr
 
     def _print_Omp_End_Clause(self, expr):
+        # a section is ended by the next one, or by the end of the sections
+        if expr.construct == 'section':
+            return ''
         omp_expr = str(expr.txt)
-        omp_expr = omp_expr.replace("for", "do")
+        omp_expr = re.sub(r'\bfor\b', 'do', omp_expr)
         ompexpr = '!$omp {}\n'.format(omp_expr)
         return ompexpr
 
-    def _print_OMP_Single_Construct(self, expr):
-        omp_expr   = str(expr.txt)
-        ompexpr = '!$omp {}\n'.format(omp_expr)
-        return ompexpr
-
-    def _print_OMP_For_Loop(self, expr):
-        omp_expr   = str(expr.txt)
-        return '!$omp do{}\n'.format(omp_expr)
-
     # .....................................................
     def _print_OMP_Parallel(self, expr):
         clauses = ' '.join(self._print(i)  for i in expr.clauses)
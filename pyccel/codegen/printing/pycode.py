@@ -40,6 +40,8 @@ class PythonCodePrinter(SympyPythonCodePrinter):
 
     def __init__(self, parser=None, settings=None):
         self.assert_contiguous = settings.pop('assert_contiguous', False)
+        # the products of matrices are computed by numpy
+        settings.pop('blas', None)
         self.parser = parser
         SympyPythonCodePrinter.__init__(self, settings=settings)
 
@@ -0,0 +1,205 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Contains the profiler used to measure where the time of a pyccel build is
+spent.
+
+When it is enabled (see the option profile of execute_pyccel), the profiler
+records the wall time of each stage of the pipeline for each module. For the
+stages run by Python (parsing, annotation, code generation) it also records
+the peak of the memory allocated during the stage, measured with tracemalloc,
+and they can be profiled with cProfile.
+The memory used by the compilers is not measured per stage: the resource
+usage of a child process includes the memory of the pyccel process it was
+forked from. Only the maximum resident set size of the pyccel process is
+reported.
+"""
+
+import cProfile
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+__all__ = ['Profiler']
+
+#==============================================================================
+def _max_rss():
+    """ Maximum resident set size (in bytes) of the process, or None if it
+    is unknown
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes, except on macOS
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+#==============================================================================
+class Profiler:
+    """
+    Singleton recording the duration and the memory usage of the stages of
+    the pipeline. It does nothing unless it was started.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._enabled  = False
+            cls._instance._stages   = []
+            cls._instance._cprofile = None
+            cls._instance._lock     = threading.Lock()
+            cls._instance._start    = 0.0
+            cls._instance._depth    = 0
+        return cls._instance
+
+    @property
+    def enabled(self):
+        """ True if the stages are being recorded """
+        return self._enabled
+
+    @property
+    def stages(self):
+        """ The stages recorded since the profiler was started """
+        return list(self._stages)
+
+    def start(self, cprofile = False):
+        """
+        Forget the recorded stages and start recording.
+
+        Parameters
+        ----------
+        cprofile : bool
+                Also profile the Python stages with cProfile
+        """
+        self._stages   = []
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._depth    = 0
+        self._start    = time.perf_counter()
+        self._end      = None
+        self._enabled  = True
+        self._tracemalloc = not tracemalloc.is_tracing()
+        if self._tracemalloc:
+            tracemalloc.start()
+
+    def stop(self):
+        """ Stop recording """
+        if not self._enabled:
+            return
+        self._enabled = False
+        self._end     = time.perf_counter()
+        if self._tracemalloc:
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name, module = None, compiler = False):
+        """
+        Context manager recording the stage which it encloses.
+
+        Parameters
+        ----------
+        name     : str
+                Name of the stage (e.g. 'semantic')
+
+        module   : str
+                File treated by the stage
+
+        compiler : bool
+                True if the stage runs a compiler instead of Python code.
+                Such stages may be run simultaneously in different threads,
+                only their wall time is recorded
+        """
+        if not self._enabled:
+            yield
+            return
+
+        # Only the outermost Python stage is measured by tracemalloc/cProfile
+        python_stage = not compiler and self._depth == 0
+        if not compiler:
+            self._depth += 1
+        if python_stage:
+            current, _ = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            if self._cprofile:
+                self._cprofile.enable()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start
+            record = {'stage'     : name,
+                      'module'    : module,
+                      'start'     : start - self._start,
+                      'wall_time' : wall_time}
+            if python_stage:
+                if self._cprofile:
+                    self._cprofile.disable()
+                _, peak = tracemalloc.get_traced_memory()
+                record['peak_memory'] = max(peak - current, 0)
+            if not compiler:
+                self._depth -= 1
+            with self._lock:
+                self._stages.append(record)
+
+    def wrap(self, name, module, func):
+        """ Return a function calling func in the compiler stage 'name'
+        (used for the tasks run by a BuildGraph)
+        """
+        def profiled_func(*args, **kwargs):
+            with self.stage(name, module, compiler = True):
+                return func(*args, **kwargs)
+        return profiled_func if self._enabled else func
+
+    def report(self, **info):
+        """
+        Summarise the recorded stages.
+
+        Parameters
+        ----------
+        info : dict
+                Additional information saved in the report (e.g. the file
+                which was translated)
+
+        Returns
+        -------
+        report : dict
+                JSON serialisable dictionary containing info, the total wall
+                time, the maximum resident set size of the process, the list
+                of stages sorted by starting time, and the total time spent
+                in each type of stage
+        """
+        end = self._end if self._end is not None else time.perf_counter()
+        stages = sorted(self._stages, key = lambda s: s['start'])
+        totals = {}
+        for s in stages:
+            total = totals.setdefault(s['stage'], {'wall_time' : 0.0, 'count' : 0})
+            total['wall_time'] += s['wall_time']
+            total['count']     += 1
+        return dict(info,
+                    wall_time = end - self._start,
+                    max_rss   = _max_rss(),
+                    stages    = stages,
+                    totals    = totals)
+
+    def write(self, filename, **info):
+        """ Save the report (see Profiler.report) in a JSON file """
+        with open(filename, 'w') as f:
+            json.dump(self.report(**info), f, indent=1)
+
+    def dump_stats(self, filename):
+        """ Save the cProfile statistics of the Python stages (see pstats) """
+        if self._cprofile is None:
+            raise RuntimeError('The profiler was started without cProfile')
+        self._cprofile.dump_stats(filename)
@@ -8,6 +8,8 @@ import sys
 import subprocess
 import os
 import glob
+import shlex
+import sysconfig
 import warnings
 
 from pyccel.ast.bind_c                      import as_static_function_call
@@ -15,13 +17,17 @@ from pyccel.ast.core                        import SeparatorComment
 from pyccel.codegen.printing.fcode          import fcode
 from pyccel.codegen.printing.cwrappercode   import cwrappercode
 from pyccel.codegen.utilities               import compile_files, get_gfortran_library_dir
+from pyccel.codegen.profiling               import Profiler
 from .cwrapper import create_c_setup
 
 from pyccel.errors.errors import Errors
 
+import pyccel.stdlib as stdlib_folder
+
 errors = Errors()
 
-__all__ = ['create_shared_library', 'fortran_c_flag_equivalence']
+__all__ = ['create_shared_library', 'fortran_c_flag_equivalence',
+           'get_python_build_config', 'link_shared_library']
 
 #==============================================================================
 
@@ -29,6 +35,131 @@ PY_VERSION = sys.version_info[0:2]
 
 fortran_c_flag_equivalence = {'-Wconversion-extra' : '-Wconversion' }
 
+# Folder of the headers used by the wrappers
+cwrapper_folder = os.path.join(os.path.dirname(stdlib_folder.__file__), 'cwrapper')
+
+# Compilers and paths used to build Python extensions (see get_python_build_config)
+_python_build_config = {}
+
+#==============================================================================
+def get_python_build_config():
+    """
+    Get the commands and paths needed to build a Python extension module
+    without setuptools. They are read from sysconfig and numpy once per
+    process. As with setuptools, the environment variables CC, CFLAGS and
+    LDSHARED take precedence over the values used to build Python.
+
+    Returns
+    -------
+    config : dict
+            The keys are 'cc', 'cflags', 'ldshared' (lists of str),
+            'includes' (Python and NumPy include directories) and
+            'ext_suffix' (file name extension of an extension module).
+            None is returned if the extension must be built by setuptools
+            (e.g. on Windows)
+    """
+    if 'config' not in _python_build_config:
+        config = None
+        cc       = os.environ.get('CC', sysconfig.get_config_var('CC'))
+        ldshared = os.environ.get('LDSHARED', sysconfig.get_config_var('LDSHARED'))
+        if sys.platform != 'win32' and cc and ldshared:
+            import numpy # pylint: disable=import-outside-toplevel
+            cflags = ' '.join([os.environ.get('CFLAGS', sysconfig.get_config_var('CFLAGS') or ''),
+                               sysconfig.get_config_var('CCSHARED') or ''])
+            paths = sysconfig.get_paths()
+            includes = [paths['include'], numpy.get_include()]
+            if paths['platinclude'] != paths['include']:
+                includes.insert(1, paths['platinclude'])
+            config = {'cc'         : shlex.split(cc),
+                      'cflags'     : shlex.split(cflags),
+                      'ldshared'   : shlex.split(ldshared),
+                      'includes'   : includes,
+                      'ext_suffix' : sysconfig.get_config_var('EXT_SUFFIX')}
+        _python_build_config['config'] = config
+    return _python_build_config['config']
+
+#==============================================================================
+def _run_build_command(cmd, verbose):
+    """ Run a compiler command, raising a RuntimeError if it fails """
+    if verbose:
+        print(' '.join(shlex.quote(c) for c in cmd))
+    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                       universal_newlines=True, check=False)
+    if p.returncode != 0:
+        err_msg = "Failed to build module"
+        if verbose:
+            err_msg += "\n" + p.stdout
+        raise RuntimeError(err_msg)
+    if p.stdout:
+        warnings.warn(UserWarning(p.stdout))
+
+def link_shared_library(config, sharedlib_modname, wrapper_filename,
+                        dependencies,
+                        includes = (),
+                        libs     = (),
+                        libdirs  = (),
+                        flags    = (),
+                        verbose  = False):
+    """
+    Compile the C wrapper of a module and link it with the object files of
+    the module to create a Python extension module. The compiler is called
+    directly, following the rules used by setuptools.
+
+    Parameters
+    ----------
+    config            : dict
+            The build configuration returned by get_python_build_config
+
+    sharedlib_modname : str
+            The name of the Python module
+
+    wrapper_filename  : str
+            The C file containing the wrapper. The shared library is
+            created in the same folder
+
+    dependencies      : list of str
+            The object files needed by the module (without the '.o')
+
+    includes          : list of str
+            Include directories needed for compiling
+
+    libs              : list of str
+            Libraries needed for linking
+
+    libdirs           : list of str
+            Library directories needed for linking
+
+    flags             : list of str
+            Additional flags to pass to the compiler. The flags starting
+            with '-Wl' are also passed to the linker
+
+    verbose           : bool
+            Print the commands
+
+    Returns
+    -------
+    sharedlib_filepath : str
+            The absolute path to the shared library
+    """
+    wrapper_object = os.path.splitext(wrapper_filename)[0] + '.o'
+    sharedlib_filepath = os.path.join(os.path.dirname(os.path.abspath(wrapper_filename)),
+                                      sharedlib_modname + config['ext_suffix'])
+
+    compile_cmd = [*config['cc'], *config['cflags'],
+                   *['-I{}'.format(i) for i in (*includes, *config['includes'])],
+                   '-c', wrapper_filename, '-o', wrapper_object, *flags]
+    _run_build_command(compile_cmd, verbose)
+
+    link_cmd = [*config['ldshared'], wrapper_object,
+                *['{}.o'.format(d) for d in dependencies],
+                *['-L{}'.format(d) for d in libdirs],
+                *['-l{}'.format(l) for l in libs],
+                *[f for f in flags if f.startswith('-Wl')],
+                '-o', sharedlib_filepath]
+    _run_build_command(link_cmd, verbose)
+
+    return sharedlib_filepath
+
 #==============================================================================
 def create_shared_library(codegen,
                           language,
@@ -51,9 +182,9 @@ def create_shared_library(codegen,
     # Get module name
     module_name = codegen.name
 
-    # Change working directory to '__pyccel__'
-    base_dirpath = os.getcwd()
-    os.chdir(pyccel_dirpath)
+    # Each step is recorded by the profiler (if it is enabled)
+    profiler    = Profiler()
+    source_file = codegen.parser.filename
 
     # Name of shared library
     if sharedlib_modname is None:
@@ -65,24 +196,25 @@ def create_shared_library(codegen,
         extra_libs = []
         extra_libdirs = []
         if language == 'fortran':
-            # Construct static interface for passing array shapes and write it to file bind_c_MOD.f90
+            # Construct static interface for passing array descriptors and write it to file bind_c_MOD.f90
             funcs = [f for f in codegen.routines if not f.is_private]
             sep = fcode(SeparatorComment(40), codegen.parser)
             bind_c_funcs = [as_static_function_call(f, module_name, name=f.name) for f in funcs]
             bind_c_code = '\n'.join([sep + fcode(f, codegen.parser) + sep for f in bind_c_funcs])
-            bind_c_filename = 'bind_c_{}.f90'.format(module_name)
+            bind_c_filename = os.path.join(pyccel_dirpath, 'bind_c_{}.f90'.format(module_name))
 
             with open(bind_c_filename, 'w') as f:
                 f.writelines(bind_c_code)
 
-            compile_files(bind_c_filename, compiler, flags,
-                binary=None,
-                verbose=verbose,
-                is_module=True,
-                output=pyccel_dirpath,
-                libs=libs,
-                libdirs=libdirs,
-                language=language)
+            with profiler.stage('bind_c compilation', source_file, compiler = True):
+                compile_files(bind_c_filename, compiler, flags,
+                    binary=None,
+                    verbose=verbose,
+                    is_module=True,
+                    output=pyccel_dirpath,
+                    libs=libs,
+                    libdirs=libdirs,
+                    language=language)
 
             dep_mods = (os.path.join(pyccel_dirpath,'bind_c_{}'.format(module_name)), *dep_mods)
             if compiler == 'gfortran':
@@ -91,18 +223,21 @@ def create_shared_library(codegen,
             elif compiler == 'ifort':
                 extra_libs.append('ifcore')
 
+        includes = [*includes, cwrapper_folder]
+
         if sys.platform == 'win32':
             extra_libs.append('quadmath')
 
         module_old_name = codegen.expr.name
         codegen.expr.set_name(sharedlib_modname)
-        wrapper_code = cwrappercode(codegen.expr, codegen.parser, language)
+        with profiler.stage('wrapper generation', source_file):
+            wrapper_code = cwrappercode(codegen.expr, codegen.parser, language)
         if errors.has_errors():
             return
 
         codegen.expr.set_name(module_old_name)
         wrapper_filename_root = '{}_wrapper'.format(module_name)
-        wrapper_filename = '{}.c'.format(wrapper_filename_root)
+        wrapper_filename = os.path.join(pyccel_dirpath, '{}.c'.format(wrapper_filename_root))
 
         with open(wrapper_filename, 'w') as f:
             f.writelines(wrapper_code)
@@ -118,20 +253,31 @@ def create_shared_library(codegen,
                     idx += 1
                 idx += 1
 
-        setup_code = create_c_setup(sharedlib_modname, wrapper_filename,
+        # Build the extension directly if possible, otherwise use setuptools
+        config = get_python_build_config()
+        if config is not None:
+            with profiler.stage('shared library link', source_file, compiler = True):
+                sharedlib_filepath = link_shared_library(config, sharedlib_modname,
+                        wrapper_filename, dep_mods, includes, libs + extra_libs,
+                        libdirs + extra_libdirs, c_flags, verbose)
+            return sharedlib_filepath
+
+        setup_code = create_c_setup(sharedlib_modname, os.path.basename(wrapper_filename),
                 dep_mods, compiler, includes, libs + extra_libs, libdirs + extra_libdirs, c_flags)
-        setup_filename = "setup_{}.py".format(module_name)
+        setup_filename = os.path.join(pyccel_dirpath, "setup_{}.py".format(module_name))
 
         with open(setup_filename, 'w') as f:
             f.writelines(setup_code)
 
-        setup_filename = os.path.join(pyccel_dirpath, setup_filename)
         cmd = [sys.executable, setup_filename, "build"]
 
         if verbose:
             print(' '.join(cmd))
-        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        out, err = p.communicate()
+        # setuptools builds the extension in the working directory of the command
+        with profiler.stage('shared library link', source_file, compiler = True):
+            p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                 universal_newlines=True, cwd=pyccel_dirpath)
+            out, err = p.communicate()
         if verbose:
             print(out)
         if p.returncode != 0:
@@ -152,11 +298,8 @@ def create_shared_library(codegen,
     else:
         extext = 'so'
     pattern = '{}{}*.{}'.format(sharedlib_folder, sharedlib_modname, extext)
-    sharedlib_filename = glob.glob(pattern)[0]
+    sharedlib_filename = glob.glob(os.path.join(pyccel_dirpath, pattern))[0]
     sharedlib_filepath = os.path.abspath(sharedlib_filename)
 
-    # Change working directory back to starting point
-    os.chdir(base_dirpath)
-
     # Return absolute path of shared library
     return sharedlib_filepath
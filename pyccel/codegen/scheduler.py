@@ -0,0 +1,162 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Contains the tools used to order the modules of a project and to run the
+independent compilation steps in parallel
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+__all__ = ['topological_order', 'BuildGraph']
+
+#==============================================================================
+def topological_order(roots, get_children):
+    """
+    Order a directed acyclic graph so that the children of a node always
+    appear before the node itself. Each node appears only once.
+
+    Parameters
+    ----------
+    roots        : iterable
+                   The nodes from which the graph is walked
+
+    get_children : callable
+                   Function returning the children of a node
+
+    Returns
+    -------
+    order : list
+            The nodes of the graph in topological order
+    """
+    order   = []
+    visited = set()
+
+    def visit(node):
+        if id(node) in visited:
+            return
+        visited.add(id(node))
+        for child in get_children(node):
+            visit(child)
+        order.append(node)
+
+    for r in roots:
+        visit(r)
+
+    return order
+
+#==============================================================================
+class BuildGraph:
+    """
+    A set of build tasks with dependencies between them.
+
+    Each task is a function call which can only be started once all the
+    tasks it depends on are finished. The tasks are run in the calling thread
+    if only one job is requested, and on a thread pool otherwise. Threads are
+    sufficient as the tasks are expected to spend their time waiting on
+    compiler subprocesses.
+    """
+    def __init__(self):
+        self._tasks  = OrderedDict()
+        self._failed = None
+
+    def add_task(self, name, func, *args, dependencies = (), **kwargs):
+        """
+        Add a task to the graph.
+
+        Parameters
+        ----------
+        name         : str
+                       Unique name of the task
+
+        func         : callable
+                       Function called to carry out the task
+
+        args         : tuple
+                       Positional arguments passed to func
+
+        dependencies : iterable of str
+                       Names of the tasks which must be finished before this
+                       task is started. Names which do not belong to the
+                       graph are ignored
+
+        kwargs       : dict
+                       Keyword arguments passed to func
+        """
+        if name in self._tasks:
+            raise KeyError('Task {} is already in the build graph'.format(name))
+        self._tasks[name] = (func, args, kwargs, tuple(dependencies))
+
+    def __contains__(self, name):
+        return name in self._tasks
+
+    def __len__(self):
+        return len(self._tasks)
+
+    @property
+    def failed(self):
+        """ Name of the task which raised an exception during the last run """
+        return self._failed
+
+    def _ready(self, pending, done):
+        """ Names of the pending tasks whose dependencies are all finished """
+        return [name for name, (_, _, _, deps) in pending.items()
+                if all(d in done or d not in self._tasks for d in deps)]
+
+    def _call(self, name):
+        func, args, kwargs, _ = self._tasks[name]
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            self._failed = name
+            raise
+
+    def run(self, jobs = 1):
+        """
+        Run all the tasks in an order which respects their dependencies.
+        If a task fails, no new task is started and its exception is raised
+        once the running tasks are finished.
+
+        Parameters
+        ----------
+        jobs : int
+               Maximum number of tasks run simultaneously
+
+        Returns
+        -------
+        results : OrderedDict
+               The value returned by each task, indexed by name
+        """
+        self._failed = None
+        pending = OrderedDict(self._tasks)
+        done    = OrderedDict()
+
+        if jobs is None or jobs <= 1:
+            while pending:
+                ready = self._ready(pending, done)
+                if not ready:
+                    raise RuntimeError('Cyclic dependencies between the tasks {}'.format(list(pending)))
+                for name in ready:
+                    pending.pop(name)
+                    done[name] = self._call(name)
+            return done
+
+        with ThreadPoolExecutor(max_workers = jobs) as pool:
+            running = {}
+            while pending or running:
+                for name in self._ready(pending, done):
+                    pending.pop(name)
+                    running[pool.submit(self._call, name)] = name
+
+                if not running:
+                    raise RuntimeError('Cyclic dependencies between the tasks {}'.format(list(pending)))
+
+                finished, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    done[name] = future.result()
+
+        return done
@@ -14,7 +14,8 @@ import subprocess
 import sys
 import warnings
 
-__all__ = ['construct_flags', 'compile_files', 'get_gfortran_library_dir']
+__all__ = ['construct_flags', 'compile_files', 'get_gfortran_library_dir',
+           'get_compiler_version']
 
 #==============================================================================
 # TODO use constructor and a dict to map flags w.r.t the compiler
@@ -22,6 +23,9 @@ _avail_compilers = ['gfortran', 'mpif90', 'pgfortran', 'ifort', 'gcc', 'icc']
 
 language_extension = {'fortran':'f90', 'c':'c', 'python':'py'}
 
+# versions of the compilers which have already been queried
+_compiler_versions = {}
+
 #==============================================================================
 # TODO add opt flags, etc... look at f2py interface in numpy
 def construct_flags(compiler,
@@ -64,6 +68,10 @@ def construct_flags(compiler,
         if debug:
             flags += " -fcheck=bounds"
 
+    if compiler == "gcc":
+        # the '#pragma omp simd' of the array expressions are used without openmp
+        flags += " -fopenmp-simd"
+
     if compiler == "mpif90":
         if debug:
             flags += " -fcheck=bounds"
@@ -121,11 +129,12 @@ def compile_files(filename, compiler, flags,
     j_code = ''
     if is_module:
         flags += ' -c '
-        if (len(output)>0) and language == "fortran":
-            if compiler == "ifort":
-                j_code = '-module "{folder}"'.format(folder=output)
-            else:
-                j_code = '-J"{folder}"'.format(folder=output)
+    # The .mod files are written in the output folder (not in the working directory)
+    if (len(output)>0) and language == "fortran":
+        if compiler == "ifort":
+            j_code = '-module "{folder}"'.format(folder=output)
+        else:
+            j_code = '-J"{folder}"'.format(folder=output)
 
     m_code = ' '.join('{}.o'.format(m) for m in modules)
     if is_module:
@@ -182,9 +191,19 @@ def get_gfortran_library_dir():
         file_name = 'libgfortran.a'
     file_location = subprocess.check_output([shutil.which('gfortran'), '-print-file-name='+file_name],
             universal_newlines = True)
-    lib_dir = os.path.abspath(os.path.dirname(file_location))
-    if lib_dir:
-        if lib_dir not in sys.path:
-            # Add to sytem path
-            sys.path.insert(0, lib_dir)
-    return lib_dir
+    return os.path.abspath(os.path.dirname(file_location))
+
+def get_compiler_version(compiler):
+    """Return the first line printed by 'compiler --version' (or an empty
+    string if the compiler cannot be run). The result is cached so that the
+    compiler is only called once per process.
+    """
+    if compiler not in _compiler_versions:
+        try:
+            output = subprocess.check_output([compiler, '--version'],
+                    stderr=subprocess.STDOUT, universal_newlines=True)
+            version = output.strip().split('\n')[0]
+        except (OSError, subprocess.CalledProcessError):
+            version = ''
+        _compiler_versions[compiler] = version
+    return _compiler_versions[compiler]
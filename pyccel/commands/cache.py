@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+import time
+import argparse
+
+__all__ = ['pyccel_cache']
+
+#==============================================================================
+def pyccel_cache():
+    """
+    pyccel-cache console command: inspect or clear the epyccel cache.
+    """
+    parser = argparse.ArgumentParser(description='Inspect or clear the cache of shared libraries generated by epyccel')
+
+    parser.add_argument('--dir', type=str, default=None,
+                        help='cache folder (default: $PYCCEL_CACHE_DIR or ~/.cache/pyccel).')
+    parser.add_argument('--clear', action='store_true',
+                        help='remove all entries from the cache.')
+    parser.add_argument('--list', action='store_true',
+                        help='list the entries in the cache.')
+
+    args = parser.parse_args()
+
+    from pyccel.codegen.cache import cache_info, clear_cache
+
+    if args.clear:
+        clear_cache(args.dir)
+
+    info = cache_info(args.dir)
+    print('cache folder : {}'.format(info['path']))
+    print('entries      : {}'.format(len(info['entries'])))
+    print('size         : {:.1f} MiB / {:.1f} MiB'.format(info['size'] / 2**20, info['max_size'] / 2**20))
+
+    if args.list:
+        for e in info['entries']:
+            last_used = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(e['last_used']))
+            print('{key:.16}  {last_used}  {size:>10}  {name}'.format(key = e['key'],
+                last_used = last_used, size = e['size'], name = e.get('module_name', '')))
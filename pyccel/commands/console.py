@@ -116,9 +116,16 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                         default=(),
                         help='list of libraries to link with.')
 
+    group.add_argument('--blas', choices=('openblas', 'reference', 'none'), default='none',
+                       help='BLAS library used to compute the products of large matrices (default: none).')
+
     group.add_argument('--output', type=str, default = '',\
                        help='folder in which the output is stored.')
 
+    group.add_argument('-j', '--jobs', type=int, nargs='?', default=1,
+                        const=os.cpu_count(), metavar='N',
+                        help='number of compilations run simultaneously (default: 1, or the number of CPUs if N is omitted).')
+
     # ...
 
     # ... Accelerators
@@ -127,6 +134,8 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                        help='uses openmp')
     group.add_argument('--openacc', action='store_true', \
                        help='uses openacc')
+    group.add_argument('--auto-parallel', action='store_true', \
+                       help='parallelises with openmp the loops whose iterations are independent (implies --openmp).')
     # ...
 
     # ... Other options
@@ -135,6 +144,11 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                         help='enables verbose mode.')
     group.add_argument('--developer-mode', action='store_true', \
                         help='shows internal messages')
+    group.add_argument('--profile', type=str, nargs='?', default=False,
+                        const=True, metavar='FILE',
+                        help='saves the time and memory used by each stage in a JSON file (default: __pyccel__/<module>_profile.json).')
+    group.add_argument('--cprofile', type=str, default=None, metavar='FILE',
+                        help='saves the cProfile statistics of the Python stages in FILE.')
     # ...
 
     # TODO move to another cmd line
@@ -232,8 +246,6 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
         err_mode.set_mode('developer')
     # ...
 
-    base_dirpath = os.getcwd()
-
     try:
         # TODO: prune options
         execute_pyccel(filename,
@@ -251,11 +263,14 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                        libs          = args.libs,
                        debug         = args.debug,
                        accelerator   = accelerator,
-                       folder        = args.output)
+                       auto_parallel = args.auto_parallel,
+                       blas          = args.blas,
+                       folder        = args.output,
+                       jobs          = args.jobs,
+                       profile       = args.profile,
+                       cprofile      = args.cprofile)
     except PyccelError:
         sys.exit(1)
-    finally:
-        os.chdir(base_dirpath)
 
     return
 
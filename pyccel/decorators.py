@@ -20,7 +20,8 @@ __all__ = (
     'private',
     'elemental',
     'stack_array',
-    'allow_negative_index'
+    'allow_negative_index',
+    'nogil'
 )
 
 def lambdify(f):
@@ -96,3 +97,17 @@ def allow_negative_index(f,*args):
     def identity(f):
         return f
     return identity
+
+def nogil(f):
+    """
+    Decorator indicates that the python wrapper of the function releases
+    the GIL while the compiled function runs, so the function can be called
+    in parallel by several python threads. The arguments are still
+    collected and the results built with the GIL held
+
+    Parameters
+    ----------
+    f : Function
+        The function to which the decorator is applied
+    """
+    return f
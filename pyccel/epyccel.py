@@ -6,19 +6,48 @@
 
 
 import inspect
-import importlib
+import logging
 import sys
 import os
+import shutil
 import string
 import random
+import tempfile
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import update_wrapper
 from types import ModuleType, FunctionType
-from importlib.machinery import ExtensionFileLoader
+from importlib.machinery import ExtensionFileLoader, EXTENSION_SUFFIXES
+from importlib.util      import spec_from_file_location, module_from_spec
 
-from pyccel.codegen.pipeline import execute_pyccel
-from pyccel.errors.errors import PyccelError
+from pyccel.codegen.cache    import EpyccelCache, get_local_dependencies
+from pyccel.errors.errors import Errors, PyccelError
 
-__all__ = ['random_string', 'get_source_function', 'epyccel_seq', 'epyccel']
+__all__ = ['random_string', 'get_source_function', 'get_source_functions',
+           'import_shared_library', 'epyccel_seq', 'epyccel', 'epyccel_many',
+           'BackgroundEpyccel']
+
+# Errors raised by the builds run in the background are logged here
+logger = logging.getLogger(__name__)
+
+# The pyccel parsers use global state (e.g. the Errors singleton), so the
+# builds of a process are run one after the other. The builds of different
+# processes are isolated by their build folders and by file locks
+_build_lock = threading.RLock()
+
+# Executor running the builds requested with background=True
+_background_executor = None
+
+#==============================================================================
+def execute_pyccel(fname, **kwargs):
+    """
+    Call pyccel.codegen.pipeline.execute_pyccel. The pipeline (and sympy) is
+    only imported when the first shared library is built, so that importing
+    epyccel and loading libraries from the cache is fast.
+    """
+    from pyccel.codegen.pipeline import execute_pyccel as pipeline_execute_pyccel # pylint: disable=import-outside-toplevel
+    return pipeline_execute_pyccel(fname, **kwargs)
 
 #==============================================================================
 random_selector = random.SystemRandom()
@@ -47,6 +76,106 @@ def get_source_function(func):
 
     return code
 
+#==============================================================================
+def get_function_helpers(func):
+    """
+    Find the Python functions called by func which are defined in the same
+    module (either at module level or in an enclosing function).
+
+    Parameters
+    ----------
+    func : FunctionType
+        The function whose helpers are searched
+
+    Returns
+    -------
+    helpers : list of FunctionType
+        The helper functions
+    """
+    # Names used by the function, including in its nested functions
+    names = set()
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        names.update(code.co_freevars)
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+
+    candidates = dict(func.__globals__)
+    if func.__closure__:
+        for name, cell in zip(func.__code__.co_freevars, func.__closure__):
+            try:
+                candidates[name] = cell.cell_contents
+            except ValueError: # Empty cell
+                pass
+
+    return [candidates[n] for n in sorted(names) if n in candidates and \
+            isinstance(candidates[n], FunctionType) and \
+            candidates[n] is not func and \
+            candidates[n].__module__ == func.__module__]
+
+def get_source_functions(functions):
+    """
+    Get the code of a module containing several functions and all the
+    helper functions which they call (see get_function_helpers).
+    The helpers are placed before the functions which call them.
+
+    Parameters
+    ----------
+    functions : iterable of FunctionType
+        The functions to be placed in the module
+
+    Returns
+    -------
+    code : str
+        The source code of the module
+    """
+    ordered = []
+    names   = {}
+
+    def add_function(func, visiting):
+        if func.__name__ in names:
+            if names[func.__name__] is not func:
+                raise ValueError('Two different functions are named {}'.format(func.__name__))
+            return
+        if func in visiting: # Recursive functions
+            return
+        visiting = (*visiting, func)
+        for helper in get_function_helpers(func):
+            add_function(helper, visiting)
+        names[func.__name__] = func
+        ordered.append(func)
+
+    for f in functions:
+        if not isinstance(f, FunctionType):
+            raise TypeError('> Expecting a FunctionType')
+        add_function(f, ())
+
+    return '\n'.join(get_source_function(f) for f in ordered)
+
+#==============================================================================
+def import_shared_library(module_name, folder):
+    """
+    Import the Python extension module 'module_name' located in 'folder'.
+    The module is loaded from its file, without modifying sys.path, and is
+    added to sys.modules.
+    An ImportError is raised if no shared library is found.
+    """
+    for suffix in EXTENSION_SUFFIXES:
+        filepath = os.path.join(folder, module_name + suffix)
+        if os.path.isfile(filepath):
+            break
+    else:
+        raise ImportError('Could not load shared library', name = module_name)
+
+    loader  = ExtensionFileLoader(module_name, filepath)
+    spec    = spec_from_file_location(module_name, filepath, loader = loader)
+    package = module_from_spec(spec)
+    loader.exec_module(package)
+    sys.modules[module_name] = package
+
+    return package
+
 #==============================================================================
 def epyccel_seq(function_or_module, *,
                 language     = None,
@@ -54,105 +183,157 @@ def epyccel_seq(function_or_module, *,
                 mpi_compiler = None,
                 fflags       = None,
                 accelerator  = None,
+                auto_parallel= False,
+                blas         = None,
                 verbose      = False,
                 debug        = False,
                 includes     = (),
                 libdirs      = (),
                 modules      = (),
                 libs         = (),
-                folder       = None):
+                folder       = None,
+                cache        = True):
 
     # ... get the module source code
     if isinstance(function_or_module, FunctionType):
         pyfunc = function_or_module
         code = get_source_function(pyfunc)
 
-        tag = random_string(8)
-        module_name = 'mod_{}'.format(tag)
-
-        while module_name in sys.modules.keys():
-            tag = random_string(8)
-            module_name = 'mod_{}'.format(tag)
-
-        pymod_filename = '{}.py'.format(module_name)
-        pymod_filepath = os.path.abspath(pymod_filename)
+        module_import_prefix = 'mod_'
+        pymod_dirpath = os.getcwd()
 
     elif isinstance(function_or_module, ModuleType):
         pymod = function_or_module
         pymod_filepath = pymod.__file__
-        pymod_filename = os.path.basename(pymod_filepath)
+        pymod_dirpath, pymod_filename = os.path.split(pymod_filepath)
         lines = inspect.getsourcelines(pymod)[0]
         code = ''.join(lines)
 
-        tag = random_string(8)
-        module_import_prefix = pymod.__name__ + '_'
-        while module_import_prefix + tag in sys.modules.keys():
-            tag = random_string(n=8)
+        module_import_prefix = pymod.__name__.split('.')[-1] + '_'
+
+    elif isinstance(function_or_module, (list, tuple)):
+        code = get_source_functions(function_or_module)
 
-        module_name = pymod.__name__.split('.')[-1] + '_' + tag
+        module_import_prefix = 'mod_'
+        pymod_dirpath = os.getcwd()
 
     else:
-        raise TypeError('> Expecting a FunctionType or a ModuleType')
+        raise TypeError('> Expecting a FunctionType, a ModuleType or a list of FunctionType')
     # ...
 
-    # Store current directory
-    base_dirpath = os.getcwd()
-
     # Define working directory 'folder'
     if folder is None:
-        folder = os.path.dirname(pymod_filepath)
+        folder = pymod_dirpath
     else:
         folder = os.path.abspath(folder)
 
-    # Define directory name and path for epyccel files
-    epyccel_dirname = '__epyccel__'
-    epyccel_dirpath = os.path.join(folder, epyccel_dirname)
-
-    # Create new directories if not existing
-    os.makedirs(folder, exist_ok=True)
-    os.makedirs(epyccel_dirpath, exist_ok=True)
-
-    # Change working directory to '__epyccel__'
-    os.chdir(epyccel_dirpath)
-
-    # Store python file in '__epyccel__' folder, so that execute_pyccel can run
-    with open(pymod_filename, 'w') as f:
-        f.writelines(code)
-
-    try:
-        # Generate shared library
-        execute_pyccel(pymod_filename,
-                       verbose     = verbose,
-                       language    = language,
-                       compiler    = compiler,
-                       mpi_compiler= mpi_compiler,
-                       fflags      = fflags,
-                       includes    = includes,
-                       libdirs     = libdirs,
-                       modules     = modules,
-                       libs        = libs,
-                       debug       = debug,
-                       accelerator = accelerator,
-                       output_name = module_name)
-    finally:
-        # Change working directory back to starting point
-        os.chdir(base_dirpath)
-
-
-    # Import shared library
-    sys.path.insert(0, epyccel_dirpath)
-
-    # http://ballingt.com/import-invalidate-caches
-    # https://docs.python.org/3/library/importlib.html#importlib.invalidate_caches
-    importlib.invalidate_caches()
-
-    package = importlib.import_module(module_name)
-    sys.path.remove(epyccel_dirpath)
-
-    # Verify that we have imported the shared library, not the Python one
-    loader = getattr(package, '__loader__', None)
-    if not isinstance(loader, ExtensionFileLoader):
-        raise ImportError('Could not load shared library')
+    # Choose the module name: it is derived from the cache key, so that the
+    # shared library can be found again, or random otherwise
+    if cache:
+        epyccel_cache = EpyccelCache()
+        dependencies  = get_local_dependencies(code, [folder, pymod_dirpath])
+        cache_key = epyccel_cache.make_key(code,
+                                           language     = language,
+                                           compiler     = compiler,
+                                           mpi_compiler = mpi_compiler,
+                                           fflags       = fflags,
+                                           accelerator  = accelerator,
+                                           auto_parallel= auto_parallel,
+                                           blas         = blas,
+                                           debug        = debug,
+                                           includes     = includes,
+                                           libdirs      = libdirs,
+                                           modules      = modules,
+                                           libs         = libs,
+                                           dependencies = dependencies)
+        module_name = module_import_prefix + cache_key[:16]
+    else:
+        tag = random_string(8)
+        module_name = module_import_prefix + tag
+
+        while module_name in sys.modules.keys():
+            tag = random_string(8)
+            module_name = module_import_prefix + tag
+
+    if not isinstance(function_or_module, ModuleType):
+        pymod_filename = '{}.py'.format(module_name)
+
+    # A shared library with the same key may already be loaded or cached.
+    # The cache is locked so that the entry is not evicted before it is imported
+    package = None
+    if cache:
+        with epyccel_cache.lock():
+            sharedlib_filepath = epyccel_cache.lookup(cache_key)
+
+            if sharedlib_filepath and module_name in sys.modules:
+                package = sys.modules[module_name]
+
+            elif sharedlib_filepath:
+                if verbose:
+                    print('> Shared library found in cache: {}'.format(sharedlib_filepath))
+                package = import_shared_library(module_name, os.path.dirname(sharedlib_filepath))
+
+    if package is None:
+        # Define directory name and path for epyccel files
+        epyccel_dirname = '__epyccel__'
+        epyccel_dirpath = os.path.join(folder, epyccel_dirname)
+
+        # Create new directories if not existing
+        os.makedirs(folder, exist_ok=True)
+        os.makedirs(epyccel_dirpath, exist_ok=True)
+
+        # Each build uses its own folder inside '__epyccel__', so that the
+        # simultaneous builds of the same module do not share any file.
+        # It is removed if the build succeeds
+        build_dirpath = tempfile.mkdtemp(prefix = '{}_'.format(module_name),
+                                         dir    = epyccel_dirpath)
+
+        # Store python file in the build folder, so that execute_pyccel can run
+        pymod_filepath = os.path.join(build_dirpath, pymod_filename)
+        with open(pymod_filepath, 'w') as f:
+            f.writelines(code)
+
+        with _build_lock:
+            # Generate shared library
+            execute_pyccel(pymod_filepath,
+                           verbose     = verbose,
+                           language    = language,
+                           compiler    = compiler,
+                           mpi_compiler= mpi_compiler,
+                           fflags      = fflags,
+                           includes    = includes,
+                           libdirs     = libdirs,
+                           modules     = modules,
+                           libs        = libs,
+                           debug       = debug,
+                           accelerator = accelerator,
+                           auto_parallel = auto_parallel,
+                           blas        = blas,
+                           output_name = module_name)
+            has_warnings = Errors().has_warnings()
+
+        # Move the shared library to '__epyccel__'. The file is replaced
+        # atomically, so that it is never seen partially written
+        for sharedlib_filename in os.listdir(build_dirpath):
+            if sharedlib_filename.startswith(module_name + '.') and \
+                    any(sharedlib_filename.endswith(e) for e in EXTENSION_SUFFIXES):
+                os.replace(os.path.join(build_dirpath, sharedlib_filename),
+                           os.path.join(epyccel_dirpath, sharedlib_filename))
+        shutil.rmtree(build_dirpath, ignore_errors = True)
+
+        # Import shared library
+        package = import_shared_library(module_name, epyccel_dirpath)
+
+        # Save shared library for later use. The libraries whose build
+        # emitted warnings are not saved, so that the warnings are reported
+        # again by the next call
+        if cache and not has_warnings:
+            sharedlib_filepath = epyccel_cache.store(cache_key, package.__file__,
+                                                     module_name = module_name,
+                                                     source      = pymod_filename,
+                                                     language    = language or 'fortran')
+            if verbose:
+                print('> Shared library stored in cache: {}'.format(sharedlib_filepath))
 
     # If Python object was function, extract it from module
     if isinstance(function_or_module, FunctionType):
@@ -163,6 +344,92 @@ def epyccel_seq(function_or_module, *,
     # Return accelerated Python module and function
     return package, func
 
+#==============================================================================
+class BackgroundEpyccel:
+    """
+    Proxy returned by epyccel(..., background=True).
+
+    The Python function or module is used until its accelerated version is
+    built in the background. The proxy then forwards the calls (and the
+    attribute accesses) to the accelerated version. If the build fails, the
+    Python version keeps being used: the error is logged by the logger
+    'pyccel.epyccel' and is available through the future.
+
+    Parameters
+    ----------
+    python_function_or_module : function | module
+        The Python object which is accelerated.
+
+    future : concurrent.futures.Future
+        The future returning the accelerated function or module.
+    """
+    def __init__(self, python_function_or_module, future):
+        self._python = python_function_or_module
+        self._target = python_function_or_module
+        self._future = future
+        self._done   = threading.Event()
+        if isinstance(python_function_or_module, FunctionType):
+            update_wrapper(self, python_function_or_module)
+        future.add_done_callback(self._swap)
+
+    def _swap(self, future):
+        """ Use the accelerated version once the build succeeded """
+        try:
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is None:
+                self._target = future.result()
+            else:
+                logger.error('Failed to accelerate %s, the Python version is used',
+                        self._python.__name__, exc_info = error)
+        finally:
+            self._done.set()
+
+    @property
+    def future(self):
+        """ The future returning the accelerated function or module """
+        return self._future
+
+    @property
+    def python(self):
+        """ The original Python function or module """
+        return self._python
+
+    @property
+    def accelerated(self):
+        """ True once the accelerated version is used """
+        return self._target is not self._python
+
+    def wait(self, timeout = None):
+        """
+        Wait for the end of the build.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait (default: no limit).
+
+        Returns
+        -------
+        accelerated : bool
+            True if the accelerated version is used, False if the build
+            failed.
+        """
+        # The callback is run by the thread completing the future, after
+        # the future is done
+        self._done.wait(timeout)
+        return self.accelerated
+
+    def __call__(self, *args, **kwargs):
+        return self._target(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for the attributes which are not found in the proxy
+        if name in ('_python', '_target', '_future', '_done'):
+            raise AttributeError(name)
+        return getattr(self._target, name)
+
 #==============================================================================
 def epyccel( python_function_or_module, **kwargs ):
     """
@@ -183,6 +450,29 @@ def epyccel( python_function_or_module, **kwargs ):
         Parallel multi-threading acceleration strategy
         (currently supported: 'openmp', 'openacc').
 
+    auto_parallel : bool
+        Parallelise with OpenMP the loops whose iterations are independent
+        (see pyccel.codegen.auto_parallel). This implies accelerator='openmp'
+        (default: False).
+
+    blas : {'openblas', 'reference', 'none'}, optional
+        BLAS library used to compute the products of large matrices of
+        double precision reals (numpy.matmul and numpy.dot). By default
+        they are computed by the intrinsic functions or by loops.
+
+    cache : bool
+        Reuse the shared library from a previous call with the same source
+        code and options if it is found in the persistent cache, and store
+        new shared libraries there unless their build emitted warnings
+        (default: True).
+        See pyccel.codegen.cache for the location and size of the cache.
+
+    background : bool
+        Build the accelerated version in a background thread and return
+        immediately a BackgroundEpyccel proxy, which uses the Python version
+        until the build is finished. The builds are run one after the
+        other. Not supported in parallel mode (default: False).
+
     Options for parallel mode
     -------------------------
     comm : mpi4py.MPI.Comm, optional
@@ -205,7 +495,7 @@ def epyccel( python_function_or_module, **kwargs ):
     Returns
     -------
     res : object
-        Accelerated function or module.
+        Accelerated function or module (or a BackgroundEpyccel proxy).
 
     Examples
     --------
@@ -220,6 +510,25 @@ def epyccel( python_function_or_module, **kwargs ):
     comm  = kwargs.pop('comm', None)
     root  = kwargs.pop('root', 0)
     bcast = kwargs.pop('bcast', True)
+    background = kwargs.pop('background', False)
+
+    # Background version
+    if background:
+        if comm is not None:
+            raise ValueError('Background compilation is not supported in parallel mode')
+
+        global _background_executor # pylint: disable=global-statement
+        with _build_lock:
+            if _background_executor is None:
+                _background_executor = ThreadPoolExecutor(max_workers = 1,
+                                                thread_name_prefix = 'epyccel')
+
+        def build():
+            mod, fun = epyccel_seq( python_function_or_module, **kwargs )
+            return fun or mod
+
+        return BackgroundEpyccel(python_function_or_module,
+                                 _background_executor.submit(build))
 
     # Parallel version
     if comm is not None:
@@ -270,9 +579,7 @@ def epyccel( python_function_or_module, **kwargs ):
             # and extract function if its name is given
             if comm.rank != root:
                 folder = os.path.split(mod_path)[0]
-                sys.path.insert(0, folder)
-                mod = importlib.import_module(mod_name)
-                sys.path.remove(folder)
+                mod = import_shared_library(mod_name, folder)
                 fun = getattr(mod, fun_name) if fun_name else None
 
     # Serial version
@@ -281,3 +588,45 @@ def epyccel( python_function_or_module, **kwargs ):
 
     # Return Fortran function (if any), otherwise module
     return fun or mod
+
+#==============================================================================
+def epyccel_many(functions, **kwargs):
+    """
+    Accelerate several Python functions using Pyccel in "embedded" mode.
+
+    The functions, and the helper functions defined in the same module which
+    they call, are gathered in a single module which is translated and
+    compiled once. This is much faster than calling epyccel for each
+    function.
+
+    Parameters
+    ----------
+    functions : iterable of function
+        Python functions to be accelerated. Their names must be unique.
+
+    kwargs : dict
+        Options passed to epyccel_seq (see epyccel). The parallel options
+        are not supported.
+
+    Returns
+    -------
+    res : dict
+        Dictionary mapping the name of each function to the accelerated
+        function.
+
+    Examples
+    --------
+    >>> def one(): return 1
+    >>> def two(): return one() + 1
+    >>> from pyccel.epyccel import epyccel_many
+    >>> funcs = epyccel_many([one, two], language='c')
+    >>> funcs['two']()
+    2
+    """
+    functions = list(functions)
+    if not functions:
+        raise ValueError('> Expecting at least one function')
+
+    mod, _ = epyccel_seq(functions, **kwargs)
+
+    return {f.__name__ : getattr(mod, f.__name__) for f in functions}
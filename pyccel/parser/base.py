@@ -9,12 +9,19 @@ Module containing aspects of a parser which are in common over all stages.
 """
 
 from collections import OrderedDict
+import hashlib
 import importlib
 import os
+import pickle
 import re
+import shutil
+import tempfile
 
 #==============================================================================
-from pyccel.version import __version__
+from sympy import Function
+from sympy.core.basic import Basic as sp_Basic
+from sympy.core.function import UndefinedFunction
+from sympy.core.singleton import Singleton
 
 from pyccel.ast.core import SymbolicAssign
 from pyccel.ast.core import FunctionDef, Interface, FunctionAddress
@@ -25,6 +32,8 @@ from pyccel.ast.utilities import builtin_import_registery as pyccel_builtin_impo
 
 from pyccel.parser.utilities import is_valid_filename_pyh, is_valid_filename_py
 
+from pyccel.codegen.cache import EpyccelCache, get_default_cache_dir, get_pyccel_fingerprint
+
 from pyccel.errors.errors import Errors
 
 # TODO - remove import * and only import what we need
@@ -45,11 +54,101 @@ strip_ansi_escape = re.compile(r'(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]|[\n\t\r]')
 # Useful for very coarse version differentiation.
 
 #==============================================================================
+def get_parser_cache():
+    """
+    Return the persistent cache in which the parsers are saved by
+    BasicParser.dump. It is the sub-folder 'parsers' of the epyccel cache
+    folder and, like the epyccel cache, the least recently used entries are
+    evicted when its size exceeds PYCCEL_CACHE_SIZE.
+    """
+    return EpyccelCache(os.path.join(get_default_cache_dir(), 'parsers'))
+
+def make_parser_key(stage, filename, code, *dependencies):
+    """
+    Compute the key under which a parser is saved in the parser cache.
+
+    Parameters
+    ----------
+    stage        : str
+            The parsing stage ('syntactic' or 'semantic')
+
+    filename     : str
+            The parsed file
+
+    code         : str
+            The contents of the parsed file
+
+    dependencies : str
+            The keys of the parsers of the imported modules
+
+    Returns
+    -------
+    key : str
+            The hexadecimal hash of all the inputs
+    """
+    h = hashlib.sha256()
+    for data in (get_pyccel_fingerprint(), stage, os.path.abspath(filename), code, *dependencies):
+        h.update(data.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+def _new_basic(cls, args):
+    """ Create a pyccel node without calling its constructor """
+    return sp_Basic.__new__(cls, *args)
+
+def _get_basic_state(obj):
+    """ Return the attributes of a pyccel node which are not set by
+    sympy.Basic.__new__: the contents of its __dict__ and of its slots
+    (e.g. the value of a LiteralFloat). The slots are accessed through their
+    descriptor as they may be hidden by a property of a subclass.
+    """
+    slots = []
+    for cls in type(obj).__mro__:
+        names = cls.__dict__.get('__slots__', ())
+        for name in ((names,) if isinstance(names, str) else names):
+            if cls is sp_Basic or name in ('__dict__', '__weakref__'):
+                continue
+            try:
+                slots.append((cls, name, cls.__dict__[name].__get__(obj, cls)))
+            except (KeyError, AttributeError):
+                pass
+    return dict(getattr(obj, '__dict__', {})), slots
+
+def _set_basic_state(obj, state):
+    """ Restore the attributes saved by _get_basic_state """
+    attributes, slots = state
+    if attributes:
+        obj.__dict__.update(attributes)
+    for cls, name, value in slots:
+        cls.__dict__[name].__set__(obj, value)
+
+class _ParserPickler(pickle.Pickler):
+    """
+    Pickler able to save the pyccel AST.
+
+    Sympy pickles its objects by calling their constructor with their
+    arguments, which loses the attributes of the pyccel nodes stored outside
+    of args. The pyccel nodes are therefore rebuilt from their arguments and
+    their attributes, without calling the constructor. Undefined sympy
+    functions (e.g. decorators) are rebuilt from their name.
+    """
+    def reducer_override(self, obj):
+        if isinstance(obj, UndefinedFunction):
+            return Function, (obj.__name__,)
+        if isinstance(obj, sp_Basic) and not isinstance(type(obj), Singleton) and \
+                (type(obj).__module__ or '').startswith('pyccel.'):
+            return (_new_basic, (type(obj), obj._args), _get_basic_state(obj),
+                    None, None, _set_basic_state)
+        return NotImplemented
+
+#==============================================================================
 
 
 def get_filename_from_import(module,input_folder=''):
     """Returns a valid filename with absolute path, that corresponds to the
     definition of module.
+    The file is searched in input_folder (the folder of the importing
+    module), then in the working directory, then in the installed packages.
     The priority order is:
         - header files (extension == pyh)
         - python files (extension == py)
@@ -71,10 +170,13 @@ def get_filename_from_import(module,input_folder=''):
     filename_pyh = '{}.pyh'.format(filename)
     filename_py  = '{}.py'.format(filename)
 
-    if is_valid_filename_pyh(filename_pyh):
-        return os.path.abspath(filename_pyh)
-    if is_valid_filename_py(filename_py):
-        return os.path.abspath(filename_py)
+    for folder in (input_folder, ''):
+        poss_filename_pyh = os.path.join( folder, filename_pyh )
+        poss_filename_py  = os.path.join( folder, filename_py  )
+        if is_valid_filename_pyh(poss_filename_pyh):
+            return os.path.abspath(poss_filename_pyh)
+        if is_valid_filename_py(poss_filename_py):
+            return os.path.abspath(poss_filename_py)
     folders = input_folder.split(""".""")
     for i in range(len(folders)):
         poss_dirname      = os.path.join( *folders[:i+1] )
@@ -526,89 +628,101 @@ class BasicParser(object):
                         container[source] = []
                     container[source] += name
 
-    def dump(self, filename=None):
+    def dump(self, filename=None, key=None):
         """
-        Dump the current ast using Pickle.
+        Dump the current parser using Pickle.
 
           Parameters
           ----------
           filename: str
-            output file name. if not given `name.pyccel` will be used and placed
-            in the Pyccel directory ($HOME/.pyccel)
-        """
-        import pickle
-        import hashlib
+            output file name (with a .pyccel extension). if not given the
+            parser is saved in the parser cache (see get_parser_cache)
 
-        if not filename:
-            if not self.filename:
-                raise ValueError('Expecting a filename to load the ast')
-
-            path , name  = os.path.split(self.filename)
-
-            if not name.split('.')[-1] == 'pyh':
-                return
-            else:
-                name = name[:-4]
+          key: str
+            key of the parser in the cache. if not given `cache_key` is used.
+            Nothing is saved if there is no key
 
-            name     = '{}.pyccel'.format(name)
-            filename = os.path.join(path, name)
-        # check extension
-
-        if not filename.split(""".""")[-1] == 'pyccel':
+          Returns
+          -------
+          dumped: bool
+            True if the parser was saved
+        """
+        if filename and not filename.split(""".""")[-1] == 'pyccel':
             raise ValueError('Expecting a .pyccel extension')
 
-#        print('>>> home = ', os.environ['HOME'])
-        # ...
+        key = key or self.cache_key
+        if not (filename or key):
+            return False
+
+        # the parents and the imported modules are not part of the parser
+        state = {k:v for k,v in self.__dict__.items() if k not in ('_parents', '_d_parsers')}
 
-        # we are only exporting the AST.
         try:
-            code = self.code.encode('utf-8')
-            hs   = hashlib.md5(code)
-            with open(filename, 'wb') as f:
-                pickle.dump((hs.hexdigest(), __version__, self), f, pickle.HIGHEST_PROTOCOL)
-        except (FileNotFoundError, PermissionError, pickle.PickleError):
-            pass
+            if filename:
+                with open(filename, 'wb') as f:
+                    _ParserPickler(f, pickle.HIGHEST_PROTOCOL).dump((type(self), state))
+            else:
+                cache = get_parser_cache()
+                os.makedirs(cache.path, exist_ok=True)
+                tmp_folder = tempfile.mkdtemp(prefix='.tmp_', dir=cache.path)
+                try:
+                    tmp_filename = os.path.join(tmp_folder, 'parser.pyccel')
+                    with open(tmp_filename, 'wb') as f:
+                        _ParserPickler(f, pickle.HIGHEST_PROTOCOL).dump((type(self), state))
+                    cache.store(key, tmp_filename, source=self.filename)
+                finally:
+                    shutil.rmtree(tmp_folder, ignore_errors=True)
+        except (OSError, pickle.PickleError, TypeError, AttributeError, RecursionError):
+            return False
+
+        return True
 
-    def load(self, filename=None):
-        """ Load the current ast using Pickle.
+    def load(self, filename=None, key=None):
+        """ Load the current parser using Pickle.
 
           Parameters
           ----------
           filename: str
-            output file name. if not given `name.pyccel` will be used and placed
-            in the Pyccel directory ($HOME/.pyccel)
-        """
+            input file name (with a .pyccel extension). if not given the
+            parser is read from the parser cache (see get_parser_cache)
 
-        # ...
-        import pickle
+          key: str
+            key of the parser in the cache. if not given `cache_key` is used
 
-        if not filename:
-            if not self.filename:
-                raise ValueError('Expecting a filename to load the ast')
+          Returns
+          -------
+          loaded: bool
+            True if a parser of the same type was found and copied in self
+        """
+        if filename and not filename.split(""".""")[-1] == 'pyccel':
+            raise ValueError('Expecting a .pyccel extension')
 
-            path , name = os.path.split(self.filename)
+        if not filename:
+            key = key or self.cache_key
+            filename = get_parser_cache().lookup(key) if key else None
+            if not filename:
+                return False
 
-            if not name.split('.')[-1] == 'pyh':
-                return
-            else:
-                name = name[:-4]
+        try:
+            with open(filename, 'rb') as f:
+                cls, state = pickle.load(f)
+        except Exception: # pylint: disable=broad-except
+            # missing or unreadable file, or file saved by another version
+            return False
 
-            name     = '{}.pyccel'.format(name)
-            filename = os.path.join(path, name)
+        if cls is not type(self):
+            return False
 
-        if not filename.split(""".""")[-1] == 'pyccel':
-            raise ValueError('Expecting a .pyccel extension')
+        self.__dict__.update(state)
+        return True
 
-        try:
-            with open(filename, 'rb') as f:
-                hs, version, parser = pickle.load(f)
-        except (FileNotFoundError, PermissionError, pickle.PickleError):
-            return
-
-        import hashlib
-        code = self.code.encode('utf-8')
-        if hashlib.md5(code).hexdigest() == hs and __version__ == version:
-            self.copy(parser)
+    @property
+    def cache_key(self):
+        """
+        Key under which the parser is saved by default in the parser cache,
+        or None if it should not be saved.
+        """
+        return None
 
     def copy(self, parser):
         """
@@ -12,9 +12,10 @@ import os
 import copy
 from collections import OrderedDict
 
-from pyccel.parser.base      import get_filename_from_import
+from pyccel.parser.base      import get_filename_from_import, make_parser_key
 from pyccel.parser.syntactic import SyntaxParser
 from pyccel.parser.semantic  import SemanticParser
+from pyccel.codegen.profiling import Profiler
 
 # TODO [AR, 18.11.2018] to be modified as a function
 # TODO [YG, 28.01.2020] maybe pass filename to the parse method?
@@ -37,6 +38,8 @@ class Parser(object):
         self._semantic_parser = None
         self._module_parser   = None
 
+        self._content_key = None
+
         self._input_folder = os.path.dirname(filename)
 
     @property
@@ -121,6 +124,27 @@ class Parser(object):
     def module_parser(self, module_parser):
         self._module_parser = module_parser
 
+    @property
+    def content_key(self):
+        """Returns a hash of the contents of the file and of all the files
+        which it imports (directly or indirectly). The parse method must be
+        called first."""
+        if self._content_key is None:
+            self._content_key = make_parser_key('semantic', self._filename,
+                    self._syntax_parser.code, *[p.content_key for p in self.sons])
+        return self._content_key
+
+    @property
+    def cache_key(self):
+        """Returns the key under which the annotated module is saved in the
+        parser cache, or None if it is not saved.
+        Only the imported Python files are saved: the annotation of a header
+        depends on the module which imports it, and the warnings of the file
+        being compiled must be printed every time."""
+        if self._kwargs.get('cache', False) and not self._syntax_parser.is_header_file:
+            return self.content_key
+        return None
+
     def parse(self, d_parsers=None, verbose=False):
         """
           Parse the parent file an all its dependencies.
@@ -141,7 +165,8 @@ class Parser(object):
         if self._syntax_parser:
             return self._syntax_parser.ast
 
-        parser             = SyntaxParser(self._filename, **self._kwargs)
+        with Profiler().stage('syntactic', self._filename):
+            parser         = SyntaxParser(self._filename, **self._kwargs)
         self.syntax_parser = parser
         parse_result       = parser.ast
 
@@ -185,10 +210,12 @@ class Parser(object):
         self._annotate_sons(verbose=verbose)
 
         # Create a new semantic parser and store it in object
-        parser = SemanticParser(self._syntax_parser,
-                                d_parsers=self.d_parsers,
-                                parents=self.parents,
-                                **settings)
+        with Profiler().stage('semantic', self._filename):
+            parser = SemanticParser(self._syntax_parser,
+                                    d_parsers=self.d_parsers,
+                                    parents=self.parents,
+                                    cache_key=self.cache_key,
+                                    **settings)
         self._semantic_parser = parser
 
         # Return the new semantic parser (maybe used by codegen)
@@ -239,7 +266,7 @@ class Parser(object):
             # get the absolute path corresponding to source
 
             filename = get_filename_from_import(source, self._input_folder)
-            q = Parser(filename)
+            q = Parser(filename, cache=True)
             q.parse(d_parsers=d_parsers)
             if q.module_parser:
                 d_parsers[source] = q.module_parser
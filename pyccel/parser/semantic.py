@@ -6,6 +6,7 @@
 
 # pylint: disable=R0201, missing-function-docstring
 
+import os
 from collections import OrderedDict
 from itertools import chain
 
@@ -140,6 +141,9 @@ class SemanticParser(BasicParser):
         self._parents = kwargs.pop('parents', [])
         self._d_parsers = kwargs.pop('d_parsers', OrderedDict())
 
+        # key under which the annotated module is saved in the parser cache
+        self._cache_key = kwargs.pop('cache_key', None)
+
         # ...
         if not isinstance(inputs, SyntaxParser):
             raise TypeError('> Expecting a syntactic parser as input')
@@ -173,7 +177,12 @@ class SemanticParser(BasicParser):
 
         # ... TOD add settings
         settings = {}
+        # the module may have been annotated by a previous build
+        if self.load():
+            return
         self.annotate()
+        if not errors.has_errors():
+            self.dump()
         # ...
 
     @property
@@ -187,6 +196,11 @@ class SemanticParser(BasicParser):
 
         return self._d_parsers
 
+    @property
+    def cache_key(self):
+        """ Key of the parser in the parser cache (or None) """
+        return self._cache_key
+
     def annotate(self, **settings):
         """."""
 
@@ -221,7 +235,7 @@ class SemanticParser(BasicParser):
 
             for parent in self.parents:
                 for (key, item) in parent.imports.items():
-                    if get_filename_from_import(key) == self.filename:
+                    if get_filename_from_import(key, os.path.dirname(parent.filename)) == self.filename:
                         target += item
 
             target = set(target)
@@ -1421,13 +1435,15 @@ class SemanticParser(BasicParser):
 
                 # ...
                 # Add memory allocation if needed
-                if lhs.allocatable:
+                if lhs.allocatable or lhs.is_stack_array:
                     if self._namespace.is_loop:
                         # Array defined in a loop may need reallocation at every cycle
-                        errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=name,
-                            severity='warning', blocker=False,
-                            bounding_box=(self._current_fst_node.lineno,
-                                self._current_fst_node.col_offset))
+                        # (stack arrays defined in a loop are reported below)
+                        if not lhs.is_stack_array:
+                            errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=name,
+                                severity='warning', blocker=False,
+                                bounding_box=(self._current_fst_node.lineno,
+                                    self._current_fst_node.col_offset))
                         status='unknown'
                     else:
                         # Array defined outside of a loop will be allocated only once
@@ -2049,7 +2065,9 @@ class SemanticParser(BasicParser):
         if isinstance(iterable, Variable):
             return ForIterator(target, iterable, body)
 
-        return For(target, iterable, body, local_vars=local_vars)
+        loop = For(target, iterable, body, local_vars=local_vars)
+        loop.set_fst(expr.fst)
+        return loop
 
 
     def _visit_GeneratorComprehension(self, expr, **settings):
@@ -2333,7 +2351,8 @@ class SemanticParser(BasicParser):
         results = [self._visit_Symbol(i, **settings) for i in return_vars]
 
         #add the Deallocate node before the Return node
-        code = assigns + [Deallocate(i) for i in self._allocs[-1]]
+        #(the returned arrays are not freed as the caller takes their ownership)
+        code = assigns + [Deallocate(i) for i in self._allocs[-1] if i not in results]
         if code:
             expr  = Return(results, CodeBlock(code))
         else:
@@ -2615,18 +2634,14 @@ class SemanticParser(BasicParser):
                             severity='fatal', blocker=self.blocking)
             # ...
 
-            # Raise an error if one of the return arguments is either:
-            #   a) a pointer
-            #   b) array which is not among arguments, hence intent(out)
+            # Raise an error if one of the return arguments is a pointer
+            # (arrays which are not among the arguments are only supported by
+            # the C printer, the Fortran printer raises the error)
             for r in results:
                 if r.is_pointer:
                     errors.report(UNSUPPORTED_ARRAY_RETURN_VALUE,
                     symbol=r,bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
                     severity='fatal')
-                elif (r not in args) and r.rank > 0:
-                    errors.report(UNSUPPORTED_ARRAY_RETURN_VALUE,
-                    symbol=r,bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
-                    severity='fatal')
 
             func = FunctionDef(name,
                     args,
@@ -69,7 +69,7 @@ from pyccel.ast.literals import LiteralFalse, LiteralTrue, LiteralString
 from pyccel.ast.functionalexpr import FunctionalSum, FunctionalMax, FunctionalMin
 
 from pyccel.parser.extend_tree import extend_tree
-from pyccel.parser.base import BasicParser
+from pyccel.parser.base import BasicParser, make_parser_key
 from pyccel.parser.utilities import read_file
 from pyccel.parser.utilities import get_default_path
 
@@ -109,9 +109,13 @@ class SyntaxParser(BasicParser):
 
         inputs: str
             filename or code to parse as a string
+
+        cache: bool
+            save the parser in the parser cache (headers are always saved)
     """
 
     def __init__(self, inputs, **kwargs):
+        self._cache = kwargs.pop('cache', False)
         BasicParser.__init__(self, **kwargs)
 
         # check if inputs is a file
@@ -129,15 +133,26 @@ class SyntaxParser(BasicParser):
         self._code  = code
         self._scope = []
 
-        self.load()
-
         tree                = extend_tree(code)
         self._fst           = tree
         self._used_names    = set(get_name(a) for a in ast.walk(self._fst) if isinstance(a, (ast.Name, ast.arg)))
         self._dummy_counter = 1
 
+        loaded = self.load()
+
         self.parse(verbose=True)
-        self.dump()
+        if not loaded and not errors.has_errors():
+            self.dump()
+
+    @property
+    def cache_key(self):
+        """ Key of the parser in the parser cache. Only the headers and the
+        imported files are saved: the warnings of the file being compiled
+        must be printed every time.
+        """
+        if self.filename and (self._cache or self.is_header_file):
+            return make_parser_key('syntactic', self.filename, self.code)
+        return None
 
     def parse(self, verbose=False):
         """converts python ast to sympy ast."""
@@ -11,7 +11,6 @@ from sympy.core import Symbol
 from sympy import sympify
 from sympy import Tuple
 
-from textx.metamodel import metamodel_from_file
 
 from pyccel.parser.syntax.basic import BasicStmt
 from pyccel.ast.headers   import FunctionHeader, ClassHeader, MethodHeader, VariableHeader, Template
@@ -527,7 +526,16 @@ this_folder = dirname(__file__)
 # Get meta-model from language description
 grammar = join(this_folder, '../grammar/headers.tx')
 
-meta = metamodel_from_file(grammar, classes=hdr_classes)
+# The meta-model is only built when the first pragma is parsed, as building
+# it takes a significant part of the time needed to import pyccel
+_meta = {}
+
+def get_metamodel():
+    """ Return the textX meta-model of the header grammar (built on first use) """
+    if 'meta' not in _meta:
+        from textx.metamodel import metamodel_from_file # pylint: disable=import-outside-toplevel
+        _meta['meta'] = metamodel_from_file(grammar, classes=hdr_classes)
+    return _meta['meta']
 
 def parse(filename=None, stmts=None):
     """ Parse header pragmas
@@ -546,6 +554,7 @@ def parse(filename=None, stmts=None):
 
     """
     # Instantiate model
+    meta = get_metamodel()
     if filename:
         model = meta.model_from_file(filename)
     elif stmts:
@@ -8,7 +8,6 @@
 
 from os.path import join, dirname
 
-from textx.metamodel import metamodel_from_file
 
 from pyccel.parser.syntax.basic import BasicStmt
 from pyccel.ast.core import AnnotatedComment
@@ -1313,7 +1312,16 @@ this_folder = dirname(__file__)
 # Get meta-model from language description
 grammar = join(this_folder, '../grammar/openacc.tx')
 
-meta = metamodel_from_file(grammar, classes=acc_classes)
+# The meta-model is only built when the first pragma is parsed, as building
+# it takes a significant part of the time needed to import pyccel
+_meta = {}
+
+def get_metamodel():
+    """ Return the textX meta-model of the OpenACC grammar (built on first use) """
+    if 'meta' not in _meta:
+        from textx.metamodel import metamodel_from_file # pylint: disable=import-outside-toplevel
+        _meta['meta'] = metamodel_from_file(grammar, classes=acc_classes)
+    return _meta['meta']
 
 def parse(filename=None, stmts=None):
     """ Parse openacc pragmas
@@ -1332,6 +1340,7 @@ def parse(filename=None, stmts=None):
 
     """
     # Instantiate model
+    meta = get_metamodel()
     if filename:
         model = meta.model_from_file(filename)
     elif stmts:
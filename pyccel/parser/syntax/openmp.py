@@ -8,10 +8,13 @@
 
 from os.path import join, dirname
 
-from textx.metamodel import metamodel_from_file
 
 from pyccel.parser.syntax.basic import BasicStmt
 from pyccel.ast.core import OMP_For_Loop, OMP_Parallel_Construct, OMP_Single_Construct, Omp_End_Clause
+from pyccel.ast.core import OMP_Simd_Construct, OMP_Atomic_Construct, OMP_Critical_Construct
+from pyccel.ast.core import OMP_Barrier_Construct, OMP_Master_Construct
+from pyccel.ast.core import OMP_Sections_Construct, OMP_Section_Construct
+from pyccel.ast.core import OMP_Task_Construct, OMP_Taskwait_Construct, OMP_Taskloop_Construct
 
 DEBUG = False
 
@@ -39,13 +42,7 @@ class OpenmpStmt(BasicStmt):
             print("> OpenmpStmt: expr")
 
         stmt = self.stmt
-        if isinstance(stmt, OmpEndClause):
-            return stmt.expr
-        elif isinstance(stmt, OmpParallelConstruct):
-            return stmt.expr
-        elif isinstance(stmt, OmpLoopConstruct):
-            return stmt.expr
-        elif isinstance(stmt, OmpSingleConstruct):
+        if isinstance(stmt, tuple(omp_directives)):
             return stmt.expr
         else:
             raise TypeError('Wrong stmt for OpenmpStmt')
@@ -82,11 +79,53 @@ class OmpParallelConstruct(BasicStmt):
 
         return OMP_Parallel_Construct(txt)
 
+class OmpParallelLoopConstruct(BasicStmt):
+    """Class representing a parallel construct combined with a loop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.simd    = kwargs.pop('simd', False)
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpParallelLoopConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpParallelLoopConstruct: expr")
+
+        _valid_clauses = (OmpNumThread, \
+                         OmpDefault, \
+                         OmpShared, \
+                         OmpCopyin, \
+                         OmpProcBind, \
+                         OmpPrivate, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpReduction, \
+                         OmpSchedule, \
+                         OmpCollapse, \
+                         OmpLinear, \
+                         OmpOrdered)
+        if self.simd:
+            _valid_clauses += _simd_clauses
+
+        txt = 'parallel for simd' if self.simd else 'parallel for'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpParallelLoopConstruct. Given : ', \
+                                type(clause))
+
+        return OMP_Parallel_Construct(txt)
+
 class OmpLoopConstruct(BasicStmt):
     """Class representing a ."""
     def __init__(self, **kwargs):
         """
         """
+        self.simd    = kwargs.pop('simd', False)
         self.clauses = kwargs.pop('clauses')
 
         super(OmpLoopConstruct, self).__init__(**kwargs)
@@ -104,8 +143,10 @@ class OmpLoopConstruct(BasicStmt):
                          OmpCollapse, \
                          OmpLinear, \
                          OmpOrdered)
+        if self.simd:
+            _valid_clauses += _simd_clauses
 
-        txt = ''
+        txt = 'for simd' if self.simd else 'for'
         for clause in self.clauses:
             if isinstance(clause, _valid_clauses):
                 txt = '{0} {1}'.format(txt, clause.expr)
@@ -114,6 +155,35 @@ class OmpLoopConstruct(BasicStmt):
                                 type(clause))
         return OMP_For_Loop(txt)
 
+class OmpSimdConstruct(BasicStmt):
+    """Class representing a simd construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpSimdConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSimdConstruct: expr")
+
+        _valid_clauses = (OmpPrivate, \
+                         OmpLastPrivate, \
+                         OmpReduction, \
+                         OmpCollapse, \
+                         OmpLinear) + _simd_clauses
+
+        txt = 'simd'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpSimdConstruct')
+
+        return OMP_Simd_Construct(txt)
+
 class OmpSingleConstruct(BasicStmt):
     """Class representing a ."""
     def __init__(self, **kwargs):
@@ -140,13 +210,213 @@ class OmpSingleConstruct(BasicStmt):
 
         return OMP_Single_Construct(txt)
 
+class OmpAtomicConstruct(BasicStmt):
+    """Class representing an atomic construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.kind = kwargs.pop('kind', '')
+
+        super(OmpAtomicConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpAtomicConstruct: expr")
+
+        txt = 'atomic {}'.format(self.kind) if self.kind else 'atomic'
+        return OMP_Atomic_Construct(txt)
+
+class OmpCriticalConstruct(BasicStmt):
+    """Class representing a critical construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name', '')
+
+        super(OmpCriticalConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpCriticalConstruct: expr")
+
+        txt = 'critical ({})'.format(self.name) if self.name else 'critical'
+        return OMP_Critical_Construct(txt)
+
+class OmpBarrierConstruct(BasicStmt):
+    """Class representing a barrier directive."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name')
+
+        super(OmpBarrierConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpBarrierConstruct: expr")
+
+        return OMP_Barrier_Construct(self.name)
+
+class OmpMasterConstruct(BasicStmt):
+    """Class representing a master construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name')
+
+        super(OmpMasterConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpMasterConstruct: expr")
+
+        return OMP_Master_Construct(self.name)
+
+class OmpSectionsConstruct(BasicStmt):
+    """Class representing a sections construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpSectionsConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSectionsConstruct: expr")
+
+        _valid_clauses = (OmpPrivate, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpReduction)
+
+        txt = 'sections'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpSectionsConstruct')
+
+        return OMP_Sections_Construct(txt)
+
+class OmpSectionConstruct(BasicStmt):
+    """Class representing a section of a sections construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name')
+
+        super(OmpSectionConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSectionConstruct: expr")
+
+        return OMP_Section_Construct(self.name)
+
+class OmpTaskConstruct(BasicStmt):
+    """Class representing a task construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpTaskConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskConstruct: expr")
+
+        _valid_clauses = (OmpDefault, \
+                         OmpPrivate, \
+                         OmpFirstPrivate, \
+                         OmpShared, \
+                         OmpPriority, \
+                         OmpUntied, \
+                         OmpMergeable)
+
+        txt = 'task'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpTaskConstruct')
+
+        return OMP_Task_Construct(txt)
+
+class OmpTaskwaitConstruct(BasicStmt):
+    """Class representing a taskwait directive."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name')
+
+        super(OmpTaskwaitConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskwaitConstruct: expr")
+
+        return OMP_Taskwait_Construct(self.name)
+
+class OmpTaskloopConstruct(BasicStmt):
+    """Class representing a taskloop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.simd    = kwargs.pop('simd', False)
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpTaskloopConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskloopConstruct: expr")
+
+        _valid_clauses = (OmpDefault, \
+                         OmpPrivate, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpShared, \
+                         OmpReduction, \
+                         OmpCollapse, \
+                         OmpGrainsize, \
+                         OmpNumTasks, \
+                         OmpPriority, \
+                         OmpUntied, \
+                         OmpMergeable, \
+                         OmpNogroup)
+        if self.simd:
+            _valid_clauses += _simd_clauses
+
+        txt = 'taskloop simd' if self.simd else 'taskloop'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpTaskloopConstruct. Given : ', \
+                                type(clause))
+
+        return OMP_Taskloop_Construct(txt)
+
 class OmpEndClause(BasicStmt):
     """Class representing a ."""
     def __init__(self, **kwargs):
         """
         """
         self.construct = kwargs.pop('construct')
+        self.loop      = kwargs.pop('loop', '')
         self.simd      = kwargs.pop('simd', '')
+        self.name      = kwargs.pop('name', '')
         self.nowait    = kwargs.pop('nowait', '')
 
         super(OmpEndClause, self).__init__(**kwargs)
@@ -156,7 +426,8 @@ class OmpEndClause(BasicStmt):
         if DEBUG:
             print("> OmpEndClause: expr")
 
-        txt = 'end {0} {1} {2}'.format(self.construct, self.simd, self.nowait)
+        name = '({})'.format(self.name) if self.name else ''
+        txt = ' '.join(w for w in ('end', self.construct, self.loop, self.simd, name, self.nowait) if w)
         return Omp_End_Clause(txt)
 
 class OmpNumThread(BasicStmt):
@@ -386,34 +657,214 @@ class OmpSchedule(BasicStmt):
         if DEBUG:
             print("> OmpSchedule: expr")
 
+        # TODO check if variable exist in namespace
         if self.chunk_size:
+            if self.kind in ('auto', 'runtime'):
+                raise TypeError('The {} schedule does not accept a chunk size'.format(self.kind))
             return 'schedule({0}, {1})'.format(self.kind, self.chunk_size)
         else:
             return 'schedule({0})'.format(self.kind)
+
+class OmpAligned(BasicStmt):
+    """Class representing the aligned clause of the simd constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.args      = kwargs.pop('args')
+        self.alignment = kwargs.pop('alignment', None)
+
+        super(OmpAligned, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpAligned: expr")
+
+        # TODO check if variable exist in namespace
+        args = ', '.join(str(arg) for arg in self.args)
+        if self.alignment:
+            return 'aligned({0}: {1})'.format(args, self.alignment)
+        else:
+            return 'aligned({})'.format(args)
+
+class OmpSafelen(BasicStmt):
+    """Class representing the safelen clause of the simd constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpSafelen, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSafelen: expr")
+
+        return 'safelen({})'.format(self.n)
+
+class OmpSimdlen(BasicStmt):
+    """Class representing the simdlen clause of the simd constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpSimdlen, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSimdlen: expr")
+
+        return 'simdlen({})'.format(self.n)
+
+class OmpPriority(BasicStmt):
+    """Class representing the priority clause of the task constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.value = kwargs.pop('value')
+
+        super(OmpPriority, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpPriority: expr")
+
+        # TODO check if variable exist in namespace
+        return 'priority({})'.format(self.value)
+
+class OmpGrainsize(BasicStmt):
+    """Class representing the grainsize clause of the taskloop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.value = kwargs.pop('value')
+
+        super(OmpGrainsize, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpGrainsize: expr")
+
+        # TODO check if variable exist in namespace
+        return 'grainsize({})'.format(self.value)
+
+class OmpNumTasks(BasicStmt):
+    """Class representing the num_tasks clause of the taskloop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.value = kwargs.pop('value')
+
+        super(OmpNumTasks, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpNumTasks: expr")
+
+        # TODO check if variable exist in namespace
+        return 'num_tasks({})'.format(self.value)
+
+class OmpUntied(BasicStmt):
+    """Class representing the untied clause of the task constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.untied = kwargs.pop('untied')
+
+        super(OmpUntied, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpUntied: expr")
+
+        return 'untied'
+
+class OmpMergeable(BasicStmt):
+    """Class representing the mergeable clause of the task constructs."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.mergeable = kwargs.pop('mergeable')
+
+        super(OmpMergeable, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpMergeable: expr")
+
+        return 'mergeable'
+
+class OmpNogroup(BasicStmt):
+    """Class representing the nogroup clause of the taskloop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.nogroup = kwargs.pop('nogroup')
+
+        super(OmpNogroup, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpNogroup: expr")
+
+        return 'nogroup'
+
+# clauses which are only valid for the constructs combined with simd
+_simd_clauses = (OmpAligned, OmpSafelen, OmpSimdlen)
+
 #################################################
 
 #################################################
 # whenever a new rule is added in the grammar, we must update the following
 # lists.
 omp_directives = [OmpParallelConstruct,
+                  OmpParallelLoopConstruct,
                   OmpLoopConstruct,
+                  OmpSimdConstruct,
                   OmpSingleConstruct,
+                  OmpAtomicConstruct,
+                  OmpCriticalConstruct,
+                  OmpBarrierConstruct,
+                  OmpMasterConstruct,
+                  OmpSectionsConstruct,
+                  OmpSectionConstruct,
+                  OmpTaskConstruct,
+                  OmpTaskwaitConstruct,
+                  OmpTaskloopConstruct,
                   OmpEndClause]
 
-omp_clauses = [OmpCollapse,
+omp_clauses = [OmpAligned,
+               OmpCollapse,
                OmpCopyin,
                OmpFirstPrivate,
+               OmpGrainsize,
                OmpLastPrivate,
                OmpLinear,
+               OmpMergeable,
+               OmpNogroup,
+               OmpNumTasks,
                OmpOrdered,
                OmpNumThread,
                OmpDefault,
                OmpPrivate,
+               OmpPriority,
                OmpProcBind,
                OmpPrivate,
                OmpReduction,
+               OmpSafelen,
                OmpSchedule,
-               OmpShared]
+               OmpShared,
+               OmpSimdlen,
+               OmpUntied]
 
 omp_classes = [Openmp, OpenmpStmt] + omp_directives + omp_clauses
 
@@ -423,7 +874,18 @@ this_folder = dirname(__file__)
 # Get meta-model from language description
 grammar = join(this_folder, '../grammar/openmp.tx')
 
-meta = metamodel_from_file(grammar, classes=omp_classes)
+# The meta-model is only built when the first pragma is parsed, as building
+# it takes a significant part of the time needed to import pyccel
+_meta = {}
+
+def get_metamodel():
+    """ Return the textX meta-model of the OpenMP grammar (built on first use) """
+    if 'meta' not in _meta:
+        from textx.metamodel import metamodel_from_file # pylint: disable=import-outside-toplevel
+        # autokwd prevents the keywords from matching the beginning of longer
+        # words (e.g. 'task' and 'taskwait', or 'simd' and 'simdlen')
+        _meta['meta'] = metamodel_from_file(grammar, classes=omp_classes, autokwd=True)
+    return _meta['meta']
 
 def parse(filename=None, stmts=None):
     """ Parse openmp pragmas
@@ -442,6 +904,7 @@ def parse(filename=None, stmts=None):
 
     """
     # Instantiate model
+    meta = get_metamodel()
     if filename:
         model = meta.model_from_file(filename)
     elif stmts:
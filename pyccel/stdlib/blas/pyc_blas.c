@@ -0,0 +1,161 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+#include "pyc_blas.h"
+#include <limits.h>
+
+/*
+** The BLAS routines (Fortran 77 interface). The lengths of the character
+** arguments are passed after the other arguments, as by gfortran
+*/
+void    dgemm_(const char *transa, const char *transb, const int *m, const int *n,
+            const int *k, const double *alpha, const double *a, const int *lda,
+            const double *b, const int *ldb, const double *beta, double *c,
+            const int *ldc, size_t transa_len, size_t transb_len);
+void    dgemv_(const char *trans, const int *m, const int *n, const double *alpha,
+            const double *a, const int *lda, const double *x, const int *incx,
+            const double *beta, double *y, const int *incy, size_t trans_len);
+double  ddot_(const int *n, const double *x, const int *incx, const double *y,
+            const int *incy);
+
+/*---------------------------------------------------------------------------*/
+/*
+** Get the leading dimension of the matrix a if its elements are stored by
+** columns (or by rows if by_rows is true) as expected by BLAS, or 0 if they
+** are not
+*/
+static int  leading_dimension(t_ndarray a, bool by_rows)
+{
+    int64_t length = by_rows ? a.shape[1] : a.shape[0];
+    int64_t count = by_rows ? a.shape[0] : a.shape[1];
+    int64_t unit = by_rows ? a.strides[1] : a.strides[0];
+    int64_t ld = by_rows ? a.strides[0] : a.strides[1];
+
+    if (length > 1 && unit != 1)
+        return 0;
+    /* the stride between the vectors is not used if there is only one */
+    if (count <= 1)
+        ld = length;
+    else if (ld < length)
+        return 0;
+    if (ld < 1)
+        ld = 1;
+    return ld > INT_MAX ? 0 : (int)ld;
+}
+/*---------------------------------------------------------------------------*/
+/*
+** Get the BLAS description of the matrix a stored by columns (or by rows if
+** by_rows is true): its leading dimension and the transposition which is
+** applied if it is actually stored in the other order
+*/
+static bool matrix_layout(t_ndarray a, bool by_rows, int *ld, char *trans)
+{
+    *ld = leading_dimension(a, by_rows);
+    *trans = 'N';
+    if (*ld == 0)
+    {
+        *ld = leading_dimension(a, !by_rows);
+        *trans = 'T';
+    }
+    return *ld != 0;
+}
+/*---------------------------------------------------------------------------*/
+/* Get the increment of the vector x as expected by BLAS, or 0 */
+static int  increment(t_ndarray x)
+{
+    if (x.shape[0] <= 1)
+        return 1;
+    return x.strides[0] > 0 && x.strides[0] <= INT_MAX ? (int)x.strides[0] : 0;
+}
+/*---------------------------------------------------------------------------*/
+static bool fits_int(int64_t n)
+{
+    return n <= INT_MAX;
+}
+/*---------------------------------------------------------------------------*/
+bool        pyc_dgemm(t_ndarray a, t_ndarray b, t_ndarray c)
+{
+    const double    one = 1.0;
+    const double    zero = 0.0;
+    int             lda, ldb, ldc;
+    char            transa, transb;
+    int             m, n, k;
+
+    if (!fits_int(c.shape[0]) || !fits_int(c.shape[1]) || !fits_int(a.shape[1]))
+        return false;
+    m = c.shape[0];
+    n = c.shape[1];
+    k = a.shape[1];
+    /* c stored by columns: c = a @ b */
+    if ((ldc = leading_dimension(c, false)) != 0)
+    {
+        if (!matrix_layout(a, false, &lda, &transa) || !matrix_layout(b, false, &ldb, &transb))
+            return false;
+        dgemm_(&transa, &transb, &m, &n, &k, &one, a.nd_double, &lda, b.nd_double,
+                &ldb, &zero, c.nd_double, &ldc, 1, 1);
+        return true;
+    }
+    /* c stored by rows: transpose(c) = transpose(b) @ transpose(a) */
+    if ((ldc = leading_dimension(c, true)) != 0)
+    {
+        if (!matrix_layout(a, true, &lda, &transa) || !matrix_layout(b, true, &ldb, &transb))
+            return false;
+        dgemm_(&transb, &transa, &n, &m, &k, &one, b.nd_double, &ldb, a.nd_double,
+                &lda, &zero, c.nd_double, &ldc, 1, 1);
+        return true;
+    }
+    return false;
+}
+/*---------------------------------------------------------------------------*/
+bool        pyc_dgemv(t_ndarray a, t_ndarray x, t_ndarray y, bool trans)
+{
+    const double    one = 1.0;
+    const double    zero = 0.0;
+    int             lda, incx, incy;
+    char            flag;
+    int             m, n;
+
+    if (!fits_int(a.shape[0]) || !fits_int(a.shape[1]))
+        return false;
+    incx = increment(x);
+    incy = increment(y);
+    if (incx == 0 || incy == 0)
+        return false;
+    /* a stored by columns */
+    if ((lda = leading_dimension(a, false)) != 0)
+    {
+        m = a.shape[0];
+        n = a.shape[1];
+        flag = trans ? 'T' : 'N';
+    }
+    /* a stored by rows: BLAS sees transpose(a) */
+    else if ((lda = leading_dimension(a, true)) != 0)
+    {
+        m = a.shape[1];
+        n = a.shape[0];
+        flag = trans ? 'N' : 'T';
+    }
+    else
+        return false;
+    dgemv_(&flag, &m, &n, &one, a.nd_double, &lda, x.nd_double, &incx, &zero,
+            y.nd_double, &incy, 1);
+    return true;
+}
+/*---------------------------------------------------------------------------*/
+bool        pyc_ddot(t_ndarray x, t_ndarray y, double *result)
+{
+    int     incx, incy;
+    int     n;
+
+    if (!fits_int(x.shape[0]))
+        return false;
+    incx = increment(x);
+    incy = increment(y);
+    if (incx == 0 || incy == 0)
+        return false;
+    n = x.shape[0];
+    *result = ddot_(&n, x.nd_double, &incx, y.nd_double, &incy);
+    return true;
+}
@@ -0,0 +1,101 @@
+! --------------------------------------------------------------------------------------- !
+! This file is part of Pyccel which is released under MIT License. See the LICENSE file   !
+! or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. !
+! --------------------------------------------------------------------------------------- !
+
+module pyc_blas
+
+use ISO_C_BINDING
+
+implicit none
+
+! Number of multiplications above which the products of matrices and vectors
+! are computed by BLAS rather than by the intrinsic functions. The intrinsic
+! matmul of gfortran is blocked and vectorised, so it is as fast as BLAS up
+! to matrices of size 128 x 128
+integer(C_INT64_T), parameter :: pyc_blas_threshold = 2097152_C_INT64_T
+
+! The BLAS routines (Fortran 77 interface)
+interface
+
+    subroutine dgemm(transa, transb, m, n, k, alpha, a, lda, b, ldb, beta, c, ldc)
+        import :: C_INT32_T, C_DOUBLE
+        character                     , intent(in)    :: transa, transb
+        integer(C_INT32_T)            , intent(in)    :: m, n, k, lda, ldb, ldc
+        real(C_DOUBLE)                , intent(in)    :: alpha, beta
+        real(C_DOUBLE)                , intent(in)    :: a(lda, *), b(ldb, *)
+        real(C_DOUBLE)                , intent(inout) :: c(ldc, *)
+    end subroutine dgemm
+
+    subroutine dgemv(trans, m, n, alpha, a, lda, x, incx, beta, y, incy)
+        import :: C_INT32_T, C_DOUBLE
+        character                     , intent(in)    :: trans
+        integer(C_INT32_T)            , intent(in)    :: m, n, lda, incx, incy
+        real(C_DOUBLE)                , intent(in)    :: alpha, beta
+        real(C_DOUBLE)                , intent(in)    :: a(lda, *), x(*)
+        real(C_DOUBLE)                , intent(inout) :: y(*)
+    end subroutine dgemv
+
+    function ddot(n, x, incx, y, incy) result(d)
+        import :: C_INT32_T, C_DOUBLE
+        integer(C_INT32_T)            , intent(in)    :: n, incx, incy
+        real(C_DOUBLE)                , intent(in)    :: x(*), y(*)
+        real(C_DOUBLE)                                :: d
+    end function ddot
+
+end interface
+
+contains
+
+! Compute c = op(a) op(b), where op(x) is x if trans is 'N' and transpose(x)
+! if trans is 'T'. The arrays which are not contiguous are copied by the
+! compiler when they are passed to BLAS
+subroutine pyc_dgemm(transa, transb, a, b, c)
+
+    implicit none
+
+    character                     , intent(in)    :: transa, transb
+    real(C_DOUBLE)                , intent(in)    :: a(:,:), b(:,:)
+    real(C_DOUBLE)                , intent(inout) :: c(:,:)
+    integer(C_INT32_T)                            :: k
+
+    if (transa == 'N') then
+        k = size(a, 2)
+    else
+        k = size(a, 1)
+    end if
+    call dgemm(transa, transb, size(c, 1), size(c, 2), k, 1.0_C_DOUBLE, &
+            a, max(1, size(a, 1)), b, max(1, size(b, 1)), 0.0_C_DOUBLE, &
+            c, max(1, size(c, 1)))
+
+end subroutine pyc_dgemm
+
+! Compute y = op(a) x, where op(a) is a if trans is 'N' and transpose(a) if
+! trans is 'T'
+subroutine pyc_dgemv(trans, a, x, y)
+
+    implicit none
+
+    character                     , intent(in)    :: trans
+    real(C_DOUBLE)                , intent(in)    :: a(:,:)
+    real(C_DOUBLE)                , intent(in)    :: x(:)
+    real(C_DOUBLE)                , intent(inout) :: y(:)
+
+    call dgemv(trans, size(a, 1), size(a, 2), 1.0_C_DOUBLE, a, max(1, size(a, 1)), &
+            x, 1_C_INT32_T, 0.0_C_DOUBLE, y, 1_C_INT32_T)
+
+end subroutine pyc_dgemv
+
+! Compute the dot product of the vectors x and y
+function pyc_ddot(x, y) result(d)
+
+    implicit none
+
+    real(C_DOUBLE)                , intent(in)    :: x(:), y(:)
+    real(C_DOUBLE)                                :: d
+
+    d = ddot(size(x), x, 1_C_INT32_T, y, 1_C_INT32_T)
+
+end function pyc_ddot
+
+end module pyc_blas
@@ -0,0 +1,28 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+#ifndef         PYC_BLAS_H
+#define         PYC_BLAS_H
+
+#include <stdbool.h>
+#include "ndarrays.h"
+
+/* number of multiplications above which the products of matrices and
+** vectors are computed by BLAS rather than by loops (16 x 16 matrices) */
+#define         PYC_BLAS_THRESHOLD 4096
+
+/*
+** The products are only computed if the elements of the arrays are
+** contiguous along one dimension, as expected by BLAS. The functions return
+** false otherwise
+*/
+            /* c = a @ b */
+bool            pyc_dgemm(t_ndarray a, t_ndarray b, t_ndarray c);
+            /* y = a @ x, or y = x @ a if trans is true */
+bool            pyc_dgemv(t_ndarray a, t_ndarray x, t_ndarray y, bool trans);
+            /* *result = x @ y */
+bool            pyc_ddot(t_ndarray x, t_ndarray y, double *result);
+
+#endif
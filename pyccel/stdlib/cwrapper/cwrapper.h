@@ -0,0 +1,274 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+/*
+** Argument parsing of the python wrappers. The wrappers use the METH_FASTCALL calling
+** convention: the positional arguments and then the values of the keyword arguments are
+** received in a C array and the names of the keyword arguments in a tuple, so no tuple
+** or dictionary is created by the call.
+** This header must be included after Python.h
+*/
+
+#ifndef CWRAPPER_H
+# define CWRAPPER_H
+
+# include <stdarg.h>
+# include <limits.h>
+# include <string.h>
+
+/* Flags of the wrappers in the PyMethodDef tables */
+# if PY_VERSION_HEX >= 0x03070000
+#  define PYCCEL_METH_FASTCALL (METH_FASTCALL | METH_KEYWORDS)
+# else
+/* python 3.6 always passes the names of the keyword arguments to METH_FASTCALL functions */
+#  define PYCCEL_METH_FASTCALL METH_FASTCALL
+# endif
+
+/* value of an integer argument, floats are refused as by PyArg_ParseTuple */
+static inline long  pyarg_as_long(PyObject *o)
+{
+    if (PyFloat_Check(o))
+    {
+        PyErr_SetString(PyExc_TypeError, "integer argument expected, got float");
+        return (-1);
+    }
+    return (PyLong_AsLong(o));
+}
+
+static inline int   pyarg_check_range(long value, long min, long max, const char *type)
+{
+    if (value == -1 && PyErr_Occurred())
+        return (0);
+    if (value < min || value > max)
+    {
+        PyErr_Format(PyExc_OverflowError, "%s is %s", type,
+                value < min ? "less than minimum" : "greater than maximum");
+        return (0);
+    }
+    return (1);
+}
+
+/*
+** Convert the argument o using the format unit *format and store it in the next
+** address of ap. The format is moved to the last character of the unit.
+** If o is NULL (missing optional argument) the address is skipped
+*/
+static inline int   pyarg_convert(PyObject *o, const char **format, va_list *ap)
+{
+    long            l;
+    double          d;
+    int             b;
+    PyTypeObject    *type;
+
+    switch (**format)
+    {
+        case 'b':
+        {
+            unsigned char *p = va_arg(*ap, unsigned char *);
+            if (o == NULL)
+                return (1);
+            l = pyarg_as_long(o);
+            if (!pyarg_check_range(l, 0, UCHAR_MAX, "unsigned byte integer"))
+                return (0);
+            *p = (unsigned char)l;
+            return (1);
+        }
+        case 'h':
+        {
+            short *p = va_arg(*ap, short *);
+            if (o == NULL)
+                return (1);
+            l = pyarg_as_long(o);
+            if (!pyarg_check_range(l, SHRT_MIN, SHRT_MAX, "signed short integer"))
+                return (0);
+            *p = (short)l;
+            return (1);
+        }
+        case 'i':
+        {
+            int *p = va_arg(*ap, int *);
+            if (o == NULL)
+                return (1);
+            l = pyarg_as_long(o);
+            if (!pyarg_check_range(l, INT_MIN, INT_MAX, "signed integer"))
+                return (0);
+            *p = (int)l;
+            return (1);
+        }
+        case 'l':
+        {
+            long *p = va_arg(*ap, long *);
+            if (o == NULL)
+                return (1);
+            l = pyarg_as_long(o);
+            if (l == -1 && PyErr_Occurred())
+                return (0);
+            *p = l;
+            return (1);
+        }
+        case 'f':
+        case 'd':
+        {
+            void *p = va_arg(*ap, void *);
+            if (o == NULL)
+                return (1);
+            d = PyFloat_AsDouble(o);
+            if (d == -1.0 && PyErr_Occurred())
+                return (0);
+            if (**format == 'f')
+                *(float *)p = (float)d;
+            else
+                *(double *)p = d;
+            return (1);
+        }
+        case 'p':
+        {
+            int *p = va_arg(*ap, int *);
+            if (o == NULL)
+                return (1);
+            b = PyObject_IsTrue(o);
+            if (b < 0)
+                return (0);
+            *p = b;
+            return (1);
+        }
+        case 's':
+        {
+            const char **p = va_arg(*ap, const char **);
+            Py_ssize_t  size;
+            if (o == NULL)
+                return (1);
+            if (!PyUnicode_Check(o))
+            {
+                PyErr_Format(PyExc_TypeError, "str expected, not %.50s", Py_TYPE(o)->tp_name);
+                return (0);
+            }
+            *p = PyUnicode_AsUTF8AndSize(o, &size);
+            if (*p == NULL)
+                return (0);
+            if ((size_t)size != strlen(*p))
+            {
+                PyErr_SetString(PyExc_ValueError, "embedded null character");
+                return (0);
+            }
+            return (1);
+        }
+        case 'O':
+        {
+            if ((*format)[1] == '!')
+            {
+                (*format)++;
+                type = va_arg(*ap, PyTypeObject *);
+                if (o != NULL && !PyObject_TypeCheck(o, type))
+                {
+                    PyErr_Format(PyExc_TypeError, "%.50s expected, not %.50s",
+                            type->tp_name, Py_TYPE(o)->tp_name);
+                    return (0);
+                }
+            }
+            PyObject **p = va_arg(*ap, PyObject **);
+            if (o != NULL)
+                *p = o;
+            return (1);
+        }
+        default:
+            PyErr_Format(PyExc_SystemError, "unsupported format unit '%c'", **format);
+            return (0);
+    }
+}
+
+/* value of the keyword argument name, NULL if it is not passed */
+static inline PyObject  *pyarg_find_keyword(PyObject *kwnames, PyObject *const *kwvalues,
+        Py_ssize_t nkw, const char *name)
+{
+    for (Py_ssize_t j = 0; j < nkw; j++)
+        if (PyUnicode_CompareWithASCIIString(PyTuple_GET_ITEM(kwnames, j), name) == 0)
+            return (kwvalues[j]);
+    return (NULL);
+}
+
+/*
+** Collect the arguments of a METH_FASTCALL wrapper. The format and the keyword list
+** have the same meaning as for PyArg_ParseTupleAndKeywords, with the format units
+** b h i l f d p s O O! and '|' before the optional arguments.
+** The missing optional arguments are not modified. Returns 0 if an error occurred.
+*/
+static inline int   pyarg_parse_fastcall(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames,
+        const char *format, char **kwlist, ...)
+{
+    va_list     ap;
+    Py_ssize_t  nkw = (kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames));
+    Py_ssize_t  nfound = 0;
+    Py_ssize_t  i = 0;
+    int         optional = 0;
+    PyObject    *o;
+    PyObject    *kw;
+
+    va_start(ap, kwlist);
+    for (const char *f = format; *f != '\0'; f++)
+    {
+        if (*f == '|')
+        {
+            optional = 1;
+            continue;
+        }
+        o = (i < nargs ? args[i] : NULL);
+        /* the keywords are only searched if some arguments are passed by name */
+        if (nkw > 0)
+        {
+            kw = pyarg_find_keyword(kwnames, args + nargs, nkw, kwlist[i]);
+            if (kw != NULL)
+            {
+                if (o != NULL)
+                {
+                    PyErr_Format(PyExc_TypeError, "argument '%s' given by name and position (%zd)",
+                            kwlist[i], i + 1);
+                    va_end(ap);
+                    return (0);
+                }
+                o = kw;
+                nfound++;
+            }
+        }
+        if (o == NULL && !optional)
+        {
+            PyErr_Format(PyExc_TypeError, "missing required argument '%s' (pos %zd)",
+                    kwlist[i], i + 1);
+            va_end(ap);
+            return (0);
+        }
+        if (!pyarg_convert(o, &f, &ap))
+        {
+            va_end(ap);
+            return (0);
+        }
+        i++;
+    }
+    va_end(ap);
+    if (nargs > i)
+    {
+        PyErr_Format(PyExc_TypeError, "function takes at most %zd arguments (%zd given)",
+                i, nargs + nkw);
+        return (0);
+    }
+    if (nfound < nkw)
+    {
+        for (Py_ssize_t j = 0; j < nkw; j++)
+        {
+            kw = PyTuple_GET_ITEM(kwnames, j);
+            nfound = 0;
+            for (Py_ssize_t k = 0; k < i && !nfound; k++)
+                nfound = (PyUnicode_CompareWithASCIIString(kw, kwlist[k]) == 0);
+            if (!nfound)
+            {
+                PyErr_Format(PyExc_TypeError, "'%U' is an invalid keyword argument", kw);
+                return (0);
+            }
+        }
+    }
+    return (1);
+}
+
+#endif
@@ -0,0 +1,72 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+/*
+** C descriptors (Fortran 2018, ISO_Fortran_binding.h) of numpy arrays, used by the
+** python wrappers to pass numpy arrays to the assumed-shape arguments of the bind(c)
+** functions. No data is copied: the descriptor points to the numpy buffer and keeps
+** its strides, so non contiguous arrays are supported.
+** This header must be included after Python.h and numpy/arrayobject.h
+*/
+
+#ifndef CWRAPPER_CFI_H
+# define CWRAPPER_CFI_H
+
+# include <stdbool.h>
+# include <ISO_Fortran_binding.h>
+
+/* storage of a C descriptor of any rank */
+typedef CFI_CDESC_T(CFI_MAX_RANK) t_cfi_desc;
+
+/* type of the elements of a numpy array (only the types checked by the wrappers) */
+static inline CFI_type_t   pyarray_to_cfi_type(PyArrayObject *o)
+{
+    int type_size = PyArray_ITEMSIZE(o);
+
+    if (PyArray_ISBOOL(o))
+        return (CFI_type_Bool);
+    if (PyArray_ISCOMPLEX(o))
+        return (type_size == 2 * sizeof(float) ? CFI_type_float_Complex : CFI_type_double_Complex);
+    if (PyArray_ISFLOAT(o))
+        return (type_size == sizeof(float) ? CFI_type_float : CFI_type_double);
+    switch (type_size)
+    {
+        case 1:
+            return (CFI_type_int8_t);
+        case 2:
+            return (CFI_type_int16_t);
+        case 4:
+            return (CFI_type_int32_t);
+        default:
+            return (CFI_type_int64_t);
+    }
+}
+
+/*
+** Fill the descriptor desc with the description of the numpy array o and return it.
+** The dimensions of the C ordered arrays are reversed, as the Fortran functions
+** receive their transpose. The numpy strides (in bytes) are kept as memory strides
+*/
+static inline CFI_cdesc_t  *pyarray_to_cfi_desc(PyArrayObject *o, t_cfi_desc *desc, bool c_order)
+{
+    CFI_cdesc_t     *d = (CFI_cdesc_t *)desc;
+    CFI_index_t     extents[CFI_MAX_RANK];
+    int             rank = PyArray_NDIM(o);
+    int             k;
+
+    for (int i = 0; i < rank; i++)
+        extents[i] = PyArray_DIM(o, c_order ? rank - 1 - i : i);
+    if (CFI_establish(d, PyArray_DATA(o), CFI_attribute_other, pyarray_to_cfi_type(o),
+                PyArray_ITEMSIZE(o), rank, extents) != CFI_SUCCESS)
+        return (NULL);
+    for (int i = 0; i < rank; i++)
+    {
+        k = c_order ? rank - 1 - i : i;
+        d->dim[i].sm = PyArray_STRIDE(o, k);
+    }
+    return (d);
+}
+
+#endif
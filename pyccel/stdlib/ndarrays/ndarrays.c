@@ -9,7 +9,17 @@
 ** allocation
 */
 
-t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type)
+t_ndarray   array_create(int32_t nd, int64_t *shape, enum e_types type)
+{
+    t_ndarray arr;
+
+    arr = array_create_with_data(nd, shape, type, NULL);
+    arr.raw_data = malloc(arr.buffer_size);
+    arr.is_view = false;
+    return (arr);
+}
+
+t_ndarray   array_create_with_data(int32_t nd, int64_t *shape, enum e_types type, void *data)
 {
     t_ndarray arr;
 
@@ -45,23 +55,17 @@ t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type)
             arr.type_size = sizeof(double complex);
             break;
     }
-    arr.is_view = false;
+    arr.is_view = true;
     arr.length = 1;
-    arr.shape = malloc(arr.nd * sizeof(int32_t));
     for (int32_t i = 0; i < arr.nd; i++)
     {
         arr.length *= shape[i];
         arr.shape[i] = shape[i];
     }
     arr.buffer_size = arr.length * arr.type_size;
-    arr.strides = malloc(nd * sizeof(int32_t));
-    for (int32_t i = 0; i < arr.nd; i++)
-    {
-        arr.strides[i] = 1;
-        for (int32_t j = i + 1; j < arr.nd; j++)
-            arr.strides[i] *= arr.shape[j];
-    }
-    arr.raw_data = malloc(arr.buffer_size);
+    for (int32_t i = arr.nd - 1; i >= 0; i--)
+        arr.strides[i] = (i == arr.nd - 1) ? 1 : arr.strides[i + 1] * arr.shape[i + 1];
+    arr.raw_data = data;
     return (arr);
 }
 
@@ -70,7 +74,7 @@ void   _array_fill_int8(int8_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int8[i] = c;
 }
 
@@ -79,7 +83,7 @@ void   _array_fill_int16(int16_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int16[i] = c;
 }
 
@@ -88,7 +92,7 @@ void   _array_fill_int32(int32_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int32[i] = c;
 }
 
@@ -97,7 +101,7 @@ void   _array_fill_int64(int64_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int64[i] = c;
 }
 
@@ -106,7 +110,7 @@ void   _array_fill_bool(bool c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_bool[i] = c;
 }
 
@@ -115,7 +119,7 @@ void   _array_fill_float(float c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_float[i] = c;
 }
 
@@ -124,7 +128,7 @@ void   _array_fill_double(double c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_double[i] = c;
 }
 
@@ -133,7 +137,7 @@ void   _array_fill_cfloat(float complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cfloat[i] = c;
 }
 
@@ -143,7 +147,7 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cdouble[i] = c;
 }
 
@@ -153,39 +157,122 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
 
 int32_t free_array(t_ndarray arr)
 {
-    if (arr.shape == NULL)
+    if (arr.raw_data == NULL || arr.is_view)
         return (0);
     free(arr.raw_data);
     arr.raw_data = NULL;
-    free(arr.shape);
-    arr.shape = NULL;
-    free(arr.strides);
-    arr.strides = NULL;
     return (1);
 }
 
-int32_t free_pointer(t_ndarray arr)
+/*
+** scratch memory
+** The memory is taken by moving a position in blocks which are kept from one
+** call to the next, so the temporary arrays of a function called in a loop do
+** not call malloc and free. Each thread has its own blocks.
+*/
+
+/* size of the first block and alignment of the allocations */
+# define SCRATCH_BLOCK_SIZE 65536
+# define SCRATCH_ALIGNMENT  64
+
+typedef struct  s_scratch_block
 {
-    if (arr.is_view == false || arr.shape == NULL)
-        return (0);
-    free(arr.shape);
-    arr.shape = NULL;
-    free(arr.strides);
-    arr.strides = NULL;
-    return (1);
+    struct s_scratch_block  *prev;
+    struct s_scratch_block  *next;
+    int64_t                 size;
+    int64_t                 used;
+    char                    data[];
+}               t_scratch_block;
+
+static _Thread_local t_scratch_block  *scratch_first = NULL;
+static _Thread_local t_scratch_block  *scratch_current = NULL;
+
+void    *scratch_alloc(int64_t size)
+{
+    t_scratch_block *block = scratch_current;
+    t_scratch_block *next;
+    t_scratch_block *tmp;
+    int64_t         block_size;
+    void            *data;
+
+    size = (size + SCRATCH_ALIGNMENT - 1) / SCRATCH_ALIGNMENT * SCRATCH_ALIGNMENT;
+    if (block == NULL || block->used + size > block->size)
+    {
+        next = (block == NULL ? scratch_first : block->next);
+        if (next == NULL || next->size < size)
+        {
+            /* the following blocks are unused and too small: they are replaced by a larger one */
+            while (next != NULL)
+            {
+                tmp = next->next;
+                free(next);
+                next = tmp;
+            }
+            block_size = (block == NULL ? SCRATCH_BLOCK_SIZE : 2 * block->size);
+            block_size = (block_size < size ? size : block_size);
+            next = malloc(sizeof(t_scratch_block) + block_size + SCRATCH_ALIGNMENT);
+            if (next == NULL)
+                return (NULL);
+            next->size = block_size;
+            next->prev = block;
+            next->next = NULL;
+            if (block == NULL)
+                scratch_first = next;
+            else
+                block->next = next;
+        }
+        next->used = 0;
+        block = next;
+        scratch_current = block;
+    }
+    /* the data is aligned on SCRATCH_ALIGNMENT bytes */
+    data = block->data + block->used;
+    data = (char *)data + (SCRATCH_ALIGNMENT - (uintptr_t)data % SCRATCH_ALIGNMENT) % SCRATCH_ALIGNMENT;
+    block->used += size;
+    return (data);
+}
+
+/* current position in the scratch memory */
+t_scratch_mark  scratch_mark(void)
+{
+    t_scratch_mark  mark;
+
+    mark.block = scratch_current;
+    mark.used = (scratch_current == NULL ? 0 : scratch_current->used);
+    return (mark);
+}
+
+/* release all the memory allocated since mark was taken */
+void    scratch_release(t_scratch_mark mark)
+{
+    scratch_current = mark.block;
+    if (mark.block != NULL)
+        mark.block->used = mark.used;
 }
 
 /*
 ** slices
 */
 
-t_slice new_slice(int32_t start, int32_t end, int32_t step)
+t_slice new_slice(int64_t start, int64_t end, int64_t step)
 {
     t_slice slice;
 
     slice.start = start;
     slice.end = end;
     slice.step = step;
+    slice.is_element = false;
+    return (slice);
+}
+
+t_slice new_element(int64_t index)
+{
+    t_slice slice;
+
+    slice.start = index;
+    slice.end = index + 1;
+    slice.step = 1;
+    slice.is_element = true;
     return (slice);
 }
 
@@ -194,65 +281,47 @@ t_ndarray array_slicing(t_ndarray arr, ...)
     t_ndarray view;
     va_list  va;
     t_slice slice;
-    int32_t start = 0;
+    int64_t start = 0;
+    int32_t j = 0;
 
-    view.nd = arr.nd;
     view.type = arr.type;
     view.type_size = arr.type_size;
-    view.shape = malloc(sizeof(int32_t) * arr.nd);
-    view.strides = malloc(sizeof(int32_t) * arr.nd);
-    memcpy(view.strides, arr.strides, sizeof(int32_t) * arr.nd);
     view.is_view = true;
     va_start(va, arr);
     for (int32_t i = 0; i < arr.nd ; i++)
     {
         slice = va_arg(va, t_slice);
-        view.shape[i] = (slice.end - slice.start + (slice.step - 1)) / slice.step; // we need to round up the shape
         start += slice.start * arr.strides[i];
-        view.strides[i] *= slice.step;
+        if (slice.is_element)
+            continue;
+        view.shape[j] = (slice.end - slice.start + (slice.step - 1)) / slice.step; // we need to round up the shape
+        view.strides[j] = arr.strides[i] * slice.step;
+        j++;
     }
     va_end(va);
+    view.nd = j;
     view.raw_data = arr.raw_data + start * arr.type_size;
     view.length = 1;
     for (int32_t i = 0; i < view.nd; i++)
             view.length *= view.shape[i];
+    view.buffer_size = view.length * view.type_size;
     return (view);
 }
 
-/*
-** assigns
-*/
-
-void        alias_assign(t_ndarray *dest, t_ndarray src)
-{
-    /*
-    ** copy src to dest
-    ** allocate new memory for shape and strides
-    ** setting is_view to true for the garbage collector to deallocate
-    */
-
-    *dest = src;
-    dest->shape = malloc(sizeof(int32_t) * src.nd);
-    memcpy(dest->shape, src.shape, sizeof(int32_t) * src.nd);
-    dest->strides = malloc(sizeof(int32_t) * src.nd);
-    memcpy(dest->strides, src.strides, sizeof(int32_t) * src.nd);
-    dest->is_view = true;
-}
-
 /*
 ** indexing
 */
 
-int32_t     get_index(t_ndarray arr, ...)
+int64_t     get_index(t_ndarray arr, ...)
 {
     va_list va;
-    int32_t index;
+    int64_t index;
 
     va_start(va, arr);
     index = 0;
     for (int32_t i = 0; i < arr.nd; i++)
     {
-        index += va_arg(va, int32_t) * arr.strides[i];
+        index += va_arg(va, int64_t) * arr.strides[i];
     }
     va_end(va);
     return (index);
@@ -13,6 +13,15 @@
 # include <stdarg.h>
 # include <stdbool.h>
 # include <stdint.h>
+# ifdef _WIN32
+#  include <malloc.h>
+#  define alloca _alloca
+# else
+#  include <alloca.h>
+# endif
+
+/* maximum number of dimensions of an array */
+# define MAX_NDIM 15
 
 /* mapping the function array_fill to the correct type */
 # define array_fill(c, arr) _Generic((c), int64_t : _array_fill_int64,\
@@ -27,9 +36,11 @@
 
 typedef struct  s_slice
 {
-    int32_t start;
-    int32_t end;
-    int32_t step;
+    int64_t start;
+    int64_t end;
+    int64_t step;
+    /* True if the dimension is indexed by an integer and removed from the view */
+    bool    is_element;
 }               t_slice;
 
 enum e_types
@@ -63,25 +74,34 @@ typedef struct  s_ndarray
     /* number of dimensions */
     int32_t                 nd;
     /* shape 'size of each dimension' */
-    int32_t                 *shape;
-    /* strides 'number of bytes to skip to get the next element' */
-    int32_t                 *strides;
+    int64_t                 shape[MAX_NDIM];
+    /* strides 'number of elements to skip to get the next element' */
+    int64_t                 strides[MAX_NDIM];
     /* type of the array elements */
     enum e_types            type;
     /* type size of the array elements */
     int32_t                 type_size;
     /* number of element in the array */
-    int32_t                 length;
+    int64_t                 length;
     /* size of the array */
-    int32_t                 buffer_size;
+    int64_t                 buffer_size;
     /* True if the array does not own the data */
     bool                    is_view;
 }               t_ndarray;
 
+/* position in the scratch memory, see scratch_mark */
+typedef struct  s_scratch_mark
+{
+    struct s_scratch_block  *block;
+    int64_t                 used;
+}               t_scratch_mark;
+
 /* functions prototypes */
 
 /* allocations */
-t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type);
+t_ndarray   array_create(int32_t nd, int64_t *shape, enum e_types type);
+                /* array using the memory data, which is not freed by free_array */
+t_ndarray   array_create_with_data(int32_t nd, int64_t *shape, enum e_types type, void *data);
 void        _array_fill_int8(int8_t c, t_ndarray arr);
 void        _array_fill_int16(int16_t c, t_ndarray arr);
 void        _array_fill_int32(int32_t c, t_ndarray arr);
@@ -94,18 +114,45 @@ void        _array_fill_cdouble(double complex c, t_ndarray arr);
 
 /* slicing */
                 /* creating a Slice object */
-t_slice     new_slice(int32_t start, int32_t end, int32_t step);
-                /* creating an array view */
+t_slice     new_slice(int64_t start, int64_t end, int64_t step);
+t_slice     new_element(int64_t index);
+                /* creating an array view (which does not need to be freed) */
 t_ndarray   array_slicing(t_ndarray p, ...);
 
-/* assigns */
-void        alias_assign(t_ndarray *dest, t_ndarray src);
-
 /* free */
 int32_t         free_array(t_ndarray dump);
-int32_t         free_pointer(t_ndarray dump);
+
+/* scratch memory of the temporary arrays, released at once at the end of the functions */
+void            *scratch_alloc(int64_t size);
+t_scratch_mark  scratch_mark(void);
+void            scratch_release(t_scratch_mark mark);
 
 /* indexing */
-int32_t         get_index(t_ndarray arr, ...);
+int64_t         get_index(t_ndarray arr, ...);
+
+/*
+** rank-specialized versions of get_index which can be inlined by the compiler
+** (the strides are given in number of elements)
+*/
+static inline int64_t  get_index_1(t_ndarray arr, int64_t i0)
+{
+    return i0 * arr.strides[0];
+}
+
+static inline int64_t  get_index_2(t_ndarray arr, int64_t i0, int64_t i1)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1];
+}
+
+static inline int64_t  get_index_3(t_ndarray arr, int64_t i0, int64_t i1, int64_t i2)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1] + i2 * arr.strides[2];
+}
+
+static inline int64_t  get_index_4(t_ndarray arr, int64_t i0, int64_t i1, int64_t i2, int64_t i3)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1] + i2 * arr.strides[2]
+        + i3 * arr.strides[3];
+}
 
 #endif
@@ -0,0 +1,132 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+#include "pyc_random.h"
+#include <stdbool.h>
+#include <time.h>
+#ifdef _OPENMP
+# include <omp.h>
+#endif
+
+/* constants of the Philox4x32 generator */
+#define PHILOX_M0       0xD2511F53u
+#define PHILOX_M1       0xCD9E8D57u
+#define PHILOX_W0       0x9E3779B9u
+#define PHILOX_W1       0xBB67AE85u
+
+/* number of streams, the threads with larger numbers share them */
+#define PYC_RANDOM_STREAMS 256
+
+/*
+** State of the stream of a thread: the number of blocks of 4 words which
+** were generated and the words of the last block which were not used yet.
+** Each stream fills a cache line to avoid false sharing between threads
+*/
+typedef struct s_stream
+{
+    uint64_t    counter;
+    uint32_t    block[4];
+    int32_t     used;
+    char        padding[36];
+}               t_stream;
+
+static t_stream g_streams[PYC_RANDOM_STREAMS];
+static uint32_t g_key[2];
+static bool     g_seeded = false;
+
+/*---------------------------------------------------------------------------*/
+/* Compute the block of 4 words of the given counter with the given key */
+static void philox4x32(const uint32_t counter[4], const uint32_t key[2], uint32_t block[4])
+{
+    uint32_t    c0 = counter[0], c1 = counter[1], c2 = counter[2], c3 = counter[3];
+    uint32_t    k0 = key[0], k1 = key[1];
+
+    for (int round = 0; round < 10; round++)
+    {
+        uint64_t p0 = (uint64_t)PHILOX_M0 * c0;
+        uint64_t p1 = (uint64_t)PHILOX_M1 * c2;
+
+        c0 = (uint32_t)(p1 >> 32) ^ c1 ^ k0;
+        c1 = (uint32_t)p1;
+        c2 = (uint32_t)(p0 >> 32) ^ c3 ^ k1;
+        c3 = (uint32_t)p0;
+        k0 += PHILOX_W0;
+        k1 += PHILOX_W1;
+    }
+    block[0] = c0;
+    block[1] = c1;
+    block[2] = c2;
+    block[3] = c3;
+}
+/*---------------------------------------------------------------------------*/
+void    pyc_random_seed(int64_t seed)
+{
+    g_key[0] = (uint32_t)seed;
+    g_key[1] = (uint32_t)((uint64_t)seed >> 32);
+    for (int i = 0; i < PYC_RANDOM_STREAMS; i++)
+    {
+        g_streams[i].counter = 0;
+        g_streams[i].used = 4;
+    }
+    g_seeded = true;
+}
+/*---------------------------------------------------------------------------*/
+/* Get the stream of the calling thread, and choose a seed if there is none */
+static t_stream *get_stream(int *number)
+{
+    if (!g_seeded)
+    {
+#ifdef _OPENMP
+#pragma omp critical (pyc_random_init)
+#endif
+        {
+            if (!g_seeded)
+            {
+                struct timespec now;
+
+                timespec_get(&now, TIME_UTC);
+                pyc_random_seed((int64_t)now.tv_sec * 1000000000 + now.tv_nsec);
+            }
+        }
+    }
+#ifdef _OPENMP
+    *number = omp_get_thread_num() % PYC_RANDOM_STREAMS;
+#else
+    *number = 0;
+#endif
+    return &g_streams[*number];
+}
+/*---------------------------------------------------------------------------*/
+/* Get the next 32 bits word of the stream with the given number */
+static uint32_t next_word(t_stream *stream, int number)
+{
+    if (stream->used == 4)
+    {
+        uint32_t counter[4] = {(uint32_t)stream->counter,
+                               (uint32_t)(stream->counter >> 32),
+                               (uint32_t)number, 0};
+
+        philox4x32(counter, g_key, stream->block);
+        stream->counter++;
+        stream->used = 0;
+    }
+    return stream->block[stream->used++];
+}
+/*---------------------------------------------------------------------------*/
+double  pyc_random_uniform(void)
+{
+    int         number;
+    t_stream    *stream = get_stream(&number);
+    /* 53 random bits, as many as the precision of a double */
+    uint64_t    a = next_word(stream, number) >> 5;
+    uint64_t    b = next_word(stream, number) >> 6;
+
+    return (double)(a * 67108864 + b) * (1.0 / 9007199254740992.0);
+}
+/*---------------------------------------------------------------------------*/
+int64_t pyc_randint(int64_t low, int64_t high)
+{
+    return low + (int64_t)(pyc_random_uniform() * (double)(high - low));
+}
@@ -0,0 +1,207 @@
+! --------------------------------------------------------------------------------------- !
+! This file is part of Pyccel which is released under MIT License. See the LICENSE file   !
+! or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. !
+! --------------------------------------------------------------------------------------- !
+
+! Counter-based random number generator (Philox4x32-10). Each OpenMP thread
+! draws from its own stream, so the procedures can be called in parallel
+! regions without locks, and the numbers only depend on the seed, the number
+! of the thread and the number of values drawn by this thread. The numbers
+! are the same as the ones of the C library. The seed is chosen from the
+! clock if pyc_random_seed is not called
+module pyc_random
+
+use ISO_C_BINDING
+!$ use omp_lib
+
+implicit none
+
+private
+
+public :: pyc_random_seed, pyc_random_uniform, pyc_randint, pyc_random_number, &
+          pyc_random_integer
+
+! The words of 32 bits are stored in integers of 64 bits as Fortran has no
+! unsigned integers
+integer(C_INT64_T), parameter :: mask32 = 4294967295_C_INT64_T
+integer(C_INT64_T), parameter :: mask16 = 65535_C_INT64_T
+
+! constants of the Philox4x32 generator
+integer(C_INT64_T), parameter :: philox_m0 = int(z'D2511F53', C_INT64_T)
+integer(C_INT64_T), parameter :: philox_m1 = int(z'CD9E8D57', C_INT64_T)
+integer(C_INT64_T), parameter :: philox_w0 = int(z'9E3779B9', C_INT64_T)
+integer(C_INT64_T), parameter :: philox_w1 = int(z'BB67AE85', C_INT64_T)
+
+! number of streams, the threads with larger numbers share them
+integer, parameter :: pyc_random_streams = 256
+
+! State of the stream of a thread: the number of blocks of 4 words which were
+! generated and the words of the last block which were not used yet. Each
+! stream fills a cache line to avoid false sharing between threads
+type :: t_stream
+    integer(C_INT64_T) :: counter = 0
+    integer(C_INT64_T) :: block(0:3) = 0
+    integer(C_INT64_T) :: used = 4
+    integer(C_INT64_T) :: padding(2) = 0
+end type t_stream
+
+type(t_stream)    , save :: streams(0:pyc_random_streams - 1)
+integer(C_INT64_T), save :: key(0:1) = 0
+logical           , save :: seeded = .false.
+
+contains
+
+! Compute the product of the words a and b, as two words
+pure subroutine mulhilo(a, b, hi, lo)
+
+    implicit none
+
+    integer(C_INT64_T), intent(in)  :: a, b
+    integer(C_INT64_T), intent(out) :: hi, lo
+    integer(C_INT64_T)              :: p0, p1, t
+
+    ! a * b = p1 * 2**16 + p0 is computed in parts to avoid an overflow
+    p0 = a * iand(b, mask16)
+    p1 = a * shiftr(b, 16)
+    t  = p0 + shiftl(iand(p1, mask16), 16)
+    lo = iand(t, mask32)
+    hi = shiftr(p1, 16) + shiftr(t, 32)
+
+end subroutine mulhilo
+
+! Compute the block of 4 words of the given counter with the given key
+pure subroutine philox4x32(counter, key, block)
+
+    implicit none
+
+    integer(C_INT64_T), intent(in)  :: counter(0:3), key(0:1)
+    integer(C_INT64_T), intent(out) :: block(0:3)
+    integer(C_INT64_T)              :: k(0:1), hi0, lo0, hi1, lo1
+    integer                         :: round
+
+    block = counter
+    k = key
+    do round = 1, 10
+        call mulhilo(philox_m0, block(0), hi0, lo0)
+        call mulhilo(philox_m1, block(2), hi1, lo1)
+        block = [ieor(ieor(hi1, block(1)), k(0)), lo1, &
+                 ieor(ieor(hi0, block(3)), k(1)), lo0]
+        k(0) = iand(k(0) + philox_w0, mask32)
+        k(1) = iand(k(1) + philox_w1, mask32)
+    end do
+
+end subroutine philox4x32
+
+! Restart all the streams from the given seed
+subroutine pyc_random_seed(seed)
+
+    implicit none
+
+    integer(C_INT64_T), intent(in) :: seed
+
+    key(0) = iand(seed, mask32)
+    key(1) = iand(shiftr(seed, 32), mask32)
+    streams(:)%counter = 0
+    streams(:)%used = 4
+    seeded = .true.
+
+end subroutine pyc_random_seed
+
+! Get the number of the stream of the calling thread, and choose a seed if
+! there is none
+function current_stream() result(number)
+
+    implicit none
+
+    integer            :: number
+    integer(C_INT64_T) :: clock
+
+    if (.not. seeded) then
+        !$omp critical (pyc_random_init)
+        if (.not. seeded) then
+            call system_clock(clock)
+            call pyc_random_seed(clock)
+        end if
+        !$omp end critical (pyc_random_init)
+    end if
+
+    number = 0
+    !$ number = modulo(omp_get_thread_num(), pyc_random_streams)
+
+end function current_stream
+
+! Get the next word of 32 bits of the stream with the given number
+function next_word(number) result(word)
+
+    implicit none
+
+    integer, intent(in) :: number
+    integer(C_INT64_T)  :: word
+
+    associate (stream => streams(number))
+        if (stream%used == 4) then
+            call philox4x32([iand(stream%counter, mask32),                   &
+                             iand(shiftr(stream%counter, 32), mask32),       &
+                             int(number, C_INT64_T), 0_C_INT64_T], key, stream%block)
+            stream%counter = stream%counter + 1
+            stream%used = 0
+        end if
+        word = stream%block(stream%used)
+        stream%used = stream%used + 1
+    end associate
+
+end function next_word
+
+! Get a uniform value in [0, 1)
+function pyc_random_uniform() result(x)
+
+    implicit none
+
+    real(C_DOUBLE)     :: x
+    integer(C_INT64_T) :: a, b
+    integer            :: number
+
+    ! 53 random bits, as many as the precision of a double
+    number = current_stream()
+    a = shiftr(next_word(number), 5)
+    b = shiftr(next_word(number), 6)
+    x = real(a * 67108864_C_INT64_T + b, C_DOUBLE) / 9007199254740992.0_C_DOUBLE
+
+end function pyc_random_uniform
+
+! Get a uniform integer in [low, high)
+function pyc_randint(low, high) result(i)
+
+    implicit none
+
+    integer(C_INT64_T), intent(in) :: low, high
+    integer(C_INT64_T)             :: i
+
+    i = low + int(pyc_random_uniform() * real(high - low, C_DOUBLE), C_INT64_T)
+
+end function pyc_randint
+
+! Set x to uniform values in [0, 1)
+impure elemental subroutine pyc_random_number(x)
+
+    implicit none
+
+    real(C_DOUBLE), intent(out) :: x
+
+    x = pyc_random_uniform()
+
+end subroutine pyc_random_number
+
+! Set x to uniform integers in [low, high)
+impure elemental subroutine pyc_random_integer(x, low, high)
+
+    implicit none
+
+    integer(C_INT64_T), intent(out) :: x
+    integer(C_INT64_T), intent(in)  :: low, high
+
+    x = pyc_randint(low, high)
+
+end subroutine pyc_random_integer
+
+end module pyc_random
@@ -0,0 +1,25 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+#ifndef         PYC_RANDOM_H
+#define         PYC_RANDOM_H
+
+#include <stdint.h>
+
+/*
+** Counter-based random number generator (Philox4x32-10). Each OpenMP thread
+** draws from its own stream, so the functions can be called in parallel
+** regions without locks, and the numbers only depend on the seed, the
+** number of the thread and the number of values drawn by this thread.
+** The seed is chosen from the clock if pyc_random_seed is not called
+*/
+            /* restart all the streams from the given seed */
+void            pyc_random_seed(int64_t seed);
+            /* uniform value in [0, 1) */
+double          pyc_random_uniform(void);
+            /* uniform integer in [low, high) */
+int64_t         pyc_randint(int64_t low, int64_t high);
+
+#endif
@@ -47,7 +47,8 @@ def setup_package():
     setup(packages=packages, \
           include_package_data=True, \
           install_requires=install_requires, \
-          entry_points={'console_scripts': ['pyccel = pyccel.commands.console:pyccel']}, \
+          entry_points={'console_scripts': ['pyccel = pyccel.commands.console:pyccel',
+                                            'pyccel-cache = pyccel.commands.cache:pyccel_cache']}, \
           **setup_args)
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import pytest
+
+from pyccel.codegen.pipeline import execute_pyccel
+
+code = """from pyccel.decorators import types
+
+@types('real[:,:]', 'real[:]')
+def row_sums(a, s):
+    total = 0.0
+    for i in range(a.shape[0]):
+        t = 0.0
+        for j in range(a.shape[1]):
+            t += a[i, j]
+        s[i] = t
+        total += t
+    return total
+
+@types('real[:]')
+def prefix_sum(x):
+    for i in range(1, x.shape[0]):
+        x[i] = x[i] + x[i - 1]
+
+@types('real[:]')
+def prints(x):
+    for i in range(x.shape[0]):
+        print(x[i])
+
+@types('real[:]')
+def annotated(x):
+    #$ omp parallel for
+    for i in range(x.shape[0]):
+        x[i] = 1.0
+    #$ omp end parallel for
+"""
+
+@pytest.mark.parametrize('language', ['fortran', 'c'])
+def test_auto_parallel_report(tmpdir, language):
+    src = tmpdir.join('mod.py')
+    src.write(code)
+    execute_pyccel(str(src), language = language, convert_only = True, auto_parallel = True)
+
+    report = tmpdir.join('__pyccel__', 'mod_parallel.txt').read().splitlines()
+    assert report == [
+        '{}:6: row_sums: loop over i: parallelised '
+            '(parallel for private(j, t) reduction(+:total))'.format(src),
+        '{}:16: prefix_sum: loop over i: not parallelised: '
+            'x is written at x[i] and accessed at x[i - 1]'.format(src),
+        '{}:21: prints: loop over i: not parallelised: '
+            'it contains a statement which is not supported (PythonPrint)'.format(src),
+        '{}: annotated: not parallelised: the function already contains '
+            'OpenMP directives'.format(src)]
+
+    ext = 'f90' if language == 'fortran' else 'c'
+    generated = tmpdir.join('__pyccel__', 'mod.' + ext).read()
+    if language == 'fortran':
+        assert '!$omp parallel do private(j, t) reduction(+:total)' in generated
+        assert generated.count('!$omp parallel do') == 2
+    else:
+        assert '#pragma omp parallel for private(j, t) reduction(+:total)' in generated
+        assert generated.count('#pragma omp parallel for') == 2
+
+def test_auto_parallel_openacc(tmpdir):
+    src = tmpdir.join('mod.py')
+    src.write(code)
+    with pytest.raises(ValueError):
+        execute_pyccel(str(src), convert_only = True, auto_parallel = True, accelerator = 'openacc')
@@ -0,0 +1,47 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import os
+import threading
+import time
+
+from pyccel.codegen.filelock import FileLock, lock_folders
+
+def test_file_lock(tmpdir):
+    filepath = str(tmpdir.join('sub', '.lock'))
+    lock = FileLock(filepath)
+    assert not lock.is_locked
+
+    with lock:
+        assert lock.is_locked
+        assert os.path.isfile(filepath)
+    assert not lock.is_locked
+
+def test_file_lock_threads(tmpdir):
+    filepath = str(tmpdir.join('.lock'))
+    events = []
+
+    def work(i):
+        with FileLock(filepath):
+            events.append(('start', i))
+            time.sleep(0.05)
+            events.append(('end', i))
+
+    threads = [threading.Thread(target = work, args = (i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # The critical sections never overlap
+    assert len(events) == 8
+    for start, end in zip(events[::2], events[1::2]):
+        assert start[0] == 'start' and end == ('end', start[1])
+
+def test_lock_folders(tmpdir):
+    folders = [str(tmpdir.join('b')), str(tmpdir.join('a')), str(tmpdir.join('b'))]
+    with lock_folders(folders):
+        assert os.path.isfile(str(tmpdir.join('a', '.lock')))
+        assert os.path.isfile(str(tmpdir.join('b', '.lock')))
+
+    # The locks are released
+    with lock_folders(folders):
+        pass
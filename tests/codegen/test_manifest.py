@@ -0,0 +1,51 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import os
+
+from pyccel.codegen.manifest import BuildManifest, compute_fingerprint
+
+def test_fingerprint(tmpdir):
+    src = tmpdir.join('mod.py')
+    src.write('x = 1\n')
+    fingerprint = compute_fingerprint({'language' : 'c'}, [str(src)])
+
+    assert compute_fingerprint({'language' : 'c'}, [str(src)]) == fingerprint
+    assert compute_fingerprint({'language' : 'fortran'}, [str(src)]) != fingerprint
+
+    src.write('x = 2\n')
+    assert compute_fingerprint({'language' : 'c'}, [str(src)]) != fingerprint
+
+def test_manifest(tmpdir):
+    folder = str(tmpdir.mkdir('__pyccel__'))
+    output = tmpdir.join('__pyccel__', 'mod.o')
+    output.write('')
+
+    manifest = BuildManifest(folder)
+    assert not manifest.is_up_to_date('object:mod', 'abc')
+    manifest.update('object:mod', 'abc', outputs = [str(output)])
+    manifest.save()
+
+    manifest = BuildManifest(folder)
+    assert manifest.is_up_to_date('object:mod', 'abc')
+    assert not manifest.is_up_to_date('object:mod', 'def')
+
+    # A target is out of date if its outputs were removed
+    os.remove(str(output))
+    assert not manifest.is_up_to_date('object:mod', 'abc')
+
+def test_manifest_merge(tmpdir):
+    folder = str(tmpdir)
+    manifest1 = BuildManifest(folder)
+    manifest2 = BuildManifest(folder)
+
+    manifest1.update('a', '1')
+    manifest1.save()
+    manifest2.update('b', '2')
+    manifest2.save()
+
+    manifest = BuildManifest(folder)
+    assert manifest.get('a')['fingerprint'] == '1'
+    assert manifest.get('b')['fingerprint'] == '2'
+
+    manifest.remove('a')
+    manifest.save()
+    assert BuildManifest(folder).get('a') is None
@@ -0,0 +1,60 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import json
+import os
+import pstats
+import pytest
+
+from pyccel.codegen.pipeline  import execute_pyccel
+from pyccel.codegen.profiling import Profiler
+
+def test_profiler():
+    profiler = Profiler()
+    assert profiler is Profiler()
+
+    with profiler.stage('disabled'):
+        pass
+    assert not profiler.enabled
+
+    profiler.start()
+    with profiler.stage('semantic', 'mod.py'):
+        data = [0]*10000
+    with profiler.stage('compilation', 'mod.py', compiler = True):
+        pass
+    profiler.stop()
+    del data
+
+    report = profiler.report(file = 'mod.py')
+    assert report['file'] == 'mod.py'
+    assert [s['stage'] for s in report['stages']] == ['semantic', 'compilation']
+    assert report['stages'][0]['peak_memory'] > 0
+    assert 'peak_memory' not in report['stages'][1]
+    assert report['totals']['semantic']['count'] == 1
+    json.dumps(report)
+
+@pytest.mark.parametrize('language', ['fortran', 'c'])
+def test_execute_pyccel_profile(tmpdir, language):
+    tmpdir.join('utils.py').write("from pyccel.decorators import types\n"
+                                  "@types('int')\n"
+                                  "def incr(x):\n"
+                                  "    return x + 1\n")
+    src = tmpdir.join('mod.py')
+    src.write("from pyccel.decorators import types\n"
+              "from utils import incr\n"
+              "@types('int')\n"
+              "def f(x):\n"
+              "    return incr(x)*2\n")
+
+    stats = str(tmpdir.join('mod.prof'))
+    execute_pyccel(str(src), language = language, profile = True, cprofile = stats)
+    assert not Profiler().enabled
+
+    with open(str(tmpdir.join('__pyccel__', 'mod_profile.json'))) as f:
+        report = json.load(f)
+
+    stages = {(s['stage'], os.path.basename(s['module'])) for s in report['stages']}
+    for module in ('mod.py', 'utils.py'):
+        for stage in ('syntactic', 'semantic', 'codegen', 'compilation'):
+            assert (stage, module) in stages
+    assert ('wrapper generation', 'mod.py') in stages
+    assert ('shared library link', 'mod.py') in stages
+    assert pstats.Stats(stats).total_calls > 0
@@ -0,0 +1,65 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import threading
+import time
+import pytest
+
+from pyccel.codegen.scheduler import BuildGraph, topological_order
+
+def test_topological_order():
+    graph = {'a' : ['b', 'c'], 'b' : ['d'], 'c' : ['d'], 'd' : []}
+    order = topological_order(['a'], lambda n: graph[n])
+    assert order[0] == 'd'
+    assert order[-1] == 'a'
+    assert sorted(order) == ['a', 'b', 'c', 'd']
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_build_order(jobs):
+    lock = threading.Lock()
+    finished = []
+    def task(name):
+        time.sleep(0.01)
+        with lock:
+            finished.append(name)
+        return name.upper()
+
+    build = BuildGraph()
+    build.add_task('a', task, 'a', dependencies = ['b', 'c'])
+    build.add_task('b', task, 'b', dependencies = ['d'])
+    build.add_task('c', task, 'c', dependencies = ['d', 'unknown'])
+    build.add_task('d', task, 'd')
+
+    results = build.run(jobs)
+
+    assert results['a'] == 'A'
+    assert finished[0] == 'd'
+    assert finished[-1] == 'a'
+    assert len(finished) == 4
+
+def test_parallel_tasks():
+    barrier = threading.Barrier(3, timeout = 5)
+    build = BuildGraph()
+    for i in range(3):
+        build.add_task(str(i), barrier.wait)
+    # The tasks can only finish if they are run simultaneously
+    build.run(jobs = 3)
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_failed_task(jobs):
+    finished = []
+    def fail():
+        raise ValueError('compilation error')
+
+    build = BuildGraph()
+    build.add_task('a', finished.append, 'a', dependencies = ['b'])
+    build.add_task('b', fail)
+    with pytest.raises(ValueError):
+        build.run(jobs)
+    assert build.failed == 'b'
+    assert not finished
+
+def test_cyclic_dependencies():
+    build = BuildGraph()
+    build.add_task('a', print, dependencies = ['b'])
+    build.add_task('b', print, dependencies = ['a'])
+    with pytest.raises(RuntimeError):
+        build.run()
@@ -0,0 +1,47 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+
+from pyccel.decorators import types, stack_array
+
+#==============================================================================
+# Local arrays allocated on the stack and in the scratch memory
+#==============================================================================
+@stack_array('b')
+@types('real[:]', 'int')
+def stack_temporary(a, n):
+    b = np.zeros(n)
+    b[:] = 2 * a[:n]
+    if n > 4:
+        return b[n-1]
+    return b[0] + b[n-1]
+
+@types('real[:]', 'int')
+def local_temporaries(a, n):
+    b = np.zeros(n)
+    c = np.ones(n)
+    b[:] = a[:n] + c
+    c[:] = b * b
+    s = 0.0
+    for i in range(n):
+        s += c[i]
+    if s > 1000.0:
+        return s
+    return -s
+
+@types('real[:]', 'int')
+def nested_temporaries(a, n):
+    b = np.zeros(n)
+    s = 0.0
+    for i in range(1, n+1):
+        b[:i] = a[:i]
+        s += local_temporaries(b, i)
+    return s
+
+@types('real[:]', 'int')
+def loop_temporaries(a, n):
+    s = 0.0
+    for i in range(1, n+1):
+        b = np.zeros(i)
+        b[:] = a[:i]
+        s += b[i-1]
+    return s
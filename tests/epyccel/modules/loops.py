@@ -215,3 +215,44 @@ def while_not_0( n ):
     while n:
         n -= 1
     return n
+
+@types( int, int )
+def stencil_on_local_2d_array( n, m ):
+    from numpy import zeros
+    a = zeros((n, m))
+    for i in range(n):
+        for j in range(m):
+            a[i, j] = i - 2*j
+    s = 0.0
+    for i in range(1, n-1):
+        for j in range(1, m-1):
+            s = s + a[i-1, j] + a[i+1, m-j-1] - a[i, j+1] + a[n//2, m//2] + a[-1, -2]
+    return s
+
+@types( int, int )
+def loop_on_local_2d_array_view( n, m ):
+    from numpy import zeros
+    a = zeros((n, m))
+    for i in range(n):
+        for j in range(m):
+            a[i, j] = i*m + j
+    b = a[1:, ::2]
+    s = 0.0
+    for i in range(n-1):
+        for j in range((m+1)//2):
+            s = s + b[i, j] * (i + 1)
+    return s
+
+@types( int )
+def loop_on_local_3d_array( n ):
+    from numpy import zeros
+    a = zeros((n, n+1, n+2), dtype=int)
+    for i in range(n):
+        for j in range(n+1):
+            for k in range(n+2):
+                a[i, j, k] = i*100 + j*10 + k
+    s = 0
+    for i in range(n):
+        for j in range(n+1):
+            s = s + a[i, j, n+1-j] * a[n-1-i, j, 0]
+    return s
@@ -275,3 +275,145 @@ def omp_arraysum_single(x):
     #$ omp end single
     #$ omp end parallel
     return result
+
+@types('real[:]', 'real[:]', 'int')
+def omp_parallel_for(x, y, chunk):
+    #$ omp parallel for schedule(dynamic, chunk)
+    for i in range(x.shape[0]):
+        y[i] = 2 * x[i]
+    #$ omp end parallel for
+
+@types('int[:]')
+def omp_parallel_for_simd(x):
+    result = 0
+    #$ omp parallel for simd reduction(+:result) schedule(static) safelen(8)
+    for i in range(x.shape[0]):
+        result += x[i]
+    #$ omp end parallel for simd
+    return result
+
+@types('real[:]')
+def omp_simd(x):
+    result = 0.0
+    #$ omp simd reduction(+:result) simdlen(4)
+    for i in range(x.shape[0]):
+        result += x[i]
+    #$ omp end simd
+    return result
+
+@types('int[:]')
+def omp_for_schedule_runtime(x):
+    result = 0
+    #$ omp parallel private(i)
+    #$ omp for simd schedule(runtime) reduction(+:result)
+    for i in range(x.shape[0]):
+        result += x[i]
+    #$ omp end for simd
+    #$ omp end parallel
+    return result
+
+@types('int[:]', 'int[:]')
+def omp_for_nowait(x, y):
+    z = 0
+    #$ omp parallel private(i)
+    #$ omp for
+    for i in range(x.shape[0]):
+        y[i] = x[i]
+    #$ omp end for nowait
+    #$ omp single
+    z = 1
+    #$ omp end single nowait
+    #$ omp end parallel
+    return z
+
+def omp_atomic():
+    count = 0
+    #$ omp parallel
+    #$ omp atomic
+    count += 1
+    #$ omp end parallel
+    return count
+
+@types('int[:]')
+def omp_critical(x):
+    result = 0
+    #$ omp parallel private(i)
+    #$ omp for
+    for i in range(x.shape[0]):
+        #$ omp critical (sum)
+        result = result + x[i]
+        #$ omp end critical (sum)
+    #$ omp end parallel
+    return result
+
+def omp_master_barrier():
+    x = 0
+    y = 0
+    #$ omp parallel
+    #$ omp master
+    x = 1
+    #$ omp end master
+    #$ omp barrier
+    #$ omp atomic update
+    y += x
+    #$ omp end parallel
+    return y
+
+def omp_sections():
+    a = 0
+    b = 0
+    #$ omp parallel
+    #$ omp sections
+    #$ omp section
+    a = 1
+    #$ omp end section
+    #$ omp section
+    b = 2
+    #$ omp end section
+    #$ omp end sections
+    #$ omp end parallel
+    return a + b
+
+@types('int')
+def omp_tasks(n):
+    x = 0
+    y = 0
+    #$ omp parallel
+    #$ omp single
+    #$ omp task shared(x)
+    x = n
+    #$ omp end task
+    #$ omp task shared(y) untied
+    y = 2 * n
+    #$ omp end task
+    #$ omp taskwait
+    #$ omp end single
+    #$ omp end parallel
+    return x + y
+
+@types('int[:]', 'int[:]', 'int')
+def omp_taskloop(x, y, grain):
+    #$ omp parallel
+    #$ omp single
+    #$ omp taskloop grainsize(grain)
+    for i in range(x.shape[0]):
+        y[i] = 2 * x[i]
+    #$ omp end taskloop
+    #$ omp end single
+    #$ omp end parallel
+
+@types('int', 'int')
+def omp_monte_carlo_pi(n, s):
+    from numpy.random import rand, seed
+    seed(s)
+    count = 0
+    #$ omp parallel private(i, x, y) reduction(+:count)
+    #$ omp for schedule(static)
+    for i in range(n):
+        x = rand()
+        y = rand()
+        if x * x + y * y < 1.0:
+            count += 1
+    #$ omp end for
+    #$ omp end parallel
+    return 4.0 * count / n
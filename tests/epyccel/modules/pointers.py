@@ -3,7 +3,10 @@ __all__ = [
         'slice_is_pointer_idx_0',
         'array_copy_is_pointer',
         'pointer_to_pointer_is_pointer',
-        'reassigned_pointer'
+        'reassigned_pointer',
+        'row_is_pointer',
+        'missing_index_is_pointer',
+        'pointers_in_loop'
         ]
 
 def slice_is_pointer_idx_0():
@@ -36,3 +39,29 @@ def reassigned_pointer():
     c[1] = 0
     c = a
     return c[0], c[1], c[2], shape(c)[0]
+
+def row_is_pointer():
+    from numpy import array, shape
+    a = array([[1, 2, 3], [4, 5, 6]])
+    b = a[1, :]
+    a[1, 2] = 9
+    return b[0], b[1], b[2], shape(b)[0]
+
+def missing_index_is_pointer():
+    from numpy import array, shape
+    a = array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    b = a[1]
+    c = a[1:, 1]
+    a[2, 1] = 0
+    return b[0], b[2], c[0], c[1], shape(b)[0], shape(c)[0]
+
+def pointers_in_loop():
+    from numpy import array
+    a = array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    s = 0
+    for i in range(3):
+        row = a[i, :]
+        for j in range(1, 3):
+            w = a[j-1:j+1, i]
+            s = s + row[j] * w[0] - w[1]
+    return s
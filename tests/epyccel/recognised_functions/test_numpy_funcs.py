@@ -2074,14 +2074,6 @@ def test_array(language):
     assert(f2_val()   == create_array_tuple_val())
     assert(type(f2_val()) == type(create_array_tuple_val().item()))
 
-@pytest.mark.parametrize( 'language', (
-        pytest.param("fortran", marks = pytest.mark.fortran),
-        pytest.param("c", marks = [
-            pytest.mark.skip(reason="arrays not implemented"),
-            pytest.mark.c]
-        )
-    )
-)
 def test_rand_basic(language):
     def create_val():
         from numpy.random import rand # pylint: disable=reimported
@@ -2094,14 +2086,6 @@ def test_rand_basic(language):
     assert(all([isinstance(yi,float) for yi in y]))
     assert(len(set(y))>1)
 
-@pytest.mark.parametrize( 'language', (
-        pytest.param("fortran", marks = pytest.mark.fortran),
-        pytest.param("c", marks = [
-            pytest.mark.skip(reason="arrays not implemented"),
-            pytest.mark.c]
-        )
-    )
-)
 def test_rand_args(language):
     @types('int')
     def create_array_size_1d(n):
@@ -2160,14 +2144,6 @@ def test_rand_args(language):
     assert(all([isinstance(yi,float) for yi in y]))
     assert(len(set(y))>1)
 
-@pytest.mark.parametrize( 'language', (
-        pytest.param("fortran", marks = pytest.mark.fortran),
-        pytest.param("c", marks = [
-            pytest.mark.skip(reason="arrays not implemented"),
-            pytest.mark.c]
-        )
-    )
-)
 def test_rand_expr(language):
     def create_val():
         from numpy.random import rand # pylint: disable=reimported
@@ -2181,7 +2157,14 @@ def test_rand_expr(language):
     assert(all([isinstance(yi,float) for yi in y]))
     assert(len(set(y))>1)
 
-@pytest.mark.xfail(reason="a is not allocated")
+@pytest.mark.parametrize( 'language', (
+        pytest.param("fortran", marks = [
+            pytest.mark.xfail(reason="a is not allocated"),
+            pytest.mark.fortran]
+        ),
+        pytest.param("c", marks = pytest.mark.c)
+    )
+)
 def test_rand_expr_array(language):
     def create_array_vals_2d():
         from numpy.random import rand # pylint: disable=reimported
@@ -2195,14 +2178,26 @@ def test_rand_expr_array(language):
     assert(all([isinstance(yi,float) for yi in y]))
     assert(len(set(y))>1)
 
-@pytest.mark.parametrize( 'language', (
-        pytest.param("fortran", marks = pytest.mark.fortran),
-        pytest.param("c", marks = [
-            pytest.mark.skip(reason="randint not implemented"),
-            pytest.mark.c]
-        )
-    )
-)
+def test_random_seed(language):
+    @types('int', 'int')
+    def create_array(n, s):
+        from numpy.random import rand, randint, seed
+        from numpy import zeros
+        seed(s)
+        a = zeros(n)
+        for i in range(n):
+            a[i] = rand()
+        b = rand(n)
+        c = randint(-3, 3, n)
+        return a[n-1], b[0], b[n-1], c[0], c[n-1]
+
+    f1 = epyccel(create_array, language = language)
+    x = f1(20, 4)
+    assert(f1(20, 4) == x)
+    assert(f1(20, 5) != x)
+    assert(all([0 <= xi < 1 for xi in x[:3]]))
+    assert(all([-3 <= xi < 3 for xi in x[3:]]))
+
 def test_randint_basic(language):
     def create_rand():
         from numpy.random import randint # pylint: disable=reimported
@@ -2239,14 +2234,6 @@ def test_randint_basic(language):
     assert(all([isinstance(yi,int) for yi in y]))
     assert(len(set(y))>1)
 
-@pytest.mark.parametrize( 'language', (
-        pytest.param("fortran", marks = pytest.mark.fortran),
-        pytest.param("c", marks = [
-            pytest.mark.skip(reason="randint not implemented"),
-            pytest.mark.c]
-        )
-    )
-)
 def test_randint_expr(language):
     @types('int')
     def create_val(high):
@@ -1496,7 +1496,6 @@ def test_array_real_2d_2d_matmul_F_F_F_F():
     f2(A2, B2, C2)
     assert np.array_equal(C1, C2)
 
-@pytest.mark.xfail(reason="Should fail as long as mixed order not supported, see #244")
 def test_array_real_2d_2d_matmul_mixorder():
     f1 = arrays.array_real_2d_2d_matmul_mixorder
     f2 = epyccel( f1 )
@@ -0,0 +1,140 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Element-wise expressions on whole arrays and on array sections
+#==============================================================================
+@types('real[:]', 'real[:]', 'real[:]')
+def axpy_1d(a, b, c):
+    c[:] = a + 2*b
+
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def combine_2d(a, b, c):
+    c[:,:] = a * b - 3.0 / (a + 1)
+
+@types('real[:,:](order=F)', 'real[:,:](order=F)')
+def combine_2d_F(a, b):
+    b[:,:] = 2*a + 1
+
+@types('real[:]', 'real[:]')
+def ufuncs(a, b):
+    from numpy import sin, exp, sqrt
+    b[:] = sin(a) + exp(-a) * sqrt(a)
+
+@types('int[:]', 'int[:]')
+def integers(a, b):
+    b[:] = a % 3 + a // 2 - 2*a
+
+@types('complex[:]', 'complex[:]')
+def complexes(a, b):
+    from numpy import exp
+    b[:] = exp(1j * a) * a
+
+@types('real[:,:]', 'real')
+def fill_scalar(a, x):
+    a[:,:] = x
+    a[1,:] = 2*x
+
+@types('real[:]', 'real[:]')
+def sections(a, b):
+    n = a.shape[0]
+    b[1:n-1] = a[2:n] - a[:n-2]
+    b[::2] = a[1::2]
+
+@types('real[:]')
+def negative_steps(a):
+    a[::-1] = a[::-1] + 1
+    a[:3] = a[-3:]
+
+@types('real[:]', 'real[:]')
+def aug_assign(a, b):
+    b[:] += a
+    b[:] *= 2
+    b[:] -= a * a
+
+@types('real[:]')
+def overlap(a):
+    n = a.shape[0]
+    a[1:] = a[:n-1] * 2
+    a[:] = a[::-1]
+
+@types('int')
+def local_arrays(n):
+    from numpy import zeros, ones
+    a = zeros((n, 2*n))
+    b = ones((n, 2*n))
+    c = a + 2*b
+    c[1:n, :] = c[:n-1, :] + b[:n-1, :]
+    d = c[0]
+    return d[n] + c[n-1, 0]
+
+@types('real[:,:]', 'real[:,:]')
+def views(a, b):
+    x = a[1:, ::2]
+    x[:,:] = 5.0
+    b[:,:] = a
+
+#==============================================================================
+def check(f, language, *args):
+    f2 = epyccel(f, language = language)
+    args1 = [np.copy(a) if isinstance(a, np.ndarray) else a for a in args]
+    args2 = [np.copy(a) if isinstance(a, np.ndarray) else a for a in args]
+    r1 = f(*args1)
+    r2 = f2(*args2)
+    assert r1 == r2
+    for a1, a2 in zip(args1, args2):
+        if isinstance(a1, np.ndarray):
+            assert np.allclose(a1, a2, rtol=1e-13, atol=1e-14)
+
+def test_axpy_1d(language):
+    check(axpy_1d, language, np.arange(10.), np.linspace(0, 1, 10), np.zeros(10))
+
+def test_combine_2d(language):
+    a = np.arange(12.).reshape(3, 4)
+    check(combine_2d, language, a, a.T.copy().T, np.zeros((3, 4)))
+
+def test_combine_2d_F(language):
+    check(combine_2d_F, language, np.asfortranarray(np.arange(12.).reshape(3, 4)),
+            np.zeros((3, 4), order='F'))
+
+def test_ufuncs(language):
+    check(ufuncs, language, np.linspace(0, 5, 17), np.zeros(17))
+
+def test_integers(language):
+    check(integers, language, np.arange(20), np.zeros(20, dtype=int))
+
+def test_complexes(language):
+    check(complexes, language, np.linspace(0, 1, 7)*(1+2j), np.zeros(7, dtype=complex))
+
+def test_fill_scalar(language):
+    check(fill_scalar, language, np.zeros((3, 4)), 1.5)
+
+def test_sections(language):
+    check(sections, language, np.arange(10.)**2, np.zeros(10))
+
+def test_negative_steps(language):
+    check(negative_steps, language, np.arange(10.))
+
+def test_aug_assign(language):
+    check(aug_assign, language, np.arange(10.), np.ones(10))
+
+def test_overlap(language):
+    check(overlap, language, np.arange(10.))
+
+def test_local_arrays(language):
+    check(local_arrays, language, 5)
+
+def test_strided_arguments(language):
+    x = np.arange(48.).reshape(6, 8)
+    f2 = epyccel(combine_2d, language = language)
+    c1 = np.zeros((6, 8))
+    c2 = np.zeros((6, 8))
+    combine_2d(x[::2, 1::3], x[1::2, ::-3], c1[::2, ::3])
+    f2(x[::2, 1::3], x[1::2, ::-3], c2[::2, ::3])
+    assert np.array_equal(c1, c2)
+
+def test_views(language):
+    check(views, language, np.zeros((4, 6)), np.zeros((4, 6)))
@@ -0,0 +1,50 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+# Number of elements which cannot be represented by a 32-bit integer.
+# The arrays are never filled, so only a few pages of memory are used.
+n_large = 2**31 + 8
+
+#==============================================================================
+def test_local_large_1d_array(language):
+    @types('int')
+    def f(n):
+        from numpy import empty
+        a = empty(n, dtype='int8')
+        a[n-1] = 5
+        a[n-2] = 2
+        b = a[n-2:]
+        return a.shape[0], b[0] + b[1]
+
+    f2 = epyccel(f, language = language)
+    assert f2(n_large) == (n_large, 7)
+
+def test_local_large_2d_array(language):
+    @types('int', 'int')
+    def f(n, m):
+        from numpy import empty
+        a = empty((n, m), dtype='int8')
+        a[n-1, m-1] = 5
+        a[n-1, m-2] = 2
+        return a[n-1, m-1] + a[n-1, m-2]
+
+    f2 = epyccel(f, language = language)
+    assert f2(2**16 + 1, 2**15 + 3) == 7
+
+def test_memmap_large_1d_array(language, tmp_path):
+    @types('int8[:]')
+    def f(a):
+        n = a.shape[0]
+        a[n-1] = 3
+        return n, a[n-2] + a[n-1]
+
+    f2 = epyccel(f, language = language)
+
+    a = np.memmap(str(tmp_path / 'large.dat'), dtype = np.int8, mode = 'w+', shape = (n_large,))
+    a[n_large-2] = 4
+    assert f2(a) == (n_large, 7)
+    assert a[n_large-1] == 3
+    del a
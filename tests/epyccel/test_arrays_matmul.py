@@ -0,0 +1,162 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from ctypes.util import find_library
+
+import pytest
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Products of matrices and vectors
+#==============================================================================
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def matmul_C(a, b, c):
+    from numpy import matmul
+    c[:,:] = matmul(a, b)
+
+@types('real[:,:](order=F)', 'real[:,:](order=F)', 'real[:,:](order=F)')
+def matmul_F(a, b, c):
+    from numpy import matmul
+    c[:,:] = matmul(a, b)
+
+@types('real[:,:]', 'real[:,:](order=F)', 'real[:,:]')
+def matmul_mixed_order(a, b, c):
+    from numpy import matmul
+    c[:,:] = matmul(a, b)
+
+@types('real[:,:]', 'real[:]', 'real[:]')
+def dot_matrix_vector(a, x, y):
+    from numpy import dot
+    y[:] = dot(a, x)
+
+@types('real[:,:](order=F)', 'real[:]', 'real[:]')
+def matmul_vector_matrix_F(a, x, y):
+    from numpy import matmul
+    y[:] = matmul(x, a)
+
+@types('real[:]', 'real[:,:]', 'real[:]')
+def matmul_vector_matrix(x, a, y):
+    from numpy import matmul
+    y[:] = matmul(x, a)
+
+@types('real[:]', 'real[:]')
+def dot_vectors(x, y):
+    from numpy import dot
+    d = dot(x, y)
+    return d + 2 * dot(x[::2], y[1::2])
+
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def matmul_slices(a, c, d):
+    from numpy import matmul
+    c[:,:] = matmul(a[::2, 1:], a[1:, ::3])
+    d[:,:] = matmul(a[::2, 1:], a[1:, :101])
+
+@types('int[:,:]', 'int[:,:]', 'int[:,:]')
+def matmul_int(a, b, c):
+    from numpy import matmul
+    c[:,:] = matmul(a, b)
+
+@types('complex[:]', 'complex[:]')
+def dot_complex(x, y):
+    from numpy import dot
+    return dot(x, y)
+
+@types('int', 'int')
+def matmul_allocated(m, n):
+    from numpy import ones, matmul
+    a = ones((m, n))
+    b = ones((n, m))
+    c = matmul(a, b)
+    return c[0, 0] + c[m - 1, m - 1]
+
+#==============================================================================
+blas_options = [None,
+        pytest.param('openblas', marks = pytest.mark.skipif(find_library('openblas') is None,
+            reason = 'OpenBLAS is not installed'))]
+
+# The sizes are large enough for the products to be computed by BLAS
+@pytest.mark.parametrize('blas', blas_options)
+def test_matmul(language, blas):
+    f1 = epyccel(matmul_C, language = language, blas = blas)
+    f2 = epyccel(matmul_F, language = language, blas = blas)
+    for m, n, k in [(3, 4, 2), (140, 120, 130)]:
+        a = np.random.random((m, k))
+        b = np.random.random((k, n))
+
+        c = np.empty((m, n))
+        f1(a, b, c)
+        assert np.allclose(c, a @ b, rtol=1e-13, atol=0)
+
+        c = np.empty((m, n), order='F')
+        f2(np.asfortranarray(a), np.asfortranarray(b), c)
+        assert np.allclose(c, a @ b, rtol=1e-13, atol=0)
+
+@pytest.mark.parametrize('blas', blas_options)
+def test_matmul_mixed_order(language, blas):
+    f = epyccel(matmul_mixed_order, language = language, blas = blas)
+    for m, n, k in [(3, 4, 2), (140, 120, 130)]:
+        a = np.random.random((m, k))
+        b = np.asfortranarray(np.random.random((k, n)))
+        c = np.empty((m, n))
+        f(a, b, c)
+        assert np.allclose(c, a @ b, rtol=1e-13, atol=0)
+
+@pytest.mark.parametrize('blas', blas_options)
+def test_matrix_vector(language, blas):
+    f1 = epyccel(dot_matrix_vector, language = language, blas = blas)
+    f2 = epyccel(matmul_vector_matrix, language = language, blas = blas)
+    f3 = epyccel(matmul_vector_matrix_F, language = language, blas = blas)
+    for m, n in [(3, 4), (1500, 1600)]:
+        a = np.random.random((m, n))
+        x = np.random.random(n)
+        y = np.random.random(m)
+
+        z = np.empty(m)
+        f1(a, x, z)
+        assert np.allclose(z, a @ x, rtol=1e-13, atol=0)
+
+        z = np.empty(n)
+        f2(y, a, z)
+        assert np.allclose(z, y @ a, rtol=1e-13, atol=0)
+
+        z = np.empty(n)
+        f3(np.asfortranarray(a), y, z)
+        assert np.allclose(z, y @ a, rtol=1e-13, atol=0)
+
+@pytest.mark.parametrize('blas', blas_options)
+def test_dot_vectors(language, blas):
+    f = epyccel(dot_vectors, language = language, blas = blas)
+    for n in (6, 100000):
+        x = np.random.random(n)
+        y = np.random.random(n)
+        assert np.isclose(f(x, y), dot_vectors(x, y), rtol=1e-13, atol=0)
+
+# The elements of the arrays are not contiguous, or only along one dimension
+@pytest.mark.parametrize('blas', blas_options)
+def test_matmul_slices(language, blas):
+    f = epyccel(matmul_slices, language = language, blas = blas)
+    a = np.random.random((301, 301))
+    c1, d1 = np.empty((151, 101)), np.empty((151, 101))
+    c2, d2 = np.empty((151, 101)), np.empty((151, 101))
+    f(a, c1, d1)
+    matmul_slices(a, c2, d2)
+    assert np.allclose(c1, c2, rtol=1e-13, atol=0)
+    assert np.allclose(d1, d2, rtol=1e-13, atol=0)
+
+def test_matmul_types(language):
+    f1 = epyccel(matmul_int, language = language)
+    f2 = epyccel(dot_complex, language = language)
+    a = np.random.randint(-10, 10, (5, 3))
+    b = np.random.randint(-10, 10, (3, 4))
+    c = np.empty((5, 4), dtype=int)
+    f1(a, b, c)
+    assert np.array_equal(c, a @ b)
+
+    x = np.random.random(7) + 1j * np.random.random(7)
+    y = np.random.random(7) + 1j * np.random.random(7)
+    assert np.isclose(f2(x, y), dot_complex(x, y), rtol=1e-13, atol=0)
+
+def test_matmul_allocated(language):
+    f = epyccel(matmul_allocated, language = language)
+    assert f(4, 3) == matmul_allocated(4, 3)
@@ -0,0 +1,250 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import math
+
+import pytest
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Reductions of all the elements of an array
+#==============================================================================
+@types('real[:]')
+def reductions_1d(a):
+    from numpy import sum as np_sum, prod as np_prod, min as np_min, max as np_max
+    return np_sum(a), np_prod(a), np_min(a), np_max(a)
+
+@types('real[:,:]')
+def reductions_2d(a):
+    from numpy import sum as np_sum, prod as np_prod, min as np_min, max as np_max
+    return np_sum(a), np_prod(a), np_min(a), np_max(a)
+
+@types('real[:,:](order=F)')
+def reductions_2d_F(a):
+    from numpy import sum as np_sum, prod as np_prod, min as np_min, max as np_max
+    return np_sum(a), np_prod(a), np_min(a), np_max(a)
+
+@types('int[:,:]')
+def reductions_int(a):
+    return a.sum(), a.min(), a.max()
+
+@types('int32[:]')
+def prod_int32(a):
+    from numpy import prod as np_prod
+    return np_prod(a)
+
+@types('bool[:]')
+def sum_bool(a):
+    from numpy import sum as np_sum
+    return np_sum(a)
+
+@types('complex[:]')
+def reductions_complex(a):
+    from numpy import sum as np_sum, prod as np_prod
+    return np_sum(a), np_prod(a)
+
+@types('real[:]')
+def reductions_in_expressions(a):
+    from numpy import sum as np_sum, max as np_max
+    n = a.shape[0]
+    x = 2*np_sum(a[1:n-1]) - np_max(a*a) / np_sum(a + 1)
+    x += np_sum(a[::2] * a[1::2])
+    return x
+
+@types('real[:]', 'real')
+def reduction_in_while(a, x):
+    from numpy import sum as np_sum
+    n = 0
+    while np_sum(a) < x:
+        a[n] += 1.0
+        n += 1
+    return n
+
+@types('real[:]')
+def norms_1d(a):
+    from numpy.linalg import norm
+    return norm(a), norm(a[::2])
+
+@types('real[:,:]')
+def norm_2d(a):
+    from numpy.linalg import norm
+    return norm(a)
+
+@types('complex[:]')
+def norm_complex(a):
+    from numpy.linalg import norm
+    return norm(a)
+
+#==============================================================================
+# Reductions along an axis
+#==============================================================================
+@types('real[:,:]', 'real[:]', 'real[:]')
+def sum_axis(a, b, c):
+    from numpy import sum as np_sum
+    b[:] = np_sum(a, axis=0)
+    c[:] = np_sum(a, axis=-1)
+
+@types('real[:,:](order=F)', 'real[:]', 'real[:]')
+def min_max_axis_F(a, b, c):
+    from numpy import min as np_min, max as np_max
+    b[:] = np_min(a, axis=1)
+    c[:] = np_max(a, 0)
+
+@types('real[:,:,:]')
+def reductions_axis_3d(a):
+    from numpy import sum as np_sum, prod as np_prod
+    b = np_sum(a, axis=1)
+    c = np_prod(a, axis=2)
+    return b[0,1] + 2*b[1,0] + 3*c[1,2] + 4*c[0,0]
+
+@types('real[:,:]', 'real[:]')
+def aug_assign_axis(a, b):
+    from numpy import sum as np_sum
+    b[:] += np_sum(a, axis=1)
+
+@types('real[:,:]', 'real[:]')
+def norm_axis(a, b):
+    from numpy.linalg import norm
+    b[:] = norm(a, axis=1)
+
+#==============================================================================
+def test_reductions_1d(language):
+    f = epyccel(reductions_1d, language = language)
+    a = np.random.random(1000) + 0.5
+
+    assert np.allclose(f(a), reductions_1d(a), rtol=1e-13, atol=0)
+    assert np.allclose(f(a[1:-1:3]), reductions_1d(a[1:-1:3]), rtol=1e-13, atol=0)
+
+def test_reductions_2d(language):
+    f1 = epyccel(reductions_2d, language = language)
+    f2 = epyccel(reductions_2d_F, language = language)
+    a = np.random.random((13, 9)) + 0.5
+
+    assert np.allclose(f1(a), reductions_2d(a), rtol=1e-13, atol=0)
+    assert np.allclose(f1(a[::2, 1:]), reductions_2d(a[::2, 1:]), rtol=1e-13, atol=0)
+    assert np.allclose(f2(np.asfortranarray(a)), reductions_2d_F(a), rtol=1e-13, atol=0)
+
+def test_reductions_int(language):
+    f1 = epyccel(reductions_int, language = language)
+    f2 = epyccel(prod_int32, language = language)
+    f3 = epyccel(sum_bool, language = language)
+    a = np.random.randint(-100, 100, (7, 5))
+    b = np.random.randint(1, 4, 20, dtype=np.int32)
+    c = np.random.random(30) > 0.5
+
+    assert f1(a) == reductions_int(a)
+    assert f2(b) == prod_int32(b)
+    assert f3(c) == sum_bool(c)
+
+def test_reductions_complex(language):
+    f = epyccel(reductions_complex, language = language)
+    a = np.random.random(50) + 1j * np.random.random(50) + 0.5
+
+    assert np.allclose(f(a), reductions_complex(a), rtol=1e-13, atol=0)
+
+def test_reductions_in_expressions(language):
+    f1 = epyccel(reductions_in_expressions, language = language)
+    f2 = epyccel(reduction_in_while, language = language)
+    a = np.random.random(20)
+
+    assert np.isclose(f1(a), reductions_in_expressions(a), rtol=1e-13, atol=0)
+    b = np.zeros(10)
+    c = np.zeros(10)
+    assert f2(b, 4.5) == reduction_in_while(c, 4.5)
+    assert np.array_equal(b, c)
+
+def test_norms(language):
+    f1 = epyccel(norms_1d, language = language)
+    f2 = epyccel(norm_2d, language = language)
+    f3 = epyccel(norm_complex, language = language)
+    a = np.random.random(100)
+    b = np.random.random((8, 6))
+    c = np.random.random(10) + 1j * np.random.random(10)
+
+    assert np.allclose(f1(a), norms_1d(a), rtol=1e-13, atol=0)
+    assert np.isclose(f2(b), norm_2d(b), rtol=1e-13, atol=0)
+    assert np.isclose(f3(c), norm_complex(c), rtol=1e-13, atol=0)
+
+def test_reductions_axis(language):
+    f1 = epyccel(sum_axis, language = language)
+    f2 = epyccel(min_max_axis_F, language = language)
+    f3 = epyccel(reductions_axis_3d, language = language)
+    f4 = epyccel(aug_assign_axis, language = language)
+    f5 = epyccel(norm_axis, language = language)
+    a = np.random.random((6, 4))
+
+    b1, c1 = np.zeros(4), np.zeros(6)
+    b2, c2 = np.zeros(4), np.zeros(6)
+    f1(a, b1, c1)
+    sum_axis(a, b2, c2)
+    assert np.allclose(b1, b2, rtol=1e-13, atol=0)
+    assert np.allclose(c1, c2, rtol=1e-13, atol=0)
+
+    af = np.asfortranarray(a)
+    b1, c1 = np.zeros(6), np.zeros(4)
+    b2, c2 = np.zeros(6), np.zeros(4)
+    f2(af, b1, c1)
+    min_max_axis_F(af, b2, c2)
+    assert np.array_equal(b1, b2)
+    assert np.array_equal(c1, c2)
+
+    d = np.random.random((2, 5, 3))
+    assert np.isclose(f3(d), reductions_axis_3d(d), rtol=1e-13, atol=0)
+
+    b1 = np.ones(6)
+    b2 = np.ones(6)
+    f4(a, b1)
+    aug_assign_axis(a, b2)
+    assert np.allclose(b1, b2, rtol=1e-13, atol=0)
+
+    b1 = np.zeros(6)
+    b2 = np.zeros(6)
+    f5(a, b1)
+    norm_axis(a, b2)
+    assert np.allclose(b1, b2, rtol=1e-13, atol=0)
+
+# The Fortran intrinsics ignore the nan values
+@pytest.mark.parametrize('language', [pytest.param('c', marks = pytest.mark.c)])
+def test_min_max_nan(language):
+    f = epyccel(reductions_1d, language = language)
+    a = np.random.random(10)
+    a[3] = np.nan
+
+    _, _, amin, amax = f(a)
+    assert np.isnan(amin)
+    assert np.isnan(amax)
+
+#==============================================================================
+# The compensated summation of the C backend
+#==============================================================================
+@pytest.mark.parametrize('language', [pytest.param('c', marks = pytest.mark.c)])
+def test_sum_accuracy(language):
+    f = epyccel(reductions_1d, language = language)
+    a = np.full(10**6, 0.1)
+    a[::2] = 1e8 / 3
+
+    # The relative error of the naive summation is of the order of 1e-12
+    assert math.isclose(f(a)[0], math.fsum(a), rel_tol=1e-14)
+
+@pytest.mark.parametrize('language', [pytest.param('c', marks = pytest.mark.c)])
+def test_reductions_openmp(language):
+    f1 = epyccel(reductions_2d, language = language, accelerator = 'openmp')
+    f2 = epyccel(sum_axis, language = language, accelerator = 'openmp')
+    f3 = epyccel(reductions_complex, language = language, accelerator = 'openmp')
+    a = np.random.random((1000, 300)) + 0.5
+
+    s, _, amin, amax = f1(a)
+    assert math.isclose(s, math.fsum(a.ravel()), rel_tol=1e-15)
+    assert amin == a.min()
+    assert amax == a.max()
+
+    b1, c1 = np.zeros(300), np.zeros(1000)
+    b2, c2 = np.zeros(300), np.zeros(1000)
+    f2(a, b1, c1)
+    sum_axis(a, b2, c2)
+    assert np.allclose(b1, b2, rtol=1e-13, atol=0)
+    assert np.allclose(c1, c2, rtol=1e-13, atol=0)
+
+    z = np.random.random(100000) + 1j * np.random.random(100000)
+    assert np.isclose(f3(z)[0], np.sum(z), rtol=1e-13, atol=0)
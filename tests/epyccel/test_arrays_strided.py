@@ -0,0 +1,81 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Non contiguous arrays are passed without copies, the results are checked
+# against python and the modifications must be visible in the original array
+#==============================================================================
+@types('float[:,:]')
+def fill_2d(a):
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            a[i, j] = 10*i + j
+
+@types('float[:,:](order=F)')
+def fill_2d_F(a):
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            a[i, j] = 10*i + j
+
+@types('int32[:]')
+def sum_1d(a):
+    s = 0
+    for i in range(a.shape[0]):
+        s += a[i]
+    return s
+
+@types('complex[:,:,:]')
+def scale_3d(a):
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            for k in range(a.shape[2]):
+                a[i, j, k] = (i + 2*j + 3*k) * a[i, j, k]
+
+#==============================================================================
+def check_fill(f, language, x, view):
+    f2 = epyccel(f, language = language)
+
+    x1 = x.copy(order = 'A')
+    x2 = x.copy(order = 'A')
+    f(view(x1))
+    f2(view(x2))
+    assert np.array_equal(x1, x2)
+
+def test_strided_rows_and_columns(language):
+    check_fill(fill_2d, language, np.zeros((6, 8)), lambda x: x[1::2, ::3])
+
+def test_negative_strides(language):
+    check_fill(fill_2d, language, np.zeros((6, 8)), lambda x: x[::2, ::-3])
+
+def test_transposed(language):
+    check_fill(fill_2d, language, np.zeros((6, 8)), lambda x: x.T)
+
+def test_column_of_3d_array(language):
+    check_fill(fill_2d, language, np.zeros((4, 5, 3)), lambda x: x[:, ::-1, 1])
+
+def test_strided_F_array(language):
+    check_fill(fill_2d_F, language, np.zeros((6, 8), order = 'F'), lambda x: x[::2, 1::3])
+
+def test_transposed_F_array(language):
+    check_fill(fill_2d_F, language, np.zeros((6, 8)), lambda x: x.T[::-1, :])
+
+def test_strided_1d(language):
+    f2 = epyccel(sum_1d, language = language)
+
+    x = np.arange(20, dtype = np.int32)
+    assert f2(x[::3]) == sum_1d(x[::3])
+    assert f2(x[::-2]) == sum_1d(x[::-2])
+    assert f2(x[7:2:-1]) == sum_1d(x[7:2:-1])
+    assert f2(x[5:5]) == 0
+
+def test_strided_3d(language):
+    f2 = epyccel(scale_3d, language = language)
+
+    x1 = np.ones((5, 4, 6), dtype = complex) * (1+2j)
+    x2 = x1.copy()
+    scale_3d(x1[::2, ::-1, 1::2])
+    f2(x2[::2, ::-1, 1::2])
+    assert np.array_equal(x1, x2)
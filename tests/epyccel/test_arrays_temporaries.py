@@ -0,0 +1,59 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import pytest
+import numpy as np
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+from modules import arrays_temporaries
+
+#==============================================================================
+# The array returned by a function does not use the scratch memory
+#==============================================================================
+@types('int')
+def returned_array(n):
+    from numpy import zeros
+    b = zeros(n)
+    c = zeros(n)
+    c[:] = 1.0
+    b[:] = c + 2
+    return b
+
+#==============================================================================
+@pytest.fixture
+def temporaries(language):
+    return epyccel(arrays_temporaries, language = language)
+
+def test_stack_temporary(temporaries):
+    f = temporaries.stack_temporary
+    a = np.random.random(20)
+
+    for n in (1, 3, 5, 20):
+        assert np.isclose(f(a, n), arrays_temporaries.stack_temporary(a, n), rtol=1e-13, atol=1e-14)
+
+def test_local_temporaries(temporaries):
+    f = temporaries.local_temporaries
+    a = np.random.random(2000) * 10
+
+    # The memory of the arrays is reused by the successive calls
+    for n in (2000, 10, 1, 1500, 2000) * 2:
+        assert np.isclose(f(a, n), arrays_temporaries.local_temporaries(a, n), rtol=1e-13, atol=1e-14)
+
+def test_nested_temporaries(temporaries):
+    f = temporaries.nested_temporaries
+    a = np.random.random(50)
+
+    for n in (50, 7, 50):
+        assert np.isclose(f(a, n), arrays_temporaries.nested_temporaries(a, n), rtol=1e-13, atol=1e-14)
+
+def test_loop_temporaries(temporaries):
+    f = temporaries.loop_temporaries
+    a = np.random.random(50)
+
+    assert np.isclose(f(a, 50), arrays_temporaries.loop_temporaries(a, 50), rtol=1e-13, atol=1e-14)
+
+# Array results are not supported by the Fortran wrappers
+def test_returned_array():
+    f = epyccel(returned_array, language = 'c')
+
+    for n in (3, 1000):
+        assert np.array_equal(f(n), returned_array(n))
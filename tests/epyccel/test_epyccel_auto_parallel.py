@@ -0,0 +1,96 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import modules.openmp as openmp
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Loops which are parallelised
+#==============================================================================
+@types('real[:,:]', 'real[:,:]', 'real')
+def scale_rows(a, b, c):
+    for i in range(a.shape[0]):
+        b[i, :] = c * a[i, :] + 1.0
+
+@types('real[:]', 'real[:]')
+def stencil(a, b):
+    n = a.shape[0]
+    for i in range(1, n - 1):
+        b[i] = 0.5 * a[i] + 0.25 * (a[i - 1] + a[i + 1])
+
+@types('real[:,:]', 'real[:]')
+def row_norms(a, s):
+    total = 0.0
+    t = 0.0
+    for i in range(a.shape[0]):
+        t = 0.0
+        for j in range(a.shape[1]):
+            t += a[i, j] * a[i, j]
+        s[i] = t
+        total = total + t
+    return total + t
+
+@types('real[:]', 'real')
+def count_above(x, threshold):
+    count = 0
+    for i in range(x.shape[0]):
+        if x[i] > threshold:
+            count += 1
+    return count
+
+#==============================================================================
+# Loops which are not parallelised
+#==============================================================================
+@types('real[:]')
+def prefix_sum(x):
+    for i in range(1, x.shape[0]):
+        x[i] = x[i] + x[i - 1]
+
+@types('real[:,:]', 'int')
+def smooth(a, steps):
+    # The iterations of the outer loop depend on each other, the inner loop
+    # is parallelised
+    n = a.shape[0]
+    for k in range(steps):
+        for i in range(n):
+            a[i, :] = 0.5 * a[i, :]
+
+#==============================================================================
+def test_auto_parallel(language):
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    funcs = [scale_rows, stencil, row_norms, count_above, prefix_sum, smooth]
+    compiled = {f.__name__ : epyccel(f, language=language, auto_parallel=True) for f in funcs}
+
+    for n_threads in (1, 4):
+        set_num_threads(n_threads)
+
+        a = np.random.random((31, 17))
+        b1, b2 = np.empty_like(a), np.empty_like(a)
+        compiled['scale_rows'](a, b1, 2.0)
+        scale_rows(a, b2, 2.0)
+        assert np.allclose(b1, b2, rtol=1e-13, atol=0)
+
+        x = np.random.random(101)
+        y1, y2 = np.zeros(101), np.zeros(101)
+        compiled['stencil'](x, y1)
+        stencil(x, y2)
+        assert np.allclose(y1, y2, rtol=1e-13, atol=0)
+
+        s1, s2 = np.empty(31), np.empty(31)
+        assert np.isclose(compiled['row_norms'](a, s1), row_norms(a, s2), rtol=1e-13, atol=0)
+        assert np.allclose(s1, s2, rtol=1e-13, atol=0)
+
+        assert compiled['count_above'](x, 0.5) == count_above(x, 0.5)
+
+        x1, x2 = x.copy(), x.copy()
+        compiled['prefix_sum'](x1)
+        prefix_sum(x2)
+        assert np.allclose(x1, x2, rtol=1e-13, atol=0)
+
+        a1, a2 = a.copy(), a.copy()
+        compiled['smooth'](a1, 3)
+        smooth(a2, 3)
+        assert np.allclose(a1, a2, rtol=1e-13, atol=0)
+
+    set_num_threads(4)
@@ -0,0 +1,34 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import logging
+
+from pyccel.epyccel import epyccel, BackgroundEpyccel
+from pyccel.decorators import types
+
+@types('int')
+def triple(x):
+    return 3*x
+
+def test_background(language):
+    f = epyccel(triple, language = language, background = True)
+    assert isinstance(f, BackgroundEpyccel)
+
+    # The Python version is used until the build is finished
+    assert f(4) == 12
+
+    assert f.wait()
+    assert f.accelerated
+    assert f.python is triple
+    assert f(4) == 12
+    assert f.__name__ == 'triple'
+
+def test_background_error(caplog):
+    def not_typed(x):
+        return x.undefined_attribute
+
+    with caplog.at_level(logging.ERROR, logger = 'pyccel.epyccel'):
+        f = epyccel(not_typed, background = True)
+        assert not f.wait()
+
+    assert not f.accelerated
+    assert f.future.exception() is not None
+    assert 'not_typed' in caplog.text
@@ -0,0 +1,29 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import os
+import sysconfig
+import pytest
+
+import pyccel.codegen.python_wrapper as python_wrapper
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+@types('int', 'int')
+def axpy(a, b):
+    return 3*a + b
+
+def test_python_build_config():
+    config = python_wrapper.get_python_build_config()
+    if config is None:
+        pytest.skip('Extensions are built with setuptools on this platform')
+    assert config is python_wrapper.get_python_build_config()
+    assert config['ext_suffix'] == sysconfig.get_config_var('EXT_SUFFIX')
+    assert all(os.path.isdir(i) for i in config['includes'])
+
+@pytest.mark.parametrize('use_setuptools', [False, True])
+def test_build_backend(language, use_setuptools, monkeypatch):
+    if use_setuptools:
+        monkeypatch.setitem(python_wrapper._python_build_config, 'config', None) # pylint: disable=protected-access
+
+    f = epyccel(axpy, language = language, cache = False)
+    assert f(2, 5) == axpy(2, 5)
+
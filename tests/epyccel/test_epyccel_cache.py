@@ -0,0 +1,83 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import os
+import sys
+import pytest
+
+import pyccel.epyccel
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+from pyccel.codegen.cache import EpyccelCache, cache_info, clear_cache, get_local_dependencies
+
+@pytest.fixture
+def cache_dir(tmpdir, monkeypatch):
+    folder = str(tmpdir.mkdir('cache'))
+    monkeypatch.setenv('PYCCEL_CACHE_DIR', folder)
+    return folder
+
+def no_build(*args, **kwargs):
+    raise AssertionError('Shared library should be found in the cache')
+
+def test_cache_hit(cache_dir, language, monkeypatch):
+    @types('int', 'int')
+    def f(a, b):
+        return a + 2*b
+
+    f1 = epyccel(f, language = language)
+    assert f1(3, 4) == f(3, 4)
+
+    info = cache_info()
+    assert info['path'] == cache_dir
+    assert len(info['entries']) == 1
+    assert info['size'] > 0
+
+    # Second call does not compile and does not create a new entry
+    monkeypatch.setattr(pyccel.epyccel, 'execute_pyccel', no_build)
+    del sys.modules[f1.__module__]
+    f2 = epyccel(f, language = language)
+    assert f2(3, 4) == f(3, 4)
+    assert len(cache_info()['entries']) == 1
+
+def test_cache_options(cache_dir):
+    @types('int')
+    def f(a):
+        return a + 1
+
+    epyccel(f, language = 'c')
+    epyccel(f, language = 'c', fflags = '-O2')
+    epyccel(f, language = 'c', cache = False)
+    assert len(cache_info()['entries']) == 2
+
+    clear_cache()
+    assert len(cache_info()['entries']) == 0
+
+def test_local_dependencies(tmpdir):
+    folder = tmpdir.mkdir('project')
+    folder.join('mod1.py').write('from mod2 import g\n')
+    folder.join('mod2.py').write('import numpy as np\n')
+    code = 'from mod1 import f\n'
+
+    deps = get_local_dependencies(code, [str(folder)])
+    assert sorted(os.path.basename(d) for d in deps) == ['mod1.py', 'mod2.py']
+
+    # Modifying an indirect dependency modifies the hashes
+    folder.join('mod2.py').write('import numpy as np\nx = 1\n')
+    assert get_local_dependencies(code, [str(folder)]) != deps
+
+def test_lru_eviction(tmpdir):
+    cache = EpyccelCache(str(tmpdir.join('cache')), max_size = 2500)
+    def store(key):
+        filepath = str(tmpdir.join(key + '.so'))
+        with open(filepath, 'wb') as f:
+            f.write(b'0' * 1000)
+        return cache.store(key, filepath)
+
+    store('key0')
+    store('key1')
+    # key0 is used more recently than key1
+    os.utime(os.path.join(cache.path, 'key0', 'info.json'), (200, 200))
+    os.utime(os.path.join(cache.path, 'key1', 'info.json'), (100, 100))
+
+    store('key2')
+    assert [e['key'] for e in cache.info()] == ['key2', 'key0']
+    assert cache.lookup('key1') is None
+    assert cache.lookup('key0').endswith('key0.so')
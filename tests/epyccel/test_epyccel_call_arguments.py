@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import pytest
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+#==============================================================================
+# Arguments passed by position and by name to the wrappers
+#==============================================================================
+@types('int', 'real', 'real')
+def axpy(n, x, y = 1.0):
+    return n*x + y
+
+@types('int32', 'int8', 'bool', 'complex', 'real[:]')
+def mixed(i, b, flag, z, a):
+    a[0] = i + b
+    if flag:
+        a[1] = 1.0
+    return z*i
+
+#------------------------------------------------------------------------------
+def test_positional_and_keyword_arguments(language):
+    f = epyccel(axpy, language = language)
+
+    assert f(3, 1.5) == axpy(3, 1.5)
+    assert f(3, 1.5, 2.5) == axpy(3, 1.5, 2.5)
+    assert f(3, 1.5, y = 2.5) == axpy(3, 1.5, y = 2.5)
+    assert f(3, x = 1.5) == axpy(3, x = 1.5)
+    assert f(y = 2.5, x = 1.5, n = 3) == axpy(y = 2.5, x = 1.5, n = 3)
+    assert f(*(3, 1.5), **{'y' : 2.5}) == axpy(3, 1.5, 2.5)
+
+def test_converted_arguments(language):
+    f = epyccel(axpy, language = language)
+
+    assert f(np.int64(3), np.float64(1.5)) == axpy(3, 1.5)
+    assert f(3, 2) == axpy(3, 2)
+
+def test_wrong_arguments(language):
+    f = epyccel(axpy, language = language)
+
+    with pytest.raises(TypeError):
+        f()
+    with pytest.raises(TypeError):
+        f(3)
+    with pytest.raises(TypeError):
+        f(3, 1.5, 2.5, 4.5)
+    with pytest.raises(TypeError):
+        f(3, 1.5, z = 2.5)
+    with pytest.raises(TypeError):
+        f(3, 1.5, n = 3)
+    with pytest.raises(TypeError):
+        f(3.5, 1.5)
+    with pytest.raises(TypeError):
+        f(3, 'x')
+
+def test_mixed_arguments(language):
+    f = epyccel(mixed, language = language)
+
+    a1 = np.zeros(2)
+    a2 = np.zeros(2)
+    assert f(4, 5, True, 1+2j, a1) == mixed(4, 5, True, 1+2j, a2)
+    assert np.array_equal(a1, a2)
+    assert f(a = a1, z = 2j, flag = False, b = 1, i = 2) == mixed(2, 1, False, 2j, a2)
+    assert np.array_equal(a1, a2)
+
+    with pytest.raises(OverflowError):
+        f(2**40, 5, True, 1j, a1)
+    with pytest.raises(TypeError):
+        f(4, 5, True, 1j, [0.0, 0.0])
@@ -0,0 +1,35 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+@types('int')
+def add_one(x):
+    return x + 1
+
+@types('int')
+def add_two(x):
+    return x + 2
+
+@types('int')
+def add_three(x):
+    return x + 3
+
+def test_epyccel_threads(language):
+    cwd      = os.getcwd()
+    sys_path = list(sys.path)
+
+    functions = [add_one, add_two, add_three, add_one]
+    with ThreadPoolExecutor(max_workers = 4) as executor:
+        results = list(executor.map(lambda f: epyccel(f, language = language, cache = False),
+                                    functions))
+
+    for f, f_acc in zip(functions, results):
+        assert f_acc(5) == f(5)
+
+    # The builds do not change the state of the interpreter
+    assert os.getcwd() == cwd
+    assert sys.path == sys_path
@@ -1,9 +1,14 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring/
 # coding: utf-8
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 from pyccel.epyccel import epyccel
-from pyccel.decorators import private
+from pyccel.decorators import private, nogil, types
 
 def test_private(language):
     @private
@@ -15,3 +20,45 @@ def test_private(language):
     with pytest.raises(NotImplementedError):
         g()
 
+
+def test_nogil(language):
+    @nogil
+    @types('real[:]', 'int')
+    def f(a, n):
+        s = 0.0
+        for k in range(n):
+            for i in range(a.shape[0]):
+                s += a[i] * (k % 3)
+        return s
+
+    g = epyccel(f, language=language)
+
+    # Concurrent calls give the same results as the sequential ones
+    arrays = [np.arange(i, i + 100, dtype=float) for i in range(8)]
+    with ThreadPoolExecutor(max_workers = 4) as executor:
+        results = list(executor.map(lambda a: g(a, 10), arrays))
+    assert results == [f(a, 10) for a in arrays]
+
+    # The interpreter keeps running python code while the compiled function
+    # runs: the longest pause of the main thread is shorter than the call
+    a = np.ones(1000)
+    start = time.perf_counter()
+    g(a, 200000)
+    duration = time.perf_counter() - start
+
+    started = threading.Event()
+    def work():
+        started.wait()
+        g(a, 200000)
+
+    worker = threading.Thread(target = work)
+    worker.start()
+    pause = 0.0
+    last  = time.perf_counter()
+    started.set()
+    while worker.is_alive():
+        now   = time.perf_counter()
+        pause = max(pause, now - last)
+        last  = now
+    worker.join()
+    assert pause < duration / 2
@@ -0,0 +1,20 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import subprocess
+import sys
+
+def imported_modules(statement):
+    code = '{}; import sys; print(" ".join(sys.modules))'.format(statement)
+    out = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+    return set(out.split())
+
+def test_lazy_imports():
+    # The pipeline, sympy and the grammars are only loaded by the first build
+    modules = imported_modules('import pyccel.epyccel')
+    assert 'pyccel.epyccel' in modules
+    for heavy in ('sympy', 'textx', 'pyccel.codegen.pipeline', 'pyccel.parser.parser'):
+        assert heavy not in modules
+
+def test_lazy_printers():
+    modules = imported_modules('import pyccel.codegen.codegen')
+    assert 'pyccel.codegen.printing.ccode' not in modules
+    assert 'pyccel.codegen.printing.pycode' not in modules
@@ -0,0 +1,56 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import pytest
+
+from pyccel.epyccel import epyccel_many, get_source_functions
+from pyccel.decorators import types
+
+@types('int')
+def square(x):
+    return x*x
+
+@types('int')
+def sum_of_squares(n):
+    s = 0
+    for i in range(n):
+        s += square(i)
+    return s
+
+@types('real', 'real')
+def hypot2(x, y):
+    return x*x + y*y
+
+def test_helpers_are_included():
+    code = get_source_functions([sum_of_squares])
+    assert code.index('def square') < code.index('def sum_of_squares')
+
+def test_epyccel_many(language):
+    funcs = epyccel_many([sum_of_squares, hypot2, square], language = language)
+
+    assert set(funcs) == {'sum_of_squares', 'hypot2', 'square'}
+    assert funcs['sum_of_squares'](10) == sum_of_squares(10)
+    assert funcs['hypot2'](3.0, 4.0) == hypot2(3.0, 4.0)
+    assert funcs['square'](7) == square(7)
+
+    # All the functions are compiled in the same module
+    assert len({f.__module__ for f in funcs.values()}) == 1
+
+def test_epyccel_many_local_functions(language):
+    @types('int')
+    def incr(x):
+        return x + 1
+
+    @types('int')
+    def incr_twice(x):
+        return incr(incr(x))
+
+    funcs = epyccel_many([incr_twice], language = language)
+    assert list(funcs) == ['incr_twice']
+    assert funcs['incr_twice'](3) == 5
+
+def test_name_clash():
+    @types('int')
+    def square(x): # pylint: disable=redefined-outer-name
+        return x
+
+    with pytest.raises(ValueError):
+        epyccel_many([sum_of_squares, square])
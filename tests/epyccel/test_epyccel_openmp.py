@@ -241,13 +241,6 @@ def test_omp_matmul_2d_2d(language):
 
     assert np.array_equal(y1, y2)
 
-@pytest.mark.parametrize( 'language', [
-        pytest.param("c", marks = [
-            pytest.mark.xfail(reason="Numpy Arrays not implemented in C !"),
-            pytest.mark.c]),
-        pytest.param("fortran", marks = pytest.mark.fortran)
-    ]
-)
 def test_omp_arraysum(language):
     f1 = epyccel(openmp.omp_arraysum, accelerator='openmp', language=language)
     set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
@@ -272,3 +265,76 @@ def test_omp_arraysum_single(language):
     x = random.randint(20, size=(10))
 
     assert f1(x) == np.sum(x)
+
+def test_omp_parallel_for(language):
+    f1 = epyccel(openmp.omp_parallel_for, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_parallel_for_simd, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.random(100)
+    y = np.empty(100)
+    f1(x, y, 7)
+    assert np.array_equal(y, 2 * x)
+
+    x = np.random.randint(20, size=100)
+    assert f2(x) == np.sum(x)
+
+def test_omp_simd(language):
+    f1 = epyccel(openmp.omp_simd, accelerator='openmp', language=language)
+    x = np.random.random(100)
+    assert np.isclose(f1(x), np.sum(x), rtol=1e-13, atol=0)
+
+def test_omp_for_schedule_runtime(language):
+    f1 = epyccel(openmp.omp_for_schedule_runtime, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.randint(20, size=100)
+    assert f1(x) == np.sum(x)
+
+def test_omp_for_nowait(language):
+    f1 = epyccel(openmp.omp_for_nowait, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.randint(20, size=100)
+    y = np.empty(100, dtype=int)
+    assert f1(x, y) == 1
+    assert np.array_equal(x, y)
+
+def test_omp_atomic_critical(language):
+    f1 = epyccel(openmp.omp_atomic, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_critical, accelerator='openmp', language=language)
+    f3 = epyccel(openmp.omp_master_barrier, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    assert f1() == 4
+    x = np.random.randint(20, size=100)
+    assert f2(x) == np.sum(x)
+    assert f3() == 4
+
+def test_omp_sections(language):
+    f1 = epyccel(openmp.omp_sections, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(2)
+    assert f1() == 3
+
+def test_omp_tasks(language):
+    f1 = epyccel(openmp.omp_tasks, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_taskloop, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    assert f1(5) == 15
+    x = np.random.randint(20, size=100)
+    y = np.empty(100, dtype=int)
+    f2(x, y, 8)
+    assert np.array_equal(y, 2 * x)
+
+def test_omp_random(language):
+    f1 = epyccel(openmp.omp_monte_carlo_pi, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    for n_threads in (1, 4):
+        set_num_threads(n_threads)
+        pi = f1(400000, 7)
+        # the numbers of each thread only depend on the seed
+        assert f1(400000, 7) == pi
+        assert abs(pi - np.pi) < 0.01
+    set_num_threads(4)
@@ -0,0 +1,119 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import pytest
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+
+language_c_only = pytest.mark.parametrize( 'language', (
+        pytest.param("fortran", marks = [
+            pytest.mark.xfail(reason="Array return arguments are currently not supported"),
+            pytest.mark.fortran]
+        ),
+        pytest.param("c", marks = pytest.mark.c)
+    )
+)
+
+#==============================================================================
+@language_c_only
+def test_return_1d_array(language):
+    @types('int')
+    def f(n):
+        from numpy import empty
+        a = empty(n)
+        for i in range(n):
+            a[i] = 2.0*i
+        return a
+
+    f2 = epyccel(f, language = language)
+
+    x = f2(5)
+    assert x.dtype == np.float64
+    assert np.array_equal(x, f(5))
+    # the data allocated by pyccel is owned by the base object
+    assert not x.flags['OWNDATA']
+    assert x.base is not None
+
+@language_c_only
+def test_return_2d_array(language):
+    @types('int', 'int')
+    def f(n, m):
+        from numpy import ones
+        a = ones((n, m), dtype='int32')
+        a[n-1, 0] = 5
+        return a
+
+    f2 = epyccel(f, language = language)
+
+    x = f2(3, 4)
+    assert x.dtype == np.int32
+    assert x.flags['C_CONTIGUOUS']
+    assert np.array_equal(x, f(3, 4))
+
+@language_c_only
+def test_return_multiple_arrays(language):
+    @types('int')
+    def f(n):
+        from numpy import zeros, empty
+        a = zeros(n)
+        b = empty((n, 2), dtype='int64')
+        for i in range(n):
+            a[i] = 0.5*i
+            b[i, 0] = i
+            b[i, 1] = -i
+        return a, b
+
+    f2 = epyccel(f, language = language)
+
+    x, y = f2(4)
+    x_py, y_py = f(4)
+    assert np.array_equal(x, x_py)
+    assert np.array_equal(y, y_py)
+
+@language_c_only
+def test_returned_array_outlives_call(language):
+    @types('int')
+    def f(n):
+        from numpy import full
+        a = full(n, 3.0)
+        return a
+
+    f2 = epyccel(f, language = language)
+
+    arrays = [f2(1000) for _ in range(10)]
+    view = arrays[-1][::2]
+    del arrays
+    assert view.shape == (500,)
+    assert np.all(view == 3.0)
+
+#==============================================================================
+def test_array_argument_is_shared(language):
+    @types('float[:,:]')
+    def f(a):
+        for i in range(a.shape[0]):
+            for j in range(a.shape[1]):
+                a[i, j] = 10*i + j
+
+    f2 = epyccel(f, language = language)
+
+    x1 = np.zeros((3, 4))
+    x2 = np.zeros((3, 4))
+    f(x1)
+    f2(x2)
+    assert np.array_equal(x1, x2)
+
+def test_array_argument_view(language):
+    @types('float[:]')
+    def f(a):
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i]
+            a[i] = -1.0
+        return s
+
+    f2 = epyccel(f, language = language)
+
+    x = np.arange(10.0)
+    assert f2(x[2:7]) == f(np.arange(10.0)[2:7])
+    assert np.array_equal(x[2:7], -np.ones(5))
+    assert np.array_equal(x[:2], [0.0, 1.0])
@@ -174,6 +174,21 @@ def test_continue(language):
 
     assert( out1 == out2 )
 
+def test_stencil_on_local_2d_array(language):
+    f1 = loops.stencil_on_local_2d_array
+    f2 = epyccel( f1, language = language )
+    assert np.isclose( f1( 9, 7 ), f2( 9, 7 ) )
+
+def test_loop_on_local_2d_array_view(language):
+    f1 = loops.loop_on_local_2d_array_view
+    f2 = epyccel( f1, language = language )
+    assert np.isclose( f1( 6, 5 ), f2( 6, 5 ) )
+
+def test_loop_on_local_3d_array(language):
+    f1 = loops.loop_on_local_3d_array
+    f2 = epyccel( f1, language = language )
+    assert f1( 5 ) == f2( 5 )
+
 ##==============================================================================
 ## CLEAN UP GENERATED FILES AFTER RUNNING TESTS
 ##==============================================================================
@@ -0,0 +1,8 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types
+
+@types('int')
+def f(n):
+    from numpy import zeros
+    a = zeros(n)
+    return a
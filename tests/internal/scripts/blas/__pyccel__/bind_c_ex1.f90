@@ -0,0 +1,11 @@
+!........................................
+subroutine test_daxpy() bind(c) 
+
+  use ex1, only: mod_test_daxpy => test_daxpy
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_test_daxpy()
+
+end subroutine test_daxpy
+!........................................
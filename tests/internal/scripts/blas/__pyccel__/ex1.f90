@@ -0,0 +1,40 @@
+module ex1
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine test_daxpy() 
+
+  implicit none
+
+  integer(C_INT64_T) :: n
+  real(C_DOUBLE) :: sa
+  integer(C_INT64_T) :: incx
+  real(C_DOUBLE), allocatable :: sx(:)
+  integer(C_INT64_T) :: incy
+  real(C_DOUBLE), allocatable :: sy(:)
+
+  n = 5_C_INT64_T
+  sa = 1.0_C_DOUBLE
+  incx = 1_C_INT64_T
+  allocate(sx(0:n - 1_C_INT64_T))
+  sx = 0.0_C_DOUBLE
+  incy = 1_C_INT64_T
+  allocate(sy(0:n - 1_C_INT64_T))
+  sy = 0.0_C_DOUBLE
+  sx(0_C_INT64_T) = 1.0_C_DOUBLE
+  sx(1_C_INT64_T) = 3.0_C_DOUBLE
+  sx(3_C_INT64_T) = 5.0_C_DOUBLE
+  sy(0_C_INT64_T) = 2.0_C_DOUBLE
+  sy(1_C_INT64_T) = 4.0_C_DOUBLE
+  sy(3_C_INT64_T) = 6.0_C_DOUBLE
+  call daxpy(n, sa, sx, incx, sy, incy)
+
+end subroutine test_daxpy
+!........................................
+
+end module ex1
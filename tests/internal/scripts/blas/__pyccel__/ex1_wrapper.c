@@ -0,0 +1,69 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+void test_daxpy(void);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *test_daxpy_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    test_daxpy();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef ex1_methods[] = {
+    {
+        "test_daxpy",
+        (PyCFunction)(void (*)(void))test_daxpy_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef ex1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "ex1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    ex1_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_ex1(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&ex1_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
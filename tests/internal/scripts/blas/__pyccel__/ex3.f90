@@ -0,0 +1,44 @@
+program prog_ex3
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: n
+integer(C_INT64_T) :: m
+real(C_DOUBLE), allocatable :: a(:,:)
+real(C_DOUBLE), allocatable :: x(:)
+real(C_DOUBLE), allocatable :: y(:)
+real(C_DOUBLE) :: alpha
+integer(C_INT64_T) :: incx
+integer(C_INT64_T) :: incy
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+n = 4_C_INT64_T
+m = 5_C_INT64_T
+allocate(a(0:m - 1_C_INT64_T, 0:n - 1_C_INT64_T))
+a = 0.0_C_DOUBLE
+allocate(x(0:m - 1_C_INT64_T))
+x = 0.0_C_DOUBLE
+allocate(y(0:n - 1_C_INT64_T))
+y = 0.0_C_DOUBLE
+!...
+x(0_C_INT64_T) = 2.0_C_DOUBLE
+x(1_C_INT64_T) = 3.0_C_DOUBLE
+x(2_C_INT64_T) = 4.0_C_DOUBLE
+x(3_C_INT64_T) = 5.0_C_DOUBLE
+x(4_C_INT64_T) = 6.0_C_DOUBLE
+!...
+!...
+y(0_C_INT64_T) = 1.0_C_DOUBLE
+y(1_C_INT64_T) = -1.0_C_DOUBLE
+y(2_C_INT64_T) = 1.0_C_DOUBLE
+y(3_C_INT64_T) = -1.0_C_DOUBLE
+!...
+alpha = 2.0_C_DOUBLE
+incx = 1_C_INT64_T
+incy = 1_C_INT64_T
+call dger(n, m, alpha, y, incy, x, incx, a, n)
+print *, a
+
+end program prog_ex3
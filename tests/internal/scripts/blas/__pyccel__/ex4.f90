@@ -0,0 +1,60 @@
+program prog_ex4
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: m
+integer(C_INT64_T) :: k
+integer(C_INT64_T) :: n
+real(C_DOUBLE), allocatable :: a(:,:)
+real(C_DOUBLE), allocatable :: b(:,:)
+real(C_DOUBLE), allocatable :: c(:,:)
+real(C_DOUBLE) :: alpha
+real(C_DOUBLE) :: beta
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+m = 4_C_INT64_T
+k = 5_C_INT64_T
+n = 4_C_INT64_T
+allocate(a(0:k - 1_C_INT64_T, 0:m - 1_C_INT64_T))
+a = 0.0_C_DOUBLE
+allocate(b(0:n - 1_C_INT64_T, 0:k - 1_C_INT64_T))
+b = 0.0_C_DOUBLE
+allocate(c(0:n - 1_C_INT64_T, 0:m - 1_C_INT64_T))
+c = 0.0_C_DOUBLE
+!...
+a(0_C_INT64_T, 0_C_INT64_T) = 1.0_C_DOUBLE
+a(0_C_INT64_T, 1_C_INT64_T) = 6.0_C_DOUBLE
+a(0_C_INT64_T, 2_C_INT64_T) = 11.0_C_DOUBLE
+a(0_C_INT64_T, 3_C_INT64_T) = 16.0_C_DOUBLE
+a(1_C_INT64_T, 0_C_INT64_T) = 2.0_C_DOUBLE
+a(1_C_INT64_T, 1_C_INT64_T) = 7.0_C_DOUBLE
+a(1_C_INT64_T, 2_C_INT64_T) = 12.0_C_DOUBLE
+a(1_C_INT64_T, 3_C_INT64_T) = 17.0_C_DOUBLE
+a(2_C_INT64_T, 0_C_INT64_T) = 3.0_C_DOUBLE
+a(2_C_INT64_T, 1_C_INT64_T) = 8.0_C_DOUBLE
+a(2_C_INT64_T, 2_C_INT64_T) = 13.0_C_DOUBLE
+a(2_C_INT64_T, 3_C_INT64_T) = 18.0_C_DOUBLE
+a(3_C_INT64_T, 0_C_INT64_T) = 4.0_C_DOUBLE
+a(3_C_INT64_T, 1_C_INT64_T) = 9.0_C_DOUBLE
+a(3_C_INT64_T, 2_C_INT64_T) = 14.0_C_DOUBLE
+a(3_C_INT64_T, 3_C_INT64_T) = 19.0_C_DOUBLE
+a(4_C_INT64_T, 0_C_INT64_T) = 5.0_C_DOUBLE
+a(4_C_INT64_T, 1_C_INT64_T) = 10.0_C_DOUBLE
+a(4_C_INT64_T, 2_C_INT64_T) = 15.0_C_DOUBLE
+a(4_C_INT64_T, 3_C_INT64_T) = 20.0_C_DOUBLE
+!...
+!...
+b(0_C_INT64_T, 0_C_INT64_T) = 1.0_C_DOUBLE
+b(2_C_INT64_T, 1_C_INT64_T) = 1.0_C_DOUBLE
+b(1_C_INT64_T, 2_C_INT64_T) = 1.0_C_DOUBLE
+b(3_C_INT64_T, 3_C_INT64_T) = 1.0_C_DOUBLE
+b(4_C_INT64_T, 3_C_INT64_T) = 1.0_C_DOUBLE
+!...
+alpha = 2.0_C_DOUBLE
+beta = 1.0_C_DOUBLE
+call dgemm('N', 'N', m, n, k, alpha, a, m, b, k, beta, c, m)
+print *, c
+
+end program prog_ex4
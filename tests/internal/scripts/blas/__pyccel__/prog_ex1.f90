@@ -0,0 +1,10 @@
+program prog_prog_ex1
+
+use ex1, only: test_daxpy
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+call test_daxpy()
+
+end program prog_prog_ex1
@@ -0,0 +1,47 @@
+!........................................
+subroutine test_1() bind(c) 
+
+  use ex1, only: mod_test_1 => test_1
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_test_1()
+
+end subroutine test_1
+!........................................
+
+!........................................
+subroutine test_2() bind(c) 
+
+  use ex1, only: mod_test_2 => test_2
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_test_2()
+
+end subroutine test_2
+!........................................
+
+!........................................
+subroutine test_3() bind(c) 
+
+  use ex1, only: mod_test_3 => test_3
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_test_3()
+
+end subroutine test_3
+!........................................
+
+!........................................
+subroutine test_4() bind(c) 
+
+  use ex1, only: mod_test_4 => test_4
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_test_4()
+
+end subroutine test_4
+!........................................
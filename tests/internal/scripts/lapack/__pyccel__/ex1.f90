@@ -0,0 +1,179 @@
+module ex1
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine test_1() 
+
+  implicit none
+
+  integer(C_INT64_T) :: n
+  integer(C_INT64_T) :: ml
+  integer(C_INT64_T) :: mu
+  integer(C_INT64_T) :: lda
+  real(C_DOUBLE), allocatable :: a(:,:)
+  real(C_DOUBLE), allocatable :: b(:)
+  integer(C_INT64_T) :: m
+  integer(C_INT64_T) :: info
+  integer(C_INT64_T), allocatable :: ipiv(:)
+
+  n = 25_C_INT64_T
+  ml = 1_C_INT64_T
+  mu = 1_C_INT64_T
+  lda = 2_C_INT64_T * ml + mu + 1_C_INT64_T
+  allocate(a(0:n - 1_C_INT64_T, 0:lda - 1_C_INT64_T))
+  a = 0.0_C_DOUBLE
+  allocate(b(0:n - 1_C_INT64_T))
+  b = 0.0_C_DOUBLE
+  b(0_C_INT64_T) = 1.0_C_DOUBLE
+  b(n - 1_C_INT64_T) = 1.0_C_DOUBLE
+  !Superdiagonal, Diagonal, Subdiagonal
+  m = ml + mu
+  a(1_C_INT64_T:n - 1_C_INT64_T, m - 1_C_INT64_T) = -1.0_C_DOUBLE
+  a(0_C_INT64_T:n - 1_C_INT64_T, m) = 2.0_C_DOUBLE
+  a(0_C_INT64_T:n - 1_C_INT64_T - 1_C_INT64_T, m + 1_C_INT64_T) = &
+      -1.0_C_DOUBLE
+  info = -1_C_INT64_T
+  allocate(ipiv(0:n - 1_C_INT64_T))
+  ipiv = 0_C_INT64_T
+  call dgbtrf(n, n, ml, mu, a, lda, ipiv, info)
+  !assert(info == 0)
+  call dgbtrs('n', n, ml, mu, 1_C_INT64_T, a, lda, ipiv, b, n, info)
+
+end subroutine test_1
+!........................................
+
+!........................................
+subroutine test_2() 
+
+  implicit none
+
+  integer(C_INT64_T) :: n
+  integer(C_INT64_T) :: lda
+  real(C_DOUBLE), allocatable :: a(:,:)
+  integer(C_INT64_T) :: info
+  integer(C_INT64_T), allocatable :: ipiv(:)
+  integer(C_INT64_T), allocatable :: iwork(:)
+  integer(C_INT64_T) :: lwork
+  real(C_DOUBLE), allocatable :: work(:)
+  real(C_DOUBLE) :: anorm
+  real(C_DOUBLE) :: rcond
+
+  n = 3_C_INT64_T
+  lda = n
+  allocate(a(0:n - 1_C_INT64_T, 0:lda - 1_C_INT64_T))
+  a = 0.0_C_DOUBLE
+  a(0_C_INT64_T, 0_C_INT64_T) = 0.0_C_DOUBLE
+  a(1_C_INT64_T, 0_C_INT64_T) = 1.0_C_DOUBLE
+  a(2_C_INT64_T, 0_C_INT64_T) = 2.0_C_DOUBLE
+  a(0_C_INT64_T, 1_C_INT64_T) = 4.0_C_DOUBLE
+  a(1_C_INT64_T, 1_C_INT64_T) = 5.0_C_DOUBLE
+  a(2_C_INT64_T, 1_C_INT64_T) = 6.0_C_DOUBLE
+  a(0_C_INT64_T, 2_C_INT64_T) = 7.0_C_DOUBLE
+  a(1_C_INT64_T, 2_C_INT64_T) = 8.0_C_DOUBLE
+  a(2_C_INT64_T, 2_C_INT64_T) = 0.0_C_DOUBLE
+  info = -1_C_INT64_T
+  allocate(ipiv(0:n - 1_C_INT64_T))
+  ipiv = 0_C_INT64_T
+  call dgetrf(n, n, a, lda, ipiv, info)
+  !assert(info == 0)
+  allocate(iwork(0:n - 1_C_INT64_T))
+  iwork = 0_C_INT64_T
+  lwork = 4_C_INT64_T * n
+  allocate(work(0:lwork - 1_C_INT64_T))
+  work = 0.0_C_DOUBLE
+  !Get the condition number.
+  anorm = 1.0_C_DOUBLE
+  rcond = -1.0_C_DOUBLE
+  call dgecon('I', n, a, lda, anorm, rcond, work, iwork, info)
+
+end subroutine test_2
+!........................................
+
+!........................................
+subroutine test_3() 
+
+  implicit none
+
+  integer(C_INT64_T) :: n
+  integer(C_INT64_T) :: lda
+  real(C_DOUBLE), allocatable :: a(:,:)
+  integer(C_INT64_T) :: info
+  integer(C_INT64_T), allocatable :: ipiv(:)
+  integer(C_INT64_T) :: lwork
+  real(C_DOUBLE), allocatable :: work(:)
+
+  n = 3_C_INT64_T
+  lda = n
+  allocate(a(0:n - 1_C_INT64_T, 0:lda - 1_C_INT64_T))
+  a = 0.0_C_DOUBLE
+  a(0_C_INT64_T, 0_C_INT64_T) = 0.0_C_DOUBLE
+  a(1_C_INT64_T, 0_C_INT64_T) = 1.0_C_DOUBLE
+  a(2_C_INT64_T, 0_C_INT64_T) = 2.0_C_DOUBLE
+  a(0_C_INT64_T, 1_C_INT64_T) = 4.0_C_DOUBLE
+  a(1_C_INT64_T, 1_C_INT64_T) = 5.0_C_DOUBLE
+  a(2_C_INT64_T, 1_C_INT64_T) = 6.0_C_DOUBLE
+  a(0_C_INT64_T, 2_C_INT64_T) = 7.0_C_DOUBLE
+  a(1_C_INT64_T, 2_C_INT64_T) = 8.0_C_DOUBLE
+  a(2_C_INT64_T, 2_C_INT64_T) = 0.0_C_DOUBLE
+  info = -1_C_INT64_T
+  allocate(ipiv(0:n - 1_C_INT64_T))
+  ipiv = 0_C_INT64_T
+  call dgetrf(n, n, a, lda, ipiv, info)
+  !assert(info == 0)
+  lwork = 4_C_INT64_T * n
+  allocate(work(0:lwork - 1_C_INT64_T))
+  work = 0.0_C_DOUBLE
+  !Compute the inverse matrix.
+  call dgetri(n, a, lda, ipiv, work, lwork, info)
+
+end subroutine test_3
+!........................................
+
+!........................................
+subroutine test_4() 
+
+  implicit none
+
+  integer(C_INT64_T) :: n
+  integer(C_INT64_T) :: lda
+  real(C_DOUBLE), allocatable :: a(:,:)
+  integer(C_INT64_T) :: info
+  integer(C_INT64_T), allocatable :: ipiv(:)
+  real(C_DOUBLE), allocatable :: b(:)
+
+  n = 3_C_INT64_T
+  lda = n
+  allocate(a(0:n - 1_C_INT64_T, 0:lda - 1_C_INT64_T))
+  a = 0.0_C_DOUBLE
+  a(0_C_INT64_T, 0_C_INT64_T) = 0.0_C_DOUBLE
+  a(1_C_INT64_T, 0_C_INT64_T) = 1.0_C_DOUBLE
+  a(2_C_INT64_T, 0_C_INT64_T) = 2.0_C_DOUBLE
+  a(0_C_INT64_T, 1_C_INT64_T) = 4.0_C_DOUBLE
+  a(1_C_INT64_T, 1_C_INT64_T) = 5.0_C_DOUBLE
+  a(2_C_INT64_T, 1_C_INT64_T) = 6.0_C_DOUBLE
+  a(0_C_INT64_T, 2_C_INT64_T) = 7.0_C_DOUBLE
+  a(1_C_INT64_T, 2_C_INT64_T) = 8.0_C_DOUBLE
+  a(2_C_INT64_T, 2_C_INT64_T) = 0.0_C_DOUBLE
+  info = -1_C_INT64_T
+  allocate(ipiv(0:n - 1_C_INT64_T))
+  ipiv = 0_C_INT64_T
+  call dgetrf(n, n, a, lda, ipiv, info)
+  !assert(info == 0)
+  !Compute the inverse matrix.
+  allocate(b(0:n - 1_C_INT64_T))
+  b = 0.0_C_DOUBLE
+  b(0_C_INT64_T) = 14.0_C_DOUBLE
+  b(1_C_INT64_T) = 32.0_C_DOUBLE
+  b(2_C_INT64_T) = 23.0_C_DOUBLE
+  !Solve the linear system.
+  call dgetrs('n', n, 1_C_INT64_T, a, lda, ipiv, b, n, info)
+
+end subroutine test_4
+!........................................
+
+end module ex1
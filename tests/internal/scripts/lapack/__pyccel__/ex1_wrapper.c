@@ -0,0 +1,144 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+void test_1(void);
+void test_2(void);
+void test_3(void);
+void test_4(void);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *test_1_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    test_1();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *test_2_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    test_2();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *test_3_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    test_3();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *test_4_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    test_4();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef ex1_methods[] = {
+    {
+        "test_1",
+        (PyCFunction)(void (*)(void))test_1_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "test_2",
+        (PyCFunction)(void (*)(void))test_2_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "test_3",
+        (PyCFunction)(void (*)(void))test_3_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "test_4",
+        (PyCFunction)(void (*)(void))test_4_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef ex1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "ex1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    ex1_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_ex1(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&ex1_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,17 @@
+program prog_prog_ex1
+
+use ex1, only: test_1
+use ex1, only: test_2
+use ex1, only: test_3
+use ex1, only: test_4
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+!assert(info == 0)
+call test_1()
+call test_2()
+call test_3()
+call test_4()
+
+end program prog_prog_ex1
@@ -0,0 +1,50 @@
+program prog_allgather
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT64_T) :: nb_values
+integer(C_INT32_T) :: block_length
+integer(C_INT64_T), allocatable :: values(:)
+integer(C_INT64_T), allocatable :: data(:)
+integer(C_INT64_T) :: i
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+nb_values = 8_C_INT64_T
+block_length = Int(FLOOR(nb_values/Real(size, C_DOUBLE),C_INT64_T), &
+      C_INT32_T)
+!...
+allocate(values(0:block_length - 1_C_INT64_T))
+values = 0_C_INT64_T
+do i = 0_C_INT64_T, block_length-1_C_INT64_T, 1_C_INT64_T
+  values(i) = 1000_C_INT64_T + rank * nb_values + i
+end do
+print *, 'I, process ' // ' ' , rank, 'sent my values array : ' // ' ' , &
+      values
+!...
+!...
+allocate(data(0:nb_values - 1_C_INT64_T))
+data = 0_C_INT64_T
+call mpi_allgather(values, block_length, MPI_INTEGER8, data, &
+      block_length, MPI_INTEGER8, comm, ierr)
+!...
+print *, 'I, process ' // ' ' , rank, ', received ' // ' ' , data
+call mpi_finalize(ierr)
+
+end program prog_allgather
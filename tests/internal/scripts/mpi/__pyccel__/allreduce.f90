@@ -0,0 +1,39 @@
+program prog_allreduce
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT64_T) :: value
+integer(C_INT64_T) :: product_value
+integer(C_INT32_T) :: length
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+if (rank == 0_C_INT64_T) then
+  value = 1000_C_INT64_T
+else if (.True._C_BOOL) then
+  value = Int(rank, C_INT64_T)
+end if
+product_value = 0_C_INT64_T
+length = 1_C_INT32_T
+call mpi_allreduce(value, product_value, length, MPI_INTEGER8, MPI_PROD, &
+      comm, ierr)
+print *, 'I, process ' // ' ' , rank, ', have the global product value ' // ' ' , product_value
+call mpi_finalize(ierr)
+
+end program prog_allreduce
@@ -0,0 +1,38 @@
+program prog_bcast
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: master
+integer(C_INT64_T) :: msg
+integer(C_INT32_T) :: length
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+master = 1_C_INT32_T
+if (rank == master) then
+  msg = rank + 1000_C_INT64_T
+else if (.True._C_BOOL) then
+  msg = 0_C_INT64_T
+end if
+length = 1_C_INT32_T
+call mpi_bcast(msg, length, MPI_INTEGER8, master, comm, ierr)
+print *, 'I, process ' // ' ' , rank, ', received ' // ' ' , msg, ' from process ' // ' ' , master
+call mpi_finalize(ierr)
+
+end program prog_bcast
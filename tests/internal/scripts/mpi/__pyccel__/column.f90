@@ -0,0 +1,65 @@
+program prog_column
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: nb_lines
+integer(C_INT32_T) :: nb_columns
+integer(C_INT32_T) :: tag
+integer(C_INT64_T), allocatable :: a(:,:)
+integer(C_INT32_T), allocatable :: status(:)
+integer(C_INT32_T) :: type_column
+integer(C_INT32_T) :: count
+integer(C_INT32_T) :: dest
+integer(C_INT32_T) :: source
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+nb_lines = 3_C_INT32_T
+nb_columns = 4_C_INT32_T
+tag = 100_C_INT32_T
+allocate(a(0:nb_columns - 1_C_INT64_T, 0:nb_lines - 1_C_INT64_T))
+a = 0_C_INT64_T
+allocate(status(0:mpi_status_size - 1_C_INT64_T))
+status = 0_C_INT32_T
+!Initialization of the matrix on each process
+a(:, :) = 1000_C_INT64_T + rank
+!Definition of the type_column datatype
+type_column = Int(-1_C_INT64_T, C_INT32_T)
+  call mpi_type_contiguous(nb_lines, MPI_INTEGER8, type_column, ierr)
+  !Validation of the type_column datatype
+  call mpi_type_commit(type_column, ierr)
+  !Sending of the first column
+  if (rank == 0_C_INT64_T) then
+    count = 1_C_INT32_T
+    dest = 1_C_INT32_T
+    call mpi_send(a(0_C_INT64_T, 0_C_INT64_T), count, type_column, dest, &
+      tag, comm, ierr)
+  end if
+  !Reception in the last column
+  if (rank == 1_C_INT64_T) then
+    source = 0_C_INT32_T
+    call mpi_recv(a(nb_columns - 1_C_INT64_T, 0_C_INT64_T), nb_lines, &
+      MPI_INTEGER8, source, tag, comm, status, ierr)
+  end if
+  print *, 'I process ' // ' ' , rank, ', has a = ' // ' ' , a
+  !Free the datatype
+  call mpi_type_free(type_column, ierr)
+  call mpi_finalize(ierr)
+
+  end program prog_column
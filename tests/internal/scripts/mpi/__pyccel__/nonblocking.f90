@@ -0,0 +1,74 @@
+program prog_nonblocking
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: n
+real(C_DOUBLE), allocatable :: x(:)
+real(C_DOUBLE), allocatable :: y(:)
+integer(C_INT32_T) :: tag0
+integer(C_INT32_T) :: tag1
+integer(C_INT32_T), allocatable :: reqs(:)
+integer(C_INT32_T) :: before
+integer(C_INT32_T) :: after
+integer(C_INT32_T), allocatable :: statuses(:,:)
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+n = 4_C_INT32_T
+allocate(x(0:n - 1_C_INT64_T))
+x = 0.0_C_DOUBLE
+allocate(y(0:n - 1_C_INT64_T))
+y = 0.0_C_DOUBLE
+if (rank == 0_C_INT64_T) then
+  x(:) = 1.0_C_DOUBLE
+  y(:) = 2.0_C_DOUBLE
+end if
+!...
+tag0 = 1234_C_INT32_T
+tag1 = 5678_C_INT32_T
+allocate(reqs(0:4_C_INT64_T - 1_C_INT64_T))
+reqs = 0_C_INT32_T
+!...
+!...
+before = Int(rank - 1_C_INT64_T, C_INT32_T)
+after = Int(rank + 1_C_INT64_T, C_INT32_T)
+if (rank == 0_C_INT64_T) then
+  before = Int(size - 1_C_INT64_T, C_INT32_T)
+end if
+if (rank == size - 1_C_INT64_T) then
+  after = 0_C_INT32_T
+end if
+!...
+call mpi_irecv(x, n, MPI_REAL8, before, tag0, comm, reqs(0_C_INT64_T), &
+      ierr)
+call mpi_irecv(y, n, MPI_REAL8, after, tag1, comm, reqs(1_C_INT64_T), &
+      ierr)
+call mpi_isend(x, n, MPI_REAL8, before, tag1, comm, reqs(2_C_INT64_T), &
+      ierr)
+call mpi_isend(y, n, MPI_REAL8, after, tag0, comm, reqs(3_C_INT64_T), &
+      ierr)
+!...
+!...
+allocate(statuses(0:n - 1_C_INT64_T, 0:mpi_status_size - 1_C_INT64_T))
+statuses = 0_C_INT32_T
+call mpi_waitall(n, reqs, statuses, ierr)
+!...
+call mpi_finalize(ierr)
+
+end program prog_nonblocking
@@ -0,0 +1,50 @@
+program prog_point_to_point_1
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT64_T) :: nx
+real(C_DOUBLE), allocatable :: x(:)
+integer(C_INT32_T) :: source
+integer(C_INT32_T) :: dest
+integer(C_INT32_T) :: tag1
+integer(C_INT32_T) :: count
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+nx = 4_C_INT64_T
+allocate(x(0:nx - 1_C_INT64_T))
+x = 0.0_C_DOUBLE
+if (rank == 0_C_INT64_T) then
+  x(:) = 1.0_C_DOUBLE
+end if
+source = 0_C_INT32_T
+dest = 1_C_INT32_T
+!...
+tag1 = 1234_C_INT32_T
+if (rank == source) then
+  x(1_C_INT64_T) = 2.0_C_DOUBLE
+  count = 1_C_INT32_T
+  call mpi_send(x(1_C_INT64_T), count, MPI_REAL8, dest, tag1, comm, ierr &
+      )
+  print *, '> processor ' // ' ' , rank, ' sent x(1) = ' // ' ' , x
+end if
+!...
+call mpi_finalize(ierr)
+
+end program prog_point_to_point_1
@@ -0,0 +1,127 @@
+program prog_point_to_point_2
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: nx
+integer(C_INT32_T) :: ny
+real(C_DOUBLE), allocatable :: x(:)
+real(C_DOUBLE), allocatable :: y(:,:)
+integer(C_INT32_T) :: source
+integer(C_INT32_T) :: dest
+integer(C_INT32_T), allocatable :: status(:)
+integer(C_INT32_T) :: tag1
+integer(C_INT32_T) :: tag2
+integer(C_INT32_T) :: count
+integer(C_INT32_T) :: tag3
+integer(C_INT32_T) :: tag4
+integer(C_INT32_T) :: tag5
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+nx = 4_C_INT32_T
+ny = Int(3_C_INT64_T * 2_C_INT64_T, C_INT32_T)
+allocate(x(0:nx - 1_C_INT64_T))
+x = 0.0_C_DOUBLE
+allocate(y(0:2_C_INT64_T - 1_C_INT64_T, 0:3_C_INT64_T - 1_C_INT64_T))
+y = 0.0_C_DOUBLE
+if (rank == 0_C_INT64_T) then
+  x(:) = 1.0_C_DOUBLE
+  y(:, :) = 1.0_C_DOUBLE
+end if
+source = 0_C_INT32_T
+dest = 1_C_INT32_T
+allocate(status(0:mpi_status_size - 1_C_INT64_T))
+status = 0_C_INT32_T
+!...
+tag1 = 1234_C_INT32_T
+if (rank == source) then
+  call mpi_send(x, nx, MPI_REAL8, dest, tag1, comm, ierr)
+  print *, '> test 1: processor ' // ' ' , rank, ' sent ' // ' ' , x
+end if
+if (rank == dest) then
+  call mpi_recv(x, nx, MPI_REAL8, source, tag1, comm, status, ierr)
+  print *, '> test 1: processor ' // ' ' , rank, ' got  ' // ' ' , x
+end if
+!...
+!...
+tag2 = 5678_C_INT32_T
+count = 1_C_INT32_T
+if (rank == source) then
+  x(:) = 0.0_C_DOUBLE
+  x(1_C_INT64_T) = 2.0_C_DOUBLE
+  call mpi_send(x(1_C_INT64_T), count, MPI_REAL8, dest, tag2, comm, ierr &
+      )
+  print *, '> test 2: processor ' // ' ' , rank, ' sent ' // ' ' , x( &
+      1_C_INT64_T)
+end if
+if (rank == dest) then
+  call mpi_recv(x(1_C_INT64_T), count, MPI_REAL8, source, tag2, comm, &
+      status, ierr)
+  print *, '> test 2: processor ' // ' ' , rank, ' got  ' // ' ' , x( &
+      1_C_INT64_T)
+end if
+!...
+!...
+tag3 = 4321_C_INT32_T
+if (rank == source) then
+  call mpi_send(y, ny, MPI_REAL8, dest, tag3, comm, ierr)
+  print *, '> test 3: processor ' // ' ' , rank, ' sent ' // ' ' , y
+end if
+if (rank == dest) then
+  call mpi_recv(y, ny, MPI_REAL8, source, tag3, comm, status, ierr)
+  print *, '> test 3: processor ' // ' ' , rank, ' got  ' // ' ' , y
+end if
+!...
+!...
+tag4 = 8765_C_INT32_T
+count = 1_C_INT32_T
+if (rank == source) then
+  y(:, :) = 0.0_C_DOUBLE
+  y(1_C_INT64_T, 1_C_INT64_T) = 2.0_C_DOUBLE
+  call mpi_send(y(1_C_INT64_T, 1_C_INT64_T), count, MPI_REAL8, dest, &
+      tag4, comm, ierr)
+  print *, '> test 4: processor ' // ' ' , rank, ' sent ' // ' ' , y( &
+      1_C_INT64_T, 1_C_INT64_T)
+end if
+if (rank == dest) then
+  call mpi_recv(y(1_C_INT64_T, 1_C_INT64_T), count, MPI_REAL8, source, &
+      tag4, comm, status, ierr)
+  print *, '> test 4: processor ' // ' ' , rank, ' got  ' // ' ' , y( &
+      1_C_INT64_T, 1_C_INT64_T)
+end if
+!...
+!...
+tag5 = 6587_C_INT32_T
+count = 2_C_INT32_T
+if (rank == source) then
+  call mpi_send(y(:, 1_C_INT64_T), count, MPI_REAL8, dest, tag5, comm, &
+      ierr)
+  print *, '> test 5: processor ' // ' ' , rank, ' sent ' // ' ' , y(:, &
+      1_C_INT64_T)
+end if
+if (rank == dest) then
+  call mpi_recv(y(:, 1_C_INT64_T), count, MPI_REAL8, source, tag5, comm, &
+      status, ierr)
+  print *, '> test 5: processor ' // ' ' , rank, ' got  ' // ' ' , y(:, &
+      1_C_INT64_T)
+end if
+!...
+call mpi_finalize(ierr)
+
+end program prog_point_to_point_2
@@ -0,0 +1,43 @@
+program prog_reduce
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: root
+integer(C_INT64_T) :: value
+integer(C_INT64_T) :: sum_value
+integer(C_INT32_T) :: count
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+root = 0_C_INT32_T
+if (rank == 0_C_INT64_T) then
+  value = 1000_C_INT64_T
+else if (.True._C_BOOL) then
+  value = rank
+end if
+sum_value = 0_C_INT64_T
+count = 1_C_INT32_T
+call mpi_reduce(value, sum_value, count, MPI_INTEGER8, MPI_SUM, root, &
+      comm, ierr)
+if (rank == 0_C_INT64_T) then
+  print *, 'I, process ' // ' ' , root, ', have the global sum value ' // ' ' , sum_value
+end if
+call mpi_finalize(ierr)
+
+end program prog_reduce
@@ -0,0 +1,49 @@
+program prog_sendrecv
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: partner
+integer(C_INT64_T) :: msg
+integer(C_INT64_T) :: val
+integer(C_INT32_T) :: sendcount
+integer(C_INT32_T) :: recvcount
+integer(C_INT32_T) :: tag
+integer(C_INT32_T), allocatable :: status(:)
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank, ierr)
+if (rank == 0_C_INT64_T) then
+  partner = 1_C_INT32_T
+end if
+if (rank == 1_C_INT64_T) then
+  partner = 0_C_INT32_T
+end if
+msg = rank + 1000_C_INT64_T
+val = -1_C_INT64_T
+sendcount = 1_C_INT32_T
+recvcount = 1_C_INT32_T
+tag = 1234_C_INT32_T
+allocate(status(0:mpi_status_size - 1_C_INT64_T))
+status = 0_C_INT32_T
+call mpi_sendrecv(msg, sendcount, MPI_INTEGER8, partner, tag, val, &
+      recvcount, MPI_INTEGER8, partner, tag, comm, status, ierr)
+print *, 'I, process ' // ' ' , rank, ', I received' // ' ' , val, ' from process ' // ' ' , partner
+call mpi_finalize(ierr)
+
+end program prog_sendrecv
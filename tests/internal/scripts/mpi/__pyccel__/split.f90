@@ -0,0 +1,62 @@
+program prog_split
+
+use mpi
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT32_T) :: ierr
+integer(C_INT32_T) :: size
+integer(C_INT32_T) :: rank_in_world
+integer(C_INT32_T) :: comm
+integer(C_INT32_T) :: master
+integer(C_INT32_T) :: m
+integer(C_INT64_T), allocatable :: a(:)
+integer(C_INT32_T) :: key
+integer(C_INT64_T) :: two
+integer(C_INT64_T) :: c
+integer(C_INT32_T) :: color
+integer(C_INT32_T) :: newcomm
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!we need to declare these variables somehow,
+!since we are calling mpi subroutines
+ierr = Int(-1_C_INT64_T, C_INT32_T)
+size = Int(-1_C_INT64_T, C_INT32_T)
+rank_in_world = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_init(ierr)
+comm = mpi_comm_world
+call mpi_comm_size(comm, size, ierr)
+call mpi_comm_rank(comm, rank_in_world, ierr)
+master = 0_C_INT32_T
+m = 8_C_INT32_T
+allocate(a(0:m - 1_C_INT64_T))
+a = 0_C_INT64_T
+if (rank_in_world == 1_C_INT64_T) then
+  a(:) = 1_C_INT64_T
+end if
+if (rank_in_world == 2_C_INT64_T) then
+  a(:) = 2_C_INT64_T
+end if
+key = rank_in_world
+if (rank_in_world == 1_C_INT64_T) then
+  key = Int(-1_C_INT64_T, C_INT32_T)
+end if
+if (rank_in_world == 2_C_INT64_T) then
+  key = Int(-1_C_INT64_T, C_INT32_T)
+end if
+two = 2_C_INT64_T
+c = MODULO(rank_in_world,two)
+color = Int(c, C_INT32_T)
+newcomm = Int(-1_C_INT64_T, C_INT32_T)
+call mpi_comm_split(comm, color, key, newcomm, ierr)
+!Broadcast of the message by the rank process master of
+!each communicator to the processes of its group
+call mpi_bcast(a, m, MPI_INTEGER8, master, newcomm, ierr)
+print *, '> processor ' // ' ' , rank_in_world, ' has a = ' // ' ' , a
+!Destruction of the communicators
+call mpi_comm_free(newcomm, ierr)
+call mpi_finalize(ierr)
+
+end program prog_split
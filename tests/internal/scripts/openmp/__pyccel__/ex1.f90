@@ -0,0 +1,23 @@
+program prog_ex1
+
+use omp_lib
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: n_threads
+integer(C_INT64_T) :: max_threads
+integer(C_INT64_T) :: idx
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+n_threads = omp_get_num_threads()
+print *, '> threads number : ' // ' ' , n_threads
+max_threads = omp_get_max_threads()
+print *, '> maximum available threads : ' // ' ' , max_threads
+!$omp parallel private(idx)
+idx = omp_get_thread_num()
+print *, '> thread  id : ' // ' ' , idx
+!$omp end parallel  
+
+end program prog_ex1
@@ -0,0 +1,28 @@
+program prog_ex2
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: n
+real(C_DOUBLE), allocatable :: a(:)
+real(C_DOUBLE), allocatable :: b(:)
+integer(C_INT64_T) :: i
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+!This example is the python implementation of ploop.1.f from OpenMP 4.5 examples
+n = 100_C_INT64_T
+allocate(a(0:n - 1_C_INT64_T))
+a = 0.0_C_DOUBLE
+allocate(b(0:n - 1_C_INT64_T))
+b = 0.0_C_DOUBLE
+!$omp parallel
+!$omp do
+do i = 1_C_INT64_T, n-1_C_INT64_T, 1_C_INT64_T
+  b(i) = (a(i) + a(i - 1_C_INT64_T)) / 2.0_C_DOUBLE
+end do
+!$omp end do  
+!$omp end parallel  
+
+end program prog_ex2
@@ -1,11 +1,36 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring/
 # coding: utf-8
 
+import pytest
+
 from pyccel.parser.syntax.openmp import parse
 
 def test_parallel():
     d = parse(stmts='#$ omp parallel private(idx)')
 
+def test_combined_constructs():
+    d = parse(stmts='#$ omp parallel for simd schedule(dynamic, chunk) safelen(8)')
+    assert d.construct == 'parallel for simd'
+    d = parse(stmts='#$ omp taskloop grainsize(n) nogroup')
+    assert d.construct == 'taskloop'
+
+def test_end_clause():
+    d = parse(stmts='#$ omp end for simd nowait')
+    assert d.construct == 'for simd'
+    assert d.nowait
+    d = parse(stmts='#$ omp end critical (name)')
+    assert d.construct == 'critical'
+    assert not d.nowait
+
+def test_invalid_clauses():
+    with pytest.raises(TypeError):
+        parse(stmts='#$ omp for schedule(runtime, 4)')
+    with pytest.raises(TypeError):
+        parse(stmts='#$ omp for safelen(4)')
+
 ######################
 if __name__ == '__main__':
     test_parallel()
+    test_combined_constructs()
+    test_end_clause()
+    test_invalid_clauses()
@@ -0,0 +1,94 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+# coding: utf-8
+import os
+import pytest
+
+from pyccel.parser.parser    import Parser
+from pyccel.parser.semantic  import SemanticParser
+from pyccel.parser.syntactic import SyntaxParser
+from pyccel.codegen.codegen  import Codegen
+from pyccel.errors.errors    import Errors
+
+@pytest.fixture
+def project(tmpdir, monkeypatch):
+    monkeypatch.setenv('PYCCEL_CACHE_DIR', str(tmpdir.join('cache')))
+    folder = tmpdir.mkdir('project')
+    folder.join('utils.py').write("from pyccel.decorators import types\n"
+                                  "@types('int')\n"
+                                  "def incr(x):\n"
+                                  "    return x + 1\n")
+    folder.join('main.py').write("from pyccel.decorators import types\n"
+                                 "from utils import incr\n"
+                                 "@types('int')\n"
+                                 "def f(x):\n"
+                                 "    return incr(x)*2\n")
+    yield folder
+    Errors().reset()
+
+def annotate(filename, monkeypatch):
+    """ Parse and annotate a file, returning the names of the files which
+    were annotated """
+    annotated = []
+    original  = SemanticParser.annotate
+    def annotate_spy(self, **settings):
+        annotated.append(os.path.basename(self.filename))
+        return original(self, **settings)
+    monkeypatch.setattr(SemanticParser, 'annotate', annotate_spy)
+
+    parser = Parser(filename)
+    parser.parse()
+    parser.annotate()
+
+    monkeypatch.setattr(SemanticParser, 'annotate', original)
+    return parser, annotated
+
+def test_semantic_cache(project, monkeypatch):
+    main = str(project.join('main.py'))
+
+    parser, annotated = annotate(main, monkeypatch)
+    assert annotated == ['utils.py', 'main.py']
+    code = Codegen(parser.sons[0].semantic_parser, 'utils').doprint()
+
+    # The imported module is loaded from the cache, not the main file
+    parser, annotated = annotate(main, monkeypatch)
+    assert annotated == ['main.py']
+    assert Codegen(parser.sons[0].semantic_parser, 'utils').doprint() == code
+
+    # Modifying the imported module invalidates the entry
+    project.join('utils.py').write("from pyccel.decorators import types\n"
+                                   "@types('int')\n"
+                                   "def incr(x):\n"
+                                   "    return x + 2\n")
+    _, annotated = annotate(main, monkeypatch)
+    assert annotated == ['utils.py', 'main.py']
+
+def test_header_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv('PYCCEL_CACHE_DIR', str(tmpdir.join('cache')))
+    header = tmpdir.join('funcs.pyh')
+    header.write('#$ header function f(int, float [:])\n')
+
+    parser = SyntaxParser(str(header))
+    assert parser.cache_key is not None
+
+    # The second parser is loaded from the cache
+    def no_visit(self, stmt):
+        raise AssertionError('Header should be found in the cache')
+    monkeypatch.setattr(SyntaxParser, '_visit', no_visit)
+    cached = SyntaxParser(str(header))
+    assert repr(cached.ast.get_focus()) == repr(parser.ast.get_focus())
+
+def test_dump_file(tmpdir):
+    header = tmpdir.join('funcs.pyh')
+    header.write('#$ header function f(int, float [:])\n')
+    parser = SyntaxParser(str(header))
+    code = repr(parser.ast.get_focus())
+
+    filename = str(tmpdir.join('funcs.pyccel'))
+    assert parser.dump(filename)
+
+    other = tmpdir.join('other.py')
+    other.write('x = 1\n')
+    parser = SyntaxParser(str(other))
+    assert parser.cache_key is None
+    assert parser.load(filename)
+    assert repr(parser.ast.get_focus()) == code
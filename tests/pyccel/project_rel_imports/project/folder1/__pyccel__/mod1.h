@@ -0,0 +1,11 @@
+#ifndef MOD1_H
+#define MOD1_H
+
+#include <stdlib.h>
+#include <stdint.h>
+
+int64_t add2(int64_t x, int64_t y);
+
+int64_t sum_to_n(int64_t n);
+
+#endif // MOD1_H
\ No newline at end of file
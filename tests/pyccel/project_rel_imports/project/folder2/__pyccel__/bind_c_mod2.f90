@@ -0,0 +1,14 @@
+!........................................
+function sum_to_n_squared(n) bind(c) result(Out_0001)
+
+  use mod2, only: mod_sum_to_n_squared => sum_to_n_squared
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: n
+  integer(C_INT64_T) :: Out_0001
+
+  Out_0001 = mod_sum_to_n_squared(n)
+
+end function sum_to_n_squared
+!........................................
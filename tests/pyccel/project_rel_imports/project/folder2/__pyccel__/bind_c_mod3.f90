@@ -0,0 +1,15 @@
+!........................................
+function one_hundred_plus_sum_to_n_squared(n) bind(c) result(Out_0001)
+
+  use mod3, only: mod_one_hundred_plus_sum_to_n_squared => &
+      one_hundred_plus_sum_to_n_squared
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: n
+  integer(C_INT64_T) :: Out_0001
+
+  Out_0001 = mod_one_hundred_plus_sum_to_n_squared(n)
+
+end function one_hundred_plus_sum_to_n_squared
+!........................................
@@ -0,0 +1,13 @@
+#include <mod2.h>
+#include <stdlib.h>
+#include <math.h>
+#include <stdint.h>
+
+/*........................................*/
+int64_t sum_to_n_squared(int64_t n)
+{
+    int64_t Out_0001;
+    Out_0001 = (int64_t)pow((double)(sum_to_n(n)), 2.0);
+    return Out_0001;
+}
+/*........................................*/
\ No newline at end of file
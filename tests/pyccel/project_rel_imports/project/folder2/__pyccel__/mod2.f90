@@ -0,0 +1,24 @@
+module mod2
+
+use mod1, only: sum_to_n
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  function sum_to_n_squared(n) result(Out_0001)
+
+implicit none
+
+integer(C_INT64_T) :: Out_0001
+integer(C_INT64_T), value :: n
+
+Out_0001 = sum_to_n(n) ** 2_C_INT64_T
+return
+
+end function sum_to_n_squared
+!........................................
+
+end module mod2
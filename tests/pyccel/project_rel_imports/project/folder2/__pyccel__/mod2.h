@@ -0,0 +1,10 @@
+#ifndef MOD2_H
+#define MOD2_H
+
+#include <mod1.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+int64_t sum_to_n_squared(int64_t n);
+
+#endif // MOD2_H
\ No newline at end of file
@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+int64_t sum_to_n_squared(int64_t n);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *sum_to_n_squared_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t n;
+    int64_t Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "n",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "l", kwlist, &n))
+    {
+        return NULL;
+    }
+    Out_0001 = sum_to_n_squared(n);
+    result = Py_BuildValue("l", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef mod2_methods[] = {
+    {
+        "sum_to_n_squared",
+        (PyCFunction)(void (*)(void))sum_to_n_squared_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    mod2_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod2(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&mod2_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
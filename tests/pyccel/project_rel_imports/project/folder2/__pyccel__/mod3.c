@@ -0,0 +1,12 @@
+#include <mod3.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+/*........................................*/
+int64_t one_hundred_plus_sum_to_n_squared(int64_t n)
+{
+    int64_t Out_0001;
+    Out_0001 = add2(100, sum_to_n_squared(n));
+    return Out_0001;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,25 @@
+module mod3
+
+use mod2, only: sum_to_n_squared
+use mod1, only: add2
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  function one_hundred_plus_sum_to_n_squared(n) result(Out_0001)
+
+implicit none
+
+integer(C_INT64_T) :: Out_0001
+integer(C_INT64_T), value :: n
+
+Out_0001 = add2(100_C_INT64_T, sum_to_n_squared(n))
+return
+
+end function one_hundred_plus_sum_to_n_squared
+!........................................
+
+end module mod3
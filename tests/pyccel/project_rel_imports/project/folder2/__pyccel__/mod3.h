@@ -0,0 +1,11 @@
+#ifndef MOD3_H
+#define MOD3_H
+
+#include <mod2.h>
+#include <mod1.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+int64_t one_hundred_plus_sum_to_n_squared(int64_t n);
+
+#endif // MOD3_H
\ No newline at end of file
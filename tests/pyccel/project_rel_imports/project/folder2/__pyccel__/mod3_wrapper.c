@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+int64_t one_hundred_plus_sum_to_n_squared(int64_t n);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *one_hundred_plus_sum_to_n_squared_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t n;
+    int64_t Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "n",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "l", kwlist, &n))
+    {
+        return NULL;
+    }
+    Out_0001 = one_hundred_plus_sum_to_n_squared(n);
+    result = Py_BuildValue("l", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef mod3_methods[] = {
+    {
+        "one_hundred_plus_sum_to_n_squared",
+        (PyCFunction)(void (*)(void))one_hundred_plus_sum_to_n_squared_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod3_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod3",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    mod3_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod3(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&mod3_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,136 @@
+#include <arrays_view.h>
+#include <ndarrays.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <stdint.h>
+
+/*........................................*/
+void array_view(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    t_scratch_mark scratch = scratch_mark();
+
+    a = array_create_with_data(2, (int64_t[]){2, 5}, nd_int64, scratch_alloc(2 * 5 * sizeof(int64_t)));
+    int64_t array_dummy_0001[] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10};
+    memcpy(a.nd_int64, array_dummy_0001, a.buffer_size);
+
+    b = array_slicing(a, new_slice(0, a.shape[0], 1), new_slice(0, a.shape[1], 1));
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 5; j += 1)
+        {
+            printf("%ld\n", b.nd_int64[get_index_2(b, i, j)]);
+        }
+    }
+    free_array(a);
+    scratch_release(scratch);
+}
+/*........................................*/
+
+/*........................................*/
+void array_view_negative_literal_step(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    t_scratch_mark scratch_0001 = scratch_mark();
+
+    a = array_create_with_data(2, (int64_t[]){2, 5}, nd_int64, scratch_alloc(2 * 5 * sizeof(int64_t)));
+    int64_t array_dummy_0002[] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10};
+    memcpy(a.nd_int64, array_dummy_0002, a.buffer_size);
+
+    b = array_slicing(a, new_slice(0, a.shape[0], 1), new_slice(a.shape[1] - 1, 0, -1));
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 5; j += 1)
+        {
+            printf("%ld\n", b.nd_int64[get_index_2(b, i, j)]);
+        }
+    }
+    free_array(a);
+    scratch_release(scratch_0001);
+}
+/*........................................*/
+
+/*........................................*/
+void array_view_negative_literal_step__2(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    t_scratch_mark scratch_0002 = scratch_mark();
+
+    a = array_create_with_data(2, (int64_t[]){2, 5}, nd_int64, scratch_alloc(2 * 5 * sizeof(int64_t)));
+    int64_t array_dummy_0003[] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10};
+    memcpy(a.nd_int64, array_dummy_0003, a.buffer_size);
+
+    b = array_slicing(a, new_slice(0, a.shape[0], 1), new_slice(4, 2, -1));
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 2; j += 1)
+        {
+            printf("%ld\n", b.nd_int64[get_index_2(b, i, j)]);
+        }
+    }
+    free_array(a);
+    scratch_release(scratch_0002);
+}
+/*........................................*/
+
+/*........................................*/
+void array_view_negative_literal_step__3(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    t_scratch_mark scratch_0003 = scratch_mark();
+
+    a = array_create_with_data(2, (int64_t[]){2, 5}, nd_int64, scratch_alloc(2 * 5 * sizeof(int64_t)));
+    int64_t array_dummy_0004[] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10};
+    memcpy(a.nd_int64, array_dummy_0004, a.buffer_size);
+
+    b = array_slicing(a, new_slice(0, a.shape[0], 1), new_slice(3, 0, -2));
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 2; j += 1)
+        {
+            printf("%ld\n", b.nd_int64[get_index_2(b, i, j)]);
+        }
+    }
+    free_array(a);
+    scratch_release(scratch_0003);
+}
+/*........................................*/
+
+/*........................................*/
+void array_view_negative_variable_step(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    int64_t j;
+    t_scratch_mark scratch_0004 = scratch_mark();
+
+    a = array_create_with_data(2, (int64_t[]){2, 5}, nd_int64, scratch_alloc(2 * 5 * sizeof(int64_t)));
+    int64_t array_dummy_0005[] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10};
+    memcpy(a.nd_int64, array_dummy_0005, a.buffer_size);
+
+    i = -1;
+    b = array_slicing(a, new_slice((i > 0) ? 0 : a.shape[0] - 1, (i > 0) ? a.shape[0] : 0, i), new_slice(0, a.shape[1], 1));
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 5; j += 1)
+        {
+            printf("%ld\n", b.nd_int64[get_index_2(b, i, j)]);
+        }
+    }
+    free_array(a);
+    scratch_release(scratch_0004);
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,133 @@
+module arrays_view
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine array_view() 
+
+  implicit none
+
+  integer(C_INT64_T), allocatable, target :: a(:,:)
+  integer(C_INT64_T), pointer :: b(:,:)
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+
+  allocate(a(0:5_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+  a = reshape([[1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, &
+      5_C_INT64_T], [6_C_INT64_T, 7_C_INT64_T, 8_C_INT64_T, 9_C_INT64_T &
+      , 10_C_INT64_T]], [5_C_INT64_T, 2_C_INT64_T])
+  b(0:, 0:) => a(:, :)
+  do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      print *, b(j, i)
+    end do
+  end do
+
+end subroutine array_view
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step() 
+
+  implicit none
+
+  integer(C_INT64_T), allocatable, target :: a(:,:)
+  integer(C_INT64_T), pointer :: b(:,:)
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+
+  allocate(a(0:5_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+  a = reshape([[1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, &
+      5_C_INT64_T], [6_C_INT64_T, 7_C_INT64_T, 8_C_INT64_T, 9_C_INT64_T &
+      , 10_C_INT64_T]], [5_C_INT64_T, 2_C_INT64_T])
+  b(0:, 0:) => a(size(a, 1, C_INT64_T) - 1_C_INT64_T:0_C_INT64_T: &
+      -1_C_INT64_T, :)
+  do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      print *, b(j, i)
+    end do
+  end do
+
+end subroutine array_view_negative_literal_step
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step__2() 
+
+  implicit none
+
+  integer(C_INT64_T), allocatable, target :: a(:,:)
+  integer(C_INT64_T), pointer :: b(:,:)
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+
+  allocate(a(0:5_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+  a = reshape([[1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, &
+      5_C_INT64_T], [6_C_INT64_T, 7_C_INT64_T, 8_C_INT64_T, 9_C_INT64_T &
+      , 10_C_INT64_T]], [5_C_INT64_T, 2_C_INT64_T])
+  b(0:, 0:) => a(4_C_INT64_T:2_C_INT64_T + 1_C_INT64_T:-1_C_INT64_T, :)
+  do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      print *, b(j, i)
+    end do
+  end do
+
+end subroutine array_view_negative_literal_step__2
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step__3() 
+
+  implicit none
+
+  integer(C_INT64_T), allocatable, target :: a(:,:)
+  integer(C_INT64_T), pointer :: b(:,:)
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+
+  allocate(a(0:5_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+  a = reshape([[1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, &
+      5_C_INT64_T], [6_C_INT64_T, 7_C_INT64_T, 8_C_INT64_T, 9_C_INT64_T &
+      , 10_C_INT64_T]], [5_C_INT64_T, 2_C_INT64_T])
+  b(0:, 0:) => a(3_C_INT64_T:0_C_INT64_T:-2_C_INT64_T, :)
+  do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      print *, b(j, i)
+    end do
+  end do
+
+end subroutine array_view_negative_literal_step__3
+!........................................
+
+!........................................
+subroutine array_view_negative_variable_step() 
+
+  implicit none
+
+  integer(C_INT64_T), allocatable, target :: a(:,:)
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T), pointer :: b(:,:)
+  integer(C_INT64_T) :: j
+
+  allocate(a(0:5_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+  a = reshape([[1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, &
+      5_C_INT64_T], [6_C_INT64_T, 7_C_INT64_T, 8_C_INT64_T, 9_C_INT64_T &
+      , 10_C_INT64_T]], [5_C_INT64_T, 2_C_INT64_T])
+  i = -1_C_INT64_T
+  b(0:, 0:) => a(:, merge(0_C_INT64_T, size(a, 2, C_INT64_T) - &
+      1_C_INT64_T, i > 0_C_INT64_T):merge(size(a, 2, C_INT64_T) - &
+      1_C_INT64_T, 0_C_INT64_T, i > 0_C_INT64_T):i)
+  do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      print *, b(j, i)
+    end do
+  end do
+
+end subroutine array_view_negative_variable_step
+!........................................
+
+end module arrays_view
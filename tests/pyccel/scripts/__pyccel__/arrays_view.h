@@ -0,0 +1,16 @@
+#ifndef ARRAYS_VIEW_H
+#define ARRAYS_VIEW_H
+
+#include <stdlib.h>
+
+void array_view(void);
+
+void array_view_negative_literal_step(void);
+
+void array_view_negative_literal_step__2(void);
+
+void array_view_negative_literal_step__3(void);
+
+void array_view_negative_variable_step(void);
+
+#endif // ARRAYS_VIEW_H
\ No newline at end of file
@@ -0,0 +1,169 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+void array_view(void);
+void array_view_negative_literal_step(void);
+void array_view_negative_literal_step__2(void);
+void array_view_negative_literal_step__3(void);
+void array_view_negative_variable_step(void);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *array_view_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    array_view();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *array_view_negative_literal_step_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    array_view_negative_literal_step();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *array_view_negative_literal_step__2_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    array_view_negative_literal_step__2();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *array_view_negative_literal_step__3_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    array_view_negative_literal_step__3();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *array_view_negative_variable_step_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    array_view_negative_variable_step();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef arrays_view_methods[] = {
+    {
+        "array_view",
+        (PyCFunction)(void (*)(void))array_view_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "array_view_negative_literal_step",
+        (PyCFunction)(void (*)(void))array_view_negative_literal_step_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "array_view_negative_literal_step__2",
+        (PyCFunction)(void (*)(void))array_view_negative_literal_step__2_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "array_view_negative_literal_step__3",
+        (PyCFunction)(void (*)(void))array_view_negative_literal_step__3_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "array_view_negative_variable_step",
+        (PyCFunction)(void (*)(void))array_view_negative_variable_step_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef arrays_view_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "arrays_view",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    arrays_view_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_arrays_view(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&arrays_view_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,63 @@
+!........................................
+subroutine array_view() bind(c) 
+
+  use arrays_view, only: mod_array_view => array_view
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_array_view()
+
+end subroutine array_view
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step() bind(c) 
+
+  use arrays_view, only: mod_array_view_negative_literal_step => &
+      array_view_negative_literal_step
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_array_view_negative_literal_step()
+
+end subroutine array_view_negative_literal_step
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step__2() bind(c) 
+
+  use arrays_view, only: mod_array_view_negative_literal_step__2 => &
+      array_view_negative_literal_step__2
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_array_view_negative_literal_step__2()
+
+end subroutine array_view_negative_literal_step__2
+!........................................
+
+!........................................
+subroutine array_view_negative_literal_step__3() bind(c) 
+
+  use arrays_view, only: mod_array_view_negative_literal_step__3 => &
+      array_view_negative_literal_step__3
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_array_view_negative_literal_step__3()
+
+end subroutine array_view_negative_literal_step__3
+!........................................
+
+!........................................
+subroutine array_view_negative_variable_step() bind(c) 
+
+  use arrays_view, only: mod_array_view_negative_variable_step => &
+      array_view_negative_variable_step
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_array_view_negative_variable_step()
+
+end subroutine array_view_negative_variable_step
+!........................................
@@ -0,0 +1,135 @@
+!........................................
+function is_false(a) bind(c) result(c)
+
+  use bool_comp, only: mod_is_false => is_false
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL) :: c
+
+  c = mod_is_false(a)
+
+end function is_false
+!........................................
+
+!........................................
+function compare_is(a, b) bind(c) result(c)
+
+  use bool_comp, only: mod_compare_is => compare_is
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL), value :: b
+  logical(C_BOOL) :: c
+
+  c = mod_compare_is(a, b)
+
+end function compare_is
+!........................................
+
+!........................................
+function not_true(a) bind(c) result(c)
+
+  use bool_comp, only: mod_not_true => not_true
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL) :: c
+
+  c = mod_not_true(a)
+
+end function not_true
+!........................................
+
+!........................................
+function eq_false(a) bind(c) result(c)
+
+  use bool_comp, only: mod_eq_false => eq_false
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL) :: c
+
+  c = mod_eq_false(a)
+
+end function eq_false
+!........................................
+
+!........................................
+function neq_true(a) bind(c) result(c)
+
+  use bool_comp, only: mod_neq_true => neq_true
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL) :: c
+
+  c = mod_neq_true(a)
+
+end function neq_true
+!........................................
+
+!........................................
+function not_val(a) bind(c) result(c)
+
+  use bool_comp, only: mod_not_val => not_val
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), value :: a
+  logical(C_BOOL) :: c
+
+  c = mod_not_val(a)
+
+end function not_val
+!........................................
+
+!........................................
+function is_nil(a) bind(c) result(c)
+
+  use bool_comp, only: mod_is_nil => is_nil
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), intent(in), optional :: a
+  logical(C_BOOL) :: c
+
+  c = mod_is_nil(a)
+
+end function is_nil
+!........................................
+
+!........................................
+function is_not_nil(a) bind(c) result(c)
+
+  use bool_comp, only: mod_is_not_nil => is_not_nil
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), intent(in), optional :: a
+  logical(C_BOOL) :: c
+
+  c = mod_is_not_nil(a)
+
+end function is_not_nil
+!........................................
+
+!........................................
+function is_nil_default_arg(a) bind(c) result(c)
+
+  use bool_comp, only: mod_is_nil_default_arg => is_nil_default_arg
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), intent(in), optional :: a
+  logical(C_BOOL) :: c
+
+  c = mod_is_nil_default_arg(a)
+
+end function is_nil_default_arg
+!........................................
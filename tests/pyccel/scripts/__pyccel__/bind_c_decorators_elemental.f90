@@ -0,0 +1,14 @@
+!........................................
+function square(x) bind(c) result(s)
+
+  use decorators_elemental, only: mod_square => square
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE) :: s
+
+  s = mod_square(x)
+
+end function square
+!........................................
@@ -0,0 +1,78 @@
+!........................................
+function f1(x) bind(c) result(y)
+
+  use default_args_mod, only: mod_f1 => f1
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T) :: y
+
+  y = mod_f1(x)
+
+end function f1
+!........................................
+
+!........................................
+subroutine f5(x, m1) bind(c) 
+
+  use default_args_mod, only: mod_f5 => f5
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: x(0:)
+  integer(C_INT64_T), value :: m1
+
+  call mod_f5(x, m1)
+
+end subroutine f5
+!........................................
+
+!........................................
+function f3(x, y) bind(c) result(Out_0001)
+
+  use default_args_mod, only: mod_f3 => f3
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_f3(x, y)
+
+end function f3
+!........................................
+
+!........................................
+function is_nil_default_arg(a) bind(c) result(c)
+
+  use default_args_mod, only: mod_is_nil_default_arg => &
+      is_nil_default_arg
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  logical(C_BOOL), intent(in), optional :: a
+  logical(C_BOOL) :: c
+
+  c = mod_is_nil_default_arg(a)
+
+end function is_nil_default_arg
+!........................................
+
+!........................................
+function recursivity(x, y, z) bind(c) result(Out_0002)
+
+  use default_args_mod, only: mod_recursivity => recursivity
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  logical(C_BOOL), intent(in), optional :: z
+  real(C_DOUBLE) :: Out_0002
+
+  Out_0002 = mod_recursivity(x, y, z)
+
+end function recursivity
+!........................................
@@ -0,0 +1,14 @@
+!........................................
+function test_degree(degree) bind(c) result(Out_0001)
+
+  use runtest_degree_in, only: mod_test_degree => test_degree
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: degree
+  integer(C_INT64_T) :: Out_0001
+
+  Out_0001 = mod_test_degree(degree)
+
+end function test_degree
+!........................................
@@ -0,0 +1,30 @@
+!........................................
+function add2(x, y) bind(c) result(Out_0001)
+
+  use runtest_funcs, only: mod_add2 => add2
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  integer(C_INT64_T) :: Out_0001
+
+  Out_0001 = mod_add2(x, y)
+
+end function add2
+!........................................
+
+!........................................
+function sum_to_n(n) bind(c) result(result)
+
+  use runtest_funcs, only: mod_sum_to_n => sum_to_n
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: n
+  integer(C_INT64_T) :: result
+
+  result = mod_sum_to_n(n)
+
+end function sum_to_n
+!........................................
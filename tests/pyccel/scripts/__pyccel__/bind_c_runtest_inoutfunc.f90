@@ -0,0 +1,28 @@
+!........................................
+subroutine mult_2(x) bind(c) 
+
+  use runtest_inoutfunc, only: mod_mult_2 => mult_2
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: x(0:)
+
+  call mod_mult_2(x)
+
+end subroutine mult_2
+!........................................
+
+!........................................
+subroutine add_2(a, b) bind(c) 
+
+  use runtest_inoutfunc, only: mod_add_2 => add_2
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: a(0:)
+  real(C_DOUBLE), intent(inout) :: b(0:)
+
+  call mod_add_2(a, b)
+
+end subroutine add_2
+!........................................
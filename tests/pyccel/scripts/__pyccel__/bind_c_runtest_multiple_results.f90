@@ -0,0 +1,100 @@
+!........................................
+subroutine const_int_float(Out_0001, Out_0002) bind(c) 
+
+  use runtest_multiple_results, only: mod_const_int_float => &
+      const_int_float
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), intent(out) :: Out_0001
+  real(C_DOUBLE), intent(out) :: Out_0002
+
+  call mod_const_int_float(Out_0001 = Out_0001, Out_0002 = Out_0002)
+
+end subroutine const_int_float
+!........................................
+
+!........................................
+subroutine const_complex_bool_int(Out_0003, Out_0004, Out_0005) bind(c)
+
+  use runtest_multiple_results, only: mod_const_complex_bool_int => &
+      const_complex_bool_int
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  complex(C_DOUBLE_COMPLEX), intent(out) :: Out_0003
+  logical(C_BOOL), intent(out) :: Out_0004
+  integer(C_INT64_T), intent(out) :: Out_0005
+
+  call mod_const_complex_bool_int(Out_0003 = Out_0003, Out_0004 = &
+      Out_0004, Out_0005 = Out_0005)
+
+end subroutine const_complex_bool_int
+!........................................
+
+!........................................
+subroutine expr_complex_int_bool(n, Out_0006, Out_0007, Out_0008) bind(c &
+      )
+
+  use runtest_multiple_results, only: mod_expr_complex_int_bool => &
+      expr_complex_int_bool
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: n
+  complex(C_DOUBLE_COMPLEX), intent(out) :: Out_0006
+  integer(C_INT64_T), intent(out) :: Out_0007
+  logical(C_BOOL), intent(out) :: Out_0008
+
+  call mod_expr_complex_int_bool(n, Out_0006 = Out_0006, Out_0007 = &
+      Out_0007, Out_0008 = Out_0008)
+
+end subroutine expr_complex_int_bool
+!........................................
+
+!........................................
+subroutine f3(x, y, Out_0009, Out_0010) bind(c) 
+
+  use runtest_multiple_results, only: mod_f3 => f3
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE), intent(out) :: Out_0009
+  real(C_DOUBLE), intent(out) :: Out_0010
+
+  call mod_f3(x, y, Out_0009 = Out_0009, Out_0010 = Out_0010)
+
+end subroutine f3
+!........................................
+
+!........................................
+subroutine print_multiple() bind(c) 
+
+  use runtest_multiple_results, only: mod_print_multiple => &
+      print_multiple
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_print_multiple()
+
+end subroutine print_multiple
+!........................................
+
+!........................................
+subroutine f4(x, y, Out_0011, Out_0012) bind(c) 
+
+  use runtest_multiple_results, only: mod_f4 => f4
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE), intent(out) :: Out_0011
+  real(C_DOUBLE), intent(out) :: Out_0012
+
+  call mod_f4(x, y, Out_0011 = Out_0011, Out_0012 = Out_0012)
+
+end subroutine f4
+!........................................
@@ -0,0 +1,14 @@
+!........................................
+function f(x) bind(c) result(y)
+
+  use test_headers, only: mod_f => f
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE) :: y
+
+  y = mod_f(x)
+
+end function f
+!........................................
@@ -0,0 +1,120 @@
+#include <bool_comp.h>
+#include <stdlib.h>
+#include <stdbool.h>
+
+/*........................................*/
+bool is_false(bool a)
+{
+    bool c;
+    c = 0;
+    if (a == 0)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool compare_is(bool a, bool b)
+{
+    bool c;
+    c = 0;
+    if (a == b)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool not_true(bool a)
+{
+    bool c;
+    c = 0;
+    if (a != 1)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool eq_false(bool a)
+{
+    bool c;
+    c = 0;
+    if (a == 0)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool neq_true(bool a)
+{
+    bool c;
+    c = 0;
+    if (a != 1)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool not_val(bool a)
+{
+    bool c;
+    c = 0;
+    if (!a)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool is_nil(bool *a)
+{
+    bool c;
+    c = 0;
+    if (a == NULL)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool is_not_nil(bool *a)
+{
+    bool c;
+    c = 0;
+    if (a != NULL)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+bool is_nil_default_arg(bool *a)
+{
+    bool c;
+    c = 0;
+    if (a == NULL)
+    {
+        c = 1;
+    }
+    return c;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,163 @@
+module bool_comp
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function is_false(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+
+  c = .False._C_BOOL
+  if (a .eqv. .False._C_BOOL) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function is_false
+!........................................
+
+!........................................
+function compare_is(a, b) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+  logical(C_BOOL), value :: b
+
+  c = .False._C_BOOL
+  if (a .eqv. b) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function compare_is
+!........................................
+
+!........................................
+function not_true(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+
+  c = .False._C_BOOL
+  if (a .neqv. .True._C_BOOL) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function not_true
+!........................................
+
+!........................................
+function eq_false(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+
+  c = .False._C_BOOL
+  if (a .eqv. .False._C_BOOL) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function eq_false
+!........................................
+
+!........................................
+function neq_true(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+
+  c = .False._C_BOOL
+  if (a .neqv. .True._C_BOOL) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function neq_true
+!........................................
+
+!........................................
+function not_val(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value :: a
+
+  c = .False._C_BOOL
+  if (.not. a) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function not_val
+!........................................
+
+!........................................
+function is_nil(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value, optional :: a
+
+  c = .False._C_BOOL
+  if (.not. present(a)) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function is_nil
+!........................................
+
+!........................................
+function is_not_nil(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value, optional :: a
+
+  c = .False._C_BOOL
+  if (present(a)) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function is_not_nil
+!........................................
+
+!........................................
+function is_nil_default_arg(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value, optional :: a
+
+  c = .False._C_BOOL
+  if (.not. present(a)) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function is_nil_default_arg
+!........................................
+
+end module bool_comp
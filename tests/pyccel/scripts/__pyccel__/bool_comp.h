@@ -0,0 +1,25 @@
+#ifndef BOOL_COMP_H
+#define BOOL_COMP_H
+
+#include <stdlib.h>
+#include <stdbool.h>
+
+bool is_false(bool a);
+
+bool compare_is(bool a, bool b);
+
+bool not_true(bool a);
+
+bool eq_false(bool a);
+
+bool neq_true(bool a);
+
+bool not_val(bool a);
+
+bool is_nil(bool *a);
+
+bool is_not_nil(bool *a);
+
+bool is_nil_default_arg(bool *a);
+
+#endif // BOOL_COMP_H
\ No newline at end of file
@@ -0,0 +1,435 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <stdbool.h>
+
+bool is_false(bool a);
+bool compare_is(bool a, bool b);
+bool not_true(bool a);
+bool eq_false(bool a);
+bool neq_true(bool a);
+bool not_val(bool a);
+bool is_nil(bool *a);
+bool is_not_nil(bool *a);
+bool is_nil_default_arg(bool *a);
+
+/*........................................*/
+
+/*........................................*/
+bool pyint_to_bool(int32_t i)
+{
+    bool b;
+    b = (i != 0);
+    return b;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *bool_to_pyobj(bool b)
+{
+    PyObject *o;
+    if ((b != 0))
+    {
+        o = Py_True;
+    }
+    else if (1)
+    {
+        o = Py_False;
+    }
+    return o;
+}
+/*........................................*/
+
+/*........................................*/
+bool pybool_to_bool(PyObject *o)
+{
+    bool c;
+    c = o == Py_True;
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+
+/*........................................*/
+PyObject *is_false_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool c;
+    int32_t a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "i", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    c = is_false(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *compare_is_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool b;
+    bool c;
+    int32_t a_tmp;
+    int32_t b_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "ii", kwlist, &a_tmp, &b_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    b = pyint_to_bool(b_tmp);
+    c = compare_is(a, b);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *not_true_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool c;
+    int32_t a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "i", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    c = not_true(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *eq_false_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool c;
+    int32_t a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "i", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    c = eq_false(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *neq_true_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool c;
+    int32_t a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "i", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    c = neq_true(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *not_val_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool a;
+    bool c;
+    int32_t a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "i", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    a = pyint_to_bool(a_tmp);
+    c = not_val(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *is_nil_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool *a;
+    bool c;
+    bool a_tmp_0001;
+    PyObject *a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    a_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|O", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    if (a_tmp == Py_None)
+    {
+        a = NULL;
+    }
+    else if (!(PyArray_IsScalar(a_tmp, Bool) || PyBool_Check(a_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "a must be bool");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(a_tmp))
+        {
+            PyArray_ScalarAsCtype(a_tmp, &a_tmp_0001);
+        }
+        else if (1)
+        {
+            a_tmp_0001 = pybool_to_bool(a_tmp);
+        }
+        a = &a_tmp_0001;
+    }
+    c = is_nil(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *is_not_nil_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool *a;
+    bool c;
+    bool a_tmp_0001;
+    PyObject *a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    a_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|O", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    if (a_tmp == Py_None)
+    {
+        a = NULL;
+    }
+    else if (!(PyArray_IsScalar(a_tmp, Bool) || PyBool_Check(a_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "a must be bool");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(a_tmp))
+        {
+            PyArray_ScalarAsCtype(a_tmp, &a_tmp_0001);
+        }
+        else if (1)
+        {
+            a_tmp_0001 = pybool_to_bool(a_tmp);
+        }
+        a = &a_tmp_0001;
+    }
+    c = is_not_nil(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *is_nil_default_arg_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool *a;
+    bool c;
+    bool a_tmp_0001;
+    PyObject *a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    a_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|O", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    if (a_tmp == Py_None)
+    {
+        a = NULL;
+    }
+    else if (!(PyArray_IsScalar(a_tmp, Bool) || PyBool_Check(a_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "a must be bool");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(a_tmp))
+        {
+            PyArray_ScalarAsCtype(a_tmp, &a_tmp_0001);
+        }
+        else if (1)
+        {
+            a_tmp_0001 = pybool_to_bool(a_tmp);
+        }
+        a = &a_tmp_0001;
+    }
+    c = is_nil_default_arg(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef bool_comp_methods[] = {
+    {
+        "is_false",
+        (PyCFunction)(void (*)(void))is_false_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "compare_is",
+        (PyCFunction)(void (*)(void))compare_is_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "not_true",
+        (PyCFunction)(void (*)(void))not_true_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "eq_false",
+        (PyCFunction)(void (*)(void))eq_false_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "neq_true",
+        (PyCFunction)(void (*)(void))neq_true_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "not_val",
+        (PyCFunction)(void (*)(void))not_val_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "is_nil",
+        (PyCFunction)(void (*)(void))is_nil_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "is_not_nil",
+        (PyCFunction)(void (*)(void))is_not_nil_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "is_nil_default_arg",
+        (PyCFunction)(void (*)(void))is_nil_default_arg_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef bool_comp_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "bool_comp",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    bool_comp_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_bool_comp(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&bool_comp_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,195 @@
+#include <ndarrays.h>
+#include <stdio.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <complex.h>
+int main()
+{
+    t_ndarray ac0 = {.raw_data = NULL};
+    t_ndarray ac1 = {.raw_data = NULL};
+    t_ndarray ac2 = {.raw_data = NULL};
+    t_ndarray ac3 = {.raw_data = NULL};
+    t_ndarray af1 = {.raw_data = NULL};
+    t_ndarray af2 = {.raw_data = NULL};
+    t_ndarray af3 = {.raw_data = NULL};
+    t_ndarray af4 = {.raw_data = NULL};
+    t_ndarray af5 = {.raw_data = NULL};
+    t_ndarray ao3 = {.raw_data = NULL};
+    t_ndarray ao4 = {.raw_data = NULL};
+    t_ndarray ae1 = {.raw_data = NULL};
+    t_ndarray afl = {.raw_data = NULL};
+    t_ndarray aol = {.raw_data = NULL};
+    t_ndarray azl = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+
+    /*pylint: disable=missing-function-docstring, missing-module-docstring/*/
+    /*---------------------------- Array creation ---------------------------------*/
+
+    ac0 = array_create(1, (int64_t[]){1}, nd_int64);
+    int64_t array_dummy_0001[] = {0};
+    memcpy(ac0.nd_int64, array_dummy_0001, ac0.buffer_size);
+
+
+    ac1 = array_create(1, (int64_t[]){4}, nd_int64);
+    int64_t array_dummy_0002[] = {0, 0, 0, 0};
+    memcpy(ac1.nd_int64, array_dummy_0002, ac1.buffer_size);
+
+
+    ac2 = array_create(1, (int64_t[]){5}, nd_int64);
+    int64_t array_dummy_0003[] = {1, 2, 3, 4, 5};
+    memcpy(ac2.nd_int64, array_dummy_0003, ac2.buffer_size);
+
+
+    ac3 = array_create(1, (int64_t[]){5}, nd_int64);
+    int64_t array_dummy_0004[] = {-1, -2, -3, -4, -5};
+    memcpy(ac3.nd_int64, array_dummy_0004, ac3.buffer_size);
+
+    printf("%ld\n", ac0.nd_int64[0]);
+    for (i = 0; i < 4; i += 1)
+    {
+        printf("%ld\n", ac1.nd_int64[i]);
+    }
+    printf("\n");
+    for (i = 0; i < 5; i += 1)
+    {
+        printf("%ld\n", ac2.nd_int64[i]);
+    }
+    printf("\n");
+    for (i = 0; i < 5; i += 1)
+    {
+        printf("%ld\n", ac3.nd_int64[i]);
+    }
+    printf("\n");
+    /*------------------------------- Array full ----------------------------------*/
+
+    af1 = array_create(1, (int64_t[]){5}, nd_double);
+    array_fill((double)2.0, af1);
+
+    for (i = 0; i < 5; i += 1)
+    {
+        printf("%.12lf\n", af1.nd_double[i]);
+    }
+    printf("\n");
+
+    af2 = array_create(2, (int64_t[]){5, 5}, nd_int64);
+    array_fill((int64_t)31254626, af2);
+
+    for (i = 0; i < 5; i += 1)
+    {
+        for (j = 0; j < 5; j += 1)
+        {
+            printf("%ld\n", af2.nd_int64[i * af2.strides[0] + j]);
+        }
+        printf("\n");
+    }
+
+    af3 = array_create(2, (int64_t[]){20, 5}, nd_double);
+    array_fill((double)(-1.58), af3);
+
+    for (i = 0; i < 20; i += 1)
+    {
+        for (j = 0; j < 5; j += 1)
+        {
+            printf("%.12lf\n", af3.nd_double[i * af3.strides[0] + j]);
+        }
+        printf("\n");
+    }
+
+    af4 = array_create(2, (int64_t[]){3, 10}, nd_cdouble);
+    array_fill((double complex)(1.0 + 2.0 * _Complex_I), af4);
+
+    for (i = 0; i < 3; i += 1)
+    {
+        for (j = 0; j < 10; j += 1)
+        {
+            printf("(%.12lf + %.12lfj)\n", creal(af4.nd_cdouble[i * af4.strides[0] + j]), cimag(af4.nd_cdouble[i * af4.strides[0] + j]));
+        }
+        printf("\n");
+    }
+
+    af5 = array_create(1, (int64_t[]){5}, nd_cdouble);
+    array_fill((double complex)(12.2 + 13.0 * _Complex_I), af5);
+
+    for (i = 0; i < 5; i += 1)
+    {
+        printf("(%.12lf + %.12lfj)\n", creal(af5.nd_cdouble[i]), cimag(af5.nd_cdouble[i]));
+    }
+    printf("\n");
+    /*------------------------------ Array empty ----------------------------------*/
+
+    ao3 = array_create(1, (int64_t[]){10}, nd_double);
+    array_fill((double)1.0, ao3);
+
+    for (i = 0; i < 10; i += 1)
+    {
+        printf("%.12lf\n", ao3.nd_double[i]);
+    }
+    printf("\n");
+
+    ao4 = array_create(2, (int64_t[]){2, 3}, nd_double);
+    array_fill((double)1.0, ao4);
+
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 3; j += 1)
+        {
+            printf("%.12lf\n", ao4.nd_double[i * ao4.strides[0] + j]);
+        }
+        printf("\n");
+    }
+
+    ae1 = array_create(2, (int64_t[]){2, 3}, nd_double);
+
+    afl = array_create(2, (int64_t[]){2, 3}, nd_double);
+    array_fill((double)5.21, afl);
+
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 3; j += 1)
+        {
+            printf("%.12lf\n", afl.nd_double[i * afl.strides[0] + j]);
+        }
+        printf("\n");
+    }
+
+    aol = array_create(2, (int64_t[]){3, 10}, nd_cdouble);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), aol);
+
+    for (i = 0; i < 3; i += 1)
+    {
+        for (j = 0; j < 10; j += 1)
+        {
+            printf("(%.12lf + %.12lfj)\n", creal(aol.nd_cdouble[i * aol.strides[0] + j]), cimag(aol.nd_cdouble[i * aol.strides[0] + j]));
+        }
+        printf("\n");
+    }
+
+    azl = array_create(2, (int64_t[]){2, 3}, nd_double);
+    array_fill((double)0.0, azl);
+
+    for (i = 0; i < 2; i += 1)
+    {
+        for (j = 0; j < 3; j += 1)
+        {
+            printf("%.12lf\n", azl.nd_double[i * azl.strides[0] + j]);
+        }
+        printf("\n");
+    }
+    free_array(ac0);
+    free_array(ac1);
+    free_array(ac2);
+    free_array(ac3);
+    free_array(af1);
+    free_array(af2);
+    free_array(af3);
+    free_array(af4);
+    free_array(af5);
+    free_array(ao3);
+    free_array(ao4);
+    free_array(ae1);
+    free_array(afl);
+    free_array(aol);
+    free_array(azl);
+    return 0;
+}
\ No newline at end of file
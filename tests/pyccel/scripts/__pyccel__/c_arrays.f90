@@ -0,0 +1,127 @@
+program prog_c_arrays
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T), allocatable :: ac0(:)
+integer(C_INT64_T), allocatable :: ac1(:)
+integer(C_INT64_T), allocatable :: ac2(:)
+integer(C_INT64_T), allocatable :: ac3(:)
+real(C_DOUBLE), allocatable :: af1(:)
+integer(C_INT64_T), allocatable :: af2(:,:)
+real(C_DOUBLE), allocatable :: af3(:,:)
+complex(C_DOUBLE_COMPLEX), allocatable :: af4(:,:)
+complex(C_DOUBLE_COMPLEX), allocatable :: af5(:)
+real(C_DOUBLE), allocatable :: ao3(:)
+real(C_DOUBLE), allocatable :: ao4(:,:)
+real(C_DOUBLE), allocatable :: ae1(:,:)
+real(C_DOUBLE), allocatable :: afl(:,:)
+complex(C_DOUBLE_COMPLEX), allocatable :: aol(:,:)
+real(C_DOUBLE), allocatable :: azl(:,:)
+integer(C_INT64_T) :: i
+integer(C_INT64_T) :: j
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!---------------------------- Array creation ---------------------------------
+allocate(ac0(0:1_C_INT64_T - 1_C_INT64_T))
+ac0 = [0_C_INT64_T]
+allocate(ac1(0:4_C_INT64_T - 1_C_INT64_T))
+ac1 = [0_C_INT64_T, 0_C_INT64_T, 0_C_INT64_T, 0_C_INT64_T]
+allocate(ac2(0:5_C_INT64_T - 1_C_INT64_T))
+ac2 = [1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T, 4_C_INT64_T, 5_C_INT64_T]
+allocate(ac3(0:5_C_INT64_T - 1_C_INT64_T))
+ac3 = [-1_C_INT64_T, -2_C_INT64_T, -3_C_INT64_T, -4_C_INT64_T, &
+      -5_C_INT64_T]
+print *, ac0(0_C_INT64_T)
+do i = 0_C_INT64_T, 4_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, ac1(i)
+end do
+print *
+do i = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, ac2(i)
+end do
+print *
+do i = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, ac3(i)
+end do
+print *
+!------------------------------- Array full ----------------------------------
+allocate(af1(0:5_C_INT64_T - 1_C_INT64_T))
+af1 = 2.0_C_DOUBLE
+do i = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, af1(i)
+end do
+print *
+allocate(af2(0:5_C_INT64_T - 1_C_INT64_T, 0:5_C_INT64_T - 1_C_INT64_T))
+af2 = 31254626_C_INT64_T
+do i = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, af2(j, i)
+  end do
+  print *
+end do
+allocate(af3(0:5_C_INT64_T - 1_C_INT64_T, 0:20_C_INT64_T - 1_C_INT64_T))
+af3 = Real(-1.58_C_DOUBLE, C_DOUBLE)
+do i = 0_C_INT64_T, 20_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, af3(j, i)
+  end do
+  print *
+end do
+allocate(af4(0:10_C_INT64_T - 1_C_INT64_T, 0:3_C_INT64_T - 1_C_INT64_T))
+af4 = (1.0_C_DOUBLE, 2.0_C_DOUBLE)
+do i = 0_C_INT64_T, 3_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 10_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, af4(j, i)
+  end do
+  print *
+end do
+allocate(af5(0:5_C_INT64_T - 1_C_INT64_T))
+af5 = (12.2_C_DOUBLE, 13.0_C_DOUBLE)
+do i = 0_C_INT64_T, 5_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, af5(i)
+end do
+print *
+!------------------------------ Array empty ----------------------------------
+allocate(ao3(0:10_C_INT64_T - 1_C_INT64_T))
+ao3 = 1.0_C_DOUBLE
+do i = 0_C_INT64_T, 10_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  print *, ao3(i)
+end do
+print *
+allocate(ao4(0:3_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+ao4 = 1.0_C_DOUBLE
+do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 3_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, ao4(j, i)
+  end do
+  print *
+end do
+allocate(ae1(0:3_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+allocate(afl(0:3_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+afl = 5.21_C_DOUBLE
+do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 3_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, afl(j, i)
+  end do
+  print *
+end do
+allocate(aol(0:10_C_INT64_T - 1_C_INT64_T, 0:3_C_INT64_T - 1_C_INT64_T))
+aol = (1.0_C_DOUBLE, 0.0_C_DOUBLE)
+do i = 0_C_INT64_T, 3_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 10_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, aol(j, i)
+  end do
+  print *
+end do
+allocate(azl(0:3_C_INT64_T - 1_C_INT64_T, 0:2_C_INT64_T - 1_C_INT64_T))
+azl = 0.0_C_DOUBLE
+do i = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 3_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    print *, azl(j, i)
+  end do
+  print *
+end do
+
+end program prog_c_arrays
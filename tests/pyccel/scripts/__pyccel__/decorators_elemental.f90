@@ -0,0 +1,23 @@
+module decorators_elemental
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+elemental  function square(x) result(s)
+
+implicit none
+
+real(C_DOUBLE) :: s
+real(C_DOUBLE), value :: x
+
+s = x * x
+return
+
+end function square
+!........................................
+
+end module decorators_elemental
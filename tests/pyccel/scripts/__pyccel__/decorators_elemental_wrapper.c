@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double square(double x);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *square_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double s;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d", kwlist, &x))
+    {
+        return NULL;
+    }
+    s = square(x);
+    result = Py_BuildValue("d", s);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef decorators_elemental_methods[] = {
+    {
+        "square",
+        (PyCFunction)(void (*)(void))square_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef decorators_elemental_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "decorators_elemental",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    decorators_elemental_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_decorators_elemental(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&decorators_elemental_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,109 @@
+module default_args_mod
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function f1(x) result(y)
+
+  implicit none
+
+  integer(C_INT64_T) :: y
+  integer(C_INT64_T), value :: x
+
+  y = x - 1_C_INT64_T
+  return
+
+end function f1
+!........................................
+
+!........................................
+subroutine f5(x, m1) 
+
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: x(0:)
+  integer(C_INT64_T), value :: m1
+  integer(C_INT64_T) :: i
+
+  x(:) = 0.0_C_DOUBLE
+  do i = 0_C_INT64_T, m1-1_C_INT64_T, 1_C_INT64_T
+    x(i) = i * 1.0_C_DOUBLE
+  end do
+
+end subroutine f5
+!........................................
+
+!........................................
+function f3(x, y) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0001 = x + y
+  return
+
+end function f3
+!........................................
+
+!........................................
+function is_nil_default_arg(a) result(c)
+
+  implicit none
+
+  logical(C_BOOL) :: c
+  logical(C_BOOL), value, optional :: a
+
+  c = .False._C_BOOL
+  if (.not. present(a)) then
+    c = .True._C_BOOL
+  end if
+  return
+
+end function is_nil_default_arg
+!........................................
+
+!........................................
+function recursivity(x, y, z) result(Out_0002)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0002
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  logical(C_BOOL), value, optional :: z
+  logical(C_BOOL) :: tmp
+
+  tmp = is_not_nil(z)
+  if (tmp) then
+    y = 2.5_C_DOUBLE
+  end if
+  Out_0002 = x + y
+  return
+
+  contains
+  function is_not_nil(z) result(c)
+
+    implicit none
+
+    logical(C_BOOL) :: c
+    logical(C_BOOL), value, optional :: z
+
+    c = .False._C_BOOL
+    if (present(z)) then
+      c = .True._C_BOOL
+    end if
+    return
+
+  end function is_not_nil
+
+end function recursivity
+!........................................
+
+end module default_args_mod
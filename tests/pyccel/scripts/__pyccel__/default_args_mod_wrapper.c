@@ -0,0 +1,394 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <cwrapper_cfi.h>
+#include <stdbool.h>
+
+int64_t f1(int64_t x);
+void f5(CFI_cdesc_t *x, int64_t m1);
+double f3(double x, double y);
+bool is_nil_default_arg(bool *a);
+double recursivity(double x, double y, bool *z);
+
+/*........................................*/
+
+/*........................................*/
+bool pybool_to_bool(PyObject *o)
+{
+    bool c;
+    c = o == Py_True;
+    return c;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *bool_to_pyobj(bool b)
+{
+    PyObject *o;
+    if ((b != 0))
+    {
+        o = Py_True;
+    }
+    else if (1)
+    {
+        o = Py_False;
+    }
+    return o;
+}
+/*........................................*/
+
+/*........................................*/
+
+/*........................................*/
+PyObject *f1_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t x;
+    int64_t y;
+    PyObject *x_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        NULL
+    };
+
+    x_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|O", kwlist, &x_tmp))
+    {
+        return NULL;
+    }
+    if (x_tmp == Py_None)
+    {
+        x = 1;
+    }
+    else if (!(PyArray_IsScalar(x_tmp, Int64) || PyLong_Check(x_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "x must be int");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(x_tmp))
+        {
+            PyArray_ScalarAsCtype(x_tmp, &x);
+        }
+        else if (1)
+        {
+            x = PyLong_AsLong(x_tmp);
+        }
+    }
+    y = f1(x);
+    result = Py_BuildValue("l", y);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *f5_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x;
+    int64_t m1;
+    t_cfi_desc x_desc;
+    PyArrayObject *x_tmp;
+    PyObject *m1_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "m1",
+        NULL
+    };
+
+    m1_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!|O", kwlist, &PyArray_Type, &x_tmp, &m1_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x = pyarray_to_cfi_desc(x_tmp, &x_desc, 0);
+    }
+    if (m1_tmp == Py_None)
+    {
+        m1 = 2;
+    }
+    else if (!(PyArray_IsScalar(m1_tmp, Int64) || PyLong_Check(m1_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "m1 must be int");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(m1_tmp))
+        {
+            PyArray_ScalarAsCtype(m1_tmp, &m1);
+        }
+        else if (1)
+        {
+            m1 = PyLong_AsLong(m1_tmp);
+        }
+    }
+    f5(x, m1);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *f3_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double y;
+    double Out_0001;
+    PyObject *x_tmp;
+    PyObject *y_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+
+    x_tmp = Py_None;
+    y_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|OO", kwlist, &x_tmp, &y_tmp))
+    {
+        return NULL;
+    }
+    if (x_tmp == Py_None)
+    {
+        x = 1.5;
+    }
+    else if (!(PyArray_IsScalar(x_tmp, Float64) || PyFloat_Check(x_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "x must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(x_tmp))
+        {
+            PyArray_ScalarAsCtype(x_tmp, &x);
+        }
+        else if (1)
+        {
+            x = PyFloat_AsDouble(x_tmp);
+        }
+    }
+    if (y_tmp == Py_None)
+    {
+        y = 2.5;
+    }
+    else if (!(PyArray_IsScalar(y_tmp, Float64) || PyFloat_Check(y_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "y must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(y_tmp))
+        {
+            PyArray_ScalarAsCtype(y_tmp, &y);
+        }
+        else if (1)
+        {
+            y = PyFloat_AsDouble(y_tmp);
+        }
+    }
+    Out_0001 = f3(x, y);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *is_nil_default_arg_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool *a;
+    bool c;
+    bool a_tmp_0001;
+    PyObject *a_tmp;
+    PyObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        NULL
+    };
+
+    a_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|O", kwlist, &a_tmp))
+    {
+        return NULL;
+    }
+    if (a_tmp == Py_None)
+    {
+        a = NULL;
+    }
+    else if (!(PyArray_IsScalar(a_tmp, Bool) || PyBool_Check(a_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "a must be bool");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(a_tmp))
+        {
+            PyArray_ScalarAsCtype(a_tmp, &a_tmp_0001);
+        }
+        else if (1)
+        {
+            a_tmp_0001 = pybool_to_bool(a_tmp);
+        }
+        a = &a_tmp_0001;
+    }
+    c = is_nil_default_arg(a);
+    c_tmp = bool_to_pyobj(c);
+    result = Py_BuildValue("O", c_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *recursivity_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double y;
+    bool *z;
+    double Out_0002;
+    PyObject *y_tmp;
+    bool z_tmp_0001;
+    PyObject *z_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "y",
+        "z",
+        NULL
+    };
+
+    y_tmp = Py_None;
+    z_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d|OO", kwlist, &x, &y_tmp, &z_tmp))
+    {
+        return NULL;
+    }
+    if (y_tmp == Py_None)
+    {
+        y = 0.0;
+    }
+    else if (!(PyArray_IsScalar(y_tmp, Float64) || PyFloat_Check(y_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "y must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(y_tmp))
+        {
+            PyArray_ScalarAsCtype(y_tmp, &y);
+        }
+        else if (1)
+        {
+            y = PyFloat_AsDouble(y_tmp);
+        }
+    }
+    if (z_tmp == Py_None)
+    {
+        z = NULL;
+    }
+    else if (!(PyArray_IsScalar(z_tmp, Bool) || PyBool_Check(z_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "z must be bool");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(z_tmp))
+        {
+            PyArray_ScalarAsCtype(z_tmp, &z_tmp_0001);
+        }
+        else if (1)
+        {
+            z_tmp_0001 = pybool_to_bool(z_tmp);
+        }
+        z = &z_tmp_0001;
+    }
+    Out_0002 = recursivity(x, y, z);
+    result = Py_BuildValue("d", Out_0002);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef default_args_mod_methods[] = {
+    {
+        "f1",
+        (PyCFunction)(void (*)(void))f1_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "f5",
+        (PyCFunction)(void (*)(void))f5_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "f3",
+        (PyCFunction)(void (*)(void))f3_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "is_nil_default_arg",
+        (PyCFunction)(void (*)(void))is_nil_default_arg_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "recursivity",
+        (PyCFunction)(void (*)(void))recursivity_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef default_args_mod_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "default_args_mod",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    default_args_mod_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_default_args_mod(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&default_args_mod_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,172 @@
+#include <complex.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdio.h>
+#include <math.h>
+#include <stdint.h>
+int main()
+{
+    double a1;
+    double complex a2;
+    int64_t a3;
+    double a4;
+    double a5;
+    int64_t a6;
+    double a7;
+    double a8;
+    double a9;
+    double complex a10;
+    int64_t b1;
+    double complex b2;
+    double complex b3;
+    int64_t b4;
+    int64_t c1;
+    double c2;
+    double complex c3;
+    double complex c4;
+    double complex c5;
+    double c6;
+    double c7;
+    double c8;
+    int64_t d1;
+    double d2;
+    double d3;
+    int64_t d4;
+    double f1;
+    double f2;
+    int64_t f3;
+    int64_t f4;
+    double f5;
+    double f6;
+    int64_t f7;
+    int64_t f8;
+    int64_t f9;
+    int64_t f10;
+    int64_t f11;
+    double complex f12;
+    double e1;
+    double e2;
+    double e3;
+    int64_t e4;
+    double e5;
+    int64_t x;
+    int64_t y;
+    bool g1;
+    bool g2;
+    bool g3;
+    bool g4;
+    bool g5;
+    bool g6;
+    bool g7;
+    bool g8;
+    bool g9;
+
+    /*pylint: disable=missing-function-docstring, missing-module-docstring/*/
+    a1 = 2.0 / 2.0;
+    a2 = 2 / (2.0 * _Complex_I);
+    a3 = (int64_t)floor(2.0 / 2.0);
+    a4 = floor(2.0 / 2);
+    a5 = floor(2 / 4.0);
+    a6 = 2 % 4;
+    a7 = fmod(2.0, 4.0);
+    a8 = fmod(2.0, 4.0);
+    a9 = 1.0 * 10;
+    a10 = 1.0 * (10.0 * _Complex_I);
+    b1 = 1 - 1 - 2 - 4 - 5;
+    b2 = 1 - 1 - (2.0 * _Complex_I) - 4.0 - 5;
+    b3 = 1 - 1 - (2.0 * _Complex_I) - 5;
+    b4 = 1 - (1 - 1);
+    c1 = (int64_t)pow(2.0, 2.0);
+    c2 = pow(2.0, 2.0);
+    c3 = cpow((2.0 + 0.0 * _Complex_I), (2.0 * _Complex_I));
+    c4 = cpow((2.0 * _Complex_I), (3.0 + 0.0 * _Complex_I));
+    c5 = cpow((2.0 * _Complex_I), (4.0 + 0.0 * _Complex_I));
+    c6 = pow(2.0, (double)((-4)));
+    c7 = -pow(2.0, 4.0);
+    c8 = -pow(0.2, (-0.4));
+    d1 = 1 - 1 - 2 - 4 * 3 + 7 - 5;
+    d2 = 1 - 1 - pow(2.0, 2.0) - 4 * 3 + 7 - 5;
+    d3 = 3 * (1 + (int64_t)floor(4.0 / 2.0) * 3.0 - 3.0);
+    d4 = (int64_t)pow((double)((2 * 2)), (double)((3 * 4)));
+    f1 = 100.0 / 10.0 / 10 / 2;
+    f2 = 100.0 / (double)((-10)) / 10 / (-2);
+    f3 = (int64_t)floor((double)((int64_t)floor((double)((int64_t)floor(100.0 / 4.0)) / 5.0)) / 2.0);
+    f4 = (int64_t)floor((double)((int64_t)floor((double)((int64_t)floor(100.0 / (double)((-4)))) / 5.0)) / (double)((-2)));
+    f5 = floor(floor(floor(100.0 / 4) / 5) / 2);
+    f6 = fmod((double)(23 % 24 % 24), 24.0);
+    f7 = 23 % 24 % 24 % 24;
+    f8 = 1 - 2 + (-2) - 4 - 5;
+    f9 = 2 * 2 * (-2) * (-2) * 3 * 2;
+    f10 = (+(+2)) - (+2) - (-2);
+    f11 = (int64_t)pow(2.0, (double)(((int64_t)pow(3.0, 2.0))));
+    f12 = cpow((2.0 + 0.0 * _Complex_I), (cpow((3.0 * _Complex_I), (2.0 + 0.0 * _Complex_I))));
+    e1 = -(a1 + a3);
+    e2 = fmod(floor(fmod((double)(23 * 4), 16.032) / 16.4 / 2.0) / 2, 3.0) + 34 + fmod((double)(23 * 23 * 4), 16.0) + fmod(floor(32 / 16.4 / 2.0) / 2, 3.0);
+    e3 = floor((double)(1 % (int64_t)pow(1.0, 4.0)) / (double)((int64_t)pow(23.0, 2.0)) / 6 / 2.0);
+    e4 = 2 * 4 + (int64_t)pow(3.0, 4.0) - (int64_t)floor((double)(3 * (int64_t)pow(5.0, 3.0)) / 2.0);
+    e5 = pow((floor(fmod(1.0, 16.032) / 16.032 / 25.9948) + 25.9948 * 25.99 - (25.9 - fmod(floor(33.74 / 33.746134), 33.7461396538443) - fmod(33.7464, 36.1389956224258)) - fmod(36.1389956224258 * (36.1389 - fmod(fmod(36.138 * 6.133, pow(6.1332, 6.1332)), 6.1332)), pow((11.57607 + 11.5747 * 11.576 - 11.57609 - 22.9 + floor(floor((int64_t)floor(100.0 / 6.0) / 2.0) / 3)), 0.5))), (3.0 / 4.0 + (int64_t)floor(3.0 / 2.0)));
+    x = 10;
+    y = 4;
+    g1 = (x == 10 || y == 10) && (x == 20 || y == 20);
+    g2 = 1 || (1 && 0);
+    g3 = !1 || (1 && 0);
+    g4 = !(1 || (1 && 0));
+    g5 = (1 && 1) || 0;
+    g6 = x == 1 || y == 3 || x == 7 || y == 4;
+    g7 = x == 10 && y == 4 && x == 7;
+    g8 = (1 && 1) || (0 && 0);
+    g9 = 0 || (1 && 0) || 1;
+    printf("%.12lf\n", a1);
+    printf("(%.12lf + %.12lfj)\n", creal(a2), cimag(a2));
+    printf("%ld\n", a3);
+    printf("%.12lf\n", a4);
+    printf("%.12lf\n", a5);
+    printf("%ld\n", a6);
+    printf("%.12lf\n", a7);
+    printf("%.12lf\n", a8);
+    printf("%.12lf\n", a9);
+    printf("(%.12lf + %.12lfj)\n", creal(a10), cimag(a10));
+    printf("%ld\n", b1);
+    printf("(%.12lf + %.12lfj)\n", creal(b2), cimag(b2));
+    printf("(%.12lf + %.12lfj)\n", creal(b3), cimag(b3));
+    printf("%ld\n", b4);
+    printf("%ld\n", c1);
+    printf("%.12lf\n", c2);
+    printf("(%.12lf + %.12lfj)\n", creal(c3), cimag(c3));
+    printf("(%.12lf + %.12lfj)\n", creal(c4), cimag(c4));
+    printf("(%.12lf + %.12lfj)\n", creal(c5), cimag(c5));
+    printf("%.12lf\n", c6);
+    printf("%.12lf\n", c7);
+    printf("%.12lf\n", c8);
+    printf("%ld\n", d1);
+    printf("%.12lf\n", d2);
+    printf("%.12lf\n", d3);
+    printf("%ld\n", d4);
+    printf("%.12lf\n", e1);
+    printf("%.12lf\n", e2);
+    printf("%.12lf\n", e3);
+    printf("%ld\n", e4);
+    printf("%.12lf\n", e5);
+    printf("%.12lf\n", f1);
+    printf("%.12lf\n", f2);
+    printf("%ld\n", f3);
+    printf("%ld\n", f4);
+    printf("%.12lf\n", f5);
+    printf("%.12lf\n", f6);
+    printf("%ld\n", f7);
+    printf("%ld\n", f8);
+    printf("%ld\n", f9);
+    printf("%ld\n", f10);
+    printf("%ld\n", f11);
+    printf("(%.12lf + %.12lfj)\n", creal(f12), cimag(f12));
+    printf("%s\n", g1 ? "True" : "False");
+    printf("%s\n", g2 ? "True" : "False");
+    printf("%s\n", g3 ? "True" : "False");
+    printf("%s\n", g4 ? "True" : "False");
+    printf("%s\n", g5 ? "True" : "False");
+    printf("%s\n", g6 ? "True" : "False");
+    printf("%s\n", g7 ? "True" : "False");
+    printf("%s\n", g8 ? "True" : "False");
+    printf("%s\n", g9 ? "True" : "False");
+    return 0;
+}
\ No newline at end of file
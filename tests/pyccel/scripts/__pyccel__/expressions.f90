@@ -0,0 +1,210 @@
+program prog_expressions
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE) :: a1
+complex(C_DOUBLE_COMPLEX) :: a2
+integer(C_INT64_T) :: a3
+real(C_DOUBLE) :: a4
+real(C_DOUBLE) :: a5
+integer(C_INT64_T) :: a6
+real(C_DOUBLE) :: a7
+real(C_DOUBLE) :: a8
+real(C_DOUBLE) :: a9
+complex(C_DOUBLE_COMPLEX) :: a10
+integer(C_INT64_T) :: b1
+complex(C_DOUBLE_COMPLEX) :: b2
+complex(C_DOUBLE_COMPLEX) :: b3
+integer(C_INT64_T) :: b4
+integer(C_INT64_T) :: c1
+real(C_DOUBLE) :: c2
+complex(C_DOUBLE_COMPLEX) :: c3
+complex(C_DOUBLE_COMPLEX) :: c4
+complex(C_DOUBLE_COMPLEX) :: c5
+real(C_DOUBLE) :: c6
+real(C_DOUBLE) :: c7
+real(C_DOUBLE) :: c8
+integer(C_INT64_T) :: d1
+real(C_DOUBLE) :: d2
+real(C_DOUBLE) :: d3
+integer(C_INT64_T) :: d4
+real(C_DOUBLE) :: f1
+real(C_DOUBLE) :: f2
+integer(C_INT64_T) :: f3
+integer(C_INT64_T) :: f4
+real(C_DOUBLE) :: f5
+real(C_DOUBLE) :: f6
+integer(C_INT64_T) :: f7
+integer(C_INT64_T) :: f8
+integer(C_INT64_T) :: f9
+integer(C_INT64_T) :: f10
+integer(C_INT64_T) :: f11
+complex(C_DOUBLE_COMPLEX) :: f12
+real(C_DOUBLE) :: e1
+real(C_DOUBLE) :: e2
+real(C_DOUBLE) :: e3
+integer(C_INT64_T) :: e4
+real(C_DOUBLE) :: e5
+integer(C_INT64_T) :: x
+integer(C_INT64_T) :: y
+logical(C_BOOL) :: g1
+logical(C_BOOL) :: g2
+logical(C_BOOL) :: g3
+logical(C_BOOL) :: g4
+logical(C_BOOL) :: g5
+logical(C_BOOL) :: g6
+logical(C_BOOL) :: g7
+logical(C_BOOL) :: g8
+logical(C_BOOL) :: g9
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+a1 = 2.0_C_DOUBLE / 2.0_C_DOUBLE
+a2 = 2_C_INT64_T / (0.0_C_DOUBLE, 2.0_C_DOUBLE)
+a3 = FLOOR(2_C_INT64_T/2.0_C_DOUBLE,C_INT64_T)
+a4 = real(FLOOR(2.0_C_DOUBLE/2_C_INT64_T,C_INT64_T), C_DOUBLE)
+a5 = real(FLOOR(2_C_INT64_T/4.0_C_DOUBLE,C_INT64_T), C_DOUBLE)
+a6 = MODULO(2_C_INT64_T,4_C_INT64_T)
+a7 = MODULO(2.0_C_DOUBLE,4.0_C_DOUBLE)
+a8 = MODULO(2.0_C_DOUBLE,4.0_C_DOUBLE)
+a9 = 1.0_C_DOUBLE * 10_C_INT64_T
+a10 = 1.0_C_DOUBLE * (0.0_C_DOUBLE, 10.0_C_DOUBLE)
+b1 = 1_C_INT64_T - 1_C_INT64_T - 2_C_INT64_T - 4_C_INT64_T - 5_C_INT64_T
+b2 = 1_C_INT64_T - 1_C_INT64_T - (0.0_C_DOUBLE, 2.0_C_DOUBLE) - &
+      4.0_C_DOUBLE - 5_C_INT64_T
+b3 = 1_C_INT64_T - 1_C_INT64_T - (0.0_C_DOUBLE, 2.0_C_DOUBLE) - &
+      5_C_INT64_T
+b4 = 1_C_INT64_T - (1_C_INT64_T - 1_C_INT64_T)
+c1 = 2_C_INT64_T ** 2_C_INT64_T
+c2 = 2_C_INT64_T ** 2.0_C_DOUBLE
+c3 = 2_C_INT64_T ** (0.0_C_DOUBLE, 2.0_C_DOUBLE)
+c4 = (0.0_C_DOUBLE, 2.0_C_DOUBLE) ** 3_C_INT64_T
+c5 = (0.0_C_DOUBLE, 2.0_C_DOUBLE) ** 4.0_C_DOUBLE
+c6 = 2.0_C_DOUBLE ** (-4_C_INT64_T)
+c7 = -2.0_C_DOUBLE ** 4_C_INT64_T
+c8 = -0.2_C_DOUBLE ** (-0.4_C_DOUBLE)
+d1 = 1_C_INT64_T - 1_C_INT64_T - 2_C_INT64_T - 4_C_INT64_T * 3_C_INT64_T &
+      + 7_C_INT64_T - 5_C_INT64_T
+d2 = 1_C_INT64_T - 1_C_INT64_T - 2_C_INT64_T ** 2.0_C_DOUBLE - &
+      4_C_INT64_T * 3_C_INT64_T + 7_C_INT64_T - 5_C_INT64_T
+d3 = 3_C_INT64_T * (1_C_INT64_T + FLOOR(4_C_INT64_T/2.0_C_DOUBLE, &
+      C_INT64_T) * 3.0_C_DOUBLE - 3.0_C_DOUBLE)
+d4 = (2_C_INT64_T * 2_C_INT64_T) ** (3_C_INT64_T * 4_C_INT64_T)
+f1 = 100.0_C_DOUBLE / 10.0_C_DOUBLE / 10_C_INT64_T / 2_C_INT64_T
+f2 = 100.0_C_DOUBLE / Real((-10_C_INT64_T), C_DOUBLE) / 10_C_INT64_T / ( &
+      -2_C_INT64_T)
+f3 = FLOOR(FLOOR(FLOOR(100_C_INT64_T/4.0_C_DOUBLE,C_INT64_T)/ &
+      5.0_C_DOUBLE,C_INT64_T)/2.0_C_DOUBLE,C_INT64_T)
+f4 = FLOOR(FLOOR(FLOOR(100_C_INT64_T/Real((-4_C_INT64_T), C_DOUBLE), &
+      C_INT64_T)/5.0_C_DOUBLE,C_INT64_T)/Real((-2_C_INT64_T), C_DOUBLE) &
+      ,C_INT64_T)
+f5 = real(FLOOR(real(FLOOR(real(FLOOR(100.0_C_DOUBLE/4_C_INT64_T, &
+      C_INT64_T), C_DOUBLE)/5_C_INT64_T,C_INT64_T), C_DOUBLE)/ &
+      2_C_INT64_T,C_INT64_T), C_DOUBLE)
+f6 = MODULO(Real(MODULO(MODULO(23_C_INT64_T,24_C_INT64_T),24_C_INT64_T), &
+      C_DOUBLE),24.0_C_DOUBLE)
+f7 = MODULO(MODULO(MODULO(23_C_INT64_T,24_C_INT64_T),24_C_INT64_T), &
+      24_C_INT64_T)
+f8 = 1_C_INT64_T - 2_C_INT64_T + (-2_C_INT64_T) - 4_C_INT64_T - &
+      5_C_INT64_T
+f9 = 2_C_INT64_T * 2_C_INT64_T * (-2_C_INT64_T) * (-2_C_INT64_T) * &
+      3_C_INT64_T * 2_C_INT64_T
+f10 = (+(+2_C_INT64_T)) - (+2_C_INT64_T) - (-2_C_INT64_T)
+f11 = 2_C_INT64_T ** (3_C_INT64_T ** 2_C_INT64_T)
+f12 = 2_C_INT64_T ** ((0.0_C_DOUBLE, 3.0_C_DOUBLE) ** 2_C_INT64_T)
+e1 = -(a1 + a3)
+e2 = MODULO(real(FLOOR(MODULO(Real(23_C_INT64_T * 4_C_INT64_T, C_DOUBLE) &
+      ,16.032_C_DOUBLE) / 16.4_C_DOUBLE/2.0_C_DOUBLE,C_INT64_T), &
+      C_DOUBLE) / 2_C_INT64_T,3.0_C_DOUBLE) + 34_C_INT64_T + MODULO( &
+      Real(23_C_INT64_T * 23_C_INT64_T * 4_C_INT64_T, C_DOUBLE), &
+      16.0_C_DOUBLE) + MODULO(real(FLOOR(32_C_INT64_T / 16.4_C_DOUBLE/ &
+      2.0_C_DOUBLE,C_INT64_T), C_DOUBLE) / 2_C_INT64_T,3.0_C_DOUBLE)
+e3 = real(FLOOR(Real(MODULO(1_C_INT64_T,1_C_INT64_T ** 4_C_INT64_T), &
+      C_DOUBLE) / Real(23_C_INT64_T ** 2_C_INT64_T, C_DOUBLE) / &
+      6_C_INT64_T/2.0_C_DOUBLE,C_INT64_T), C_DOUBLE)
+e4 = 2_C_INT64_T * 4_C_INT64_T + 3_C_INT64_T ** 4_C_INT64_T - FLOOR( &
+      3_C_INT64_T * 5_C_INT64_T ** 3_C_INT64_T/2.0_C_DOUBLE,C_INT64_T)
+e5 = (real(FLOOR(MODULO(1.0_C_DOUBLE,16.032_C_DOUBLE) / 16.032_C_DOUBLE/ &
+      25.9948_C_DOUBLE,C_INT64_T), C_DOUBLE) + 25.9948_C_DOUBLE * &
+      25.99_C_DOUBLE - (25.9_C_DOUBLE - MODULO(real(FLOOR( &
+      33.74_C_DOUBLE/33.746134_C_DOUBLE,C_INT64_T), C_DOUBLE), &
+      33.7461396538443_C_DOUBLE) - MODULO(33.7464_C_DOUBLE, &
+      36.1389956224258_C_DOUBLE)) - MODULO(36.1389956224258_C_DOUBLE * &
+      (36.1389_C_DOUBLE - MODULO(MODULO(36.138_C_DOUBLE * &
+      6.133_C_DOUBLE,6.1332_C_DOUBLE ** 6.1332_C_DOUBLE), &
+      6.1332_C_DOUBLE)),(11.57607_C_DOUBLE + 11.5747_C_DOUBLE * &
+      11.576_C_DOUBLE - 11.57609_C_DOUBLE - 22.9_C_DOUBLE + real(FLOOR( &
+      real(FLOOR(FLOOR(100_C_INT64_T/6.0_C_DOUBLE,C_INT64_T)/ &
+      2.0_C_DOUBLE,C_INT64_T), C_DOUBLE)/3_C_INT64_T,C_INT64_T), &
+      C_DOUBLE)) ** 0.5_C_DOUBLE)) ** (3.0_C_DOUBLE / 4.0_C_DOUBLE + &
+      FLOOR(3_C_INT64_T/2.0_C_DOUBLE,C_INT64_T))
+x = 10_C_INT64_T
+y = 4_C_INT64_T
+g1 = (x == 10_C_INT64_T .or. y == 10_C_INT64_T) .and. (x == 20_C_INT64_T &
+      .or. y == 20_C_INT64_T)
+g2 = .True._C_BOOL .or. (.True._C_BOOL .and. .False._C_BOOL)
+g3 = .not. .True._C_BOOL .or. (.True._C_BOOL .and. .False._C_BOOL)
+g4 = .not. (.True._C_BOOL .or. (.True._C_BOOL .and. .False._C_BOOL))
+g5 = (.True._C_BOOL .and. .True._C_BOOL) .or. .False._C_BOOL
+g6 = x == 1_C_INT64_T .or. y == 3_C_INT64_T .or. x == 7_C_INT64_T .or. y &
+      == 4_C_INT64_T
+g7 = x == 10_C_INT64_T .and. y == 4_C_INT64_T .and. x == 7_C_INT64_T
+g8 = (.True._C_BOOL .and. .True._C_BOOL) .or. (.False._C_BOOL .and. &
+      .False._C_BOOL)
+g9 = .False._C_BOOL .or. (.True._C_BOOL .and. .False._C_BOOL) .or. &
+      .True._C_BOOL
+print *, a1
+print *, a2
+print *, a3
+print *, a4
+print *, a5
+print *, a6
+print *, a7
+print *, a8
+print *, a9
+print *, a10
+print *, b1
+print *, b2
+print *, b3
+print *, b4
+print *, c1
+print *, c2
+print *, c3
+print *, c4
+print *, c5
+print *, c6
+print *, c7
+print *, c8
+print *, d1
+print *, d2
+print *, d3
+print *, d4
+print *, e1
+print *, e2
+print *, e3
+print *, e4
+print *, e5
+print *, f1
+print *, f2
+print *, f3
+print *, f4
+print *, f5
+print *, f6
+print *, f7
+print *, f8
+print *, f9
+print *, f10
+print *, f11
+print *, f12
+print *, g1
+print *, g2
+print *, g3
+print *, g4
+print *, g5
+print *, g6
+print *, g7
+print *, g8
+print *, g9
+
+end program prog_expressions
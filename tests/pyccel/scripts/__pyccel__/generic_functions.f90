@@ -0,0 +1,996 @@
+module generic_functions
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+interface gen_2
+  module procedure gen_2_00
+  module procedure gen_2_01
+end interface
+
+interface gen_3
+  module procedure gen_3_00
+  module procedure gen_3_01
+end interface
+
+interface gen_4
+  module procedure gen_4_00
+  module procedure gen_4_01
+end interface
+
+interface gen_5
+  module procedure gen_5_00
+  module procedure gen_5_01
+  module procedure gen_5_02
+  module procedure gen_5_03
+end interface
+
+interface gen_6
+  module procedure gen_6_00
+  module procedure gen_6_01
+end interface
+
+interface gen_7
+  module procedure gen_7_00
+  module procedure gen_7_01
+  module procedure gen_7_02
+  module procedure gen_7_03
+end interface
+
+interface multi_heads_1
+  module procedure multi_heads_1_00
+  module procedure multi_heads_1_01
+end interface
+
+interface tmplt_1
+  module procedure tmplt_1_00
+  module procedure tmplt_1_01
+end interface
+
+interface multi_tmplt_1
+  module procedure multi_tmplt_1_00
+  module procedure multi_tmplt_1_01
+  module procedure multi_tmplt_1_02
+  module procedure multi_tmplt_1_03
+end interface
+
+interface tmplt_head_1
+  module procedure tmplt_head_1_00
+  module procedure tmplt_head_1_01
+  module procedure tmplt_head_1_02
+end interface
+
+interface local_overide_1
+  module procedure local_overide_1_00
+  module procedure local_overide_1_01
+end interface
+
+interface tmplt_tmplt_1
+  module procedure tmplt_tmplt_1_00
+  module procedure tmplt_tmplt_1_01
+  module procedure tmplt_tmplt_1_02
+  module procedure tmplt_tmplt_1_03
+end interface
+
+interface array_elem1
+  module procedure array_elem1_00
+  module procedure array_elem1_01
+end interface
+
+interface multi_tmplt_2
+  module procedure multi_tmplt_2_00
+  module procedure multi_tmplt_2_01
+end interface
+
+contains
+
+!........................................
+function gen_1(a) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: a
+
+  Out_0001 = a * 10_C_INT64_T
+  return
+
+end function gen_1
+!........................................
+
+!........................................
+function gen_2_00(y, x) result(Out_0002)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0002
+  real(C_DOUBLE), value :: y
+  integer(C_INT64_T), value :: x
+
+  Out_0002 = y * x
+  return
+
+end function gen_2_00
+!........................................
+
+!........................................
+function gen_2_01(y, x) result(Out_0002)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0002
+  integer(C_INT64_T), value :: y
+  real(C_DOUBLE), value :: x
+
+  Out_0002 = y * x
+  return
+
+end function gen_2_01
+!........................................
+
+!........................................
+function gen_3_00(x, y) result(Out_0003)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0003
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0003 = x - y
+  return
+
+end function gen_3_00
+!........................................
+
+!........................................
+function gen_3_01(x, y) result(Out_0003)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0003
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0003 = x - y
+  return
+
+end function gen_3_01
+!........................................
+
+!........................................
+function gen_4_00(x, y) result(Out_0004)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0004
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0004 = x + y
+  return
+
+end function gen_4_00
+!........................................
+
+!........................................
+function gen_4_01(x, y) result(Out_0004)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0004
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0004 = x + y
+  return
+
+end function gen_4_01
+!........................................
+
+!........................................
+function gen_5_00(x, y) result(Out_0005)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0005
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0005 = x + y
+  return
+
+end function gen_5_00
+!........................................
+
+!........................................
+function gen_5_01(x, y) result(Out_0005)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0005
+  integer(C_INT64_T), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0005 = x + y
+  return
+
+end function gen_5_01
+!........................................
+
+!........................................
+function gen_5_02(x, y) result(Out_0005)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0005
+  real(C_DOUBLE), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0005 = x + y
+  return
+
+end function gen_5_02
+!........................................
+
+!........................................
+function gen_5_03(x, y) result(Out_0005)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0005
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0005 = x + y
+  return
+
+end function gen_5_03
+!........................................
+
+!........................................
+function gen_6_00(x, y) result(Out_0006)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0006
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0006 = x + y
+  return
+
+end function gen_6_00
+!........................................
+
+!........................................
+function gen_6_01(x, y) result(Out_0006)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0006
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0006 = x + y
+  return
+
+end function gen_6_01
+!........................................
+
+!........................................
+function gen_7_00(x, y, z) result(Out_0007)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0007
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0007 = x + y + z
+  return
+
+end function gen_7_00
+!........................................
+
+!........................................
+function gen_7_01(x, y, z) result(Out_0007)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0007
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0007 = x + y + z
+  return
+
+end function gen_7_01
+!........................................
+
+!........................................
+function gen_7_02(x, y, z) result(Out_0007)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0007
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0007 = x + y + z
+  return
+
+end function gen_7_02
+!........................................
+
+!........................................
+function gen_7_03(x, y, z) result(Out_0007)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0007
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0007 = x + y + z
+  return
+
+end function gen_7_03
+!........................................
+
+!........................................
+function multi_heads_1_00(x, y) result(Out_0008)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0008
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0008 = x + y
+  return
+
+end function multi_heads_1_00
+!........................................
+
+!........................................
+function multi_heads_1_01(x, y) result(Out_0008)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0008
+  integer(C_INT64_T), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0008 = x + y
+  return
+
+end function multi_heads_1_01
+!........................................
+
+!........................................
+function tmplt_1_00(x, y) result(Out_0009)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0009
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0009 = x + y
+  return
+
+end function tmplt_1_00
+!........................................
+
+!........................................
+function tmplt_1_01(x, y) result(Out_0009)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0009
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0009 = x + y
+  return
+
+end function tmplt_1_01
+!........................................
+
+!........................................
+function multi_tmplt_1_00(x, y, z) result(Out_0010)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0010
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0010 = x + y + z
+  return
+
+end function multi_tmplt_1_00
+!........................................
+
+!........................................
+function multi_tmplt_1_01(x, y, z) result(Out_0010)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0010
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0010 = x + y + z
+  return
+
+end function multi_tmplt_1_01
+!........................................
+
+!........................................
+function multi_tmplt_1_02(x, y, z) result(Out_0010)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0010
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0010 = x + y + z
+  return
+
+end function multi_tmplt_1_02
+!........................................
+
+!........................................
+function multi_tmplt_1_03(x, y, z) result(Out_0010)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0010
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0010 = x + y + z
+  return
+
+end function multi_tmplt_1_03
+!........................................
+
+!........................................
+function tmplt_head_1_00(x, y) result(Out_0011)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0011
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0011 = x + y
+  return
+
+end function tmplt_head_1_00
+!........................................
+
+!........................................
+function tmplt_head_1_01(x, y) result(Out_0011)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0011
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0011 = x + y
+  return
+
+end function tmplt_head_1_01
+!........................................
+
+!........................................
+function tmplt_head_1_02(x, y) result(Out_0011)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0011
+  integer(C_INT64_T), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0011 = x + y
+  return
+
+end function tmplt_head_1_02
+!........................................
+
+!........................................
+function local_overide_1_00(x, y) result(Out_0012)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0012
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+
+  Out_0012 = x + y
+  return
+
+end function local_overide_1_00
+!........................................
+
+!........................................
+function local_overide_1_01(x, y) result(Out_0012)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0012
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+
+  Out_0012 = x + y
+  return
+
+end function local_overide_1_01
+!........................................
+
+!........................................
+function tmplt_tmplt_1_00(x, y, z) result(Out_0013)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0013
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0013 = x + y + z
+  return
+
+end function tmplt_tmplt_1_00
+!........................................
+
+!........................................
+function tmplt_tmplt_1_01(x, y, z) result(Out_0013)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0013
+  integer(C_INT64_T), value :: x
+  integer(C_INT64_T), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0013 = x + y + z
+  return
+
+end function tmplt_tmplt_1_01
+!........................................
+
+!........................................
+function tmplt_tmplt_1_02(x, y, z) result(Out_0013)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0013
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0013 = x + y + z
+  return
+
+end function tmplt_tmplt_1_02
+!........................................
+
+!........................................
+function tmplt_tmplt_1_03(x, y, z) result(Out_0013)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0013
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0013 = x + y + z
+  return
+
+end function tmplt_tmplt_1_03
+!........................................
+
+!........................................
+function array_elem1_00(x) result(Out_0014)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0014
+  integer(C_INT64_T), intent(in) :: x(0:)
+
+  Out_0014 = x(0_C_INT64_T)
+  return
+
+end function array_elem1_00
+!........................................
+
+!........................................
+function array_elem1_01(x) result(Out_0014)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0014
+  real(C_DOUBLE), intent(in) :: x(0:)
+
+  Out_0014 = x(0_C_INT64_T)
+  return
+
+end function array_elem1_01
+!........................................
+
+!........................................
+function multi_tmplt_2_00(y, z) result(Out_0015)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0015
+  integer(C_INT64_T), value :: y
+  integer(C_INT64_T), value :: z
+
+  Out_0015 = y + z
+  return
+
+end function multi_tmplt_2_00
+!........................................
+
+!........................................
+function multi_tmplt_2_01(y, z) result(Out_0015)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0015
+  integer(C_INT64_T), value :: y
+  real(C_DOUBLE), value :: z
+
+  Out_0015 = y + z
+  return
+
+end function multi_tmplt_2_01
+!........................................
+
+!........................................
+function dup_types_1(a) result(Out_0016)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0016
+  integer(C_INT64_T), value :: a
+
+  Out_0016 = a
+  return
+
+end function dup_types_1
+!........................................
+
+!........................................
+function dup_types_2(a) result(Out_0017)
+
+  implicit none
+
+  integer(C_INT64_T) :: Out_0017
+  integer(C_INT64_T), value :: a
+
+  Out_0017 = a
+  return
+
+end function dup_types_2
+!........................................
+
+!........................................
+function tst_gen_1() result(x)
+
+  implicit none
+
+  real(C_DOUBLE) :: x
+
+  x = gen_1(5.5_C_DOUBLE)
+  return
+
+end function tst_gen_1
+!........................................
+
+!........................................
+function tst_gen_2() result(Out_0018)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0018
+  real(C_DOUBLE) :: x
+  real(C_DOUBLE) :: y
+
+  x = gen_2(5.5_C_DOUBLE, 5_C_INT64_T)
+  y = gen_2(5_C_INT64_T, 5.5_C_DOUBLE)
+  Out_0018 = x + y
+  return
+
+end function tst_gen_2
+!........................................
+
+!........................................
+function tst_gen_3() result(Out_0019)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0019
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+
+  x = gen_3(5_C_INT64_T, 5_C_INT64_T)
+  y = gen_3(5.5_C_DOUBLE, 5.5_C_DOUBLE)
+  Out_0019 = x + y
+  return
+
+end function tst_gen_3
+!........................................
+
+!........................................
+function tst_gen_4() result(Out_0020)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0020
+  real(C_DOUBLE) :: x
+  integer(C_INT64_T) :: y
+
+  x = gen_4(5.5_C_DOUBLE, 5.5_C_DOUBLE)
+  y = gen_4(5_C_INT64_T, 5_C_INT64_T)
+  Out_0020 = x + y
+  return
+
+end function tst_gen_4
+!........................................
+
+!........................................
+function tst_gen_5() result(Out_0021)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0021
+  real(C_DOUBLE) :: x
+  integer(C_INT64_T) :: y
+  real(C_DOUBLE) :: z
+  real(C_DOUBLE) :: a
+
+  x = gen_5(5.5_C_DOUBLE, 5.5_C_DOUBLE)
+  y = gen_5(5_C_INT64_T, 5_C_INT64_T)
+  z = gen_5(5.5_C_DOUBLE, 5_C_INT64_T)
+  a = gen_5(5_C_INT64_T, 6.6_C_DOUBLE)
+  Out_0021 = x * a * y * z
+  return
+
+end function tst_gen_5
+!........................................
+
+!........................................
+function tst_gen_6() result(Out_0022)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0022
+  real(C_DOUBLE) :: x
+  integer(C_INT64_T) :: y
+
+  x = gen_6(5.5_C_DOUBLE, 5.5_C_DOUBLE)
+  y = gen_6(5_C_INT64_T, 5_C_INT64_T)
+  Out_0022 = x * y
+  return
+
+end function tst_gen_6
+!........................................
+
+!........................................
+function tst_gen_7() result(Out_0023)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0023
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+  real(C_DOUBLE) :: z
+  real(C_DOUBLE) :: a
+
+  x = gen_7(5_C_INT64_T, 5_C_INT64_T, 7_C_INT64_T)
+  y = gen_7(5_C_INT64_T, 5_C_INT64_T, 7.3_C_DOUBLE)
+  z = gen_7(4.5_C_DOUBLE, 4.5_C_DOUBLE, 8_C_INT64_T)
+  a = gen_7(7.5_C_DOUBLE, 3.5_C_DOUBLE, 7.7_C_DOUBLE)
+  Out_0023 = x * a * y * z
+  return
+
+end function tst_gen_7
+!........................................
+
+!........................................
+function tst_multi_heads_1() result(Out_0024)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0024
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+
+  x = multi_heads_1(5_C_INT64_T, 5_C_INT64_T)
+  y = multi_heads_1(5_C_INT64_T, 7.3_C_DOUBLE)
+  Out_0024 = x * y
+  return
+
+end function tst_multi_heads_1
+!........................................
+
+!........................................
+function tst_tmplt_1() result(Out_0025)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0025
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+
+  x = tmplt_1(5_C_INT64_T, 5_C_INT64_T)
+  y = tmplt_1(5.5_C_DOUBLE, 7.3_C_DOUBLE)
+  Out_0025 = x * y
+  return
+
+end function tst_tmplt_1
+!........................................
+
+!........................................
+function tst_multi_tmplt_1() result(Out_0026)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0026
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+  real(C_DOUBLE) :: z
+  real(C_DOUBLE) :: a
+
+  x = multi_tmplt_1(5_C_INT64_T, 5_C_INT64_T, 7_C_INT64_T)
+  y = multi_tmplt_1(5_C_INT64_T, 5_C_INT64_T, 7.3_C_DOUBLE)
+  z = multi_tmplt_1(4.5_C_DOUBLE, 4.5_C_DOUBLE, 8_C_INT64_T)
+  a = multi_tmplt_1(7.5_C_DOUBLE, 3.5_C_DOUBLE, 7.7_C_DOUBLE)
+  Out_0026 = x * a * y * z
+  return
+
+end function tst_multi_tmplt_1
+!........................................
+
+!........................................
+function tst_tmplt_head_1() result(Out_0027)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0027
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+  real(C_DOUBLE) :: z
+
+  x = tmplt_head_1(5_C_INT64_T, 5_C_INT64_T)
+  y = tmplt_head_1(5.5_C_DOUBLE, 7.3_C_DOUBLE)
+  z = tmplt_head_1(5_C_INT64_T, 5.56_C_DOUBLE)
+  Out_0027 = x * y * z
+  return
+
+end function tst_tmplt_head_1
+!........................................
+
+!........................................
+function tst_local_overide_1() result(Out_0028)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0028
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+
+  x = local_overide_1(5_C_INT64_T, 4_C_INT64_T)
+  y = local_overide_1(6.56_C_DOUBLE, 3.3_C_DOUBLE)
+  Out_0028 = x * y
+  return
+
+end function tst_local_overide_1
+!........................................
+
+!........................................
+function tst_tmplt_tmplt_1() result(Out_0029)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0029
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+  real(C_DOUBLE) :: z
+  real(C_DOUBLE) :: a
+
+  x = tmplt_tmplt_1(5_C_INT64_T, 5_C_INT64_T, 5_C_INT64_T)
+  y = tmplt_tmplt_1(5.5_C_DOUBLE, 7.3_C_DOUBLE, 7.7_C_DOUBLE)
+  z = tmplt_tmplt_1(5.5_C_DOUBLE, 5.56_C_DOUBLE, 7_C_INT64_T)
+  a = tmplt_tmplt_1(5_C_INT64_T, 5_C_INT64_T, 7.7_C_DOUBLE)
+  Out_0029 = x * y * z * a
+  return
+
+end function tst_tmplt_tmplt_1
+!........................................
+
+!........................................
+function tst_array_elem1() result(Out_0030)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0030
+  integer(C_INT64_T), allocatable :: x1(:)
+  integer(C_INT64_T) :: y
+  real(C_DOUBLE), allocatable :: x2(:)
+  real(C_DOUBLE) :: x
+
+  allocate(x1(0:3_C_INT64_T - 1_C_INT64_T))
+  x1 = [1_C_INT64_T, 2_C_INT64_T, 3_C_INT64_T]
+  y = array_elem1(x1)
+  allocate(x2(0:3_C_INT64_T - 1_C_INT64_T))
+  x2 = [1.3_C_DOUBLE, 2.4_C_DOUBLE, 3.4_C_DOUBLE]
+  x = array_elem1(x2)
+  Out_0030 = x * y
+  return
+
+end function tst_array_elem1
+!........................................
+
+!........................................
+function tst_multi_tmplt_2() result(Out_0031)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0031
+  integer(C_INT64_T) :: x
+  real(C_DOUBLE) :: y
+
+  x = multi_tmplt_2(5_C_INT64_T, 5_C_INT64_T)
+  y = multi_tmplt_2(5_C_INT64_T, 7.3_C_DOUBLE)
+  Out_0031 = x * y
+  return
+
+end function tst_multi_tmplt_2
+!........................................
+
+!........................................
+function tst_dup_types_1() result(x)
+
+  implicit none
+
+  integer(C_INT64_T) :: x
+
+  x = dup_types_1(5_C_INT64_T)
+  return
+
+end function tst_dup_types_1
+!........................................
+
+!........................................
+function tst_dup_types_2() result(x)
+
+  implicit none
+
+  integer(C_INT64_T) :: x
+
+  x = dup_types_2(5_C_INT64_T)
+  return
+
+end function tst_dup_types_2
+!........................................
+
+end module generic_functions
@@ -0,0 +1,158 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+#ifndef NDARRAYS_H
+# define NDARRAYS_H
+
+# include <stdlib.h>
+# include <complex.h>
+# include <string.h>
+# include <stdio.h>
+# include <stdarg.h>
+# include <stdbool.h>
+# include <stdint.h>
+# ifdef _WIN32
+#  include <malloc.h>
+#  define alloca _alloca
+# else
+#  include <alloca.h>
+# endif
+
+/* maximum number of dimensions of an array */
+# define MAX_NDIM 15
+
+/* mapping the function array_fill to the correct type */
+# define array_fill(c, arr) _Generic((c), int64_t : _array_fill_int64,\
+                                        int32_t : _array_fill_int32,\
+                                        int16_t : _array_fill_int16,\
+                                        int8_t : _array_fill_int8,\
+                                        float : _array_fill_float,\
+                                        double : _array_fill_double,\
+                                        bool : _array_fill_bool,\
+                                        float complex : _array_fill_cfloat,\
+                                        double complex : _array_fill_cdouble)(c, arr)
+
+typedef struct  s_slice
+{
+    int64_t start;
+    int64_t end;
+    int64_t step;
+    /* True if the dimension is indexed by an integer and removed from the view */
+    bool    is_element;
+}               t_slice;
+
+enum e_types
+{
+        nd_bool,
+        nd_int8,
+        nd_int16,
+        nd_int32,
+        nd_int64,
+        nd_float,
+        nd_double,
+        nd_cfloat,
+        nd_cdouble
+};
+
+typedef struct  s_ndarray
+{
+    /* raw data buffer*/
+    union {
+            char            *raw_data;
+            int8_t          *nd_int8;
+            int16_t         *nd_int16;
+            int32_t         *nd_int32;
+            int64_t         *nd_int64;
+            float           *nd_float;
+            double          *nd_double;
+            bool            *nd_bool;
+            double complex  *nd_cdouble;
+            float  complex  *nd_cfloat;
+            };
+    /* number of dimensions */
+    int32_t                 nd;
+    /* shape 'size of each dimension' */
+    int64_t                 shape[MAX_NDIM];
+    /* strides 'number of elements to skip to get the next element' */
+    int64_t                 strides[MAX_NDIM];
+    /* type of the array elements */
+    enum e_types            type;
+    /* type size of the array elements */
+    int32_t                 type_size;
+    /* number of element in the array */
+    int64_t                 length;
+    /* size of the array */
+    int64_t                 buffer_size;
+    /* True if the array does not own the data */
+    bool                    is_view;
+}               t_ndarray;
+
+/* position in the scratch memory, see scratch_mark */
+typedef struct  s_scratch_mark
+{
+    struct s_scratch_block  *block;
+    int64_t                 used;
+}               t_scratch_mark;
+
+/* functions prototypes */
+
+/* allocations */
+t_ndarray   array_create(int32_t nd, int64_t *shape, enum e_types type);
+                /* array using the memory data, which is not freed by free_array */
+t_ndarray   array_create_with_data(int32_t nd, int64_t *shape, enum e_types type, void *data);
+void        _array_fill_int8(int8_t c, t_ndarray arr);
+void        _array_fill_int16(int16_t c, t_ndarray arr);
+void        _array_fill_int32(int32_t c, t_ndarray arr);
+void        _array_fill_int64(int64_t c, t_ndarray arr);
+void        _array_fill_float(float c, t_ndarray arr);
+void        _array_fill_double(double c, t_ndarray arr);
+void        _array_fill_bool(bool c, t_ndarray arr);
+void        _array_fill_cfloat(float complex c, t_ndarray arr);
+void        _array_fill_cdouble(double complex c, t_ndarray arr);
+
+/* slicing */
+                /* creating a Slice object */
+t_slice     new_slice(int64_t start, int64_t end, int64_t step);
+t_slice     new_element(int64_t index);
+                /* creating an array view (which does not need to be freed) */
+t_ndarray   array_slicing(t_ndarray p, ...);
+
+/* free */
+int32_t         free_array(t_ndarray dump);
+
+/* scratch memory of the temporary arrays, released at once at the end of the functions */
+void            *scratch_alloc(int64_t size);
+t_scratch_mark  scratch_mark(void);
+void            scratch_release(t_scratch_mark mark);
+
+/* indexing */
+int64_t         get_index(t_ndarray arr, ...);
+
+/*
+** rank-specialized versions of get_index which can be inlined by the compiler
+** (the strides are given in number of elements)
+*/
+static inline int64_t  get_index_1(t_ndarray arr, int64_t i0)
+{
+    return i0 * arr.strides[0];
+}
+
+static inline int64_t  get_index_2(t_ndarray arr, int64_t i0, int64_t i1)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1];
+}
+
+static inline int64_t  get_index_3(t_ndarray arr, int64_t i0, int64_t i1, int64_t i2)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1] + i2 * arr.strides[2];
+}
+
+static inline int64_t  get_index_4(t_ndarray arr, int64_t i0, int64_t i1, int64_t i2, int64_t i3)
+{
+    return i0 * arr.strides[0] + i1 * arr.strides[1] + i2 * arr.strides[2]
+        + i3 * arr.strides[3];
+}
+
+#endif
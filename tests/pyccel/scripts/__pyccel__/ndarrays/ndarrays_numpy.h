@@ -0,0 +1,134 @@
+/* --------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file   */
+/* or go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details. */
+/* --------------------------------------------------------------------------------------- */
+
+/*
+** Conversions between numpy arrays and t_ndarray used by the python wrappers.
+** No data is copied: a numpy argument is seen as a view of the numpy buffer and
+** a returned t_ndarray gives the ownership of its buffer to the numpy array.
+** This header must be included after Python.h and numpy/arrayobject.h
+*/
+
+#ifndef NDARRAYS_NUMPY_H
+# define NDARRAYS_NUMPY_H
+
+# include "ndarrays.h"
+
+/* type of the elements of a numpy array (only the types checked by the wrappers) */
+static inline enum e_types  pyarray_to_ndarray_type(PyArrayObject *o)
+{
+    int32_t type_size = PyArray_ITEMSIZE(o);
+
+    if (PyArray_ISBOOL(o))
+        return (nd_bool);
+    if (PyArray_ISCOMPLEX(o))
+        return (type_size == sizeof(float complex) ? nd_cfloat : nd_cdouble);
+    if (PyArray_ISFLOAT(o))
+        return (type_size == sizeof(float) ? nd_float : nd_double);
+    switch (type_size)
+    {
+        case 1:
+            return (nd_int8);
+        case 2:
+            return (nd_int16);
+        case 4:
+            return (nd_int32);
+        default:
+            return (nd_int64);
+    }
+}
+
+static inline int  ndarray_to_pyarray_type(enum e_types type)
+{
+    switch (type)
+    {
+        case nd_bool:
+            return (NPY_BOOL);
+        case nd_int8:
+            return (NPY_INT8);
+        case nd_int16:
+            return (NPY_INT16);
+        case nd_int32:
+            return (NPY_INT32);
+        case nd_int64:
+            return (NPY_INT64);
+        case nd_float:
+            return (NPY_FLOAT);
+        case nd_cfloat:
+            return (NPY_CFLOAT);
+        case nd_cdouble:
+            return (NPY_CDOUBLE);
+        default:
+            return (NPY_DOUBLE);
+    }
+}
+
+/*
+** t_ndarray view of the buffer of a numpy array. The numpy strides (in bytes)
+** are converted to a number of elements
+*/
+static inline t_ndarray    pyarray_to_ndarray(PyArrayObject *o)
+{
+    t_ndarray   array;
+
+    array.nd = PyArray_NDIM(o);
+    array.raw_data = PyArray_DATA(o);
+    array.type = pyarray_to_ndarray_type(o);
+    array.type_size = PyArray_ITEMSIZE(o);
+    array.length = PyArray_SIZE(o);
+    array.buffer_size = PyArray_NBYTES(o);
+    for (int32_t i = 0; i < array.nd; i++)
+    {
+        array.shape[i] = PyArray_DIM(o, i);
+        array.strides[i] = PyArray_STRIDE(o, i) / array.type_size;
+    }
+    array.is_view = true;
+    return (array);
+}
+
+/* destructor of the capsule which owns the buffer of a returned array */
+static inline void ndarray_capsule_free(PyObject *capsule)
+{
+    free(PyCapsule_GetPointer(capsule, NULL));
+}
+
+/*
+** numpy array using the buffer of an array allocated by array_create. The
+** buffer is freed by the capsule set as base object when the numpy array is
+** deleted. NULL is returned (and the buffer freed) if an error occurs
+*/
+static inline PyObject *ndarray_to_pyarray(t_ndarray array)
+{
+    npy_intp    shape[MAX_NDIM];
+    PyObject    *o;
+    PyObject    *capsule;
+
+    for (int32_t i = 0; i < array.nd; i++)
+        shape[i] = array.shape[i];
+    if (array.raw_data == NULL)
+        return (PyArray_SimpleNew(array.nd, shape, ndarray_to_pyarray_type(array.type)));
+    o = PyArray_SimpleNewFromData(array.nd, shape,
+            ndarray_to_pyarray_type(array.type), array.raw_data);
+    if (o == NULL)
+    {
+        free(array.raw_data);
+        return (NULL);
+    }
+    capsule = PyCapsule_New(array.raw_data, NULL, ndarray_capsule_free);
+    if (capsule == NULL)
+    {
+        free(array.raw_data);
+        Py_DECREF(o);
+        return (NULL);
+    }
+    /* steals the reference to the capsule, even if it fails */
+    if (PyArray_SetBaseObject((PyArrayObject *)o, capsule) < 0)
+    {
+        Py_DECREF(o);
+        return (NULL);
+    }
+    return (o);
+}
+
+#endif
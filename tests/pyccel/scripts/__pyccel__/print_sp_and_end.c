@@ -0,0 +1,25 @@
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    /*pylint: disable=missing-function-docstring, missing-module-docstring/*/
+    /*------------------------string with sep and end ---------------------------*/
+    printf("%s %s\n", "ahoy", "world");
+    printf("%s%s\n", "ohoy", "awa");
+    printf("%s\n%s\n", "bonjour", "Le monde");
+    printf("%s/%s/%s\n", "home", "user", "documents");
+    printf("%s/%s/%s/%s\n", "", "home", "user", "documents");
+    printf("%s,%s\n", "Python Tricks", "Dan Bader");
+    printf("%s -> %s -> %s\n", "node", "child", "child");
+    printf("%s. ", "The first sentence");
+    printf("%s. ", "The second sentence");
+    printf("%s, %s, %s, ", "Mercury", "Venus", "Earth");
+    printf("%s, %s, %s, ", "Mars", "Jupiter", "Saturn");
+    printf("%s, %s, %s\n", "Uranus", "Neptune", "Pluto");
+    printf("%s\n * ", "Printing in a Nutshell");
+    printf("%s\n * ", "Calling Print");
+    printf("%s\n * ", "Separating Multiple Arguments");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+program prog_print_sp_and_end
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!------------------------string with sep and end ---------------------------
+print *, 'ahoy' // ' ' , 'world' // ' ' , sep = ' '
+print *, 'ohoy' // ' ' , 'awa' // ' ' , sep = 
+print *, 'bonjour' // ' ' , 'Le monde' // ' ' , sep = ACHAR(10)
+print *, 'home' // ' ' , 'user' // ' ' , 'documents' // ' ' , sep = '/'
+print *,  // ' ' , 'home' // ' ' , 'user' // ' ' , 'documents' // ' ' , sep = '/'
+print *, 'Python Tricks' // ' ' , 'Dan Bader' // ' ' , sep = ','
+print *, 'node' // ' ' , 'child' // ' ' , 'child' // ' ' , sep = ' -> '
+print *, 'The first sentence' // ' ' , end = '. '
+print *, 'The second sentence' // ' ' , end = '. '
+print *, 'Mercury' // ' ' , 'Venus' // ' ' , 'Earth' // ' ' , sep = ', ' // ' ' , end = ', '
+print *, 'Mars' // ' ' , 'Jupiter' // ' ' , 'Saturn' // ' ' , sep = ', ' // ' ' , end = ', '
+print *, 'Uranus' // ' ' , 'Neptune' // ' ' , 'Pluto' // ' ' , sep = ', '
+print *, 'Printing in a Nutshell' // ' ' , end = ACHAR(10) // ' * '
+print *, 'Calling Print' // ' ' , end = ACHAR(10) // ' * '
+print *, 'Separating Multiple Arguments' // ' ' , end = ACHAR(10) // ' * '
+
+end program prog_print_sp_and_end
@@ -0,0 +1,46 @@
+#include <stdio.h>
+#include <stdlib.h>
+int main()
+{
+
+
+    /*pylint: disable=missing-function-docstring, missing-module-docstring/*/
+    /*------------------------------- Strings ------------------------------------*/
+    printf("%s\n", "mcha bba lsbata");
+    printf("%s\n", "voilaaa");
+    printf("%s\n", "3...2...1...Go!");
+    printf("%s\n", "line1 \n line2\nline3");
+    printf("%s %s\n", "\n", "\n");
+    printf("\n");
+    printf("%s\n", "\nAZUL\n");
+    printf("%s\n", "\nat\nmid\n");
+    printf("%s\n", "\'\'\'\'\'");
+    printf("%s\n", "\"\'");
+    printf("%s\n", "\'\'");
+    printf("%s\n", "tab\ttab");
+    printf("%s %s %s %s\n", "multistrings", "one", "two with\ttab", "   three     ");
+    printf("%s\n", "\n");
+    printf("%s\n", "\a");
+    printf("%s\n", "\b");
+    printf("%s\n", "\f");
+    printf("%s\n", "\r");
+    printf("%s\n", "\'");
+    printf("%s\n", "The last sentence.");
+    printf("%s\n", "Preventing\tLine\nBreaks");
+    printf("%s\n", "\"walo\" + \"walo\" == \'hiya walo\'.");
+    printf("%s\n", "//\\//\\/\\/\\/\\/\\/\\/\\/\\/\\/\\/\\/\\/");
+    printf("%s\n", "[^_^]");
+    printf("%s\n", "[-_-]");
+    printf("%s\n", "[+__+]");
+    printf("%s\n", "[*-*]");
+    printf("%s\n", "(0_0)");
+    printf("%s\n", "mcha bba lsbata");
+    printf("%s %s %s\n", "yan", "sin", "krad");
+    printf("%s %s\n", "Azul", "fellawn");
+    printf("%s\n", "\b\v\b\v\b");
+    printf("%s\n", "\a\b\n\b\f");
+    printf("%s\n", "line1\nline2\nline3");
+    printf("%s\n", "line1\rline2\rline3");
+    printf("%s\n", "\'\'\'\'\"\'\"\'///\\\\");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,46 @@
+program prog_print_strings
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!------------------------------- Strings ------------------------------------
+print *, 'mcha bba lsbata'
+print *, 'voilaaa'
+print *, '3...2...1...Go!'
+print *, 'line1 ' // ACHAR(10) // ' line2' // ACHAR(10) // 'line3'
+print *, ACHAR(10), ACHAR(10)
+print *
+print *, ACHAR(10) // 'AZUL' // ACHAR(10)
+print *, ACHAR(10) // 'at' // ACHAR(10) // 'mid' // ACHAR(10)
+print *, ACHAR(39) // ACHAR(39) // ACHAR(39) // ACHAR(39) // ACHAR(39)
+print *, '"' // ACHAR(39)
+print *, ACHAR(39) // ACHAR(39)
+print *, 'tab' // ACHAR(9) // 'tab'
+print *, 'multistrings' // ' ' , 'one' // ' ' , 'two with' // ACHAR(9) // 'tab' // ' ' , '   three     '
+print *, ACHAR(10)
+print *, ACHAR(7)
+print *, ACHAR(8)
+print *, ACHAR(12)
+print *, ACHAR(13)
+print *, ACHAR(39)
+print *, 'The last sentence.'
+print *, 'Preventing' // ACHAR(9) // 'Line' // ACHAR(10) // 'Breaks'
+print *, '"walo" + "walo" == ' // ACHAR(39) // 'hiya walo' // ACHAR(39) // '.'
+print *, '//\//\/\/\/\/\/\/\/\/\/\/\/\/'
+print *, '[^_^]'
+print *, '[-_-]'
+print *, '[+__+]'
+print *, '[*-*]'
+print *, '(0_0)'
+print *, 'mcha bba lsbata'
+print *, 'yan' // ' ' , 'sin' // ' ' , 'krad'
+print *, 'Azul' // ' ' , 'fellawn'
+print *, ACHAR(8) // ACHAR(11) // ACHAR(8) // ACHAR(11) // ACHAR(8)
+print *, ACHAR(7) // ACHAR(8) // ACHAR(10) // ACHAR(8) // ACHAR(12)
+print *, 'line1' // ACHAR(10) // 'line2' // ACHAR(10) // 'line3'
+print *, 'line1' // ACHAR(13) // 'line2' // ACHAR(13) // 'line3'
+print *, ACHAR(39) // ACHAR(39) // ACHAR(39) // ACHAR(39) // '"' // ACHAR(39) // '"' // ACHAR(39) // '///\\'
+
+end program prog_print_strings
@@ -0,0 +1,13 @@
+#include <arrays_view.h>
+#include <stdlib.h>
+int main()
+{
+
+
+    array_view();
+    array_view_negative_literal_step();
+    array_view_negative_literal_step__2();
+    array_view_negative_literal_step__3();
+    array_view_negative_variable_step();
+    return 0;
+}
\ No newline at end of file
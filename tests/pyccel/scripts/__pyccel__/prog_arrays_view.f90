@@ -0,0 +1,18 @@
+program prog_prog_arrays_view
+
+use arrays_view, only: array_view
+use arrays_view, only: array_view_negative_literal_step
+use arrays_view, only: array_view_negative_literal_step__2
+use arrays_view, only: array_view_negative_literal_step__3
+use arrays_view, only: array_view_negative_variable_step
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+call array_view()
+call array_view_negative_literal_step()
+call array_view_negative_literal_step__2()
+call array_view_negative_literal_step__3()
+call array_view_negative_variable_step()
+
+end program prog_prog_arrays_view
@@ -0,0 +1,28 @@
+#include <bool_comp.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdio.h>
+int main()
+{
+    bool tmp;
+    bool tmp_0001;
+    bool tmp_0002;
+
+    printf("%s\n", is_false(0) ? "True" : "False");
+    printf("%s\n", compare_is(1, 0) ? "True" : "False");
+    printf("%s\n", not_true(1) ? "True" : "False");
+    printf("%s\n", eq_false(1) ? "True" : "False");
+    printf("%s\n", neq_true(0) ? "True" : "False");
+    printf("%s\n", not_val(0) ? "True" : "False");
+    tmp = 1;
+    printf("%s\n", is_nil(&tmp) ? "True" : "False");
+    printf("%s\n", is_nil(NULL) ? "True" : "False");
+    tmp_0001 = 1;
+    printf("%s\n", is_not_nil(&tmp_0001) ? "True" : "False");
+    printf("%s\n", is_not_nil(NULL) ? "True" : "False");
+    tmp_0002 = 1;
+    printf("%s\n", is_nil_default_arg(&tmp_0002) ? "True" : "False");
+    printf("%s\n", is_nil_default_arg(NULL) ? "True" : "False");
+    printf("%s\n", is_nil_default_arg(NULL) ? "True" : "False");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,30 @@
+program prog_prog_bool_comp
+
+use bool_comp, only: is_false
+use bool_comp, only: compare_is
+use bool_comp, only: not_true
+use bool_comp, only: eq_false
+use bool_comp, only: neq_true
+use bool_comp, only: not_val
+use bool_comp, only: is_nil
+use bool_comp, only: is_not_nil
+use bool_comp, only: is_nil_default_arg
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, is_false(.False._C_BOOL)
+print *, compare_is(.True._C_BOOL, .False._C_BOOL)
+print *, not_true(.True._C_BOOL)
+print *, eq_false(.True._C_BOOL)
+print *, neq_true(.False._C_BOOL)
+print *, not_val(.False._C_BOOL)
+print *, is_nil(.True._C_BOOL)
+print *, is_nil()
+print *, is_not_nil(.True._C_BOOL)
+print *, is_not_nil()
+print *, is_nil_default_arg(.True._C_BOOL)
+print *, is_nil_default_arg()
+print *, is_nil_default_arg()
+
+end program prog_prog_bool_comp
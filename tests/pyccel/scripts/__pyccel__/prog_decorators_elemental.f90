@@ -0,0 +1,22 @@
+program prog_prog_decorators_elemental
+
+use decorators_elemental, only: square
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE) :: a
+real(C_DOUBLE) :: b
+real(C_DOUBLE), allocatable :: xs(:)
+real(C_DOUBLE), allocatable :: ys(:)
+
+a = 2.0_C_DOUBLE
+b = square(a)
+print *, b
+allocate(xs(0:3_C_INT64_T - 1_C_INT64_T))
+xs = [1.0_C_DOUBLE, 2.0_C_DOUBLE, 3.0_C_DOUBLE]
+allocate(ys(0:3_C_INT64_T - 1_C_INT64_T))
+ys = square(xs)
+print *, ys
+
+end program prog_prog_decorators_elemental
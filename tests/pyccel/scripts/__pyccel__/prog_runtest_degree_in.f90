@@ -0,0 +1,10 @@
+program prog_prog_runtest_degree_in
+
+use runtest_degree_in, only: test_degree
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, test_degree(3_C_INT64_T)
+
+end program prog_prog_runtest_degree_in
@@ -0,0 +1,10 @@
+#include <runtest_funcs.h>
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    printf("%ld\n", sum_to_n(4));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+program prog_prog_runtest_funcs
+
+use runtest_funcs, only: add2
+use runtest_funcs, only: sum_to_n
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, sum_to_n(4_C_INT64_T)
+
+end program prog_prog_runtest_funcs
@@ -0,0 +1,19 @@
+program prog_prog_runtest_inoutfunc
+
+use runtest_inoutfunc, only: mult_2
+use runtest_inoutfunc, only: add_2
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE), allocatable :: x(:)
+real(C_DOUBLE), allocatable :: y(:)
+
+allocate(x(0:4_C_INT64_T - 1_C_INT64_T))
+x = 1.0_C_DOUBLE
+allocate(y(0:4_C_INT64_T - 1_C_INT64_T))
+y = 6.0_C_DOUBLE
+call add_2(x, y)
+print *, y
+
+end program prog_prog_runtest_inoutfunc
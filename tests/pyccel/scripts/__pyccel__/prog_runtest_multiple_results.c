@@ -0,0 +1,70 @@
+#include <runtest_multiple_results.h>
+#include <complex.h>
+#include <stdio.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <stdbool.h>
+int main()
+{
+    int64_t a;
+    double b;
+    double complex c;
+    bool d;
+    int64_t e;
+    double complex f;
+    int64_t g;
+    bool h;
+    double i;
+    double j;
+    int64_t k;
+    double tmp_0002;
+    double tmp_0003;
+    double tmp_0004;
+    double tmp_0005;
+    double tmp_0006;
+    double tmp_0007;
+    double tmp_0008;
+    double tmp_0009;
+
+    const_int_float(&a, &b);
+    printf("%ld\n", a);
+    printf("%.12lf\n", b);
+    const_complex_bool_int(&c, &d, &e);
+    printf("(%.12lf + %.12lfj)\n", creal(c), cimag(c));
+    printf("%s\n", d ? "True" : "False");
+    printf("%ld\n", e);
+    expr_complex_int_bool(a, &f, &g, &h);
+    printf("(%.12lf + %.12lfj)\n", creal(f), cimag(f));
+    printf("%ld\n", g);
+    printf("%s\n", h ? "True" : "False");
+    f3(19.2, 6.7, &i, &j);
+    printf("%.12lf %.12lf\n", i, j);
+    f3(4.5, 2.5, &i, &j);
+    printf("%.12lf %.12lf\n", i, j);
+    f3(1.5, 8.2, &i, &j);
+    printf("%.12lf %.12lf\n", i, j);
+    f3(1.5, 2.5, &i, &j);
+    printf("%.12lf %.12lf\n", i, j);
+    f3(1.5, 2.5, &tmp_0002, &tmp_0003);
+    printf("(%.12lf, %.12lf)\n", tmp_0002, tmp_0003);
+    print_multiple();
+    for (k = 0; k < 2; k += 1)
+    {
+        f4(i, j, &tmp_0004, &tmp_0005);
+        printf("(%.12lf, %.12lf)\n", tmp_0004, tmp_0005);
+    }
+    if (j > i)
+    {
+        f4(i, j, &tmp_0006, &tmp_0007);
+        printf("(%.12lf, %.12lf)\n", tmp_0006, tmp_0007);
+    }
+    k = 1;
+    while(k < 3)
+    {
+        k = k + 1;
+        f4(i, j, &tmp_0008, &tmp_0009);
+        printf("(%.12lf, %.12lf)\n", tmp_0008, tmp_0009);
+    }
+    printf("%.12lf %.12lf\n", i, j);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,76 @@
+program prog_prog_runtest_multiple_results
+
+use runtest_multiple_results, only: const_int_float
+use runtest_multiple_results, only: const_complex_bool_int
+use runtest_multiple_results, only: expr_complex_int_bool
+use runtest_multiple_results, only: f3
+use runtest_multiple_results, only: print_multiple
+use runtest_multiple_results, only: f4
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: a
+real(C_DOUBLE) :: b
+complex(C_DOUBLE_COMPLEX) :: c
+logical(C_BOOL) :: d
+integer(C_INT64_T) :: e
+complex(C_DOUBLE_COMPLEX) :: f
+integer(C_INT64_T) :: g
+logical(C_BOOL) :: h
+real(C_DOUBLE) :: i
+real(C_DOUBLE) :: j
+real(C_DOUBLE) :: Dummy_0003
+real(C_DOUBLE) :: Dummy_0004
+real(C_DOUBLE) :: Dummy_0005
+real(C_DOUBLE) :: Dummy_0006
+real(C_DOUBLE) :: Dummy_0007
+real(C_DOUBLE) :: Dummy_0008
+real(C_DOUBLE) :: Dummy_0009
+real(C_DOUBLE) :: Dummy_0010
+integer(C_INT64_T) :: k
+
+call const_int_float(Out_0001 = a, Out_0002 = b)
+print *, a
+print *, b
+call const_complex_bool_int(Out_0003 = c, Out_0004 = d, Out_0005 = e)
+print *, c
+print *, d
+print *, e
+call expr_complex_int_bool(a, Out_0006 = f, Out_0007 = g, Out_0008 = h)
+print *, f
+print *, g
+print *, h
+call f3(19.2_C_DOUBLE, 6.7_C_DOUBLE, Out_0009 = i, Out_0010 = j)
+print *, i, j
+call f3(4.5_C_DOUBLE, 2.5_C_DOUBLE, Out_0009 = i, Out_0010 = j)
+print *, i, j
+call f3(1.5_C_DOUBLE, 8.2_C_DOUBLE, Out_0009 = i, Out_0010 = j)
+print *, i, j
+call f3(1.5_C_DOUBLE, 2.5_C_DOUBLE, Out_0009 = i, Out_0010 = j)
+print *, i, j
+call f3(1.5_C_DOUBLE, 2.5_C_DOUBLE, Out_0009 = Dummy_0003, Out_0010 = &
+      Dummy_0004)
+
+print *, [Dummy_0003, Dummy_0004]
+call print_multiple()
+do k = 0_C_INT64_T, 2_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  call f4(i, j, Out_0011 = Dummy_0005, Out_0012 = Dummy_0006)
+
+  print *, [Dummy_0005, Dummy_0006]
+end do
+if (j > i) then
+  call f4(i, j, Out_0011 = Dummy_0007, Out_0012 = Dummy_0008)
+
+  print *, [Dummy_0007, Dummy_0008]
+end if
+k = 1_C_INT64_T
+do while (k < 3_C_INT64_T)
+  k = k + 1_C_INT64_T
+  call f4(i, j, Out_0011 = Dummy_0009, Out_0012 = Dummy_0010)
+
+  print *, [Dummy_0009, Dummy_0010]
+end do
+print *, i, j
+
+end program prog_prog_runtest_multiple_results
@@ -0,0 +1,10 @@
+#include <test_headers.h>
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    printf("%.12lf\n", f(1.5));
+    return 0;
+}
\ No newline at end of file
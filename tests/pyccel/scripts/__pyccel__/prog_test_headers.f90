@@ -0,0 +1,10 @@
+program prog_prog_test_headers
+
+use test_headers, only: f
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, f(1.5_C_DOUBLE)
+
+end program prog_prog_test_headers
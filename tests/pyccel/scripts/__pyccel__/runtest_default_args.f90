@@ -0,0 +1,38 @@
+program prog_runtest_default_args
+
+use default_args_mod, only: f1
+use default_args_mod, only: f5
+use default_args_mod, only: f3
+use default_args_mod, only: is_nil_default_arg
+use default_args_mod, only: recursivity
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: m1
+real(C_DOUBLE), allocatable :: x_expected(:)
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+!coding: utf-8
+print *, f1(2_C_INT64_T)
+print *, f1(1_C_INT64_T)
+!...
+m1 = 3_C_INT64_T
+allocate(x_expected(0:m1 - 1_C_INT64_T))
+x_expected = 0.0_C_DOUBLE
+call f5(x_expected, 2_C_INT64_T)
+print *, x_expected
+call f5(x_expected, m1)
+print *, f3(19.2_C_DOUBLE, 6.7_C_DOUBLE)
+print *, f3(4.5_C_DOUBLE, 2.5_C_DOUBLE)
+print *, f3(1.5_C_DOUBLE, 8.2_C_DOUBLE)
+print *, f3(1.5_C_DOUBLE, 2.5_C_DOUBLE)
+print *, is_nil_default_arg()
+print *, is_nil_default_arg()
+print *, is_nil_default_arg(.False._C_BOOL)
+print *, recursivity(19.2_C_DOUBLE, 6.7_C_DOUBLE)
+print *, recursivity(4.5_C_DOUBLE, 0.0_C_DOUBLE)
+print *, recursivity(19.2_C_DOUBLE, 6.7_C_DOUBLE, .True._C_BOOL)
+print *, recursivity(4.5_C_DOUBLE, 0.0_C_DOUBLE, .False._C_BOOL)
+
+end program prog_runtest_default_args
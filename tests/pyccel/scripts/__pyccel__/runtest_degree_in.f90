@@ -0,0 +1,28 @@
+module runtest_degree_in
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  function test_degree(degree) result(Out_0001)
+
+implicit none
+
+integer(C_INT64_T) :: Out_0001
+integer(C_INT64_T), value :: degree
+real(C_DOUBLE) :: tmp(0:degree + 1_C_INT64_T-1)
+integer(C_INT64_T) :: i
+
+do i = 0_C_INT64_T, degree + 1_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  tmp(i) = 0.0_C_DOUBLE
+end do
+Out_0001 = 1_C_INT64_T
+return
+
+end function test_degree
+!........................................
+
+end module runtest_degree_in
@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+int64_t test_degree(int64_t degree);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *test_degree_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t degree;
+    int64_t Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "degree",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "l", kwlist, &degree))
+    {
+        return NULL;
+    }
+    Out_0001 = test_degree(degree);
+    result = Py_BuildValue("l", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef runtest_degree_in_methods[] = {
+    {
+        "test_degree",
+        (PyCFunction)(void (*)(void))test_degree_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef runtest_degree_in_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "runtest_degree_in",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    runtest_degree_in_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_runtest_degree_in(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&runtest_degree_in_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
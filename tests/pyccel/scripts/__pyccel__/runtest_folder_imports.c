@@ -0,0 +1,11 @@
+#include <folder1_funcs.h>
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    /*pylint: disable=missing-function-docstring, missing-module-docstring/*/
+    printf("%ld\n", sum_to_n(4));
+    return 0;
+}
\ No newline at end of file
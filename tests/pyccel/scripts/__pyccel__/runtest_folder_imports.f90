@@ -0,0 +1,11 @@
+program prog_runtest_folder_imports
+
+use folder1_funcs, only: sum_to_n
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+print *, sum_to_n(4_C_INT64_T)
+
+end program prog_runtest_folder_imports
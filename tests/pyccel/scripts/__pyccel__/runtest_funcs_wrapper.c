@@ -0,0 +1,102 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+int64_t add2(int64_t x, int64_t y);
+int64_t sum_to_n(int64_t n);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *add2_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t x;
+    int64_t y;
+    int64_t Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "ll", kwlist, &x, &y))
+    {
+        return NULL;
+    }
+    Out_0001 = add2(x, y);
+    result = Py_BuildValue("l", Out_0001);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *sum_to_n_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t n;
+    int64_t result;
+    PyObject *result_0001;
+    static char *kwlist[] = {
+        "n",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "l", kwlist, &n))
+    {
+        return NULL;
+    }
+    result = sum_to_n(n);
+    result_0001 = Py_BuildValue("l", result);
+    return result_0001;
+}
+/*........................................*/
+
+static PyMethodDef runtest_funcs_methods[] = {
+    {
+        "add2",
+        (PyCFunction)(void (*)(void))add2_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "sum_to_n",
+        (PyCFunction)(void (*)(void))sum_to_n_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef runtest_funcs_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "runtest_funcs",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    runtest_funcs_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_runtest_funcs(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&runtest_funcs_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,43 @@
+program prog_runtest_generic_functions
+
+use generic_functions, only: tst_gen_1
+use generic_functions, only: tst_gen_2
+use generic_functions, only: tst_gen_3
+use generic_functions, only: tst_gen_4
+use generic_functions, only: tst_gen_5
+use generic_functions, only: tst_gen_6
+use generic_functions, only: tst_gen_7
+use generic_functions, only: tst_multi_heads_1
+use generic_functions, only: tst_tmplt_1
+use generic_functions, only: tst_multi_tmplt_1
+use generic_functions, only: tst_tmplt_head_1
+use generic_functions, only: tst_local_overide_1
+use generic_functions, only: tst_tmplt_tmplt_1
+use generic_functions, only: tst_array_elem1
+use generic_functions, only: tst_multi_tmplt_2
+use generic_functions, only: tst_dup_types_1
+use generic_functions, only: tst_dup_types_2
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+print *, tst_gen_1()
+print *, tst_gen_2()
+print *, tst_gen_3()
+print *, tst_gen_4()
+print *, tst_gen_5()
+print *, tst_gen_6()
+print *, tst_gen_7()
+print *, tst_multi_heads_1()
+print *, tst_tmplt_1()
+print *, tst_multi_tmplt_1()
+print *, tst_tmplt_head_1()
+print *, tst_local_overide_1()
+print *, tst_tmplt_tmplt_1()
+print *, tst_array_elem1()
+print *, tst_multi_tmplt_2()
+print *, tst_dup_types_1()
+print *, tst_dup_types_2()
+
+end program prog_runtest_generic_functions
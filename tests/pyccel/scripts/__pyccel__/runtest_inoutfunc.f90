@@ -0,0 +1,40 @@
+module runtest_inoutfunc
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  subroutine mult_2(x) 
+
+implicit none
+
+real(C_DOUBLE), intent(inout) :: x(0:)
+integer(C_INT64_T) :: i
+real(C_DOUBLE) :: xi
+
+do i = 0_C_INT64_T, size(x, kind=C_INT64_T)-1_C_INT64_T, 1_C_INT64_T
+  xi = x(i)
+  x(i) = xi * 2_C_INT64_T
+end do
+
+end subroutine mult_2
+!........................................
+
+!........................................
+pure  subroutine add_2(a, b) 
+
+implicit none
+
+real(C_DOUBLE), intent(inout) :: a(0:)
+real(C_DOUBLE), intent(inout) :: b(0:)
+
+call mult_2(a)
+b(:) = b(:) + a(:)
+
+end subroutine add_2
+!........................................
+
+end module runtest_inoutfunc
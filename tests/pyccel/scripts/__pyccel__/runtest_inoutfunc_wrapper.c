@@ -0,0 +1,153 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <cwrapper_cfi.h>
+
+void mult_2(CFI_cdesc_t *x);
+void add_2(CFI_cdesc_t *a, CFI_cdesc_t *b);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *mult_2_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x;
+    t_cfi_desc x_desc;
+    PyArrayObject *x_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!", kwlist, &PyArray_Type, &x_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x = pyarray_to_cfi_desc(x_tmp, &x_desc, 0);
+    }
+    mult_2(x);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *add_2_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *a;
+    CFI_cdesc_t *b;
+    t_cfi_desc a_desc;
+    PyArrayObject *a_tmp;
+    t_cfi_desc b_desc;
+    PyArrayObject *b_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!", kwlist, &PyArray_Type, &a_tmp, &PyArray_Type, &b_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(a_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "a_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(a_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(a_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "a must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        a = pyarray_to_cfi_desc(a_tmp, &a_desc, 0);
+    }
+    if (PyArray_NDIM(b_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "b_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(b_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(b_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "b must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        b = pyarray_to_cfi_desc(b_tmp, &b_desc, 0);
+    }
+    add_2(a, b);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef runtest_inoutfunc_methods[] = {
+    {
+        "mult_2",
+        (PyCFunction)(void (*)(void))mult_2_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "add_2",
+        (PyCFunction)(void (*)(void))add_2_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef runtest_inoutfunc_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "runtest_inoutfunc",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    runtest_inoutfunc_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_runtest_inoutfunc(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&runtest_inoutfunc_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
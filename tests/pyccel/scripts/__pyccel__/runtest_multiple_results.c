@@ -0,0 +1,64 @@
+#include <runtest_multiple_results.h>
+#include <complex.h>
+#include <stdio.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <stdbool.h>
+
+/*........................................*/
+int const_int_float(int64_t *Out_0001, double *Out_0002)
+{
+    (*Out_0001) = 1;
+    (*Out_0002) = 3.4;
+    return 0;
+}
+/*........................................*/
+
+/*........................................*/
+int const_complex_bool_int(double complex *Out_0003, bool *Out_0004, int64_t *Out_0005)
+{
+    (*Out_0003) = (1.0 + 2.0 * _Complex_I);
+    (*Out_0004) = 0;
+    (*Out_0005) = 8;
+    return 0;
+}
+/*........................................*/
+
+/*........................................*/
+int expr_complex_int_bool(int64_t n, double complex *Out_0006, int64_t *Out_0007, bool *Out_0008)
+{
+    (*Out_0006) = 0.5 + n * _Complex_I;
+    (*Out_0007) = 2 * n;
+    (*Out_0008) = n == 3;
+    return 0;
+}
+/*........................................*/
+
+/*........................................*/
+int f3(double x, double y, double *Out_0009, double *Out_0010)
+{
+    (*Out_0009) = x + y;
+    (*Out_0010) = x - y;
+    return 0;
+}
+/*........................................*/
+
+/*........................................*/
+void print_multiple(void)
+{
+    double tmp;
+    double tmp_0001;
+    f3(1.5, 2.5, &tmp, &tmp_0001);
+    printf("(%.12lf, %.12lf)\n", tmp, tmp_0001);
+}
+/*........................................*/
+
+/*........................................*/
+int f4(double x, double y, double *Out_0011, double *Out_0012)
+{
+    x = x + y;
+    (*Out_0011) = x + y;
+    (*Out_0012) = x - y;
+    return 0;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,110 @@
+module runtest_multiple_results
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  subroutine const_int_float(Out_0001, Out_0002) 
+
+implicit none
+
+integer(C_INT64_T), intent(out) :: Out_0001
+real(C_DOUBLE), intent(out) :: Out_0002
+
+Out_0001 = 1_C_INT64_T
+Out_0002 = 3.4_C_DOUBLE
+return
+
+end subroutine const_int_float
+!........................................
+
+!........................................
+pure  subroutine const_complex_bool_int(Out_0003, Out_0004, Out_0005) 
+
+implicit none
+
+complex(C_DOUBLE_COMPLEX), intent(out) :: Out_0003
+logical(C_BOOL), intent(out) :: Out_0004
+integer(C_INT64_T), intent(out) :: Out_0005
+
+Out_0003 = (1.0_C_DOUBLE, 2.0_C_DOUBLE)
+Out_0004 = .False._C_BOOL
+Out_0005 = 8_C_INT64_T
+return
+
+end subroutine const_complex_bool_int
+!........................................
+
+!........................................
+pure  subroutine expr_complex_int_bool(n, Out_0006, Out_0007, Out_0008)
+
+implicit none
+
+complex(C_DOUBLE_COMPLEX), intent(out) :: Out_0006
+integer(C_INT64_T), intent(out) :: Out_0007
+logical(C_BOOL), intent(out) :: Out_0008
+integer(C_INT64_T), value :: n
+
+Out_0006 = 0.5_C_DOUBLE + n * cmplx(0,1, kind = C_DOUBLE_COMPLEX)
+Out_0007 = 2_C_INT64_T * n
+Out_0008 = n == 3_C_INT64_T
+return
+
+end subroutine expr_complex_int_bool
+!........................................
+
+!........................................
+subroutine f3(x, y, Out_0009, Out_0010) 
+
+implicit none
+
+real(C_DOUBLE), intent(out) :: Out_0009
+real(C_DOUBLE), intent(out) :: Out_0010
+real(C_DOUBLE), value :: x
+real(C_DOUBLE), value :: y
+
+Out_0009 = x + y
+Out_0010 = x - y
+return
+
+end subroutine f3
+!........................................
+
+!........................................
+subroutine print_multiple() 
+
+implicit none
+
+real(C_DOUBLE) :: Dummy_0001
+real(C_DOUBLE) :: Dummy_0002
+
+call f3(1.5_C_DOUBLE, 2.5_C_DOUBLE, Out_0009 = Dummy_0001, Out_0010 = &
+      Dummy_0002)
+
+print *, [Dummy_0001, Dummy_0002]
+
+end subroutine print_multiple
+!........................................
+
+!........................................
+subroutine f4(x, y, Out_0011, Out_0012) 
+
+implicit none
+
+real(C_DOUBLE), intent(out) :: Out_0011
+real(C_DOUBLE), intent(out) :: Out_0012
+real(C_DOUBLE), value :: x
+real(C_DOUBLE), value :: y
+
+x = x + y
+Out_0011 = x + y
+Out_0012 = x - y
+return
+
+end subroutine f4
+!........................................
+
+end module runtest_multiple_results
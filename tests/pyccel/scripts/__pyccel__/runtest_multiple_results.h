@@ -0,0 +1,21 @@
+#ifndef RUNTEST_MULTIPLE_RESULTS_H
+#define RUNTEST_MULTIPLE_RESULTS_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <complex.h>
+#include <stdbool.h>
+
+int const_int_float(int64_t *Out_0001, double *Out_0002);
+
+int const_complex_bool_int(double complex *Out_0003, bool *Out_0004, int64_t *Out_0005);
+
+int expr_complex_int_bool(int64_t n, double complex *Out_0006, int64_t *Out_0007, bool *Out_0008);
+
+int f3(double x, double y, double *Out_0009, double *Out_0010);
+
+void print_multiple(void);
+
+int f4(double x, double y, double *Out_0011, double *Out_0012);
+
+#endif // RUNTEST_MULTIPLE_RESULTS_H
\ No newline at end of file
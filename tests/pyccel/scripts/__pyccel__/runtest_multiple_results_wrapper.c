@@ -0,0 +1,321 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <complex.h>
+#include <stdbool.h>
+
+int const_int_float(int64_t *Out_0001, double *Out_0002);
+int const_complex_bool_int(double complex *Out_0003, bool *Out_0004, int64_t *Out_0005);
+int expr_complex_int_bool(int64_t n, double complex *Out_0006, int64_t *Out_0007, bool *Out_0008);
+int f3(double x, double y, double *Out_0009, double *Out_0010);
+void print_multiple(void);
+int f4(double x, double y, double *Out_0011, double *Out_0012);
+
+/*........................................*/
+
+/*........................................*/
+PyObject *complex_to_pycomplex(double complex c)
+{
+    double real_part;
+    double imag_part;
+    PyObject *o;
+    real_part = creal(c);
+    imag_part = cimag(c);
+    o = PyComplex_FromDoubles(real_part, imag_part);
+    return o;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *bool_to_pyobj(bool b)
+{
+    PyObject *o;
+    if ((b != 0))
+    {
+        o = Py_True;
+    }
+    else if (1)
+    {
+        o = Py_False;
+    }
+    return o;
+}
+/*........................................*/
+
+/*........................................*/
+
+/*........................................*/
+PyObject *const_int_float_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t Out_0001;
+    double Out_0002;
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    const_int_float(&Out_0001, &Out_0002);
+    result = Py_BuildValue("ld", Out_0001, Out_0002);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *const_complex_bool_int_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double complex Out_0003;
+    bool Out_0004;
+    int64_t Out_0005;
+    PyObject *Out_0003_tmp;
+    PyObject *Out_0004_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    const_complex_bool_int(&Out_0003, &Out_0004, &Out_0005);
+    Out_0003_tmp = complex_to_pycomplex(Out_0003);
+    Out_0004_tmp = bool_to_pyobj(Out_0004);
+    result = Py_BuildValue("OOl", Out_0003_tmp, Out_0004_tmp, Out_0005);
+    Py_DECREF(Out_0003_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *expr_complex_int_bool_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t n;
+    double complex Out_0006;
+    int64_t Out_0007;
+    bool Out_0008;
+    PyObject *Out_0006_tmp;
+    PyObject *Out_0008_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "n",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "l", kwlist, &n))
+    {
+        return NULL;
+    }
+    expr_complex_int_bool(n, &Out_0006, &Out_0007, &Out_0008);
+    Out_0006_tmp = complex_to_pycomplex(Out_0006);
+    Out_0008_tmp = bool_to_pyobj(Out_0008);
+    result = Py_BuildValue("OlO", Out_0006_tmp, Out_0007, Out_0008_tmp);
+    Py_DECREF(Out_0006_tmp);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *f3_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double y;
+    double Out_0009;
+    double Out_0010;
+    PyObject *x_tmp;
+    PyObject *y_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+
+    x_tmp = Py_None;
+    y_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "|OO", kwlist, &x_tmp, &y_tmp))
+    {
+        return NULL;
+    }
+    if (x_tmp == Py_None)
+    {
+        x = 1.5;
+    }
+    else if (!(PyArray_IsScalar(x_tmp, Float64) || PyFloat_Check(x_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "x must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(x_tmp))
+        {
+            PyArray_ScalarAsCtype(x_tmp, &x);
+        }
+        else if (1)
+        {
+            x = PyFloat_AsDouble(x_tmp);
+        }
+    }
+    if (y_tmp == Py_None)
+    {
+        y = 2.5;
+    }
+    else if (!(PyArray_IsScalar(y_tmp, Float64) || PyFloat_Check(y_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "y must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(y_tmp))
+        {
+            PyArray_ScalarAsCtype(y_tmp, &y);
+        }
+        else if (1)
+        {
+            y = PyFloat_AsDouble(y_tmp);
+        }
+    }
+    f3(x, y, &Out_0009, &Out_0010);
+    result = Py_BuildValue("dd", Out_0009, Out_0010);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *print_multiple_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    print_multiple();
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *f4_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double y;
+    double Out_0011;
+    double Out_0012;
+    PyObject *y_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+
+    y_tmp = Py_None;
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d|O", kwlist, &x, &y_tmp))
+    {
+        return NULL;
+    }
+    if (y_tmp == Py_None)
+    {
+        y = 2.5;
+    }
+    else if (!(PyArray_IsScalar(y_tmp, Float64) || PyFloat_Check(y_tmp)))
+    {
+        PyErr_SetString(PyExc_TypeError, "y must be real");
+        return NULL;
+    }
+    else if (1)
+    {
+        if (PyArray_CheckScalar(y_tmp))
+        {
+            PyArray_ScalarAsCtype(y_tmp, &y);
+        }
+        else if (1)
+        {
+            y = PyFloat_AsDouble(y_tmp);
+        }
+    }
+    f4(x, y, &Out_0011, &Out_0012);
+    result = Py_BuildValue("dd", Out_0011, Out_0012);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef runtest_multiple_results_methods[] = {
+    {
+        "const_int_float",
+        (PyCFunction)(void (*)(void))const_int_float_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "const_complex_bool_int",
+        (PyCFunction)(void (*)(void))const_complex_bool_int_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "expr_complex_int_bool",
+        (PyCFunction)(void (*)(void))expr_complex_int_bool_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "f3",
+        (PyCFunction)(void (*)(void))f3_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "print_multiple",
+        (PyCFunction)(void (*)(void))print_multiple_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "f4",
+        (PyCFunction)(void (*)(void))f4_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef runtest_multiple_results_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "runtest_multiple_results",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    runtest_multiple_results_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_runtest_multiple_results(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&runtest_multiple_results_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,11 @@
+#include <test_headers.h>
+#include <stdlib.h>
+
+/*........................................*/
+double f(double x)
+{
+    double y;
+    y = x;
+    return y;
+}
+/*........................................*/
\ No newline at end of file
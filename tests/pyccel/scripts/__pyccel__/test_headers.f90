@@ -0,0 +1,23 @@
+module test_headers
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function f(x) result(y)
+
+  implicit none
+
+  real(C_DOUBLE) :: y
+  real(C_DOUBLE), value :: x
+
+  y = x
+  return
+
+end function f
+!........................................
+
+end module test_headers
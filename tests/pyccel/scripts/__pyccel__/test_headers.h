@@ -0,0 +1,8 @@
+#ifndef TEST_HEADERS_H
+#define TEST_HEADERS_H
+
+#include <stdlib.h>
+
+double f(double x);
+
+#endif // TEST_HEADERS_H
\ No newline at end of file
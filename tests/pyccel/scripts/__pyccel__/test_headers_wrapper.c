@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double f(double x);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *f_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double y;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d", kwlist, &x))
+    {
+        return NULL;
+    }
+    y = f(x);
+    result = Py_BuildValue("d", y);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef test_headers_methods[] = {
+    {
+        "f",
+        (PyCFunction)(void (*)(void))f_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef test_headers_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "test_headers",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    test_headers_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_test_headers(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&test_headers_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
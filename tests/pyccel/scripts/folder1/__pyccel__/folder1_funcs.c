@@ -0,0 +1,26 @@
+#include <folder1_funcs.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+/*........................................*/
+int64_t add2(int64_t x, int64_t y)
+{
+    int64_t Out_0001;
+    Out_0001 = x + y;
+    return Out_0001;
+}
+/*........................................*/
+
+/*........................................*/
+int64_t sum_to_n(int64_t n)
+{
+    int64_t i;
+    int64_t result;
+    result = 0;
+    for (i = 1; i < n + 1; i += 1)
+    {
+        result = add2(result, i);
+    }
+    return result;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,13 @@
+!........................................
+function test_func() bind(c) result(Out_0001)
+
+  use runtest_rel_imports, only: mod_test_func => test_func
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T) :: Out_0001
+
+  Out_0001 = mod_test_func()
+
+end function test_func
+!........................................
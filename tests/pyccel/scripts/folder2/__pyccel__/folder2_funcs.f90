@@ -0,0 +1,42 @@
+module folder2_funcs
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  function add2(x, y) result(Out_0001)
+
+implicit none
+
+integer(C_INT64_T) :: Out_0001
+integer(C_INT64_T), value :: x
+integer(C_INT64_T), value :: y
+
+Out_0001 = x + y
+return
+
+end function add2
+!........................................
+
+!........................................
+pure  function sum_to_n(n) result(result)
+
+implicit none
+
+integer(C_INT64_T) :: result
+integer(C_INT64_T), value :: n
+integer(C_INT64_T) :: i
+
+result = 0_C_INT64_T
+do i = 1_C_INT64_T, n + 1_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+result = add2(result, i)
+end do
+return
+
+end function sum_to_n
+!........................................
+
+end module folder2_funcs
@@ -0,0 +1,23 @@
+module runtest_imports2
+
+use folder1_funcs, only: sum_to_n
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+pure  function test_func() result(Out_0001)
+
+implicit none
+
+integer(C_INT64_T) :: Out_0001
+
+Out_0001 = sum_to_n(4_C_INT64_T)
+return
+
+end function test_func
+!........................................
+
+end module runtest_imports2
@@ -0,0 +1,10 @@
+#ifndef RUNTEST_IMPORTS2_H
+#define RUNTEST_IMPORTS2_H
+
+#include <folder1_funcs.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+int64_t test_func(void);
+
+#endif // RUNTEST_IMPORTS2_H
\ No newline at end of file
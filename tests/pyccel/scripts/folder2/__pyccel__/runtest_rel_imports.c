@@ -0,0 +1,12 @@
+#include <runtest_rel_imports.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+/*........................................*/
+int64_t test_func(void)
+{
+    int64_t Out_0001;
+    Out_0001 = sum_to_n(4);
+    return Out_0001;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,10 @@
+#ifndef RUNTEST_REL_IMPORTS_H
+#define RUNTEST_REL_IMPORTS_H
+
+#include <folder2_funcs.h>
+#include <stdlib.h>
+#include <stdint.h>
+
+int64_t test_func(void);
+
+#endif // RUNTEST_REL_IMPORTS_H
\ No newline at end of file
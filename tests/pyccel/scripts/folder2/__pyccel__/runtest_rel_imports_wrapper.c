@@ -0,0 +1,70 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+int64_t test_func(void);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *test_func_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int64_t Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    Out_0001 = test_func();
+    result = Py_BuildValue("l", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef runtest_rel_imports_methods[] = {
+    {
+        "test_func",
+        (PyCFunction)(void (*)(void))test_func_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef runtest_rel_imports_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "runtest_rel_imports",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    runtest_rel_imports_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_runtest_rel_imports(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&runtest_rel_imports_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,14 @@
+!........................................
+function fib(n) bind(c) result(result)
+
+  use hope_fib, only: mod_fib => fib
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  integer(C_INT64_T), value :: n
+  integer(C_INT64_T) :: result
+
+  result = mod_fib(n)
+
+end function fib
+!........................................
@@ -0,0 +1,14 @@
+!........................................
+subroutine pairwise_python(X, D) bind(c) 
+
+  use hope_pairwise_python, only: mod_pairwise_python => pairwise_python
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: X(0:,0:)
+  real(C_DOUBLE), intent(inout) :: D(0:,0:)
+
+  call mod_pairwise_python(X, D)
+
+end subroutine pairwise_python
+!........................................
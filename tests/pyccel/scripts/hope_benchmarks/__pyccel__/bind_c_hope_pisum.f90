@@ -0,0 +1,13 @@
+!........................................
+function pisum() bind(c) result(pi_sum)
+
+  use hope_pisum, only: mod_pisum => pisum
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE) :: pi_sum
+
+  pi_sum = mod_pisum()
+
+end function pisum
+!........................................
@@ -0,0 +1,23 @@
+!........................................
+subroutine pdf(density, x_range, y_range, x_center, y_center, w2D, r50, &
+      b, a) bind(c)
+
+  use point_spread_func, only: mod_pdf => pdf
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: density(0:,0:)
+  integer(C_INT64_T), value :: x_range
+  integer(C_INT64_T), value :: y_range
+  real(C_DOUBLE), value :: x_center
+  real(C_DOUBLE), value :: y_center
+  real(C_DOUBLE), intent(in) :: w2D(0:,0:)
+  real(C_DOUBLE), value :: r50
+  real(C_DOUBLE), value :: b
+  real(C_DOUBLE), value :: a
+
+  call mod_pdf(density, x_range, y_range, x_center, y_center, w2D, r50, &
+      b, a)
+
+end subroutine pdf
+!........................................
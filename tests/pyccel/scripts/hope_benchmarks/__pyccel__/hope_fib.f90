@@ -0,0 +1,27 @@
+module hope_fib
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+recursive function fib(n) result(result)
+
+implicit none
+
+integer(C_INT64_T) :: result
+integer(C_INT64_T), value :: n
+
+if (n < 2_C_INT64_T) then
+  result = n
+  return
+end if
+result = fib(n - 1_C_INT64_T) + fib(n - 2_C_INT64_T)
+return
+
+end function fib
+!........................................
+
+end module hope_fib
@@ -0,0 +1,30 @@
+module hope_pisum
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function pisum() result(pi_sum)
+
+  implicit none
+
+  real(C_DOUBLE) :: pi_sum
+  integer(C_INT64_T) :: j
+  integer(C_INT64_T) :: k
+
+  !pylint: disable=unused-variable
+  do j = 1_C_INT64_T, 501_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    pi_sum = 0.0_C_DOUBLE
+    do k = 1_C_INT64_T, 10001_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+      pi_sum = pi_sum + 1.0_C_DOUBLE / (k * k)
+    end do
+  end do
+  return
+
+end function pisum
+!........................................
+
+end module hope_pisum
@@ -0,0 +1,70 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double pisum(void);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *pisum_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double pi_sum;
+    PyObject *result;
+    static char *kwlist[] = {
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "", kwlist))
+    {
+        return NULL;
+    }
+    pi_sum = pisum();
+    result = Py_BuildValue("d", pi_sum);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef hope_pisum_methods[] = {
+    {
+        "pisum",
+        (PyCFunction)(void (*)(void))pisum_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef hope_pisum_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "hope_pisum",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    hope_pisum_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_hope_pisum(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&hope_pisum_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,10 @@
+program prog_prog_hope_fib
+
+use hope_fib, only: fib
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, fib(20_C_INT64_T)
+
+end program prog_prog_hope_fib
@@ -0,0 +1,12 @@
+program prog_prog_hope_ln_python
+
+use hope_ln_python, only: ln_python
+use hope_ln_python, only: ln_python_exp
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, ln_python(2.0_C_DOUBLE)
+print *, ln_python_exp(2.0_C_DOUBLE)
+
+end program prog_prog_hope_ln_python
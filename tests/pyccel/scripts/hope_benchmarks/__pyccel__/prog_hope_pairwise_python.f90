@@ -0,0 +1,40 @@
+program prog_prog_hope_pairwise_python
+
+use hope_pairwise_python, only: pairwise_python
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: s
+real(C_DOUBLE), allocatable :: X(:,:)
+integer(C_INT64_T) :: rand
+integer(C_INT64_T) :: a
+integer(C_INT64_T) :: b
+integer(C_INT64_T) :: m
+real(C_DOUBLE), allocatable :: D(:,:)
+integer(C_INT64_T) :: i
+integer(C_INT64_T) :: j
+
+s = 100_C_INT64_T
+allocate(X(0:s - 1_C_INT64_T, 0:s - 1_C_INT64_T))
+X = 0.0_C_DOUBLE
+rand = 0_C_INT64_T
+a = 100_C_INT64_T
+b = 821_C_INT64_T
+m = 213_C_INT64_T
+do i = 0_C_INT64_T, s-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, s-1_C_INT64_T, 1_C_INT64_T
+    rand = MODULO((a * rand + b),m)
+    X(j, i) = rand
+  end do
+end do
+allocate(D(0:s - 1_C_INT64_T, 0:s - 1_C_INT64_T))
+D = 0.0_C_DOUBLE
+call pairwise_python(X, D)
+do i = 0_C_INT64_T, s-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, s-1_C_INT64_T, 1_C_INT64_T
+    print *, D(j, i)
+  end do
+end do
+
+end program prog_prog_hope_pairwise_python
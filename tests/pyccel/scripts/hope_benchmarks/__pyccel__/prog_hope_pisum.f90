@@ -0,0 +1,10 @@
+program prog_prog_hope_pisum
+
+use hope_pisum, only: pisum
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, pisum()
+
+end program prog_prog_hope_pisum
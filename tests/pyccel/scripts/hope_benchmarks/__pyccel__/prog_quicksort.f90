@@ -0,0 +1,23 @@
+program prog_prog_quicksort
+
+use quicksort, only: qsort_kernel
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE), allocatable :: x(:)
+integer(C_INT64_T) :: Dummy_0001
+real(C_DOUBLE) :: xi
+
+allocate(x(0:10_C_INT64_T - 1_C_INT64_T))
+x = [0.66_C_DOUBLE, 0.96_C_DOUBLE, 0.06_C_DOUBLE, 0.89_C_DOUBLE, &
+      0.57_C_DOUBLE, 0.56_C_DOUBLE, 0.08_C_DOUBLE, 0.33_C_DOUBLE, &
+      0.04_C_DOUBLE, 0.59_C_DOUBLE]
+call qsort_kernel(x, 0_C_INT64_T, 9_C_INT64_T)
+do Dummy_0001 = 0_C_INT64_T, size(x, kind=C_INT64_T)-1_C_INT64_T, &
+      1_C_INT64_T
+  xi = x(Dummy_0001)
+  print *, xi
+end do
+
+end program prog_prog_quicksort
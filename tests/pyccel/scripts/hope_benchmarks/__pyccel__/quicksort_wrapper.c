@@ -0,0 +1,94 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <cwrapper_cfi.h>
+
+void qsort_kernel(CFI_cdesc_t *a, int64_t lo, int64_t hi);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *qsort_kernel_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *a;
+    int64_t lo;
+    int64_t hi;
+    t_cfi_desc a_desc;
+    PyArrayObject *a_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        "lo",
+        "hi",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!ll", kwlist, &PyArray_Type, &a_tmp, &lo, &hi))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(a_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "a_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(a_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(a_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "a must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        a = pyarray_to_cfi_desc(a_tmp, &a_desc, 0);
+    }
+    qsort_kernel(a, lo, hi);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef quicksort_methods[] = {
+    {
+        "qsort_kernel",
+        (PyCFunction)(void (*)(void))qsort_kernel_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef quicksort_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "quicksort",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    quicksort_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_quicksort(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&quicksort_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,72 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double y(double x);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *y_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x;
+    double Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d", kwlist, &x))
+    {
+        return NULL;
+    }
+    Out_0001 = y(x);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef simplify_methods[] = {
+    {
+        "y",
+        (PyCFunction)(void (*)(void))y_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef simplify_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "simplify",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    simplify_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_simplify(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&simplify_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,29 @@
+!........................................
+function ln_python(X) bind(c) result(Out_0001)
+
+  use hope_ln_python, only: mod_ln_python => ln_python
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: X
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_ln_python(X)
+
+end function ln_python
+!........................................
+
+!........................................
+function ln_python_exp(Y) bind(c) result(Out_0002)
+
+  use hope_ln_python, only: mod_ln_python_exp => ln_python_exp
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: Y
+  real(C_DOUBLE) :: Out_0002
+
+  Out_0002 = mod_ln_python_exp(Y)
+
+end function ln_python_exp
+!........................................
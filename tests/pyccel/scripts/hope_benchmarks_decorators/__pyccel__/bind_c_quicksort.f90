@@ -0,0 +1,15 @@
+!........................................
+subroutine qsort_kernel(a, lo, hi) bind(c) 
+
+  use quicksort, only: mod_qsort_kernel => qsort_kernel
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: a(0:)
+  integer(C_INT64_T), value :: lo
+  integer(C_INT64_T), value :: hi
+
+  call mod_qsort_kernel(a, lo, hi)
+
+end subroutine qsort_kernel
+!........................................
@@ -0,0 +1,14 @@
+!........................................
+function y(x) bind(c) result(Out_0001)
+
+  use simplify, only: mod_y => y
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_y(x)
+
+end function y
+!........................................
@@ -0,0 +1,55 @@
+module hope_ln_python
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function ln_python(X) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: X
+
+  Out_0001 = X - 1_C_INT64_T - (X - 1_C_INT64_T) ** 2_C_INT64_T / &
+      2_C_INT64_T + (X - 1_C_INT64_T) ** 3_C_INT64_T / 3_C_INT64_T - (X &
+      - 1_C_INT64_T) ** 4_C_INT64_T / 4_C_INT64_T + (X - 1_C_INT64_T) &
+      ** 5_C_INT64_T / 5_C_INT64_T - (X - 1_C_INT64_T) ** 6_C_INT64_T / &
+      6_C_INT64_T + (X - 1_C_INT64_T) ** 7_C_INT64_T / 7_C_INT64_T - (X &
+      - 1_C_INT64_T) ** 8_C_INT64_T / 8_C_INT64_T + (X - 1_C_INT64_T) &
+      ** 9_C_INT64_T / 9_C_INT64_T
+  return
+
+end function ln_python
+!........................................
+
+!........................................
+function ln_python_exp(Y) result(Out_0002)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0002
+  real(C_DOUBLE), value :: Y
+  real(C_DOUBLE) :: x
+  real(C_DOUBLE) :: x2
+  real(C_DOUBLE) :: x4
+  real(C_DOUBLE) :: x6
+  real(C_DOUBLE) :: x8
+
+  x = Y - 1_C_INT64_T
+  x2 = x * x
+  x4 = x2 * x2
+  x6 = x4 * x2
+  x8 = x4 * x4
+  Out_0002 = x - x2 / 2_C_INT64_T + x * x2 / 3_C_INT64_T - x4 / &
+      4_C_INT64_T + x * x4 / 5_C_INT64_T - x6 / 6_C_INT64_T + x6 * x / &
+      7_C_INT64_T - x8 / 8_C_INT64_T + x8 * x / 9_C_INT64_T
+  return
+
+end function ln_python_exp
+!........................................
+
+end module hope_ln_python
@@ -0,0 +1,100 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double ln_python(double X);
+double ln_python_exp(double Y);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *ln_python_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double X;
+    double Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "X",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d", kwlist, &X))
+    {
+        return NULL;
+    }
+    Out_0001 = ln_python(X);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *ln_python_exp_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double Y;
+    double Out_0002;
+    PyObject *result;
+    static char *kwlist[] = {
+        "Y",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "d", kwlist, &Y))
+    {
+        return NULL;
+    }
+    Out_0002 = ln_python_exp(Y);
+    result = Py_BuildValue("d", Out_0002);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef hope_ln_python_methods[] = {
+    {
+        "ln_python",
+        (PyCFunction)(void (*)(void))ln_python_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    {
+        "ln_python_exp",
+        (PyCFunction)(void (*)(void))ln_python_exp_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef hope_ln_python_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "hope_ln_python",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    hope_ln_python_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_hope_ln_python(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&hope_ln_python_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
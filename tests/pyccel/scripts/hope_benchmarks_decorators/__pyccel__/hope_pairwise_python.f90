@@ -0,0 +1,40 @@
+module hope_pairwise_python
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine pairwise_python(X, D) 
+
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: X(0:,0:)
+  real(C_DOUBLE), intent(inout) :: D(0:,0:)
+  integer(C_INT64_T) :: M
+  integer(C_INT64_T) :: N
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+  real(C_DOUBLE) :: r
+  integer(C_INT64_T) :: k
+  real(C_DOUBLE) :: tmp
+
+  M = size(X, 2, C_INT64_T)
+  N = size(X, 1, C_INT64_T)
+  do i = 0_C_INT64_T, M-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, M-1_C_INT64_T, 1_C_INT64_T
+      r = 0.0_C_DOUBLE
+      do k = 0_C_INT64_T, N-1_C_INT64_T, 1_C_INT64_T
+        tmp = X(k, i) - X(k, j)
+        r = r + tmp * tmp
+      end do
+      D(j, i) = sqrt(r)
+    end do
+  end do
+
+end subroutine pairwise_python
+!........................................
+
+end module hope_pairwise_python
@@ -0,0 +1,109 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <cwrapper_cfi.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+void pairwise_python(CFI_cdesc_t *X, CFI_cdesc_t *D);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *pairwise_python_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *X;
+    CFI_cdesc_t *D;
+    t_cfi_desc X_desc;
+    PyArrayObject *X_tmp;
+    t_cfi_desc D_desc;
+    PyArrayObject *D_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "X",
+        "D",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!", kwlist, &PyArray_Type, &X_tmp, &PyArray_Type, &D_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(X_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "X_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(X_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(X_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "X must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        X = pyarray_to_cfi_desc(X_tmp, &X_desc, 1);
+    }
+    if (PyArray_NDIM(D_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "D_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(D_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(D_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "D must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        D = pyarray_to_cfi_desc(D_tmp, &D_desc, 1);
+    }
+    pairwise_python(X, D);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef hope_pairwise_python_methods[] = {
+    {
+        "pairwise_python",
+        (PyCFunction)(void (*)(void))pairwise_python_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef hope_pairwise_python_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "hope_pairwise_python",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    hope_pairwise_python_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_hope_pairwise_python(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&hope_pairwise_python_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
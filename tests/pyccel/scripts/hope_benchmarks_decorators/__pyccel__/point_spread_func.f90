@@ -0,0 +1,43 @@
+module point_spread_func
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine pdf(density, x_range, y_range, x_center, y_center, w2D, r50, &
+      b, a)
+
+  implicit none
+
+  real(C_DOUBLE), intent(inout) :: density(0:,0:)
+  integer(C_INT64_T), value :: x_range
+  integer(C_INT64_T), value :: y_range
+  real(C_DOUBLE), value :: x_center
+  real(C_DOUBLE), value :: y_center
+  real(C_DOUBLE), intent(in) :: w2D(0:,0:)
+  real(C_DOUBLE), value :: r50
+  real(C_DOUBLE), value :: b
+  real(C_DOUBLE), value :: a
+  integer(C_INT64_T) :: x
+  integer(C_INT64_T) :: y
+  real(C_DOUBLE) :: dr
+  real(C_DOUBLE) :: tmp
+
+  do x = 0_C_INT64_T, x_range-1_C_INT64_T, 1_C_INT64_T
+    do y = 0_C_INT64_T, y_range-1_C_INT64_T, 1_C_INT64_T
+      dr = sqrt((x - x_center) ** 2_C_INT64_T + (y - y_center) ** &
+      2_C_INT64_T)
+      tmp = 2_C_INT64_T * (b - 1_C_INT64_T) / (2_C_INT64_T * &
+      3.14159265358979_C_DOUBLE * (r50 * a) ** 2_C_INT64_T) * ( &
+      1_C_INT64_T + (dr / (r50 * a)) ** 2_C_INT64_T) ** (-b)
+      density(y, x) = tmp * sum(w2D)
+    end do
+  end do
+
+end subroutine pdf
+!........................................
+
+end module point_spread_func
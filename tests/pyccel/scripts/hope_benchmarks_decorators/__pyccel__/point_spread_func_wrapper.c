@@ -0,0 +1,123 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <cwrapper_cfi.h>
+#include <stdio.h>
+
+void pdf(CFI_cdesc_t *density, int64_t x_range, int64_t y_range, double x_center, double y_center, CFI_cdesc_t *w2D, double r50, double b, double a);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *pdf_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *density;
+    int64_t x_range;
+    int64_t y_range;
+    double x_center;
+    double y_center;
+    CFI_cdesc_t *w2D;
+    double r50;
+    double b;
+    double a;
+    t_cfi_desc density_desc;
+    PyArrayObject *density_tmp;
+    t_cfi_desc w2D_desc;
+    PyArrayObject *w2D_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "density",
+        "x_range",
+        "y_range",
+        "x_center",
+        "y_center",
+        "w2D",
+        "r50",
+        "b",
+        "a",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!llddO!ddd", kwlist, &PyArray_Type, &density_tmp, &x_range, &y_range, &x_center, &y_center, &PyArray_Type, &w2D_tmp, &r50, &b, &a))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(density_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "density_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(density_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(density_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "density must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        density = pyarray_to_cfi_desc(density_tmp, &density_desc, 1);
+    }
+    if (PyArray_NDIM(w2D_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "w2D_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(w2D_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(w2D_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "w2D must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        w2D = pyarray_to_cfi_desc(w2D_tmp, &w2D_desc, 1);
+    }
+    pdf(density, x_range, y_range, x_center, y_center, w2D, r50, b, a);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef point_spread_func_methods[] = {
+    {
+        "pdf",
+        (PyCFunction)(void (*)(void))pdf_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef point_spread_func_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "point_spread_func",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    point_spread_func_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_point_spread_func(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&point_spread_func_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
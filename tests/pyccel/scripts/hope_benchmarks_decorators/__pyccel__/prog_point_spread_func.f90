@@ -0,0 +1,52 @@
+program prog_prog_point_spread_func
+
+use point_spread_func, only: pdf
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE), allocatable :: w2D(:,:)
+integer(C_INT64_T) :: x_range
+integer(C_INT64_T) :: y_range
+real(C_DOUBLE), allocatable :: density(:,:)
+real(C_DOUBLE) :: x_center
+real(C_DOUBLE) :: y_center
+real(C_DOUBLE) :: r50
+real(C_DOUBLE) :: b
+real(C_DOUBLE) :: a
+integer(C_INT64_T) :: rand
+integer(C_INT64_T) :: rand_a
+integer(C_INT64_T) :: rand_b
+integer(C_INT64_T) :: rand_m
+integer(C_INT64_T) :: i
+integer(C_INT64_T) :: j
+
+allocate(w2D(0:7_C_INT64_T - 1_C_INT64_T, 0:7_C_INT64_T - 1_C_INT64_T))
+w2D = 0.0_C_DOUBLE
+x_range = 2_C_INT64_T
+y_range = 2_C_INT64_T
+allocate(density(0:y_range - 1_C_INT64_T, 0:x_range - 1_C_INT64_T))
+density = 0.0_C_DOUBLE
+x_center = 5.0_C_DOUBLE
+y_center = 5.0_C_DOUBLE
+r50 = 50.0_C_DOUBLE
+b = 2.0_C_DOUBLE
+a = 2.4_C_DOUBLE
+rand = 0_C_INT64_T
+rand_a = 100_C_INT64_T
+rand_b = 821_C_INT64_T
+rand_m = 213_C_INT64_T
+do i = 0_C_INT64_T, 7_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, 7_C_INT64_T-1_C_INT64_T, 1_C_INT64_T
+    rand = MODULO((rand_a * rand + rand_b),rand_m)
+    w2D(j, i) = Real(rand, C_DOUBLE)
+  end do
+end do
+call pdf(density, x_range, y_range, x_center, y_center, w2D, r50, b, a)
+do i = 0_C_INT64_T, x_range-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, y_range-1_C_INT64_T, 1_C_INT64_T
+    print *, density(j, i)
+  end do
+end do
+
+end program prog_prog_point_spread_func
@@ -0,0 +1,11 @@
+program prog_prog_simplify
+
+use simplify, only: y
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, y(2.78_C_DOUBLE)
+print *, y(0.07_C_DOUBLE)
+
+end program prog_prog_simplify
@@ -0,0 +1,51 @@
+module quicksort
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+recursive subroutine qsort_kernel(a, lo, hi) 
+
+implicit none
+
+real(C_DOUBLE), intent(inout) :: a(0:)
+integer(C_INT64_T), value :: lo
+integer(C_INT64_T), value :: hi
+integer(C_INT64_T) :: i
+integer(C_INT64_T) :: j
+real(C_DOUBLE) :: pivot
+real(C_DOUBLE) :: tmp
+
+i = lo
+j = hi
+do while (i < hi)
+  pivot = a(FLOOR((lo + hi)/2.0_C_DOUBLE,C_INT64_T))
+  do while (i <= j)
+    do while (a(i) < pivot)
+      i = i + 1_C_INT64_T
+    end do
+    do while (a(j) > pivot)
+      j = j - 1_C_INT64_T
+    end do
+    if (i <= j) then
+      tmp = a(i)
+      a(i) = a(j)
+      a(j) = tmp
+      i = i + 1_C_INT64_T
+      j = j - 1_C_INT64_T
+    end if
+  end do
+  if (lo < j) then
+    call qsort_kernel(a, lo, j)
+  end if
+  lo = i
+  j = hi
+end do
+
+end subroutine qsort_kernel
+!........................................
+
+end module quicksort
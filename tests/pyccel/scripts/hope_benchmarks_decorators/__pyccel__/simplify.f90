@@ -0,0 +1,25 @@
+module simplify
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function y(x) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: x
+
+  Out_0001 = sin(x) ** 2_C_INT64_T + (x ** 3_C_INT64_T + x ** &
+      2_C_INT64_T - x - 1_C_INT64_T) / (x ** 2_C_INT64_T + 2_C_INT64_T &
+      * x + 1_C_INT64_T) + cos(x) ** 2_C_INT64_T
+  return
+
+end function y
+!........................................
+
+end module simplify
@@ -0,0 +1,11 @@
+!........................................
+subroutine ones() bind(c) 
+
+  use collisions6, only: mod_ones => ones
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  call mod_ones()
+
+end subroutine ones
+!........................................
@@ -0,0 +1,15 @@
+!........................................
+subroutine matmat(a, b, c) bind(c) 
+
+  use import_mod, only: mod_matmat => matmat
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: a(0:,0:)
+  real(C_DOUBLE), intent(in) :: b(0:,0:)
+  real(C_DOUBLE), intent(inout) :: c(0:,0:)
+
+  call mod_matmat(a, b, c)
+
+end subroutine matmat
+!........................................
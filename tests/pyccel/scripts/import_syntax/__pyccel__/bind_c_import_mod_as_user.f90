@@ -0,0 +1,16 @@
+!........................................
+function fun(xi1, xi2, xi3) bind(c) result(Out_0001)
+
+  use import_mod_as_user, only: mod_fun => fun
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: xi1
+  real(C_DOUBLE), value :: xi2
+  real(C_DOUBLE), value :: xi3
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_fun(xi1, xi2, xi3)
+
+end function fun
+!........................................
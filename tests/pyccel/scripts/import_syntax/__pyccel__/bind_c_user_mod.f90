@@ -0,0 +1,16 @@
+!........................................
+function user_func(x1, x2, x3) bind(c) result(Out_0001)
+
+  use user_mod, only: mod_user_func => user_func
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x1
+  real(C_DOUBLE), value :: x2
+  real(C_DOUBLE), value :: x3
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_user_func(x1, x2, x3)
+
+end function user_func
+!........................................
@@ -0,0 +1,15 @@
+!........................................
+function user_func(x1, x2) bind(c) result(Out_0001)
+
+  use user_mod2, only: mod_user_func => user_func
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), value :: x1
+  real(C_DOUBLE), value :: x2
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_user_func(x1, x2)
+
+end function user_func
+!........................................
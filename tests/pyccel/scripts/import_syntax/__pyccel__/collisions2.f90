@@ -0,0 +1,14 @@
+program prog_collisions2
+
+use user_mod, only: user_func_0001 => user_func
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE) :: user_func
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+user_func = user_func_0001(1.0_C_DOUBLE, 2.0_C_DOUBLE, 3.0_C_DOUBLE)
+print *, user_func
+
+end program prog_collisions2
@@ -0,0 +1,16 @@
+program prog_collisions3
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE), allocatable :: ones(:)
+real(C_DOUBLE), allocatable :: c(:)
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+allocate(ones(0:3_C_INT64_T - 1_C_INT64_T))
+ones = 1.0_C_DOUBLE
+allocate(c(0:3_C_INT64_T - 1_C_INT64_T))
+c = cos(3.0_C_DOUBLE) + cos(ones)
+
+end program prog_collisions3
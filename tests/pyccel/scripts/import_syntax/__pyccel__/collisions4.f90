@@ -0,0 +1,16 @@
+program prog_collisions4
+
+use user_mod, only: user_func
+use user_mod2, only: user_func_0001 => user_func
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE) :: test
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+test = user_func(1.0_C_DOUBLE, 2.0_C_DOUBLE, 3.0_C_DOUBLE) + &
+      user_func_0001(4.0_C_DOUBLE, 5.0_C_DOUBLE)
+print *, test
+
+end program prog_collisions4
@@ -0,0 +1,17 @@
+program prog_collisions5
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: numpy
+real(C_DOUBLE), allocatable :: x(:)
+
+!pylint: disable=missing-function-docstring, missing-module-docstring/
+numpy = 3_C_INT64_T
+allocate(x(0:3_C_INT64_T - 1_C_INT64_T))
+x = 1.0_C_DOUBLE
+print *, numpy
+print *, x
+
+end program prog_collisions5
@@ -0,0 +1,19 @@
+module collisions6
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine ones() 
+
+  implicit none
+
+  print *, 22_C_INT64_T
+
+end subroutine ones
+!........................................
+
+end module collisions6
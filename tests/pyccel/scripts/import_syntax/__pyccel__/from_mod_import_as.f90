@@ -0,0 +1,42 @@
+module from_mod_import_as
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+subroutine matmat(a, b, c) 
+
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: a(0:,0:)
+  real(C_DOUBLE), intent(in) :: b(0:,0:)
+  real(C_DOUBLE), intent(inout) :: c(0:,0:)
+  integer(C_INT64_T) :: nm(0:2_C_INT64_T-1)
+  integer(C_INT64_T) :: mp(0:2_C_INT64_T-1)
+  integer(C_INT64_T) :: n
+  integer(C_INT64_T) :: m
+  integer(C_INT64_T) :: p
+  integer(C_INT64_T) :: i
+  integer(C_INT64_T) :: j
+  integer(C_INT64_T) :: k
+
+  nm = [size(a, 2, C_INT64_T), size(a, 1, C_INT64_T)]
+  mp = [size(b, 2, C_INT64_T), size(b, 1, C_INT64_T)]
+  n = nm(0_C_INT64_T)
+  m = nm(1_C_INT64_T)
+  p = mp(1_C_INT64_T)
+  do i = 0_C_INT64_T, n-1_C_INT64_T, 1_C_INT64_T
+    do j = 0_C_INT64_T, p-1_C_INT64_T, 1_C_INT64_T
+      do k = 0_C_INT64_T, m-1_C_INT64_T, 1_C_INT64_T
+        c(j, i) = c(j, i) + a(k, i) * b(j, k)
+      end do
+    end do
+  end do
+
+end subroutine matmat
+!........................................
+
+end module from_mod_import_as
@@ -0,0 +1,76 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double fun(double xi1, double xi2, double xi3);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *fun_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double xi1;
+    double xi2;
+    double xi3;
+    double Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "xi1",
+        "xi2",
+        "xi3",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "ddd", kwlist, &xi1, &xi2, &xi3))
+    {
+        return NULL;
+    }
+    Out_0001 = fun(xi1, xi2, xi3);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef from_mod_import_as_user_methods[] = {
+    {
+        "fun",
+        (PyCFunction)(void (*)(void))fun_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef from_mod_import_as_user_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "from_mod_import_as_user",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    from_mod_import_as_user_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_from_mod_import_as_user(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&from_mod_import_as_user_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,128 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <cwrapper_cfi.h>
+
+void matmat(CFI_cdesc_t *a, CFI_cdesc_t *b, CFI_cdesc_t *c);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *matmat_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *a;
+    CFI_cdesc_t *b;
+    CFI_cdesc_t *c;
+    t_cfi_desc a_desc;
+    PyArrayObject *a_tmp;
+    t_cfi_desc b_desc;
+    PyArrayObject *b_tmp;
+    t_cfi_desc c_desc;
+    PyArrayObject *c_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "a",
+        "b",
+        "c",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!O!", kwlist, &PyArray_Type, &a_tmp, &PyArray_Type, &b_tmp, &PyArray_Type, &c_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(a_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "a_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(a_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(a_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "a must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        a = pyarray_to_cfi_desc(a_tmp, &a_desc, 1);
+    }
+    if (PyArray_NDIM(b_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "b_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(b_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(b_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "b must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        b = pyarray_to_cfi_desc(b_tmp, &b_desc, 1);
+    }
+    if (PyArray_NDIM(c_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "c_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(c_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(c_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "c must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        c = pyarray_to_cfi_desc(c_tmp, &c_desc, 1);
+    }
+    matmat(a, b, c);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef from_mod_import_as_methods[] = {
+    {
+        "matmat",
+        (PyCFunction)(void (*)(void))matmat_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef from_mod_import_as_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "from_mod_import_as",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    from_mod_import_as_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_from_mod_import_as(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&from_mod_import_as_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,9 @@
+#ifndef FROM_MOD_IMPORT_USER_H
+#define FROM_MOD_IMPORT_USER_H
+
+#include <user_mod.h>
+#include <stdlib.h>
+
+double fun(double xi1, double xi2, double xi3);
+
+#endif // FROM_MOD_IMPORT_USER_H
\ No newline at end of file
@@ -0,0 +1,12 @@
+#include <from_mod_import_user_func.h>
+#include <stdlib.h>
+
+/*........................................*/
+double fun(double xi1, double xi2, double xi3)
+{
+    #include <user_mod.h>
+    double Out_0001;
+    Out_0001 = user_func(xi1, xi2, xi3);
+    return Out_0001;
+}
+/*........................................*/
\ No newline at end of file
@@ -0,0 +1,8 @@
+#ifndef FROM_MOD_IMPORT_USER_FUNC_H
+#define FROM_MOD_IMPORT_USER_FUNC_H
+
+#include <stdlib.h>
+
+double fun(double xi1, double xi2, double xi3);
+
+#endif // FROM_MOD_IMPORT_USER_FUNC_H
\ No newline at end of file
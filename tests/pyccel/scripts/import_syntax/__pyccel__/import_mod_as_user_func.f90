@@ -0,0 +1,27 @@
+module import_mod_as_user_func
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function fun(xi1, xi2, xi3) result(Out_0001)
+
+  use user_mod, only: user_func
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: xi1
+  real(C_DOUBLE), value :: xi2
+  real(C_DOUBLE), value :: xi3
+
+  Out_0001 = user_func(xi1, xi2, xi3)
+  return
+
+end function fun
+!........................................
+
+end module import_mod_as_user_func
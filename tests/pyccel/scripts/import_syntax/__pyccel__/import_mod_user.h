@@ -0,0 +1,9 @@
+#ifndef IMPORT_MOD_USER_H
+#define IMPORT_MOD_USER_H
+
+#include <user_mod.h>
+#include <stdlib.h>
+
+double fun(double xi1, double xi2, double xi3);
+
+#endif // IMPORT_MOD_USER_H
\ No newline at end of file
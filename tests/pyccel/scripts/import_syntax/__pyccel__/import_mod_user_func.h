@@ -0,0 +1,8 @@
+#ifndef IMPORT_MOD_USER_FUNC_H
+#define IMPORT_MOD_USER_FUNC_H
+
+#include <stdlib.h>
+
+double fun(double xi1, double xi2, double xi3);
+
+#endif // IMPORT_MOD_USER_FUNC_H
\ No newline at end of file
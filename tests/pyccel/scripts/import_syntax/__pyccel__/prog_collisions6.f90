@@ -0,0 +1,14 @@
+program prog_prog_collisions6
+
+use collisions6, only: ones
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+real(C_DOUBLE), allocatable :: g(:)
+
+allocate(g(0:6_C_INT64_T - 1_C_INT64_T))
+g = 1.0_C_DOUBLE
+print *, g
+
+end program prog_prog_collisions6
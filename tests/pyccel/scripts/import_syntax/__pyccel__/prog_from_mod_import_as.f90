@@ -0,0 +1,50 @@
+program prog_prog_from_mod_import_as
+
+use from_mod_import_as, only: matmat
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+integer(C_INT64_T) :: n
+integer(C_INT64_T) :: m
+integer(C_INT64_T) :: p
+real(C_DOUBLE), allocatable :: a(:,:)
+real(C_DOUBLE), allocatable :: b(:,:)
+real(C_DOUBLE), allocatable :: c(:,:)
+integer(C_INT64_T) :: i
+integer(C_INT64_T) :: j
+
+n = 3_C_INT64_T
+m = 4_C_INT64_T
+p = 3_C_INT64_T
+allocate(a(0:m - 1_C_INT64_T, 0:n - 1_C_INT64_T))
+a = 0.0_C_DOUBLE
+allocate(b(0:p - 1_C_INT64_T, 0:m - 1_C_INT64_T))
+b = 0.0_C_DOUBLE
+do i = 0_C_INT64_T, n-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, m-1_C_INT64_T, 1_C_INT64_T
+    a(j, i) = (i - j) * 1.0_C_DOUBLE
+    print *, a(j, i)
+  end do
+  print *
+end do
+print *
+do i = 0_C_INT64_T, m-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, p-1_C_INT64_T, 1_C_INT64_T
+    b(j, i) = (i + j) * 1.0_C_DOUBLE
+    print *, b(j, i)
+  end do
+  print *
+end do
+print *
+allocate(c(0:p - 1_C_INT64_T, 0:n - 1_C_INT64_T))
+c = 0.0_C_DOUBLE
+call matmat(a, b, c)
+do i = 0_C_INT64_T, n-1_C_INT64_T, 1_C_INT64_T
+  do j = 0_C_INT64_T, p-1_C_INT64_T, 1_C_INT64_T
+    print *, c(j, i)
+  end do
+  print *
+end do
+
+end program prog_prog_from_mod_import_as
@@ -0,0 +1,11 @@
+program prog_prog_from_mod_import_as_user
+
+use user_mod, only: f => user_func
+use from_mod_import_as_user, only: fun
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, fun(1.0_C_DOUBLE, 2.0_C_DOUBLE, 3.0_C_DOUBLE)
+
+end program prog_prog_from_mod_import_as_user
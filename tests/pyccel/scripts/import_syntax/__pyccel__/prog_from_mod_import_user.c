@@ -0,0 +1,11 @@
+#include <from_mod_import_user.h>
+#include <user_mod.h>
+#include <stdio.h>
+#include <stdlib.h>
+int main()
+{
+
+
+    printf("%.12lf\n", fun(1.0, 2.0, 3.0));
+    return 0;
+}
\ No newline at end of file
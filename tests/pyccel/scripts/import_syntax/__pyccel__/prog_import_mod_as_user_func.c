@@ -0,0 +1,10 @@
+#include <import_mod_as_user_func.h>
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    printf("%.12lf\n", fun(1.0, 2.0, 3.0));
+    return 0;
+}
\ No newline at end of file
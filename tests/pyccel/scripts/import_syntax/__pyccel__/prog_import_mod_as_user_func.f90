@@ -0,0 +1,10 @@
+program prog_prog_import_mod_as_user_func
+
+use import_mod_as_user_func, only: fun
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+print *, fun(1.0_C_DOUBLE, 2.0_C_DOUBLE, 3.0_C_DOUBLE)
+
+end program prog_prog_import_mod_as_user_func
@@ -0,0 +1,11 @@
+#include <user_mod.h>
+#include <import_mod_user.h>
+#include <stdlib.h>
+#include <stdio.h>
+int main()
+{
+
+
+    printf("%.12lf\n", fun(1.0, 2.0, 3.0));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+#include <user_mod.h>
+#include <stdlib.h>
+
+/*........................................*/
+double user_func(double x1, double x2, double x3)
+{
+    double Out_0001;
+    Out_0001 = x1 + x2 + x3;
+    return Out_0001;
+}
+/*........................................*/
\ No newline at end of file
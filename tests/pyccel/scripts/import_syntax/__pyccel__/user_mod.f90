@@ -0,0 +1,25 @@
+module user_mod
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function user_func(x1, x2, x3) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: x1
+  real(C_DOUBLE), value :: x2
+  real(C_DOUBLE), value :: x3
+
+  Out_0001 = x1 + x2 + x3
+  return
+
+end function user_func
+!........................................
+
+end module user_mod
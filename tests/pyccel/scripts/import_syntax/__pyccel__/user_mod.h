@@ -0,0 +1,8 @@
+#ifndef USER_MOD_H
+#define USER_MOD_H
+
+#include <stdlib.h>
+
+double user_func(double x1, double x2, double x3);
+
+#endif // USER_MOD_H
\ No newline at end of file
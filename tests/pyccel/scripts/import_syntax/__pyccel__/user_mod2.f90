@@ -0,0 +1,24 @@
+module user_mod2
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+function user_func(x1, x2) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), value :: x1
+  real(C_DOUBLE), value :: x2
+
+  Out_0001 = x1 + x2
+  return
+
+end function user_func
+!........................................
+
+end module user_mod2
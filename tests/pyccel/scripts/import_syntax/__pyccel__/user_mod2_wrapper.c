@@ -0,0 +1,74 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double user_func(double x1, double x2);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *user_func_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x1;
+    double x2;
+    double Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x1",
+        "x2",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "dd", kwlist, &x1, &x2))
+    {
+        return NULL;
+    }
+    Out_0001 = user_func(x1, x2);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef user_mod2_methods[] = {
+    {
+        "user_func",
+        (PyCFunction)(void (*)(void))user_func_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef user_mod2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "user_mod2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    user_mod2_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_user_mod2(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&user_mod2_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,76 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+
+double user_func(double x1, double x2, double x3);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *user_func_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    double x1;
+    double x2;
+    double x3;
+    double Out_0001;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x1",
+        "x2",
+        "x3",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "ddd", kwlist, &x1, &x2, &x3))
+    {
+        return NULL;
+    }
+    Out_0001 = user_func(x1, x2, x3);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef user_mod_methods[] = {
+    {
+        "user_func",
+        (PyCFunction)(void (*)(void))user_func_wrapper,
+        PYCCEL_METH_FASTCALL,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef user_mod_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "user_mod",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    user_mod_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_user_mod(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&user_mod_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -0,0 +1,107 @@
+!........................................
+!__________________________!
+!Squared exponential kernel!
+!__________________________!
+
+function kern_sqexp(x0, x1, h) bind(c) result(Out_0001)
+
+  use numpy_kernels, only: mod_kern_sqexp => kern_sqexp
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), value :: h
+  real(C_DOUBLE) :: Out_0001
+
+  Out_0001 = mod_kern_sqexp(x0, x1, h)
+
+end function kern_sqexp
+!........................................
+
+!........................................
+!________________________________________________________________!
+!Squared exponential kernel with different scale in each direction!
+!________________________________________________________________!
+
+function kern_sqexp_multiscale(x0, x1, h) bind(c) result(Out_0002)
+
+  use numpy_kernels, only: mod_kern_sqexp_multiscale => &
+      kern_sqexp_multiscale
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), intent(in) :: h(0:)
+  real(C_DOUBLE) :: Out_0002
+
+  Out_0002 = mod_kern_sqexp_multiscale(x0, x1, h)
+
+end function kern_sqexp_multiscale
+!........................................
+
+!........................................
+!____________________________________________________!
+!Wendland kernel, positive definite for dimension <= 3!
+!____________________________________________________!
+
+function kern_wendland4(x0, x1, h) bind(c) result(ret)
+
+  use numpy_kernels, only: mod_kern_wendland4 => kern_wendland4
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), value :: h
+  real(C_DOUBLE) :: ret
+
+  ret = mod_kern_wendland4(x0, x1, h)
+
+end function kern_wendland4
+!........................................
+
+!........................................
+!______________________________________________________!
+!Wendland kernel, positive definite for dimension <= 3,!
+!       different scale in each direction              !
+!______________________________________________________!
+
+function kern_wendland4_multiscale(x0, x1, h) bind(c) result(ret)
+
+  use numpy_kernels, only: mod_kern_wendland4_multiscale => &
+      kern_wendland4_multiscale
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), intent(in) :: h(0:)
+  real(C_DOUBLE) :: ret
+
+  ret = mod_kern_wendland4_multiscale(x0, x1, h)
+
+end function kern_wendland4_multiscale
+!........................................
+
+!........................................
+!__________________________________________________________________!
+!Constructs GP covariance matrix between two point tuples x0 and x1!
+!__________________________________________________________________!
+
+subroutine gp_matrix(x0, x1, a, K) bind(c) 
+
+  use numpy_kernels, only: mod_gp_matrix => gp_matrix
+  use, intrinsic :: ISO_C_BINDING
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:,0:)
+  real(C_DOUBLE), intent(in) :: x1(0:,0:)
+  real(C_DOUBLE), intent(in) :: a(0:)
+  real(C_DOUBLE), intent(inout) :: K(0:,0:)
+
+  call mod_gp_matrix(x0, x1, a, K)
+
+end subroutine gp_matrix
+!........................................
@@ -0,0 +1,134 @@
+module numpy_kernels
+
+use, intrinsic :: ISO_C_BINDING
+
+implicit none
+
+contains
+
+!........................................
+!__________________________!
+!Squared exponential kernel!
+!__________________________!
+
+function kern_sqexp(x0, x1, h) result(Out_0001)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0001
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), value :: h
+
+  Out_0001 = exp((-0.5_C_DOUBLE) * sum(((x1 - x0) / h) ** 2_C_INT64_T))
+  return
+
+end function kern_sqexp
+!........................................
+
+!........................................
+!________________________________________________________________!
+!Squared exponential kernel with different scale in each direction!
+!________________________________________________________________!
+
+function kern_sqexp_multiscale(x0, x1, h) result(Out_0002)
+
+  implicit none
+
+  real(C_DOUBLE) :: Out_0002
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), intent(in) :: h(0:)
+
+  Out_0002 = exp((-0.5_C_DOUBLE) * sum(((x1 - x0) / h) ** 2_C_INT64_T))
+  return
+
+end function kern_sqexp_multiscale
+!........................................
+
+!........................................
+!____________________________________________________!
+!Wendland kernel, positive definite for dimension <= 3!
+!____________________________________________________!
+
+function kern_wendland4(x0, x1, h) result(ret)
+
+  implicit none
+
+  real(C_DOUBLE) :: ret
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), value :: h
+  real(C_DOUBLE) :: r
+
+  r = sqrt(sum(((x1 - x0) / h) ** 2_C_INT64_T))
+  if (r < 1.0_C_DOUBLE) then
+    ret = abs((1.0_C_DOUBLE - r ** 4_C_INT64_T) * (1.0_C_DOUBLE + &
+      4.0_C_DOUBLE * r))
+  else if (.True._C_BOOL) then
+    ret = 0.0_C_DOUBLE
+  end if
+  return
+
+end function kern_wendland4
+!........................................
+
+!........................................
+!______________________________________________________!
+!Wendland kernel, positive definite for dimension <= 3,!
+!       different scale in each direction              !
+!______________________________________________________!
+
+function kern_wendland4_multiscale(x0, x1, h) result(ret)
+
+  implicit none
+
+  real(C_DOUBLE) :: ret
+  real(C_DOUBLE), intent(in) :: x0(0:)
+  real(C_DOUBLE), intent(in) :: x1(0:)
+  real(C_DOUBLE), intent(in) :: h(0:)
+  real(C_DOUBLE) :: r
+
+  r = sqrt(sum(((x1 - x0) / h) ** 2_C_INT64_T))
+  if (r < 1.0_C_DOUBLE) then
+    ret = abs((1.0_C_DOUBLE - r ** 4_C_INT64_T) * (1.0_C_DOUBLE + &
+      4.0_C_DOUBLE * r))
+  else if (.True._C_BOOL) then
+    ret = 0.0_C_DOUBLE
+  end if
+  return
+
+end function kern_wendland4_multiscale
+!........................................
+
+!........................................
+!__________________________________________________________________!
+!Constructs GP covariance matrix between two point tuples x0 and x1!
+!__________________________________________________________________!
+
+subroutine gp_matrix(x0, x1, a, K) 
+
+  implicit none
+
+  real(C_DOUBLE), intent(in) :: x0(0:,0:)
+  real(C_DOUBLE), intent(in) :: x1(0:,0:)
+  real(C_DOUBLE), intent(in) :: a(0:)
+  real(C_DOUBLE), intent(inout) :: K(0:,0:)
+  integer(C_INT64_T) :: n0
+  integer(C_INT64_T) :: n1
+  integer(C_INT64_T) :: k0
+  integer(C_INT64_T) :: k1
+
+  n0 = size(x0,2,C_INT64_T)
+  n1 = size(x1,2,C_INT64_T)
+  do k0 = 0_C_INT64_T, n0-1_C_INT64_T, 1_C_INT64_T
+    do k1 = 0_C_INT64_T, n1-1_C_INT64_T, 1_C_INT64_T
+      K(k1, k0) = a(1_C_INT64_T) * kern_sqexp(x0(:, k0), x1(:, k1), a( &
+      0_C_INT64_T))
+    end do
+  end do
+
+end subroutine gp_matrix
+!........................................
+
+end module numpy_kernels
@@ -0,0 +1,445 @@
+#define PY_SSIZE_T_CLEAN
+#define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <cwrapper.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <cwrapper_cfi.h>
+
+double kern_sqexp(CFI_cdesc_t *x0, CFI_cdesc_t *x1, double h);
+double kern_sqexp_multiscale(CFI_cdesc_t *x0, CFI_cdesc_t *x1, CFI_cdesc_t *h);
+double kern_wendland4(CFI_cdesc_t *x0, CFI_cdesc_t *x1, double h);
+double kern_wendland4_multiscale(CFI_cdesc_t *x0, CFI_cdesc_t *x1, CFI_cdesc_t *h);
+void gp_matrix(CFI_cdesc_t *x0, CFI_cdesc_t *x1, CFI_cdesc_t *a, CFI_cdesc_t *K);
+
+/*........................................*/
+
+
+
+/*........................................*/
+
+/*........................................*/
+PyObject *kern_sqexp_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x0;
+    CFI_cdesc_t *x1;
+    double h;
+    double Out_0001;
+    t_cfi_desc x0_desc;
+    PyArrayObject *x0_tmp;
+    t_cfi_desc x1_desc;
+    PyArrayObject *x1_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x0",
+        "x1",
+        "h",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!d", kwlist, &PyArray_Type, &x0_tmp, &PyArray_Type, &x1_tmp, &h))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x0_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x0_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x0_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x0_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x0 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x0 = pyarray_to_cfi_desc(x0_tmp, &x0_desc, 0);
+    }
+    if (PyArray_NDIM(x1_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x1_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x1_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x1_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x1 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x1 = pyarray_to_cfi_desc(x1_tmp, &x1_desc, 0);
+    }
+    Out_0001 = kern_sqexp(x0, x1, h);
+    result = Py_BuildValue("d", Out_0001);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *kern_sqexp_multiscale_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x0;
+    CFI_cdesc_t *x1;
+    CFI_cdesc_t *h;
+    double Out_0002;
+    t_cfi_desc x0_desc;
+    PyArrayObject *x0_tmp;
+    t_cfi_desc x1_desc;
+    PyArrayObject *x1_tmp;
+    t_cfi_desc h_desc;
+    PyArrayObject *h_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x0",
+        "x1",
+        "h",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!O!", kwlist, &PyArray_Type, &x0_tmp, &PyArray_Type, &x1_tmp, &PyArray_Type, &h_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x0_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x0_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x0_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x0_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x0 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x0 = pyarray_to_cfi_desc(x0_tmp, &x0_desc, 0);
+    }
+    if (PyArray_NDIM(x1_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x1_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x1_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x1_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x1 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x1 = pyarray_to_cfi_desc(x1_tmp, &x1_desc, 0);
+    }
+    if (PyArray_NDIM(h_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "h_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(h_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(h_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "h must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        h = pyarray_to_cfi_desc(h_tmp, &h_desc, 0);
+    }
+    Out_0002 = kern_sqexp_multiscale(x0, x1, h);
+    result = Py_BuildValue("d", Out_0002);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *kern_wendland4_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x0;
+    CFI_cdesc_t *x1;
+    double h;
+    double ret;
+    t_cfi_desc x0_desc;
+    PyArrayObject *x0_tmp;
+    t_cfi_desc x1_desc;
+    PyArrayObject *x1_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x0",
+        "x1",
+        "h",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!d", kwlist, &PyArray_Type, &x0_tmp, &PyArray_Type, &x1_tmp, &h))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x0_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x0_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x0_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x0_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x0 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x0 = pyarray_to_cfi_desc(x0_tmp, &x0_desc, 0);
+    }
+    if (PyArray_NDIM(x1_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x1_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x1_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x1_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x1 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x1 = pyarray_to_cfi_desc(x1_tmp, &x1_desc, 0);
+    }
+    ret = kern_wendland4(x0, x1, h);
+    result = Py_BuildValue("d", ret);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *kern_wendland4_multiscale_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x0;
+    CFI_cdesc_t *x1;
+    CFI_cdesc_t *h;
+    double ret;
+    t_cfi_desc x0_desc;
+    PyArrayObject *x0_tmp;
+    t_cfi_desc x1_desc;
+    PyArrayObject *x1_tmp;
+    t_cfi_desc h_desc;
+    PyArrayObject *h_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x0",
+        "x1",
+        "h",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!O!", kwlist, &PyArray_Type, &x0_tmp, &PyArray_Type, &x1_tmp, &PyArray_Type, &h_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x0_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x0_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x0_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x0_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x0 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x0 = pyarray_to_cfi_desc(x0_tmp, &x0_desc, 0);
+    }
+    if (PyArray_NDIM(x1_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "x1_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x1_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x1_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x1 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x1 = pyarray_to_cfi_desc(x1_tmp, &x1_desc, 0);
+    }
+    if (PyArray_NDIM(h_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "h_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(h_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(h_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "h must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        h = pyarray_to_cfi_desc(h_tmp, &h_desc, 0);
+    }
+    ret = kern_wendland4_multiscale(x0, x1, h);
+    result = Py_BuildValue("d", ret);
+    return result;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject *gp_matrix_wrapper(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CFI_cdesc_t *x0;
+    CFI_cdesc_t *x1;
+    CFI_cdesc_t *a;
+    CFI_cdesc_t *K;
+    t_cfi_desc x0_desc;
+    PyArrayObject *x0_tmp;
+    t_cfi_desc x1_desc;
+    PyArrayObject *x1_tmp;
+    t_cfi_desc a_desc;
+    PyArrayObject *a_tmp;
+    t_cfi_desc K_desc;
+    PyArrayObject *K_tmp;
+    PyObject *result;
+    static char *kwlist[] = {
+        "x0",
+        "x1",
+        "a",
+        "K",
+        NULL
+    };
+
+    if (!pyarg_parse_fastcall(args, nargs, kwnames, "O!O!O!O!", kwlist, &PyArray_Type, &x0_tmp, &PyArray_Type, &x1_tmp, &PyArray_Type, &a_tmp, &PyArray_Type, &K_tmp))
+    {
+        return NULL;
+    }
+    if (PyArray_NDIM(x0_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "x0_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x0_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x0_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x0 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x0 = pyarray_to_cfi_desc(x0_tmp, &x0_desc, 1);
+    }
+    if (PyArray_NDIM(x1_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "x1_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(x1_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(x1_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "x1 must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        x1 = pyarray_to_cfi_desc(x1_tmp, &x1_desc, 1);
+    }
+    if (PyArray_NDIM(a_tmp) != 1)
+    {
+        PyErr_SetString(PyExc_TypeError, "a_tmp must have rank 1");
+        return NULL;
+    }
+    else if (PyArray_TYPE(a_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(a_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "a must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        a = pyarray_to_cfi_desc(a_tmp, &a_desc, 0);
+    }
+    if (PyArray_NDIM(K_tmp) != 2)
+    {
+        PyErr_SetString(PyExc_TypeError, "K_tmp must have rank 2");
+        return NULL;
+    }
+    else if (PyArray_TYPE(K_tmp) != NPY_DOUBLE)
+    {
+        printf("%d %d\n", PyArray_TYPE(K_tmp), NPY_DOUBLE);
+        PyErr_SetString(PyExc_TypeError, "K must be double");
+        return NULL;
+    }
+    else if (1)
+    {
+        K = pyarray_to_cfi_desc(K_tmp, &K_desc, 1);
+    }
+    gp_matrix(x0, x1, a, K);
+    result = Py_BuildValue("");
+    return result;
+}
+/*........................................*/
+
+static PyMethodDef numpy_kernels_methods[] = {
+    {
+        "kern_sqexp",
+        (PyCFunction)(void (*)(void))kern_sqexp_wrapper,
+        PYCCEL_METH_FASTCALL,
+        "Squared exponential kernel"
+    },
+    {
+        "kern_sqexp_multiscale",
+        (PyCFunction)(void (*)(void))kern_sqexp_multiscale_wrapper,
+        PYCCEL_METH_FASTCALL,
+        "Squared exponential kernel with different scale in each direction"
+    },
+    {
+        "kern_wendland4",
+        (PyCFunction)(void (*)(void))kern_wendland4_wrapper,
+        PYCCEL_METH_FASTCALL,
+        "Wendland kernel, positive definite for dimension <= 3"
+    },
+    {
+        "kern_wendland4_multiscale",
+        (PyCFunction)(void (*)(void))kern_wendland4_multiscale_wrapper,
+        PYCCEL_METH_FASTCALL,
+        "Wendland kernel, positive definite for dimension <= 3,\n       different scale in each direction"
+    },
+    {
+        "gp_matrix",
+        (PyCFunction)(void (*)(void))gp_matrix_wrapper,
+        PYCCEL_METH_FASTCALL,
+        "Constructs GP covariance matrix between two point tuples x0 and x1"
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef numpy_kernels_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "numpy_kernels",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    -1,
+    numpy_kernels_methods
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_numpy_kernels(void)
+{
+    PyObject *m;
+
+    import_array();
+
+    m = PyModule_Create(&numpy_kernels_module);
+    if (m == NULL) return NULL;
+
+    return m;
+}
@@ -282,6 +282,47 @@ def test_absolute_imports_in_project(language):
 
     compare_pyth_fort_output(pyth_out, fort_out)
 
+#------------------------------------------------------------------------------
+def test_imports_in_project_build_dependencies(language):
+
+    base_dir = os.path.dirname(os.path.realpath(__file__))
+    path_dir = os.path.join(base_dir, "project_abs_imports")
+    teardown(path_dir)
+    pyth_out = get_python_output('runtest.py', cwd=path_dir)
+
+    # mod1 and mod2 are compiled when compiling mod3
+    language_opt = '--language={} -j 2'.format(language)
+    compile_pyccel(path_dir, 'project/folder2/mod3.py', language_opt)
+    fort_out = get_python_output('runtest.py', cwd=path_dir)
+
+    compare_pyth_fort_output(pyth_out, fort_out)
+
+    assert os.path.isfile(os.path.join(path_dir, 'project', 'folder1', '__pyccel__', 'mod1.o'))
+    assert os.path.isfile(os.path.join(path_dir, 'project', 'folder2', '__pyccel__', 'mod2.o'))
+
+#------------------------------------------------------------------------------
+def test_incremental_build(language):
+
+    base_dir = os.path.dirname(os.path.realpath(__file__))
+    path_dir = os.path.join(base_dir, "project_abs_imports")
+    teardown(path_dir)
+
+    language_opt = '--language={}'.format(language)
+    compile_pyccel(path_dir, 'project/folder2/mod3.py', language_opt)
+
+    outputs = [os.path.join(path_dir, 'project', 'folder1', '__pyccel__', 'mod1.o'),
+               os.path.join(path_dir, 'project', 'folder2', '__pyccel__', 'mod2.o'),
+               os.path.join(path_dir, 'project', 'folder2', '__pyccel__', 'mod3.o')]
+    mtimes = [os.path.getmtime(f) for f in outputs]
+
+    # Nothing is rebuilt when the inputs did not change
+    compile_pyccel(path_dir, 'project/folder2/mod3.py', language_opt)
+    assert [os.path.getmtime(f) for f in outputs] == mtimes
+
+    # Modifying the options rebuilds everything
+    compile_pyccel(path_dir, 'project/folder2/mod3.py', language_opt + ' --debug')
+    assert all(os.path.getmtime(f) != t for f, t in zip(outputs, mtimes))
+
 #------------------------------------------------------------------------------
 def test_rel_imports_python_accessible_folder(language):
     # pyccel is called on scripts/folder2/runtest_rel_imports.py from the scripts folder